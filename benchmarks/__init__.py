@@ -0,0 +1,69 @@
+# Copyright (c) 2010 ActiveState Software Inc.
+# See LICENSE.txt for license details.
+
+"""Performance benchmarks for codeintel2.
+
+Each module here is runnable as a script, e.g.:
+
+    python -m codeintel2.benchmarks.startup --help
+
+The helpers below are shared by the benchmarks that run their samples in
+fresh Python processes.
+"""
+
+import os
+import sys
+import subprocess
+from os.path import dirname, abspath
+
+try:
+    import json
+except ImportError:
+    json = None
+
+
+def peak_rss_mb():
+    """Return the peak resident set size of this process in MB, or None
+    if that can't be determined (e.g. on Windows).
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        return maxrss / (1024.0 * 1024.0)  # bytes
+    return maxrss / 1024.0  # KB
+
+def child_env():
+    """Return the environment for a benchmark child process, in which
+    "codeintel2" is importable from this source tree.
+    """
+    env = dict(os.environ)
+    pkg_parent_dir = dirname(dirname(dirname(abspath(__file__))))
+    env["PYTHONPATH"] = os.pathsep.join(
+        [pkg_parent_dir] + [p for p in [env.get("PYTHONPATH")] if p])
+    return env
+
+_run_in_child_script = r"""
+import json
+from codeintel2.benchmarks.%(module_name)s import %(func_name)s
+print json.dumps(%(func_name)s(*%(args)r))
+"""
+
+def run_in_child(module_name, func_name, *args):
+    """Call the named function of the given benchmark module with the
+    given (repr()-able) arguments in a fresh Python process and return
+    its (JSON-able) result.
+
+    Raises RuntimeError if the child process fails.
+    """
+    script = _run_in_child_script % {"module_name": module_name,
+                                     "func_name": func_name, "args": args}
+    p = subprocess.Popen([sys.executable, "-c", script], env=child_env(),
+                         stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    stdout, stderr = p.communicate()
+    if p.returncode:
+        raise RuntimeError("benchmark child %s.%s%r failed: %s"
+                           % (module_name, func_name, args, stderr))
+    return json.loads(stdout.strip().splitlines()[-1])
@@ -0,0 +1,293 @@
+#!/usr/bin/env python
+# Copyright (c) 2010 ActiveState Software Inc.
+# See LICENSE.txt for license details.
+
+"""Benchmark completion latency against the shipped stdlibs and catalogs.
+
+Usage:
+    python -m codeintel2.benchmarks.completion [<options>...] [<langs>...]
+
+Options:
+    -h, --help          dump this help and exit
+    -n, --repeat <n>    number of warm runs of each scenario (the median
+                        is reported), default is 10
+    -o, --output <path> also write the results as JSON to <path>
+    -l, --list          list the scenarios and exit
+
+Builds a database in a temporary dir (timing the import of the stdlibs
+and catalogs), then runs scripted completion, calltip and defn scenarios
+for the given languages (by default all of them: Python, JavaScript
+with the Dojo, Ext and YUI catalogs, PHP with the Drupal catalog, Perl,
+and Ruby with the Rails catalog). Each language is run in a fresh
+Python process, so that its first evaluation of each scenario is "cold"
+(with the db blobs and indeces not yet loaded in memory); the scenario
+is then re-evaluated `repeat' times ("warm"). The peak memory use of the
+process is reported per language.
+
+The JSON results (see `run()') can be compared between revisions, e.g.
+to catch regressions in database/, tree_*.py and lang_*.py.
+"""
+
+import sys
+import time
+import getopt
+import logging
+import tempfile
+import shutil
+from os.path import join
+
+try:
+    import json
+except ImportError:
+    json = None
+
+from codeintel2.benchmarks import peak_rss_mb, run_in_child
+
+log = logging.getLogger("codeintel.benchmarks.completion")
+
+
+# The scenarios, by lang: (<name>, <form>, <catalogs>, <content>), where
+# the content has a "<|>" marker at the position to evaluate at. The form
+# is one of "cpln", "calltip" or "defn". Catalogs are selected by the base
+# name of their .cix file (see CatalogsZone.get_lib()).
+_python_classes = """\
+class Widget(object):
+    def __init__(self, name):
+        self.name = name
+    def resize(self, width, height):
+        self.width, self.height = width, height
+
+w = Widget("w")
+"""
+_js_funcs = """\
+function resize(widget, width, height) {
+    widget.width = width;
+    widget.height = height;
+}
+"""
+scenarios_from_lang = {
+    "Python": [
+        ("local members", "cpln", [], _python_classes + "w.<|>"),
+        ("local calltip", "calltip", [], _python_classes + "w.resize(<|>"),
+        ("local defn", "defn", [], _python_classes + "w.resi<|>ze(1, 2)"),
+        ("stdlib module members", "cpln", [], "import os\nos.path.<|>"),
+    ],
+    "JavaScript": [
+        ("stdlib members", "cpln", [], "var s = 'abc';\ns.<|>"),
+        ("dojo members", "cpln", ["dojo"], "dojo.<|>"),
+        ("dojo calltip", "calltip", ["dojo"], "dojo.connect(<|>"),
+        ("ext members", "cpln", ["ext"], "Ext.<|>"),
+        ("yui members", "cpln", ["YUI"], "YAHOO.util.<|>"),
+        ("local defn", "defn", [], _js_funcs + "resi<|>ze(w, 1, 2);"),
+    ],
+    "PHP": [
+        ("stdlib members", "cpln", [],
+         "<?php\n$e = new Exception();\n$e-><|>"),
+        ("stdlib calltip", "calltip", [], "<?php\nstrlen(<|>"),
+        ("drupal calltip", "calltip", ["Drupal"], "<?php\nnode_load(<|>"),
+        ("drupal defn", "defn", ["Drupal"], "<?php\nnode_lo<|>ad(1);"),
+    ],
+    "Perl": [
+        ("stdlib members", "cpln", [],
+         "use File::Spec;\nFile::Spec-><|>"),
+        ("stdlib calltip", "calltip", [],
+         "use File::Spec;\nFile::Spec->catfile(<|>"),
+        ("stdlib imports", "cpln", [], "use File::<|>"),
+    ],
+    "Ruby": [
+        ("stdlib members", "cpln", [], "s = String.new\ns.<|>"),
+        ("stdlib calltip", "calltip", [], "File.open(<|>"),
+        ("rails members", "cpln", ["Rails"], "ActiveRecord::Base.<|>"),
+    ],
+}
+_ext_from_lang = {"Python": ".py", "JavaScript": ".js", "PHP": ".php",
+                  "Perl": ".pl", "Ruby": ".rb"}
+EVAL_TIMEOUT = 30.0
+
+
+def _median(values):
+    values = sorted(values)
+    return values[len(values)//2]
+
+def _eval(buf, form, pos):
+    """Evaluate at `pos' in `buf' and return the number of results."""
+    from codeintel2.common import EvalController, EvalTimeout
+    ctlr = EvalController()
+    if form == "defn":
+        trg = buf.defn_trg_from_pos(pos)
+    else:
+        trg = buf.trg_from_pos(pos)
+    if trg is None:
+        raise ValueError("no trigger")
+    if form == "cpln":
+        results = buf.cplns_from_trg(trg, timeout=EVAL_TIMEOUT, ctlr=ctlr)
+    elif form == "calltip":
+        results = buf.calltips_from_trg(trg, timeout=EVAL_TIMEOUT, ctlr=ctlr)
+    else:
+        results = buf.defns_from_trg(trg, timeout=EVAL_TIMEOUT, ctlr=ctlr)
+    return len(results or [])
+
+def _manager(db_base_dir):
+    from codeintel2.manager import Manager
+    mgr = Manager(db_base_dir=db_base_dir)
+    mgr.upgrade()
+    mgr.initialize()
+    return mgr
+
+def build_db(db_base_dir, langs):
+    """Create the db and import the stdlibs and catalogs used by the
+    scenarios of the given langs. Returns the time it took (in seconds).
+    """
+    start = time.time()
+    mgr = _manager(db_base_dir)
+    try:
+        selections = set()
+        for lang in langs:
+            for name, form, catalogs, content in scenarios_from_lang[lang]:
+                selections.update(catalogs)
+        mgr.db.get_catalogs_zone().update(sorted(selections))
+        for lang in langs:
+            mgr.db.get_stdlibs_zone().update_lang(lang)
+    finally:
+        mgr.finalize()
+    return time.time() - start
+
+def run_lang(db_base_dir, lang, repeat=10):
+    """Run the scenarios of the given lang against the db (in this
+    process) and return:
+        {"scenarios": {<name>: {"cold": <seconds>, "warm": <seconds>,
+                                "results": <number of results>}
+                               or {"error": <reason>}},
+         "peak_rss_mb": <MB or None>}
+    """
+    from codeintel2.environment import SimplePrefsEnvironment
+    src_dir = tempfile.mkdtemp(prefix="codeintel-bench-src-")
+    mgr = _manager(db_base_dir)
+    try:
+        results = {}
+        for i, (name, form, catalogs, content) \
+                in enumerate(scenarios_from_lang[lang]):
+            env = SimplePrefsEnvironment(codeintel_selected_catalogs=catalogs)
+            pos = content.index("<|>")
+            content = content.replace("<|>", "")
+            path = join(src_dir, "scenario%d%s" % (i, _ext_from_lang[lang]))
+            buf = mgr.buf_from_content(content, lang, env=env, path=path)
+            try:
+                start = time.time()
+                num_results = _eval(buf, form, pos)
+                cold = time.time() - start
+                if not num_results:
+                    # E.g. a catalog selection that doesn't match (see
+                    # CatalogsZone.get_lib()): the timings would be
+                    # meaningless.
+                    raise ValueError("no results")
+                warm = []
+                for j in range(repeat):
+                    start = time.time()
+                    _eval(buf, form, pos)
+                    warm.append(time.time() - start)
+            except Exception, ex:
+                log.debug("error in %s '%s' scenario", lang, name,
+                          exc_info=True)
+                results[name] = {"error": str(ex) or ex.__class__.__name__}
+                continue
+            results[name] = {"cold": cold,
+                             "warm": warm and _median(warm) or None,
+                             "results": num_results}
+        return {"scenarios": results, "peak_rss_mb": peak_rss_mb()}
+    finally:
+        mgr.finalize()
+        shutil.rmtree(src_dir, ignore_errors=True)
+
+def run(langs=None, repeat=10):
+    """Run the benchmark and return the results:
+        {"benchmark": "completion",
+         "db_build": <seconds>,
+         "results": {"<lang>/<scenario>": {"cold": <seconds>, ...}},
+         "peak_rss_mb": {<lang>: <MB>}, ...}
+    """
+    if langs is None:
+        langs = sorted(scenarios_from_lang)
+    db_base_dir = tempfile.mkdtemp(prefix="codeintel-bench-db-")
+    try:
+        data = {"benchmark": "completion",
+                "time": time.time(),
+                "python": sys.version.split()[0],
+                "platform": sys.platform,
+                "repeat": repeat,
+                "db_build": build_db(db_base_dir, langs),
+                "results": {},
+                "peak_rss_mb": {}}
+        for lang in langs:
+            lang_results = run_in_child("completion", "run_lang",
+                                        db_base_dir, lang, repeat)
+            for name, result in lang_results["scenarios"].items():
+                data["results"]["%s/%s" % (lang, name)] = result
+            data["peak_rss_mb"][lang] = lang_results["peak_rss_mb"]
+        return data
+    finally:
+        shutil.rmtree(db_base_dir, ignore_errors=True)
+
+def _report(data):
+    print "db build: %.2fs" % data["db_build"]
+    print "%-40s %10s %10s %8s" % ("scenario", "cold", "warm", "results")
+    for key in sorted(data["results"]):
+        result = data["results"][key]
+        if "error" in result:
+            print "%-40s error: %s" % (key, result["error"])
+        else:
+            print "%-40s %8.1fms %8.1fms %8d" % (
+                key, result["cold"]*1000, (result["warm"] or 0)*1000,
+                result["results"])
+    for lang in sorted(data["peak_rss_mb"]):
+        mb = data["peak_rss_mb"][lang]
+        if mb is not None:
+            print "%s peak memory: %.1fMB" % (lang, mb)
+
+def main(argv):
+    logging.basicConfig()
+    try:
+        opts, args = getopt.getopt(argv[1:], "hn:o:l",
+            ["help", "repeat=", "output=", "list"])
+    except getopt.GetoptError, ex:
+        log.error(str(ex))
+        return 1
+    repeat = 10
+    output_path = None
+    for opt, optarg in opts:
+        if opt in ("-h", "--help"):
+            sys.stdout.write(__doc__)
+            return 0
+        elif opt in ("-n", "--repeat"):
+            repeat = int(optarg)
+        elif opt in ("-o", "--output"):
+            output_path = optarg
+        elif opt in ("-l", "--list"):
+            for lang in sorted(scenarios_from_lang):
+                for name, form, catalogs, content \
+                        in scenarios_from_lang[lang]:
+                    print "%s/%s (%s%s)" % (lang, name, form,
+                        catalogs and ", " + ", ".join(catalogs) or "")
+            return 0
+    if json is None:
+        log.error("this benchmark requires the 'json' module")
+        return 1
+    langs = args or None
+    for lang in langs or ():
+        if lang not in scenarios_from_lang:
+            log.error("no scenarios for '%s' (known langs: %s)", lang,
+                      ", ".join(sorted(scenarios_from_lang)))
+            return 1
+
+    data = run(langs, repeat)
+    _report(data)
+    if output_path:
+        fout = open(output_path, 'w')
+        try:
+            json.dump(data, fout, indent=2, sort_keys=True)
+        finally:
+            fout.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# Copyright (c) 2010 ActiveState Software Inc.
+# See LICENSE.txt for license details.
+
+"""Benchmark the JavaScript CILE.
+
+Usage:
+    python -m codeintel2.benchmarks.jscile [<options>...] [<paths>...]
+
+Options:
+    -h, --help          dump this help and exit
+    -n, --repeat <n>    number of timing runs (the best is reported)
+
+Scans all the .js files under the given paths (by default the node.js
+sources shipped in "lib_srcs") with the JavaScriptCiler and reports
+tokens/sec per file and overall. Large library files (dojo, ext, yui,
+jquery, concatenated bundles) are the interesting inputs here.
+
+The files are lexed once up front: only the ciler's scan of the tokens
+and the generation of the CIX elements are timed.
+"""
+
+import os
+import sys
+import time
+import getopt
+import logging
+import tempfile
+import shutil
+from os.path import join, dirname, abspath
+
+log = logging.getLogger("codeintel.benchmarks.jscile")
+
+
+def _corpus(lexer, paths):
+    """Return a list of (path, tokens) for the .js files under `paths'."""
+    corpus = []
+    for path in paths:
+        if os.path.isfile(path):
+            filepaths = [path]
+        else:
+            filepaths = []
+            for dirpath, dirnames, filenames in os.walk(path):
+                filepaths += [join(dirpath, f) for f in filenames
+                              if f.endswith(".js")]
+        for filepath in sorted(filepaths):
+            fin = open(filepath, 'rb')
+            try:
+                content = fin.read().decode("utf-8", "replace")
+            finally:
+                fin.close()
+            corpus.append((filepath, lexer.tokenize_by_style(content)))
+    return corpus
+
+def time_scan(mgr, path, tokens, repeat=1):
+    """Return the best time (in seconds) to scan the given tokens over
+    `repeat' runs.
+    """
+    from codeintel2.lang_javascript import JavaScriptCiler
+    from ciElementTree import Element
+    best = None
+    for i in range(repeat):
+        start = time.time()
+        jscile = JavaScriptCiler(mgr, path)
+        jscile.scan_tokens(tokens)
+        jscile.convertToElementTreeFile(Element("codeintel"), "JavaScript")
+        t = time.time() - start
+        if best is None or t < best:
+            best = t
+    return best
+
+def main(argv):
+    logging.basicConfig()
+    try:
+        opts, args = getopt.getopt(argv[1:], "hn:", ["help", "repeat="])
+    except getopt.GetoptError, ex:
+        log.error(str(ex))
+        return 1
+    repeat = 1
+    for opt, optarg in opts:
+        if opt in ("-h", "--help"):
+            sys.stdout.write(__doc__)
+            return 0
+        elif opt in ("-n", "--repeat"):
+            repeat = int(optarg)
+
+    from codeintel2.manager import Manager
+    from codeintel2.lang_javascript import JavaScriptLexer
+    paths = args or [join(dirname(dirname(abspath(__file__))), "lib_srcs")]
+    db_base_dir = tempfile.mkdtemp(prefix="codeintel-bench-")
+    try:
+        mgr = Manager(db_base_dir=db_base_dir)
+        corpus = _corpus(JavaScriptLexer(mgr), paths)
+        total_time = 0.0
+        total_tokens = 0
+        for path, tokens in corpus:
+            try:
+                t = time_scan(mgr, path, tokens, repeat)
+            except Exception, ex:
+                print "%-40s error: %s" % (os.path.basename(path), ex)
+                continue
+            total_time += t
+            total_tokens += len(tokens)
+            print "%-40s %8d tokens %8.2fs %10.0f tokens/sec" % (
+                os.path.basename(path), len(tokens), t,
+                len(tokens) / max(t, 0.001))
+        if total_time:
+            print "total: %d files, %d tokens, %.2fs, %.0f tokens/sec" % (
+                len(corpus), total_tokens, total_time,
+                total_tokens / total_time)
+    finally:
+        shutil.rmtree(db_base_dir, ignore_errors=True)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
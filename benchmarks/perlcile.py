@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# Copyright (c) 2010 ActiveState Software Inc.
+# See LICENSE.txt for license details.
+
+"""Benchmark the Perl CILE.
+
+Usage:
+    python -m codeintel2.benchmarks.perlcile [<options>...] [<paths>...]
+
+Options:
+    -h, --help          dump this help and exit
+    -n, --repeat <n>    number of timing runs (the best is reported)
+    -p, --perl <path>   the perl whose @INC is scanned by default,
+                        default is the "perl" on the PATH
+    -d, --dump <dir>    write the CIX generated for each file to <dir>,
+                        to compare the output of two revisions of the
+                        Perl CILE (e.g. with "diff -r")
+
+Scans all the .pm and .pl files under the given paths (by default the
+@INC dirs of the perl, i.e. the core and CPAN modules: the initial scan
+of these is the slowest Perl indexing workload) as perlcile.scan_purelang()
+does, and reports tokens/sec for the largest files and overall.
+
+The files are lexed once up front: only the parser's handling of the
+tokens and the generation of the CIX are timed.
+"""
+
+import os
+import sys
+import time
+import getopt
+import logging
+from os.path import join, basename
+
+log = logging.getLogger("codeintel.benchmarks.perlcile")
+
+
+def _inc_dirs(perl):
+    import process
+    p = process.ProcessOpen([perl, "-e", r'print join("\n", @INC)'],
+                            stdin=None)
+    stdout, stderr = p.communicate()
+    return [d for d in stdout.splitlines() if d != "." and os.path.isdir(d)]
+
+def _corpus(lexer, paths):
+    """Return a list of (path, tokens) for the Perl files under `paths'."""
+    corpus = []
+    seen = set()
+    for path in paths:
+        if os.path.isfile(path):
+            filepaths = [path]
+        else:
+            filepaths = []
+            for dirpath, dirnames, filenames in os.walk(path):
+                filepaths += [join(dirpath, f) for f in filenames
+                              if os.path.splitext(f)[1] in (".pm", ".pl")]
+        for filepath in sorted(filepaths):
+            # The @INC dirs are nested.
+            if os.path.realpath(filepath) in seen:
+                continue
+            seen.add(os.path.realpath(filepath))
+            fin = open(filepath, 'rb')
+            try:
+                content = fin.read()
+            finally:
+                fin.close()
+            corpus.append((filepath, lexer.tokenize_by_style(content)))
+    return corpus
+
+def scan_tokens(path, tokens):
+    """Scan the given Perl tokens and return the CIX tree."""
+    from codeintel2 import perl_lexer, perl_parser, shared_lexer
+    tokens = shared_lexer.expand_tabs_in_tokens(tokens, 8,
+                                                adjust_indices=False)
+    tokenizer = perl_lexer.PerlLexer(None, False, tokens=tokens)
+    parser = perl_parser.Parser(tokenizer, provide_full_docs=False)
+    parser.moduleName = path
+    parser.parse()
+    return parser.produce_CIX()
+
+def time_scan(path, tokens, repeat=1):
+    """Return the best time (in seconds) to scan the given tokens over
+    `repeat' runs.
+    """
+    best = None
+    for i in range(repeat):
+        start = time.time()
+        scan_tokens(path, tokens)
+        t = time.time() - start
+        if best is None or t < best:
+            best = t
+    return best
+
+def main(argv):
+    logging.basicConfig()
+    try:
+        opts, args = getopt.getopt(argv[1:], "hn:p:d:",
+                                   ["help", "repeat=", "perl=", "dump="])
+    except getopt.GetoptError, ex:
+        log.error(str(ex))
+        return 1
+    repeat = 1
+    perl = "perl"
+    dump_dir = None
+    for opt, optarg in opts:
+        if opt in ("-h", "--help"):
+            sys.stdout.write(__doc__)
+            return 0
+        elif opt in ("-n", "--repeat"):
+            repeat = int(optarg)
+        elif opt in ("-p", "--perl"):
+            perl = optarg
+        elif opt in ("-d", "--dump"):
+            dump_dir = optarg
+
+    from codeintel2.perl_lexer import _get_silvercity_lexer
+    from ciElementTree import tostring
+    paths = args or _inc_dirs(perl)
+    corpus = _corpus(_get_silvercity_lexer(), paths)
+    total_time = 0.0
+    total_tokens = 0
+    timings = []
+    for path, tokens in corpus:
+        try:
+            t = time_scan(path, tokens, repeat)
+        except Exception, ex:
+            print "%-40s error: %s" % (basename(path), ex)
+            continue
+        total_time += t
+        total_tokens += len(tokens)
+        timings.append((t, path, len(tokens)))
+        if dump_dir:
+            if not os.path.exists(dump_dir):
+                os.makedirs(dump_dir)
+            name = path.replace(os.sep, "_").replace(":", "_") + ".cix"
+            fout = open(join(dump_dir, name), 'wb')
+            try:
+                fout.write(tostring(scan_tokens(path, tokens), "utf-8"))
+            finally:
+                fout.close()
+    timings.sort(reverse=True)
+    for t, path, num_tokens in timings[:10]:
+        print "%-40s %8d tokens %8.2fs %10.0f tokens/sec" % (
+            basename(path), num_tokens, t, num_tokens / max(t, 0.001))
+    if total_time:
+        print "total: %d files, %d tokens, %.2fs, %.0f tokens/sec" % (
+            len(corpus), total_tokens, total_time, total_tokens / total_time)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,219 @@
+#!/usr/bin/env python
+# Copyright (c) 2010 ActiveState Software Inc.
+# See LICENSE.txt for license details.
+
+"""Benchmark the PHP CILE on large files.
+
+Usage:
+    python -m codeintel2.benchmarks.phpcile [<options>...] [<paths>...]
+
+Options:
+    -h, --help          dump this help and exit
+    -n, --repeat <n>    number of timing runs (the best is reported)
+    -d, --dump <dir>    write the CIX generated for each file to <dir>,
+                        to compare the output of two revisions of the
+                        PHP CILE (e.g. with "diff -r")
+
+Scans the given .php files (or all the .php files under the given
+directories) with the PHPParser and reports tokens/sec per file and
+overall. By default a large PHP file is generated from each of the PHP
+stdlib CIX files shipped in "stdlibs": one class or function stub (with
+PHPDoc comments) per stdlib class or function, a few thousand in all,
+similar to Drupal/Magento-scale single files.
+
+The files are lexed once up front: only the parser's handling of the
+tokens and the generation of the CIX elements are timed.
+"""
+
+import os
+import sys
+import re
+import time
+import getopt
+import logging
+from glob import glob
+from os.path import join, dirname, abspath, basename, splitext
+
+log = logging.getLogger("codeintel.benchmarks.phpcile")
+
+
+_re_arg = re.compile(r'(?:([\w\\]+)\s+)?(&?)\$?(\w+)(\s*=\s*[^,\]\)]+)?')
+
+def _php_args(signature):
+    """Return the PHP argument list for the given CIX function signature,
+    e.g. "bind(Closure $old, object $to [, mixed $scope = "static" ] )".
+    """
+    arglist = signature[signature.find("(")+1:signature.rfind(")")]
+    args = []
+    for match in _re_arg.finditer(arglist.replace("[", "").replace("]", "")):
+        citdl, ref, name, default = match.groups()
+        arg = "%s$%s" % (ref, name)
+        if citdl and citdl not in ("mixed", "int", "string", "bool", "float"):
+            arg = "%s %s" % (citdl, arg)
+        if default:
+            arg += " = null"
+        args.append(arg)
+    return args
+
+def _php_function(lines, elem, indent=""):
+    doc = elem.get("doc") or ""
+    args = _php_args(elem.get("signature") or "")
+    lines.append(indent + "/**")
+    for docline in doc.splitlines():
+        lines.append(indent + " * " + docline)
+    for arg in args:
+        if " " in arg:
+            lines.append(indent + " * @param %s %s" % tuple(arg.split()[:2]))
+    if elem.get("returns"):
+        lines.append(indent + " * @return %s" % elem.get("returns"))
+    lines.append(indent + " */")
+    if indent:
+        lines.append(indent + "public function %s(%s) {"
+                     % (elem.get("name"), ", ".join(args)))
+        lines.append(indent + "    $result = $this->%s(%s);"
+                     % (elem.get("name"), ", ".join(a.split()[-1].lstrip("&")
+                                                    for a in args)))
+    else:
+        lines.append("function %s(%s) {" % (elem.get("name"), ", ".join(args)))
+        lines.append("    $result = array(1, 2, 'three' => \"four\");")
+    lines.append(indent + "    if ($result) {")
+    lines.append(indent + "        return new %s();" % (elem.get("returns")
+                                                        or "stdClass"))
+    lines.append(indent + "    }")
+    lines.append(indent + "    return $result;")
+    lines.append(indent + "}")
+
+def php_from_cix(cix_path):
+    """Return PHP source code with stubs for the classes and functions of
+    the given PHP stdlib CIX file.
+    """
+    from ciElementTree import parse
+    blob = parse(cix_path).getroot().find("file/scope")
+    lines = ["<?php", "// Generated from %s" % basename(cix_path), ""]
+    for elem in blob:
+        ilk = elem.get("ilk")
+        if ilk == "function":
+            _php_function(lines, elem)
+        elif ilk in ("class", "interface"):
+            header = "%s %s" % (ilk, elem.get("name"))
+            if elem.get("classrefs"):
+                header += " extends %s" % elem.get("classrefs").split()[0]
+            if elem.get("interfacerefs"):
+                header += " implements %s" % ", ".join(
+                    elem.get("interfacerefs").split())
+            lines.append(header + " {")
+            for child in elem:
+                if child.get("ilk") == "function":
+                    _php_function(lines, child, "    ")
+                elif child.get("ilk") == "constant":
+                    lines.append("    const %s = 1;" % child.get("name"))
+                elif child.tag == "variable":
+                    lines.append("    /** @var %s */" % (child.get("citdl")
+                                                         or "mixed"))
+                    lines.append("    public $%s = null;" % child.get("name"))
+            lines.append("}")
+        elif elem.tag == "variable":
+            lines.append("define('%s', %d);" % (elem.get("name"), len(lines)))
+        lines.append("")
+    lines.append("?>")
+    return "\n".join(lines)
+
+def _corpus(paths):
+    """Return a list of (name, content) for the PHP files to scan."""
+    corpus = []
+    if not paths:
+        stdlibs_dir = join(dirname(dirname(abspath(__file__))), "stdlibs")
+        for cix_path in sorted(glob(join(stdlibs_dir, "php-*.cix"))):
+            corpus.append((splitext(basename(cix_path))[0] + ".php",
+                           php_from_cix(cix_path)))
+        return corpus
+    for path in paths:
+        if os.path.isfile(path):
+            filepaths = [path]
+        else:
+            filepaths = []
+            for dirpath, dirnames, filenames in os.walk(path):
+                filepaths += [join(dirpath, f) for f in filenames
+                              if f.endswith(".php")]
+        for filepath in sorted(filepaths):
+            fin = open(filepath, 'rb')
+            try:
+                content = fin.read().decode("utf-8", "replace")
+            finally:
+                fin.close()
+            corpus.append((filepath, content))
+    return corpus
+
+def scan_tokens(path, tokens):
+    """Scan the given PHP tokens and return the CIX module element."""
+    from codeintel2.lang_php import PHPParser
+    from codeintel2.gencix_utils import (createCixRoot, createCixFile,
+                                         createCixModule)
+    cixfile = createCixFile(createCixRoot(), path, lang="PHP")
+    cixblob = createCixModule(cixfile, basename(path), "PHP", src=path)
+    phpciler = PHPParser(path)
+    for token in tokens:
+        phpciler.token_next(**token)
+    phpciler.convertToElementTreeModule(cixblob)
+    return cixblob
+
+def time_scan(path, tokens, repeat=1):
+    """Return the best time (in seconds) to scan the given tokens over
+    `repeat' runs.
+    """
+    best = None
+    for i in range(repeat):
+        start = time.time()
+        scan_tokens(path, tokens)
+        t = time.time() - start
+        if best is None or t < best:
+            best = t
+    return best
+
+def main(argv):
+    logging.basicConfig()
+    try:
+        opts, args = getopt.getopt(argv[1:], "hn:d:",
+                                   ["help", "repeat=", "dump="])
+    except getopt.GetoptError, ex:
+        log.error(str(ex))
+        return 1
+    repeat = 1
+    dump_dir = None
+    for opt, optarg in opts:
+        if opt in ("-h", "--help"):
+            sys.stdout.write(__doc__)
+            return 0
+        elif opt in ("-n", "--repeat"):
+            repeat = int(optarg)
+        elif opt in ("-d", "--dump"):
+            dump_dir = optarg
+
+    from codeintel2.lang_php import PHPLexer
+    from ciElementTree import tostring
+    lexer = PHPLexer()
+    total_time = 0.0
+    total_tokens = 0
+    corpus = _corpus(args)
+    for path, content in corpus:
+        tokens = lexer.tokenize_by_style(content)
+        t = time_scan(path, tokens, repeat)
+        total_time += t
+        total_tokens += len(tokens)
+        print "%-40s %8d tokens %8.2fs %10.0f tokens/sec" % (
+            basename(path), len(tokens), t, len(tokens) / max(t, 0.001))
+        if dump_dir:
+            if not os.path.exists(dump_dir):
+                os.makedirs(dump_dir)
+            fout = open(join(dump_dir, basename(path) + ".cix"), 'wb')
+            try:
+                fout.write(tostring(scan_tokens(path, tokens), "utf-8"))
+            finally:
+                fout.close()
+    if total_time:
+        print "total: %d files, %d tokens, %.2fs, %.0f tokens/sec" % (
+            len(corpus), total_tokens, total_time, total_tokens / total_time)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
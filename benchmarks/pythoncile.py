@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+# Copyright (c) 2010 ActiveState Software Inc.
+# See LICENSE.txt for license details.
+
+"""Benchmark and cross-check the Python CILEs.
+
+Usage:
+    python -m codeintel2.benchmarks.pythoncile [<options>...] [<paths>...]
+
+Options:
+    -h, --help          dump this help and exit
+    -n, --repeat <n>    number of timing runs (the best is reported)
+    -d, --diff          also compare the CIX of the two scanners for each
+                        file and list the files that differ
+    -L, --language <name>
+                        the language to scan as, default "Python"
+    -i, --incremental   also time rescanning each file after a one-line
+                        edit in one of its top-level definitions with
+                        pythoncile_ast.scan_et_incremental()
+
+Scans all the .py files under the given paths (by default the
+standard library of the running Python) with both the `compiler`-based
+pythoncile1 and the `ast`-based pythoncile_ast, and reports files/sec
+for each. The known differences in the CIX of the two (error and
+encoding cases) are listed and checked in test/test_pythoncile.py.
+"""
+
+import os
+import sys
+import time
+import getopt
+import logging
+import difflib
+import re
+from os.path import join, dirname
+
+log = logging.getLogger("codeintel.benchmarks.pythoncile")
+
+
+def _corpus(paths):
+    """Return a list of (path, content) for the .py files under `paths'."""
+    corpus = []
+    for path in paths:
+        if os.path.isfile(path):
+            filepaths = [path]
+        else:
+            filepaths = []
+            for dirpath, dirnames, filenames in os.walk(path):
+                filepaths += [join(dirpath, f) for f in filenames
+                              if f.endswith(".py")]
+        for filepath in sorted(filepaths):
+            fin = open(filepath, 'rb')
+            try:
+                corpus.append((filepath, fin.read()))
+            finally:
+                fin.close()
+    return corpus
+
+def _scan_cix(scanner, path, content, lang):
+    try:
+        return scanner.scan_cix(content, path, lang=lang)
+    except Exception, ex:
+        return "%s: %s" % (ex.__class__.__name__, ex)
+
+def time_scanner(scanner, corpus, lang="Python", repeat=1):
+    """Return the best time (in seconds) to scan the corpus over `repeat'
+    runs.
+    """
+    best = None
+    for i in range(repeat):
+        start = time.time()
+        for path, content in corpus:
+            try:
+                scanner.scan_et(content, path, lang=lang)
+            except Exception:
+                pass
+        t = time.time() - start
+        if best is None or t < best:
+            best = t
+    return best
+
+_def_header_re = re.compile(r"^(def|class)\b.*:[ \t]*$", re.M)
+
+def _edited(content):
+    """Return the content with a comment line added in the middle
+    top-level definition, or None if there is no suitable definition.
+    """
+    headers = list(_def_header_re.finditer(content))
+    if not headers:
+        return None
+    end = headers[len(headers) // 2].end()
+    return content[:end] + "\n    # edited" + content[end:]
+
+def time_incremental(scanner, corpus, lang="Python", repeat=1):
+    """Return (<full time>, <incremental time>, <num files>): the best
+    times (in seconds) to rescan the files of the corpus after an edit
+    with a full and with an incremental scan.
+    """
+    edits = []
+    for path, content in corpus:
+        edited = _edited(content)
+        if edited is not None:
+            edits.append((path, content, edited))
+    best_full = best_incr = None
+    for i in range(repeat):
+        t_full = t_incr = 0.0
+        for path, content, edited in edits:
+            try:
+                el, state = scanner.scan_et_incremental(content, path,
+                                                        lang=lang)
+                start = time.time()
+                scanner.scan_et_incremental(edited, path, state, lang=lang)
+                t_incr += time.time() - start
+                start = time.time()
+                scanner.scan_et(edited, path, lang=lang)
+                t_full += time.time() - start
+            except Exception:
+                pass
+        if best_full is None or t_full < best_full:
+            best_full = t_full
+        if best_incr is None or t_incr < best_incr:
+            best_incr = t_incr
+    return best_full, best_incr, len(edits)
+
+def diff_scanners(scanner_a, scanner_b, corpus, lang="Python"):
+    """Generate (<path>, <diff-lines>) for each file in the corpus for
+    which the two scanners produce different CIX.
+    """
+    for path, content in corpus:
+        cix_a = _scan_cix(scanner_a, path, content, lang)
+        cix_b = _scan_cix(scanner_b, path, content, lang)
+        if cix_a != cix_b:
+            lines_a = cix_a.replace("><", ">\n<").splitlines(0)
+            lines_b = cix_b.replace("><", ">\n<").splitlines(0)
+            yield path, list(difflib.unified_diff(lines_a, lines_b,
+                                                  scanner_a.__name__,
+                                                  scanner_b.__name__,
+                                                  lineterm=""))
+
+def main(argv):
+    logging.basicConfig()
+    try:
+        opts, args = getopt.getopt(argv[1:], "hn:dL:i",
+            ["help", "repeat=", "diff", "language=", "incremental"])
+    except getopt.GetoptError, ex:
+        log.error(str(ex))
+        return 1
+    repeat = 1
+    diff = False
+    incremental = False
+    lang = "Python"
+    for opt, optarg in opts:
+        if opt in ("-h", "--help"):
+            sys.stdout.write(__doc__)
+            return 0
+        elif opt in ("-n", "--repeat"):
+            repeat = int(optarg)
+        elif opt in ("-d", "--diff"):
+            diff = True
+        elif opt in ("-L", "--language"):
+            lang = optarg
+        elif opt in ("-i", "--incremental"):
+            incremental = True
+
+    from codeintel2 import pythoncile1, pythoncile_ast
+    paths = args or [dirname(os.__file__)]
+    corpus = _corpus(paths)
+    nbytes = sum(len(content) for path, content in corpus)
+    print "corpus: %d files, %.1f MB" % (len(corpus), nbytes / 1024.0 / 1024)
+
+    times = {}
+    for scanner in (pythoncile1, pythoncile_ast):
+        t = times[scanner] = time_scanner(scanner, corpus, lang, repeat)
+        print "%-16s %8.2fs %10.1f files/sec" % (
+            scanner.__name__.rsplit('.', 1)[-1], t, len(corpus) / t)
+    print "speedup: %.2fx" % (times[pythoncile1] / times[pythoncile_ast])
+
+    if incremental:
+        t_full, t_incr, num_edits = time_incremental(pythoncile_ast, corpus,
+                                                     lang, repeat)
+        print "rescan after edit (%d files):" % num_edits
+        print "    full        %8.2fs %10.1f files/sec" % (
+            t_full, num_edits / t_full)
+        print "    incremental %8.2fs %10.1f files/sec" % (
+            t_incr, num_edits / t_incr)
+
+    if diff:
+        num_diffs = 0
+        for path, diff_lines in diff_scanners(pythoncile1, pythoncile_ast,
+                                              corpus, lang):
+            num_diffs += 1
+            print "CIX differs: %s" % path
+            for line in diff_lines[:20]:
+                print "    " + line
+        print "%d of %d files have different CIX" % (num_diffs, len(corpus))
+        if num_diffs:
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,252 @@
+#!/usr/bin/env python
+# Copyright (c) 2010 ActiveState Software Inc.
+# See LICENSE.txt for license details.
+
+"""Benchmark the Ruby CILE.
+
+Usage:
+    python -m codeintel2.benchmarks.rubycile [<options>...] [<paths>...]
+
+Options:
+    -h, --help          dump this help and exit
+    -n, --repeat <n>    number of timing runs (the best is reported)
+    -r, --ruby <path>   the ruby whose $: (load path) is scanned by
+                        default, default is the "ruby" on the PATH
+    -a, --rails <n>     also scan a Rails app with <n> models (and as many
+                        controllers, helpers, migrations and tests),
+                        generated in a temporary dir, default is 100
+    -d, --dump <dir>    write the CIX generated for each file to <dir>,
+                        to compare the output of two revisions of the
+                        Ruby CILE (e.g. with "diff -r"), not done for
+                        the generated Rails app
+
+Scans all the .rb files under the given paths (by default the load path
+dirs of the ruby, i.e. the stdlib, e.g. of ruby-1.9.3) as the Ruby CILE
+driver does, including the Rails bits added to the files of a Rails app
+(see rubycile.check_insert_rails_env()), and reports tokens/sec for the
+largest files and overall. A real Rails app can be given as one of the
+paths.
+
+The files are lexed once up front: only the parser's handling of the
+tokens and the generation of the CIX are timed.
+"""
+
+import os
+import sys
+import time
+import getopt
+import logging
+import tempfile
+import shutil
+from os.path import join, basename, dirname, exists
+
+log = logging.getLogger("codeintel.benchmarks.rubycile")
+
+
+def _load_path_dirs(ruby):
+    import process
+    p = process.ProcessOpen([ruby, "-e", "puts $:"], stdin=None)
+    stdout, stderr = p.communicate()
+    return [d for d in stdout.splitlines() if d != "." and os.path.isdir(d)]
+
+def _write_file(path, content):
+    if not exists(dirname(path)):
+        os.makedirs(dirname(path))
+    fout = open(path, 'w')
+    try:
+        fout.write(content)
+    finally:
+        fout.close()
+
+def make_rails_app(app_root, num_models):
+    """Generate a Rails app with `num_models' models under `app_root'."""
+    _write_file(join(app_root, "app", "controllers", "application.rb"),
+                "class ApplicationController < ActionController::Base\n"
+                "  helper :all\n"
+                "end\n")
+    for i in range(num_models):
+        name = "thing%d" % i
+        cls = "Thing%d" % i
+        _write_file(join(app_root, "app", "models", name + ".rb"),
+            "# A %(cls)s.\n"
+            "class %(cls)s < ActiveRecord::Base\n"
+            "  belongs_to :owner\n"
+            "  has_many :parts\n"
+            "  attr_accessor :label, :weight\n"
+            "\n"
+            "  def full_name(prefix=\"\")\n"
+            "    @full_name = prefix + label.to_s\n"
+            "  end\n"
+            "end\n" % locals())
+        _write_file(join(app_root, "app", "controllers",
+                         name + "s_controller.rb"),
+            "class %(cls)ssController < ApplicationController\n"
+            "  def index\n"
+            "    @%(name)ss = %(cls)s.find(:all)\n"
+            "  end\n"
+            "\n"
+            "  def show\n"
+            "    @%(name)s = %(cls)s.find(params[:id])\n"
+            "  end\n"
+            "end\n" % locals())
+        _write_file(join(app_root, "app", "helpers",
+                         name + "s_helper.rb"),
+            "module %(cls)ssHelper\n"
+            "  def %(name)s_link(%(name)s)\n"
+            "    link_to %(name)s.full_name, %(name)s\n"
+            "  end\n"
+            "end\n" % locals())
+        _write_file(join(app_root, "db", "migrate",
+                         "%03d_create_%ss.rb" % (i + 1, name)),
+            "class Create%(cls)ss < ActiveRecord::Migration\n"
+            "  def self.up\n"
+            "    create_table :%(name)ss do |t|\n"
+            "      t.column :label, :string\n"
+            "      t.column :weight, :integer\n"
+            "      t.timestamps\n"
+            "    end\n"
+            "  end\n"
+            "\n"
+            "  def self.down\n"
+            "    drop_table :%(name)ss\n"
+            "  end\n"
+            "end\n" % locals())
+        _write_file(join(app_root, "test", "unit", name + "_test.rb"),
+            "require File.dirname(__FILE__) + '/../test_helper'\n"
+            "\n"
+            "class %(cls)sTest < ActiveSupport::TestCase\n"
+            "  def test_truth\n"
+            "    assert true\n"
+            "  end\n"
+            "end\n" % locals())
+        _write_file(join(app_root, "test", "functional",
+                         name + "s_controller_test.rb"),
+            "require File.dirname(__FILE__) + '/../test_helper'\n"
+            "\n"
+            "class %(cls)ssControllerTest < ActionController::TestCase\n"
+            "  def test_index\n"
+            "    get :index\n"
+            "    assert_response :success\n"
+            "  end\n"
+            "end\n" % locals())
+
+def _corpus(lexer, paths):
+    """Return a list of (path, tokens) for the Ruby files under `paths'."""
+    corpus = []
+    seen = set()
+    for path in paths:
+        if os.path.isfile(path):
+            filepaths = [path]
+        else:
+            filepaths = []
+            for dirpath, dirnames, filenames in os.walk(path):
+                filepaths += [join(dirpath, f) for f in filenames
+                              if f.endswith(".rb")]
+        for filepath in sorted(filepaths):
+            # The load path dirs are nested.
+            if os.path.realpath(filepath) in seen:
+                continue
+            seen.add(os.path.realpath(filepath))
+            fin = open(filepath, 'rb')
+            try:
+                content = fin.read().decode("utf-8", "replace")
+            finally:
+                fin.close()
+            corpus.append((filepath, lexer.tokenize_by_style(content)))
+    return corpus
+
+def scan_tokens(path, tokens):
+    """Scan the given Ruby tokens as the Ruby CILE driver does and return
+    the CIX tree.
+    """
+    from codeintel2 import rubycile
+    tree = rubycile.scan_purelang(None, path, tokens=tokens)
+    rubycile.check_insert_rails_env(path, tree.find("file/scope"))
+    return tree
+
+def time_scan(path, tokens, repeat=1):
+    """Return the best time (in seconds) to scan the given tokens over
+    `repeat' runs.
+    """
+    best = None
+    for i in range(repeat):
+        start = time.time()
+        scan_tokens(path, tokens)
+        t = time.time() - start
+        if best is None or t < best:
+            best = t
+    return best
+
+def _report(title, corpus, repeat, dump_dir=None):
+    from ciElementTree import tostring
+    total_time = 0.0
+    total_tokens = 0
+    timings = []
+    for path, tokens in corpus:
+        try:
+            t = time_scan(path, tokens, repeat)
+        except Exception, ex:
+            print "%-40s error: %s" % (basename(path), ex)
+            continue
+        total_time += t
+        total_tokens += len(tokens)
+        timings.append((t, path, len(tokens)))
+        if dump_dir:
+            if not os.path.exists(dump_dir):
+                os.makedirs(dump_dir)
+            name = path.replace(os.sep, "_").replace(":", "_") + ".cix"
+            fout = open(join(dump_dir, name), 'wb')
+            try:
+                fout.write(tostring(scan_tokens(path, tokens), "utf-8"))
+            finally:
+                fout.close()
+    print "%s:" % title
+    timings.sort(reverse=True)
+    for t, path, num_tokens in timings[:10]:
+        print "  %-38s %8d tokens %8.2fs %10.0f tokens/sec" % (
+            basename(path), num_tokens, t, num_tokens / max(t, 0.001))
+    if total_time:
+        print "  total: %d files, %d tokens, %.2fs, %.0f tokens/sec" % (
+            len(corpus), total_tokens, total_time, total_tokens / total_time)
+
+def main(argv):
+    logging.basicConfig()
+    try:
+        opts, args = getopt.getopt(argv[1:], "hn:r:a:d:",
+            ["help", "repeat=", "ruby=", "rails=", "dump="])
+    except getopt.GetoptError, ex:
+        log.error(str(ex))
+        return 1
+    repeat = 1
+    ruby = "ruby"
+    num_models = 100
+    dump_dir = None
+    for opt, optarg in opts:
+        if opt in ("-h", "--help"):
+            sys.stdout.write(__doc__)
+            return 0
+        elif opt in ("-n", "--repeat"):
+            repeat = int(optarg)
+        elif opt in ("-r", "--ruby"):
+            ruby = optarg
+        elif opt in ("-a", "--rails"):
+            num_models = int(optarg)
+        elif opt in ("-d", "--dump"):
+            dump_dir = optarg
+
+    from codeintel2.ruby_lexer import _get_silvercity_lexer
+    lexer = _get_silvercity_lexer()
+    paths = args or _load_path_dirs(ruby)
+    _report(", ".join(paths), _corpus(lexer, paths), repeat, dump_dir)
+    if num_models:
+        app_root = tempfile.mkdtemp(prefix="codeintel-bench-rails-")
+        try:
+            make_rails_app(app_root, num_models)
+            _report("Rails app (%d models)" % num_models,
+                    _corpus(lexer, [app_root]), repeat)
+        finally:
+            shutil.rmtree(app_root, ignore_errors=True)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
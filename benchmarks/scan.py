@@ -0,0 +1,310 @@
+#!/usr/bin/env python
+# Copyright (c) 2010 ActiveState Software Inc.
+# See LICENSE.txt for license details.
+
+"""Benchmark the scanning throughput of the CILEs of all languages.
+
+Usage:
+    python -m codeintel2.benchmarks.scan [<options>...] <lang>=<path>...
+    python -m codeintel2.benchmarks.scan --compare <old.json> <new.json>
+
+Options:
+    -h, --help          dump this help and exit
+    -n, --repeat <n>    number of timing runs per file (the best is
+                        reported), default is 3
+    -s, --slowest <n>   number of slowest files to report per language,
+                        default is 5
+    -o, --output <path> also write the results as JSON to <path>
+    -b, --baseline <path>
+                        compare the results with those of an earlier run
+                        (written with --output) and flag regressions
+    -c, --compare       compare the results in two JSON files (the
+                        arguments) instead of running the benchmark
+    -t, --threshold <percent>
+                        the change beyond which a difference is flagged
+                        as a regression, default is 10
+
+Scans the files of each language under the given corpus paths (e.g.
+"Python=/usr/lib/python2.7", "PHP=~/src/drupal") with the CILE driver of
+the language, as the indexer does (`CILEDriver.scan_purelang()`, which
+calls `scan_multilang()` for multi-lang buffers), and reports files/sec,
+MB/sec, the peak memory use and the slowest files per language. Only the
+files whose language is guessed (from the extension) as the one given
+are scanned.
+
+To keep runs comparable, each language is run in a fresh Python process,
+the files are scanned in a fixed order, after a warm-up scan, with a
+fresh buffer (i.e. lexing included) and a garbage collection before each
+timed scan.
+
+When comparing, a change of files/sec or MB/sec down, or of peak memory
+up, by more than the threshold is flagged as a regression, and the exit
+status is 2. The JSON results of benchmarks.completion can be compared
+too (their "cold" and "warm" latencies).
+"""
+
+import os
+import sys
+import time
+import getopt
+import logging
+import tempfile
+import shutil
+import gc
+from os.path import join, expanduser
+
+try:
+    import json
+except ImportError:
+    json = None
+
+from codeintel2.benchmarks import peak_rss_mb, run_in_child
+
+log = logging.getLogger("codeintel.benchmarks.scan")
+
+
+# The metrics compared between runs: {<name>: <1 if higher is better,
+# -1 if lower is better>}.
+_direction_from_metric = {
+    "files_per_sec": 1,
+    "mb_per_sec": 1,
+    "peak_rss_mb": -1,
+    # benchmarks.completion results
+    "cold": -1,
+    "warm": -1,
+}
+
+
+def _corpus(lang, paths):
+    """Return the sorted list of the `lang' files under `paths'."""
+    from codeintel2.common import CodeIntelError
+    from codeintel2.util import guess_lang_from_path
+    filepaths = set()
+    for path in paths:
+        if os.path.isfile(path):
+            filepaths.add(path)
+            continue
+        for dirpath, dirnames, filenames in os.walk(path):
+            for filename in filenames:
+                try:
+                    if guess_lang_from_path(filename) == lang:
+                        filepaths.add(join(dirpath, filename))
+                except CodeIntelError:
+                    pass
+    return sorted(filepaths)
+
+def time_scan(mgr, lang, path, repeat=3):
+    """Return the best time (in seconds) to scan the given file over
+    `repeat' runs and the scan error, if any.
+    """
+    cile_driver = mgr.citadel.cile_driver_from_lang(lang)
+    best = None
+    error = None
+    for i in range(repeat):
+        buf = mgr.buf_from_path(path, lang=lang)
+        gc.collect()
+        start = time.time()
+        tree = cile_driver.scan_purelang(buf)
+        t = time.time() - start
+        if best is None or t < best:
+            best = t
+        error = tree[0].get("error")
+    return best, error
+
+def run_lang(lang, paths, repeat=3, num_slowest=5):
+    """Scan the `lang' files under the given paths (in this process) and
+    return their stats:
+        {"num_files": <n>, "bytes": <n>, "seconds": <total scan time>,
+         "files_per_sec": <n>, "mb_per_sec": <n>, "errors": <n>,
+         "peak_rss_mb": <MB or None>,
+         "slowest": [[<path>, <seconds>], ...]}
+    """
+    from codeintel2.manager import Manager
+    filepaths = _corpus(lang, paths)
+    db_base_dir = tempfile.mkdtemp(prefix="codeintel-bench-db-")
+    mgr = Manager(db_base_dir=db_base_dir)
+    try:
+        mgr.upgrade()
+        mgr.initialize()
+        if filepaths:
+            time_scan(mgr, lang, filepaths[0], 1)  # warm-up
+        total_time = 0.0
+        total_bytes = 0
+        num_errors = 0
+        timings = []
+        for path in filepaths:
+            try:
+                t, error = time_scan(mgr, lang, path, repeat)
+            except Exception, ex:
+                log.debug("error scanning '%s'", path, exc_info=True)
+                num_errors += 1
+                continue
+            if error:
+                num_errors += 1
+            total_time += t
+            total_bytes += os.path.getsize(path)
+            timings.append((t, path))
+        timings.sort(reverse=True)
+        return {"num_files": len(timings),
+                "bytes": total_bytes,
+                "seconds": total_time,
+                "files_per_sec": total_time and len(timings)/total_time or 0,
+                "mb_per_sec": total_time
+                              and total_bytes/(1024.0*1024.0)/total_time or 0,
+                "errors": num_errors,
+                "peak_rss_mb": peak_rss_mb(),
+                "slowest": [[path, t] for t, path in timings[:num_slowest]]}
+    finally:
+        mgr.finalize()
+        shutil.rmtree(db_base_dir, ignore_errors=True)
+
+def run(paths_from_lang, repeat=3, num_slowest=5):
+    """Run the benchmark and return the results:
+        {"benchmark": "scan", "results": {<lang>: <stats>}, ...}
+    See `run_lang()' for the stats.
+    """
+    data = {"benchmark": "scan",
+            "time": time.time(),
+            "python": sys.version.split()[0],
+            "platform": sys.platform,
+            "repeat": repeat,
+            "results": {}}
+    for lang in sorted(paths_from_lang):
+        data["results"][lang] = run_in_child("scan", "run_lang", lang,
+            paths_from_lang[lang], repeat, num_slowest)
+    return data
+
+def compare(old_data, new_data, threshold=10.0):
+    """Compare the results of two runs and return a list of
+        (<key>, <metric>, <old value>, <new value>, <change in percent>,
+         <is regression>)
+    for the metrics in both. A change for the worse by more than
+    `threshold' percent is a regression.
+    """
+    diffs = []
+    old_results = old_data["results"]
+    new_results = new_data["results"]
+    for key in sorted(set(old_results) & set(new_results)):
+        for metric in sorted(_direction_from_metric):
+            old_value = old_results[key].get(metric)
+            new_value = new_results[key].get(metric)
+            if not old_value or new_value is None:
+                continue
+            change = (new_value - old_value) * 100.0 / old_value
+            is_regression \
+                = -change * _direction_from_metric[metric] > threshold
+            diffs.append((key, metric, old_value, new_value, change,
+                          is_regression))
+    return diffs
+
+def _report(data):
+    print "%-12s %7s %9s %9s %9s %7s %9s" % ("lang", "files", "MB",
+        "files/s", "MB/s", "errors", "peak MB")
+    for lang in sorted(data["results"]):
+        stats = data["results"][lang]
+        print "%-12s %7d %9.2f %9.1f %9.3f %7d %9s" % (
+            lang, stats["num_files"], stats["bytes"]/(1024.0*1024.0),
+            stats["files_per_sec"], stats["mb_per_sec"], stats["errors"],
+            stats["peak_rss_mb"] is not None
+                and "%.1f" % stats["peak_rss_mb"] or "-")
+    for lang in sorted(data["results"]):
+        slowest = data["results"][lang]["slowest"]
+        if slowest:
+            print "%s slowest files:" % lang
+            for path, t in slowest:
+                print "  %8.1fms %s" % (t*1000, path)
+
+def _report_diffs(diffs):
+    """Print the diffs and return the number of regressions."""
+    num_regressions = 0
+    print "%-40s %-14s %12s %12s %8s" % ("", "metric", "old", "new",
+                                         "change")
+    for key, metric, old_value, new_value, change, is_regression in diffs:
+        print "%-40s %-14s %12.4f %12.4f %+7.1f%%%s" % (
+            key, metric, old_value, new_value, change,
+            is_regression and "  REGRESSION" or "")
+        if is_regression:
+            num_regressions += 1
+    if num_regressions:
+        print "%d regression(s) flagged" % num_regressions
+    return num_regressions
+
+def _load_json(path):
+    fin = open(path, 'r')
+    try:
+        return json.load(fin)
+    finally:
+        fin.close()
+
+def main(argv):
+    logging.basicConfig()
+    try:
+        opts, args = getopt.getopt(argv[1:], "hn:s:o:b:ct:",
+            ["help", "repeat=", "slowest=", "output=", "baseline=",
+             "compare", "threshold="])
+    except getopt.GetoptError, ex:
+        log.error(str(ex))
+        return 1
+    repeat = 3
+    num_slowest = 5
+    output_path = None
+    baseline_path = None
+    compare_only = False
+    threshold = 10.0
+    for opt, optarg in opts:
+        if opt in ("-h", "--help"):
+            sys.stdout.write(__doc__)
+            return 0
+        elif opt in ("-n", "--repeat"):
+            repeat = int(optarg)
+        elif opt in ("-s", "--slowest"):
+            num_slowest = int(optarg)
+        elif opt in ("-o", "--output"):
+            output_path = optarg
+        elif opt in ("-b", "--baseline"):
+            baseline_path = optarg
+        elif opt in ("-c", "--compare"):
+            compare_only = True
+        elif opt in ("-t", "--threshold"):
+            threshold = float(optarg)
+    if json is None:
+        log.error("this benchmark requires the 'json' module")
+        return 1
+
+    if compare_only:
+        if len(args) != 2:
+            log.error("--compare takes two JSON result files, got %d "
+                      "argument(s)", len(args))
+            return 1
+        diffs = compare(_load_json(args[0]), _load_json(args[1]), threshold)
+        return _report_diffs(diffs) and 2 or 0
+
+    paths_from_lang = {}
+    for arg in args:
+        if '=' not in arg:
+            log.error("invalid corpus argument, expected <lang>=<path>: "
+                      "'%s'", arg)
+            return 1
+        lang, path = arg.split('=', 1)
+        paths_from_lang.setdefault(lang, []).append(expanduser(path))
+    if not paths_from_lang:
+        log.error("no corpus given: see `--help'")
+        return 1
+
+    data = run(paths_from_lang, repeat, num_slowest)
+    _report(data)
+    if output_path:
+        fout = open(output_path, 'w')
+        try:
+            json.dump(data, fout, indent=2, sort_keys=True)
+        finally:
+            fout.close()
+    if baseline_path:
+        print
+        diffs = compare(_load_json(baseline_path), data, threshold)
+        if _report_diffs(diffs):
+            return 2
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# Copyright (c) 2010 ActiveState Software Inc.
+# See LICENSE.txt for license details.
+
+"""Benchmark codeintel Manager startup time.
+
+Usage:
+    python -m codeintel2.benchmarks.startup [-n <repeat>]
+
+Each sample is run in a fresh Python process (so module imports are
+cold) and times `Manager()` construction with and without lazy language
+module registration, and the first use of one language (Python) after
+it. The number of imported modules is also reported.
+"""
+
+import sys
+import getopt
+import logging
+import subprocess
+import tempfile
+import shutil
+
+from codeintel2.benchmarks import child_env
+
+log = logging.getLogger("codeintel.benchmarks.startup")
+
+
+_child_script = r"""
+import sys, time
+t0 = time.time()
+from codeintel2.manager import Manager
+t1 = time.time()
+mgr = Manager(db_base_dir=%(db_base_dir)r, lazy_lang_modules=%(lazy)r)
+t2 = time.time()
+nmodules = len(sys.modules)
+mgr.langintel_from_lang("Python")
+mgr.citadel.cile_driver_from_lang("Python")
+t3 = time.time()
+print "%%f %%f %%f %%d" %% (t1-t0, t2-t1, t3-t2, nmodules)
+"""
+
+def _sample(db_base_dir, lazy):
+    script = _child_script % {"db_base_dir": db_base_dir, "lazy": lazy}
+    p = subprocess.Popen([sys.executable, "-c", script], env=child_env(),
+                         stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    stdout, stderr = p.communicate()
+    if p.returncode:
+        raise RuntimeError("benchmark child failed: %s" % stderr)
+    t_import, t_mgr, t_first_use, nmodules = stdout.split()
+    return float(t_import), float(t_mgr), float(t_first_use), int(nmodules)
+
+def _median(values):
+    values = sorted(values)
+    return values[len(values)//2]
+
+def run(repeat=5):
+    """Return {<mode>: (import, Manager(), first-use, num-modules)} with
+    the median times (in seconds) over `repeat' samples.
+    """
+    db_base_dir = tempfile.mkdtemp(prefix="codeintel-bench-")
+    try:
+        results = {}
+        for mode, lazy in (("eager", False), ("lazy", True)):
+            samples = [_sample(db_base_dir, lazy) for i in range(repeat)]
+            results[mode] = tuple(_median([s[i] for s in samples])
+                                  for i in range(4))
+        return results
+    finally:
+        shutil.rmtree(db_base_dir, ignore_errors=True)
+
+def main(argv):
+    logging.basicConfig()
+    try:
+        opts, args = getopt.getopt(argv[1:], "hn:", ["help", "repeat="])
+    except getopt.GetoptError, ex:
+        log.error(str(ex))
+        return 1
+    repeat = 5
+    for opt, optarg in opts:
+        if opt in ("-h", "--help"):
+            sys.stdout.write(__doc__)
+            return 0
+        elif opt in ("-n", "--repeat"):
+            repeat = int(optarg)
+
+    results = run(repeat)
+    print "%-6s %10s %12s %12s %9s" % ("mode", "import", "Manager()",
+                                         "first-use", "modules")
+    for mode in ("eager", "lazy"):
+        t_import, t_mgr, t_first_use, nmodules = results[mode]
+        print "%-6s %9.1fms %11.1fms %11.1fms %9d" % (
+            mode, t_import*1000, t_mgr*1000, t_first_use*1000, nmodules)
+    eager, lazy = results["eager"], results["lazy"]
+    print "Manager() startup saving: %.1fms (%d fewer modules imported)" % (
+        (eager[1] - lazy[1])*1000, eager[3] - lazy[3])
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
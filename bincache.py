@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+# Copyright (c) 2010 ActiveState Software Inc.
+# See LICENSE.txt for license details.
+
+"""A cache of the CIX generated for binary modules.
+
+Scanning a binary module (e.g. a Python extension, see pybinary.py) means
+loading it into an interpreter, which is slow. The same binary module
+file is typically scanned again and again: for every environment using
+the same site-packages, after every reset of the database, etc. This
+cache saves the CIX from those scans by file *content*, so that a scan is
+only done once per (file content, interpreter version, scanner version).
+
+The cache is a directory of "<key>.cix" files, where the key is a digest
+of the file size, file content digest, interpreter version, scanner
+version and the version of the cache's user (the database: the cache
+survives its resets but not an upgrade of the CIX it stores). The file
+mtime is only used to avoid re-digesting an unchanged file. The mtime of
+a cache file is its last use: when the cache grows beyond its size cap
+the least recently used entries are removed.
+
+Usage:
+    cache = BinaryScanCache(cache_dir, version)
+    cix = cache.get(path, interpreter_ver, scanner_ver)
+    if cix is None:
+        cix = <scan the binary module>
+        cache.put(path, interpreter_ver, scanner_ver, cix)
+"""
+
+import os
+from os.path import join, exists, getsize
+import logging
+import threading
+from hashlib import sha1
+
+from codeintel2.util import write_file_atomically
+
+
+log = logging.getLogger("codeintel.bincache")
+
+
+class BinaryScanCache(object):
+    # The default size cap of the cache in bytes.
+    MAX_SIZE = 20 * 1024 * 1024
+
+    def __init__(self, cache_dir, version, max_size=None):
+        self.cache_dir = cache_dir
+        self.version = version
+        if max_size is not None:
+            self.max_size = max_size
+        else:
+            self.max_size = self.MAX_SIZE
+        self._lock = threading.RLock()
+        # Content digests of binary module files, to not re-read an
+        # unchanged file: {<path>: (<size>, <mtime>, <digest>)}
+        self._digest_from_path = {}
+        # Total size of the cache files, None until first needed.
+        self._total_size = None
+
+    def __repr__(self):
+        return "<BinaryScanCache '%s'>" % self.cache_dir
+
+    def _file_digest(self, path):
+        """Return (<size>, <content digest>) for the given file."""
+        st = os.stat(path)
+        size, mtime = st.st_size, st.st_mtime
+        self._lock.acquire()
+        try:
+            cached = self._digest_from_path.get(path)
+        finally:
+            self._lock.release()
+        if cached is not None and cached[:2] == (size, mtime):
+            return size, cached[2]
+
+        hasher = sha1()
+        fin = open(path, 'rb')
+        try:
+            while True:
+                chunk = fin.read(65536)
+                if not chunk:
+                    break
+                hasher.update(chunk)
+        finally:
+            fin.close()
+        digest = hasher.hexdigest()
+        self._lock.acquire()
+        try:
+            self._digest_from_path[path] = (size, mtime, digest)
+        finally:
+            self._lock.release()
+        return size, digest
+
+    def _cache_path(self, path, interpreter_ver, scanner_ver):
+        size, digest = self._file_digest(path)
+        key = sha1("%d\n%s\n%s\n%s\n%s" % (size, digest, interpreter_ver,
+                                           scanner_ver, self.version)
+                  ).hexdigest()
+        return join(self.cache_dir, key + ".cix")
+
+    def get(self, path, interpreter_ver, scanner_ver):
+        """Return the cached CIX for the given binary module file as
+        scanned with the given interpreter and scanner versions, or None
+        if not cached.
+        """
+        try:
+            cache_path = self._cache_path(path, interpreter_ver, scanner_ver)
+            fin = open(cache_path, 'rb')
+        except EnvironmentError:
+            return None
+        try:
+            cix = fin.read()
+        finally:
+            fin.close()
+        try:
+            os.utime(cache_path, None)  # mark as recently used
+        except EnvironmentError:
+            pass
+        log.debug("cache hit for '%s' (%s): '%s'", path, interpreter_ver,
+                  cache_path)
+        return cix
+
+    def put(self, path, interpreter_ver, scanner_ver, cix):
+        """Cache the CIX for the given binary module file as scanned with
+        the given interpreter and scanner versions.
+
+        Failures to write the cache are logged and otherwise ignored.
+        """
+        self._lock.acquire()
+        try:
+            try:
+                cache_path = self._cache_path(path, interpreter_ver,
+                                              scanner_ver)
+                if not exists(self.cache_dir):
+                    log.debug("fs-write: create binary scan cache dir '%s'",
+                              self.cache_dir)
+                    os.makedirs(self.cache_dir)
+                total_size = self._get_total_size()
+                if exists(cache_path):
+                    total_size -= getsize(cache_path)
+                log.debug("fs-write: '%s' CIX to '%s'", path, cache_path)
+                write_file_atomically(cache_path, cix)
+                self._total_size = total_size + len(cix)
+            except EnvironmentError, ex:
+                log.warn("could not cache CIX for '%s': %s", path, ex)
+                return
+            if self._total_size > self.max_size:
+                self.prune()
+        finally:
+            self._lock.release()
+
+    def _get_total_size(self):
+        if self._total_size is None:
+            self._total_size = sum(size for p, size, mtime
+                                   in self._gen_entries())
+        return self._total_size
+
+    def _gen_entries(self):
+        """Generate (<cache-path>, <size>, <mtime>) for each cache entry."""
+        try:
+            names = os.listdir(self.cache_dir)
+        except EnvironmentError:
+            return
+        for name in names:
+            if not name.endswith(".cix"):
+                continue
+            cache_path = join(self.cache_dir, name)
+            try:
+                st = os.stat(cache_path)
+            except EnvironmentError:
+                continue  # removed by another process
+            yield cache_path, st.st_size, st.st_mtime
+
+    def prune(self, max_size=None):
+        """Remove the least recently used entries until the cache is at
+        most 3/4 of `max_size` bytes (by default the cache's size cap).
+        """
+        if max_size is None:
+            max_size = self.max_size
+        target_size = max_size * 3 // 4
+        self._lock.acquire()
+        try:
+            entries = sorted(self._gen_entries(), key=lambda e: e[2])
+            total_size = sum(e[1] for e in entries)
+            num_removed = 0
+            for cache_path, size, mtime in entries:
+                if total_size <= target_size:
+                    break
+                try:
+                    os.remove(cache_path)
+                except EnvironmentError, ex:
+                    log.debug("could not remove '%s': %s", cache_path, ex)
+                    continue
+                total_size -= size
+                num_removed += 1
+            self._total_size = total_size
+            if num_removed:
+                log.info("pruned %d entries from '%s'", num_removed,
+                         self.cache_dir)
+        finally:
+            self._lock.release()
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        self.prune(0)
@@ -63,6 +63,7 @@ from codeintel2.buffer import Buffer
 from codeintel2.common import *
 from codeintel2.indexer import ScanRequest
 from codeintel2.langintel import LangIntel
+from codeintel2.metrics import metrics
 
 
 
@@ -247,6 +248,22 @@ class CitadelBuffer(Buffer):
         The results are stored on the buffer to be retrieved via the
         scan_time/scan_error/blob_from_lang properties.
         """
+        scan_tree, mtime, scan_error = self._scan_without_db_update(mtime)
+
+        # Put it into the database.
+        self.mgr.db.update_buf_data(self, scan_tree, mtime, scan_error,
+                                    skip_scan_time_check=skip_scan_time_check)
+        self._load_buf_data_once(True)
+
+    def _cile_scan(self, cile_driver):
+        return cile_driver.scan_purelang(self)
+
+    def _scan_without_db_update(self, mtime=None):
+        """Scan the current buffer, but don't put the results in the db.
+
+        Returns (<scan_tree>, <mtime>, <scan_error>) for
+        `Database.update_buf_data()`. See `Citadel.scan_bufs()`.
+        """
         if self.path is None:
             raise CodeIntelError("cannot scan %s buffer: 'path' is not set (setting "
                                  "a fake path starting with '<Unsaved>' is okay)"
@@ -262,8 +279,9 @@ class CitadelBuffer(Buffer):
         #      <file error="..."> mechanism in favour of just raising
         #      CILEError.
         scan_tree = None
+        start = time.time()
         try:
-            scan_tree = cile_driver.scan_purelang(self)
+            scan_tree = self._cile_scan(cile_driver)
         except CodeIntelError, ex:
             exc_info = sys.exc_info()
             exc_class, exc, tb = sys.exc_info()
@@ -279,6 +297,9 @@ class CitadelBuffer(Buffer):
                          % (msg, exc, tb_path, tb_lineno, tb_func)
         else:
             scan_error = scan_tree[0].get("error")
+        metrics.observe("scan.%s" % self.lang, time.time() - start)
+        if scan_error:
+            metrics.incr("scan.errors")
 
         self.acquire_lock()
         try:
@@ -286,11 +307,7 @@ class CitadelBuffer(Buffer):
             self._scan_error_cache = scan_error
         finally:
             self.release_lock()
-
-        # Put it into the database.
-        self.mgr.db.update_buf_data(self, scan_tree, mtime, scan_error,
-                                    skip_scan_time_check=skip_scan_time_check)
-        self._load_buf_data_once(True)
+        return scan_tree, mtime, scan_error
 
     def scoperef_from_pos(self, pos):
         """Return the scoperef for the given position in this buffer.
@@ -367,49 +384,15 @@ class BinaryBuffer(CitadelBuffer):
         super(BinaryBuffer, self).__init__(mgr, None, env, path, None)
         
     def scan(self, mtime=None, skip_scan_time_check=False):
-        if self.path is None:
-            raise CodeIntelError("cannot scan %s buffer: 'path' is not set (setting "
-                                 "a fake path starting with '<Unsaved>' is okay)"
-                                 % self.lang)
-
-        cile_driver = self.mgr.citadel.cile_driver_from_lang(self.lang)
-        if mtime is None:
-            mtime = time.time()
-
-        scan_tree = None
-        try:
-            scan_tree = cile_driver.scan_binary(self)
-        except CodeIntelError, ex:
-            exc_info = sys.exc_info()
-            exc_class, exc, tb = sys.exc_info()
-            tb_path, tb_lineno, tb_func = traceback.extract_tb(tb)[-1][:3]
-            scan_error = "%s (%s:%s in %s)" % (exc, tb_path, tb_lineno, tb_func)
-        except Exception, ex:
-            msg = "unexpected error scanning `%s'" % basename(self.path)
-            log.exception(msg)
-            exc_info = sys.exc_info()
-            exc_class, exc, tb = sys.exc_info()
-            tb_path, tb_lineno, tb_func = traceback.extract_tb(tb)[-1][:3]
-            scan_error = "%s: %s (%s:%s in %s)"\
-                         % (msg, exc, tb_path, tb_lineno, tb_func)
-        else:
-            scan_error = scan_tree[0].get("error")
-
-        self.acquire_lock()
-        try:
-            self._scan_time_cache = mtime
-            self._scan_error_cache = scan_error
-        finally:
-            self.release_lock()
-
-        # Put it into the database.
-        self.mgr.db.update_buf_data(self, scan_tree, mtime, scan_error,
-                                    skip_scan_time_check=skip_scan_time_check)
-        self._load_buf_data_once(True)
+        CitadelBuffer.scan(self, mtime=mtime,
+                           skip_scan_time_check=skip_scan_time_check)
         
         #TODO: potential race condition here with Buffer.cached_sections().
         self._sections_cache = None
 
+    def _cile_scan(self, cile_driver):
+        return cile_driver.scan_binary(self)
+
     def string_styles(self):
         return []
         
@@ -567,6 +550,18 @@ class ImportHandler:
 
         """
         raise NotImplementedError("find_importables_in_dir: virtual method")
+
+    def _listing_of_dir(self, dir):
+        """Return (<sub-dir names>, <other entry names>) -- both sets --
+        for the given dir, or None if it cannot be listed.
+
+        The listing comes from the dir listing cache shared by all import
+        handlers (see dircache.py): one stat() if the dir is unchanged.
+        """
+        listing = self.mgr.db.dir_listing_cache.listing(dir)
+        if listing is None:
+            return None
+        return set(listing[0]), set(listing[1])
     
     def import_blob_name(self, import_name, libs, ctlr):
         """Return the blob tree for the given import name and libs.
@@ -724,11 +719,20 @@ class Citadel(object):
         if is_cpln_lang:
             self._is_citadel_cpln_from_lang[lang] = True
 
+    def set_deferred_lang_info(self, lang, is_cpln_lang=False):
+        """Note a Citadel lang whose support module has not been loaded
+        yet. Its CILE driver is set by `set_lang_info()` on first use.
+        """
+        if is_cpln_lang:
+            self._is_citadel_cpln_from_lang[lang] = True
+
     def cile_driver_from_lang(self, lang):
         """Return the CILE driver for this language.
         
         Raises KeyError if there isn't one registered.
         """
+        if lang not in self._cile_driver_from_lang:
+            self.mgr.ensure_lang_registered(lang)
         return self._cile_driver_from_lang[lang]
 
     def is_citadel_cpln_lang(self, lang):
@@ -742,6 +746,23 @@ class Citadel(object):
     def finalize(self):
         pass
 
+    def scan_bufs(self, bufs, mtime=None, skip_scan_time_check=False):
+        """Scan the given buffers and put the results in the db as one
+        batch (see `Database.update_bufs_data()`).
+
+        This is like calling `buf.scan(...)` for each buffer, except that
+        the db indexes of each dir are updated once for all of the
+        buffers in it, rather than once per buffer.
+        """
+        buf_datas = [(buf, ) + buf._scan_without_db_update(mtime)
+                     for buf in bufs]
+        self.mgr.db.update_bufs_data(buf_datas,
+            skip_scan_time_check=skip_scan_time_check)
+        for buf in bufs:
+            buf._load_buf_data_once(True)
+            if isinstance(buf, BinaryBuffer):
+                buf._sections_cache = None
+
     def import_handler_from_lang(self, lang):
         """Return an "import"-handler for the given language.
 
@@ -751,6 +772,7 @@ class Citadel(object):
         TODO: move this to Manager class.
         """
         if lang not in self._import_handler_from_lang:
+            self.mgr.ensure_lang_registered(lang)
             try:
                 self._import_handler_from_lang[lang] \
                     = self.mgr.import_handler_class_from_lang[lang](self.mgr)
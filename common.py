@@ -479,6 +479,9 @@ class EvalController(object):
         self.defns = None
         self.desc = None
         self.keep_existing = False
+        # A PhaseTracer recording the timing of the evaluation, if
+        # enabled. See .enable_tracing().
+        self.tracer = None
 
     def close(self):
         """Done with this eval controller, clear any references"""
@@ -494,6 +497,17 @@ class EvalController(object):
     def set_desc(self, desc):
         self.desc = desc
 
+    def enable_tracing(self):
+        """Record the timing of the phases of the evaluation, and of the
+        database lookups it makes, in `self.tracer`.
+
+        Call this before requesting the evaluation. The trace can then
+        be exported, e.g. with `self.tracer.write_chrome_trace(path)`,
+        to diagnose a slow completion without debug logging.
+        """
+        from codeintel2.tracing import PhaseTracer
+        self.tracer = PhaseTracer("eval")
+
     def done(self, reason):
         """Called by the evaluation engine to indicate completion handling
         has finished."""
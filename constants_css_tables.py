@@ -0,0 +1,1491 @@
+#!/usr/bin/env python
+# Copyright (c) 2010 ActiveState Software Inc.
+# See LICENSE.txt for license details.
+
+"""
+The CSS property and value tables used for CSS completions and calltips.
+
+These are the CSS 1/2/3 and Microsoft/Mozilla/WebKit extension tables of
+the constants_css* modules, merged, sorted for display (see
+util.OrdPunctLast) and with the calltips wrapped. Building them from
+those modules (merging dicts, text wrapping hundreds of calltips) takes
+longer than importing the result, so they are generated into this module
+rather than built on import.
+
+Regenerate this module after changing any of the constants_css* modules:
+
+    python -m codeintel2.constants_css_tables
+"""
+
+import sys
+
+
+def _generate():
+    """Return the auto generated section of this module."""
+    from codeintel2.util import OrdPunctLast
+    from codeintel2 import constants_css3 as constants_css
+    from codeintel2 import constants_css_microsoft_extensions
+    from codeintel2 import constants_css_moz_extensions
+    from codeintel2 import constants_css_webkit_extensions
+
+    attrs = constants_css.CSS_ATTR_DICT.copy()
+    attrs.update(constants_css_microsoft_extensions.CSS_MICROSOFT_SPECIFIC_ATTRS_DICT)
+    attrs.update(constants_css_moz_extensions.CSS_MOZ_SPECIFIC_ATTRS_DICT)
+    attrs.update(constants_css_webkit_extensions.CSS_WEBKIT_SPECIFIC_ATTRS_DICT)
+    calltips = constants_css.CSS_PROPERTY_ATTRIBUTE_CALLTIPS_DICT.copy()
+    calltips.update(constants_css_microsoft_extensions.CSS_MICROSOFT_SPECIFIC_CALLTIP_DICT)
+    calltips.update(constants_css_moz_extensions.CSS_MOZ_SPECIFIC_CALLTIP_DICT)
+    calltips.update(constants_css_webkit_extensions.CSS_WEBKIT_SPECIFIC_CALLTIP_DICT)
+
+    lines = []
+    lines.append("# The CSS property names, in completion order.")
+    lines.append("CSS_PROPERTY_NAMES = (")
+    for name in sorted(attrs, key=OrdPunctLast):
+        lines.append("    %r," % (name, ))
+    lines.append(")")
+    lines.append("")
+    lines.append("# The values of each CSS property, in completion order.")
+    lines.append("CSS_ATTRIBUTES = {")
+    for name in sorted(attrs):
+        values = tuple(sorted(attrs[name] or [], key=OrdPunctLast))
+        lines.append("    %r: %r," % (name, values))
+    lines.append("}")
+    lines.append("")
+    lines.append("# Calltips for the CSS properties.")
+    lines.append("CSS_PROPERTY_ATTRIBUTE_CALLTIPS_DICT = {")
+    for name in sorted(calltips):
+        lines.append("    %r: %r," % (name, calltips[name]))
+    lines.append("}")
+    lines.append("")
+    lines.append("# The CSS pseudo-class names, in completion order.")
+    lines.append("CSS_PSEUDO_CLASS_NAMES = (")
+    for name in sorted(constants_css.CSS_PSEUDO_CLASS_NAMES, key=OrdPunctLast):
+        lines.append("    %r," % (name, ))
+    lines.append(")")
+    return "\n".join(lines) + "\n"
+
+def main(argv):
+    path = __file__
+    if path.endswith((".pyc", ".pyo")):
+        path = path[:-1]
+    fin = open(path, 'r')
+    try:
+        content = fin.read()
+    finally:
+        fin.close()
+    start_marker = "### START: Auto generated\n"
+    end_marker = "### END: Auto generated\n"
+    start = content.index(start_marker) + len(start_marker)
+    end = content.index(end_marker, start)
+    content = content[:start] + "\n" + _generate() + "\n" + content[end:]
+    fout = open(path, 'w')
+    try:
+        fout.write(content)
+    finally:
+        fout.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
+
+
+### START: Auto generated
+
+# The CSS property names, in completion order.
+CSS_PROPERTY_NAMES = (
+    'alignment-adjust',
+    'alignment-baseline',
+    'animation',
+    'animation-delay',
+    'animation-direction',
+    'animation-duration',
+    'animation-iteration-count',
+    'animation-name',
+    'animation-play-state',
+    'animation-timing-function',
+    'appearance',
+    'background',
+    'background-attachment',
+    'background-clip',
+    'background-color',
+    'background-image',
+    'background-origin',
+    'background-position',
+    'background-repeat',
+    'background-size',
+    'baseline-shift',
+    'binding',
+    'bookmark-label',
+    'bookmark-level',
+    'bookmark-target',
+    'border',
+    'border-bottom',
+    'border-bottom-color',
+    'border-bottom-left-radius',
+    'border-bottom-right-radius',
+    'border-bottom-style',
+    'border-bottom-width',
+    'border-collapse',
+    'border-color',
+    'border-image',
+    'border-left',
+    'border-left-color',
+    'border-left-style',
+    'border-left-width',
+    'border-radius',
+    'border-right',
+    'border-right-color',
+    'border-right-style',
+    'border-right-width',
+    'border-spacing',
+    'border-style',
+    'border-top',
+    'border-top-color',
+    'border-top-left-radius',
+    'border-top-right-radius',
+    'border-top-style',
+    'border-top-width',
+    'border-width',
+    'bottom',
+    'box-align',
+    'box-decoration-break',
+    'box-direction',
+    'box-flex',
+    'box-flex-group',
+    'box-lines',
+    'box-ordinal-group',
+    'box-orient',
+    'box-pack',
+    'box-shadow',
+    'box-sizing',
+    'break-after',
+    'break-before',
+    'break-inside',
+    'caption-side',
+    'clear',
+    'color',
+    'color-profile',
+    'columns',
+    'column-count',
+    'column-fill',
+    'column-gap',
+    'column-rule',
+    'column-rule-color',
+    'column-rule-style',
+    'column-rule-width',
+    'column-span',
+    'column-width',
+    'content',
+    'counter-increment',
+    'counter-reset',
+    'crop',
+    'cue',
+    'cue-after',
+    'cue-before',
+    'cursor',
+    'direction',
+    'display',
+    'dominant-baseline',
+    'drop-initial-after-adjust',
+    'drop-initial-after-align',
+    'drop-initial-before-adjust',
+    'drop-initial-before-align',
+    'drop-initial-size',
+    'drop-initial-value',
+    'elevation',
+    'empty-cells',
+    'fit',
+    'fit-position',
+    'float',
+    'float-offset',
+    'font',
+    'font-family',
+    'font-size',
+    'font-size-adjust',
+    'font-stretch',
+    'font-style',
+    'font-variant',
+    'font-weight',
+    'grid-columns',
+    'grid-rows',
+    'hanging-punctuation',
+    'height',
+    'hyphenate-after',
+    'hyphenate-before',
+    'hyphenate-character',
+    'hyphenate-lines',
+    'hyphenate-resource',
+    'hyphens',
+    'icon',
+    'image-orientation',
+    'image-resolution',
+    'inline-box-align',
+    'left',
+    'letter-spacing',
+    'line-height',
+    'line-stacking',
+    'line-stacking-ruby',
+    'line-stacking-shift',
+    'line-stacking-strategy',
+    'list-style',
+    'list-style-image',
+    'list-style-position',
+    'list-style-type',
+    'margin',
+    'margin-bottom',
+    'margin-left',
+    'margin-right',
+    'margin-top',
+    'mark',
+    'marker-offset',
+    'marks',
+    'mark-after',
+    'mark-before',
+    'marquee-direction',
+    'marquee-play-count',
+    'marquee-speed',
+    'marquee-style',
+    'max-height',
+    'max-width',
+    'min-height',
+    'min-width',
+    'move-to',
+    'nav-down',
+    'nav-index',
+    'nav-left',
+    'nav-right',
+    'nav-up',
+    'opacity',
+    'orphans',
+    'outline',
+    'outline-color',
+    'outline-offset',
+    'outline-style',
+    'outline-width',
+    'overflow',
+    'overflow-style',
+    'overflow-x',
+    'overflow-y',
+    'padding',
+    'padding-bottom',
+    'padding-left',
+    'padding-right',
+    'padding-top',
+    'page',
+    'page-break-after',
+    'page-break-before',
+    'page-break-inside',
+    'page-policy',
+    'pause',
+    'pause-after',
+    'pause-before',
+    'phonemes',
+    'pitch',
+    'pitch-range',
+    'play-during',
+    'position',
+    'presentation-level',
+    'punctuation-trim',
+    'quotes',
+    'rendering-intent',
+    'resize',
+    'rest',
+    'rest-after',
+    'rest-before',
+    'richness',
+    'right',
+    'rotation',
+    'rotation-point',
+    'ruby-align',
+    'ruby-overhang',
+    'ruby-position',
+    'ruby-span',
+    'size',
+    'speak',
+    'speak-header',
+    'speak-numeral',
+    'speak-punctuation',
+    'speech-rate',
+    'stress',
+    'string-set',
+    'table-layout',
+    'target',
+    'target-name',
+    'target-new',
+    'target-position',
+    'text-align',
+    'text-align-last',
+    'text-decoration',
+    'text-emphasis',
+    'text-height',
+    'text-indent',
+    'text-justify',
+    'text-outline',
+    'text-shadow',
+    'text-transform',
+    'text-wrap',
+    'top',
+    'transition',
+    'transition-delay',
+    'transition-duration',
+    'transition-property',
+    'transition-timing-function',
+    'unicode-bidi',
+    'vertical-align',
+    'visibility',
+    'voice-balance',
+    'voice-duration',
+    'voice-family',
+    'voice-pitch',
+    'voice-pitch-range',
+    'voice-rate',
+    'voice-stress',
+    'voice-volume',
+    'volume',
+    'white-space',
+    'white-space-collapse',
+    'widows',
+    'width',
+    'word-break',
+    'word-spacing',
+    'word-wrap',
+    'z-index',
+    '-moz-appearance',
+    '-moz-background-clip',
+    '-moz-background-inline-policy',
+    '-moz-background-origin',
+    '-moz-background-size',
+    '-moz-binding',
+    '-moz-border-bottom-colors',
+    '-moz-border-end',
+    '-moz-border-end-color',
+    '-moz-border-end-style',
+    '-moz-border-end-width',
+    '-moz-border-image',
+    '-moz-border-left-colors',
+    '-moz-border-radius',
+    '-moz-border-radius-bottomleft',
+    '-moz-border-radius-bottomright',
+    '-moz-border-radius-topleft',
+    '-moz-border-radius-topright',
+    '-moz-border-right-colors',
+    '-moz-border-start',
+    '-moz-border-start-color',
+    '-moz-border-start-style',
+    '-moz-border-start-width',
+    '-moz-border-top-colors',
+    '-moz-box-align',
+    '-moz-box-direction',
+    '-moz-box-flex',
+    '-moz-box-flexgroup',
+    '-moz-box-ordinal-group',
+    '-moz-box-orient',
+    '-moz-box-pack',
+    '-moz-box-shadow',
+    '-moz-box-sizing',
+    '-moz-column-count',
+    '-moz-column-gap',
+    '-moz-column-rule',
+    '-moz-column-rule-color',
+    '-moz-column-rule-style',
+    '-moz-column-rule-width',
+    '-moz-column-width',
+    '-moz-float-edge',
+    '-moz-force-broken-image-icon',
+    '-moz-image-region',
+    '-moz-margin-end',
+    '-moz-margin-start',
+    '-moz-opacity',
+    '-moz-outline',
+    '-moz-outline-color',
+    '-moz-outline-offset',
+    '-moz-outline-radius',
+    '-moz-outline-radius-bottomleft',
+    '-moz-outline-radius-bottomright',
+    '-moz-outline-radius-topleft',
+    '-moz-outline-radius-topright',
+    '-moz-outline-style',
+    '-moz-outline-width',
+    '-moz-padding-end',
+    '-moz-padding-start',
+    '-moz-stack-sizing',
+    '-moz-transform',
+    '-moz-transform-origin',
+    '-moz-transition',
+    '-moz-transition-delay',
+    '-moz-transition-duration',
+    '-moz-transition-property',
+    '-moz-transition-timing-function',
+    '-moz-user-focus',
+    '-moz-user-input',
+    '-moz-user-modify',
+    '-moz-user-select',
+    '-moz-window-shadow',
+    '-ms-accelerator',
+    '-ms-background-position-x',
+    '-ms-background-position-y',
+    '-ms-behavior',
+    '-ms-block-progression',
+    '-ms-filter',
+    '-ms-ime-mode',
+    '-ms-interpolation-mode',
+    '-ms-layout-grid',
+    '-ms-layout-grid-char',
+    '-ms-layout-grid-line',
+    '-ms-layout-grid-mode',
+    '-ms-layout-grid-type',
+    '-ms-line-break',
+    '-ms-line-grid-mode',
+    '-ms-overflow-x',
+    '-ms-overflow-y',
+    '-ms-scrollbar-3dlight-color',
+    '-ms-scrollbar-arrow-color',
+    '-ms-scrollbar-base-color',
+    '-ms-scrollbar-darkshadow-color',
+    '-ms-scrollbar-face-color',
+    '-ms-scrollbar-highlight-color',
+    '-ms-scrollbar-shadow-color',
+    '-ms-scrollbar-track-color',
+    '-ms-text-align-last',
+    '-ms-text-autospace',
+    '-ms-text-justify',
+    '-ms-text-kashida-space',
+    '-ms-text-overflow',
+    '-ms-text-underline-position',
+    '-ms-word-break',
+    '-ms-word-wrap',
+    '-ms-writing-mode',
+    '-ms-zoom',
+    '-webkit-animation',
+    '-webkit-animation-delay',
+    '-webkit-animation-direction',
+    '-webkit-animation-duration',
+    '-webkit-animation-iteration-count',
+    '-webkit-animation-name',
+    '-webkit-animation-play-state',
+    '-webkit-animation-timing-function',
+    '-webkit-appearance',
+    '-webkit-backface-visibility',
+    '-webkit-background-clip',
+    '-webkit-background-composite',
+    '-webkit-background-origin',
+    '-webkit-background-size',
+    '-webkit-border-bottom-left-radius',
+    '-webkit-border-bottom-right-radius',
+    '-webkit-border-horizontal-spacing',
+    '-webkit-border-image',
+    '-webkit-border-radius',
+    '-webkit-border-top-left-radius',
+    '-webkit-border-top-right-radius',
+    '-webkit-border-vertical-spacing',
+    '-webkit-box-align',
+    '-webkit-box-direction',
+    '-webkit-box-flex',
+    '-webkit-box-flex-group',
+    '-webkit-box-lines',
+    '-webkit-box-ordinal-group',
+    '-webkit-box-orient',
+    '-webkit-box-pack',
+    '-webkit-box-reflect',
+    '-webkit-box-shadow',
+    '-webkit-box-sizing',
+    '-webkit-columns',
+    '-webkit-column-break-after',
+    '-webkit-column-break-before',
+    '-webkit-column-break-inside',
+    '-webkit-column-count',
+    '-webkit-column-gap',
+    '-webkit-column-rule',
+    '-webkit-column-rule-color',
+    '-webkit-column-rule-style',
+    '-webkit-column-rule-width',
+    '-webkit-column-width',
+    '-webkit-dashboard-region',
+    '-webkit-line-break',
+    '-webkit-margin-bottom-collapse',
+    '-webkit-margin-collapse',
+    '-webkit-margin-start',
+    '-webkit-margin-top-collapse',
+    '-webkit-marquee',
+    '-webkit-marquee-direction',
+    '-webkit-marquee-increment',
+    '-webkit-marquee-repetition',
+    '-webkit-marquee-speed',
+    '-webkit-marquee-style',
+    '-webkit-mask',
+    '-webkit-mask-attachment',
+    '-webkit-mask-box-image',
+    '-webkit-mask-clip',
+    '-webkit-mask-composite',
+    '-webkit-mask-image',
+    '-webkit-mask-origin',
+    '-webkit-mask-position',
+    '-webkit-mask-position-x',
+    '-webkit-mask-position-y',
+    '-webkit-mask-repeat',
+    '-webkit-mask-size',
+    '-webkit-nbsp-mode',
+    '-webkit-padding-start',
+    '-webkit-perspective',
+    '-webkit-perspective-origin',
+    '-webkit-rtl-ordering',
+    '-webkit-tap-highlight-color',
+    '-webkit-text-fill-color',
+    '-webkit-text-security',
+    '-webkit-text-size-adjust',
+    '-webkit-text-stroke',
+    '-webkit-text-stroke-color',
+    '-webkit-text-stroke-width',
+    '-webkit-touch-callout',
+    '-webkit-transform',
+    '-webkit-transform-origin',
+    '-webkit-transform-origin-x',
+    '-webkit-transform-origin-y',
+    '-webkit-transform-origin-z',
+    '-webkit-transform-style',
+    '-webkit-transition',
+    '-webkit-transition-delay',
+    '-webkit-transition-duration',
+    '-webkit-transition-property',
+    '-webkit-transition-timing-function',
+    '-webkit-user-drag',
+    '-webkit-user-modify',
+    '-webkit-user-select',
+)
+
+# The values of each CSS property, in completion order.
+CSS_ATTRIBUTES = {
+    '-moz-appearance': ('button', 'checkbox', 'checkbox-container', 'checkbox-small', 'dialog', 'listbox', 'menuitem', 'menulist', 'menulist-button', 'menulist-textfield', 'menupopup', 'none', 'progressbar', 'radio', 'radio-container', 'radio-small', 'resizer', 'scrollbar', 'scrollbarbutton-down', 'scrollbarbutton-left', 'scrollbarbutton-right', 'scrollbarbutton-up', 'scrollbartrack-horizontal', 'scrollbartrack-vertical', 'separator', 'statusbar', 'tab', 'tabpanels', 'tab-left-edge', 'textfield', 'toolbar', 'toolbarbutton', 'toolbox', 'tooltip', 'treeheadercell', 'treeheadersortarrow', 'treeitem', 'treetwisty', 'treetwistyopen', 'treeview', 'window', '-moz-mac-unified-toolbar', '-moz-win-browsertabbar-toolbox', '-moz-win-communications-toolbox', '-moz-win-glass', '-moz-win-media-toolbox'),
+    '-moz-background-clip': ('border', 'border-box', 'content-box', 'padding', 'padding-box'),
+    '-moz-background-inline-policy': ('bounding-box', 'continuous', 'each-box'),
+    '-moz-background-origin': ('border', 'border-box', 'content', 'content-box', 'padding', 'padding-box'),
+    '-moz-background-size': ('auto', 'contain', 'cover', '<length>', '<percentage>'),
+    '-moz-binding': ('none', '<uri>'),
+    '-moz-border-bottom-colors': (),
+    '-moz-border-end': (),
+    '-moz-border-end-color': (),
+    '-moz-border-end-style': (),
+    '-moz-border-end-width': (),
+    '-moz-border-image': ('none', 'stretch', '<border-width>', '<image>', '<number>'),
+    '-moz-border-left-colors': (),
+    '-moz-border-radius': ('<length>', '<percentage>'),
+    '-moz-border-radius-bottomleft': (),
+    '-moz-border-radius-bottomright': (),
+    '-moz-border-radius-topleft': ('<length>', '<percentage>'),
+    '-moz-border-radius-topright': (),
+    '-moz-border-right-colors': (),
+    '-moz-border-start': (),
+    '-moz-border-start-color': (),
+    '-moz-border-start-style': (),
+    '-moz-border-start-width': (),
+    '-moz-border-top-colors': ('none', '<color>'),
+    '-moz-box-align': ('baseline', 'center', 'end', 'start', 'stretch'),
+    '-moz-box-direction': ('normal', 'reverse'),
+    '-moz-box-flex': ('0',),
+    '-moz-box-flexgroup': (),
+    '-moz-box-ordinal-group': (),
+    '-moz-box-orient': ('horizontal', 'vertical'),
+    '-moz-box-pack': ('center', 'end', 'justify', 'start'),
+    '-moz-box-shadow': ('inset', '<blur-radius>', '<color>', '<offset-x>', '<spread-radius>'),
+    '-moz-box-sizing': (),
+    '-moz-column-count': ('<integer>',),
+    '-moz-column-gap': ('normal', '<length>'),
+    '-moz-column-rule': ('<border-style>', '<border-width>', '<color>'),
+    '-moz-column-rule-color': ('<color>',),
+    '-moz-column-rule-style': ('<border-style>',),
+    '-moz-column-rule-width': ('<border-width>',),
+    '-moz-column-width': ('<length>',),
+    '-moz-float-edge': (),
+    '-moz-force-broken-image-icon': ('<integer>',),
+    '-moz-image-region': (),
+    '-moz-margin-end': ('<length>', '<percentage>'),
+    '-moz-margin-start': ('<length>', '<percentage>'),
+    '-moz-opacity': ('0', '1'),
+    '-moz-outline': (),
+    '-moz-outline-color': (),
+    '-moz-outline-offset': (),
+    '-moz-outline-radius': ('<length>', '<percentage>'),
+    '-moz-outline-radius-bottomleft': (),
+    '-moz-outline-radius-bottomright': (),
+    '-moz-outline-radius-topleft': (),
+    '-moz-outline-radius-topright': (),
+    '-moz-outline-style': (),
+    '-moz-outline-width': (),
+    '-moz-padding-end': ('<length>', '<percentage>'),
+    '-moz-padding-start': ('<length>', '<percentage>'),
+    '-moz-stack-sizing': ('ignore', 'stretch-to-fit'),
+    '-moz-transform': ('none', 'transform-function'),
+    '-moz-transform-origin': ('bottom', 'center', 'left', 'right', 'top', '<length>', '<percentage>'),
+    '-moz-transition': (),
+    '-moz-transition-delay': ('time',),
+    '-moz-transition-duration': ('time',),
+    '-moz-transition-property': ('all', 'none', 'property-name'),
+    '-moz-transition-timing-function': ('cubic-bezier', 'ease', 'ease-in', 'ease-in-out', 'ease-out', 'linear'),
+    '-moz-user-focus': ('ignore', 'normal'),
+    '-moz-user-input': ('disabled', 'enabled', 'none'),
+    '-moz-user-modify': (),
+    '-moz-user-select': ('all', 'none', 'text', '-moz-none'),
+    '-moz-window-shadow': ('default', 'none'),
+    '-ms-accelerator': (),
+    '-ms-background-position-x': (),
+    '-ms-background-position-y': (),
+    '-ms-behavior': (),
+    '-ms-block-progression': (),
+    '-ms-filter': ('progid:DXImageTransform.Microsoft.Alpha', 'progid:DXImageTransform.Microsoft.BasicImage', 'progid:DXImageTransform.Microsoft.Blur', 'progid:DXImageTransform.Microsoft.Chroma', 'progid:DXImageTransform.Microsoft.Compositor', 'progid:DXImageTransform.Microsoft.DropShadow', 'progid:DXImageTransform.Microsoft.Emboss', 'progid:DXImageTransform.Microsoft.Engrave', 'progid:DXImageTransform.Microsoft.Glow', 'progid:DXImageTransform.Microsoft.ICMFilter', 'progid:DXImageTransform.Microsoft.Light', 'progid:DXImageTransform.Microsoft.MaskFilter', 'progid:DXImageTransform.Microsoft.Matrix', 'progid:DXImageTransform.Microsoft.MotionBlur', 'progid:DXImageTransform.Microsoft.Shadow', 'progid:DXImageTransform.Microsoft.Wave'),
+    '-ms-ime-mode': (),
+    '-ms-interpolation-mode': (),
+    '-ms-layout-grid': (),
+    '-ms-layout-grid-char': (),
+    '-ms-layout-grid-line': (),
+    '-ms-layout-grid-mode': (),
+    '-ms-layout-grid-type': (),
+    '-ms-line-break': (),
+    '-ms-line-grid-mode': (),
+    '-ms-overflow-x': (),
+    '-ms-overflow-y': (),
+    '-ms-scrollbar-3dlight-color': (),
+    '-ms-scrollbar-arrow-color': (),
+    '-ms-scrollbar-base-color': (),
+    '-ms-scrollbar-darkshadow-color': (),
+    '-ms-scrollbar-face-color': (),
+    '-ms-scrollbar-highlight-color': (),
+    '-ms-scrollbar-shadow-color': (),
+    '-ms-scrollbar-track-color': (),
+    '-ms-text-align-last': (),
+    '-ms-text-autospace': (),
+    '-ms-text-justify': (),
+    '-ms-text-kashida-space': (),
+    '-ms-text-overflow': (),
+    '-ms-text-underline-position': (),
+    '-ms-word-break': (),
+    '-ms-word-wrap': (),
+    '-ms-writing-mode': (),
+    '-ms-zoom': (),
+    '-webkit-animation': (u'delay', u'direction', u'duration', u'iteration_count', u'name', u'timing_function'),
+    '-webkit-animation-delay': (u'0', u'now'),
+    '-webkit-animation-direction': (u'alternate', u'normal'),
+    '-webkit-animation-duration': (u'0', u'<time>'),
+    '-webkit-animation-iteration-count': (u'1', u'infinite'),
+    '-webkit-animation-name': (u'name',),
+    '-webkit-animation-play-state': (u'paused', u'running'),
+    '-webkit-animation-timing-function': (u'ease', u'ease-in', u'ease-in-out', u'ease-out', u'linear', u'<function>'),
+    '-webkit-appearance': (u'button', u'button-bevel', u'caps-lock-indicator', u'caret', u'checkbox', u'default-button', u'listbox', u'listitem', u'media-fullscreen-button', u'media-mute-button', u'media-play-button', u'media-seek-back-button', u'media-seek-forward-button', u'media-slider', u'media-sliderthumb', u'menulist', u'menulist-button', u'menulist-text', u'menulist-textfield', u'none', u'push-button', u'radio', u'scrollbarbutton-down', u'scrollbarbutton-left', u'scrollbarbutton-right', u'scrollbarbutton-up', u'scrollbargripper-horizontal', u'scrollbargripper-vertical', u'scrollbarthumb-horizontal', u'scrollbarthumb-vertical', u'scrollbartrack-horizontal', u'scrollbartrack-vertical', u'searchfield', u'searchfield-cancel-button', u'searchfield-decoration', u'searchfield-results-button', u'searchfield-results-decoration', u'sliderthumb-horizontal', u'sliderthumb-vertical', u'slider-horizontal', u'slider-vertical', u'square-button', u'textarea', u'textfield'),
+    '-webkit-backface-visibility': (u'hidden', u'visible'),
+    '-webkit-background-clip': (u'border', u'content', u'padding', u'text'),
+    '-webkit-background-composite': (u'border', u'padding'),
+    '-webkit-background-origin': (u'origin',),
+    '-webkit-background-size': (u'length', u'length_x', u'length_y'),
+    '-webkit-border-bottom-left-radius': (u'horizontal_radius', u'radius', u'vertical_radius'),
+    '-webkit-border-bottom-right-radius': (u'horizontal_radius', u'radius', u'vertical_radius'),
+    '-webkit-border-horizontal-spacing': (u'value',),
+    '-webkit-border-image': (u'repeat', u'round', u'stretch'),
+    '-webkit-border-radius': (u'horizontal_radius', u'radius', u'vertical_radius'),
+    '-webkit-border-top-left-radius': (u'horizontal_radius', u'radius', u'vertical_radius'),
+    '-webkit-border-top-right-radius': (u'horizontal_radius', u'radius', u'vertical_radius'),
+    '-webkit-border-vertical-spacing': (u'value',),
+    '-webkit-box-align': (u'baseline', u'center', u'end', u'start', u'stretch'),
+    '-webkit-box-direction': (u'normal', u'reverse'),
+    '-webkit-box-flex': (u'<flexvalue>',),
+    '-webkit-box-flex-group': (u'<group_number>',),
+    '-webkit-box-lines': (u'multiple', u'single'),
+    '-webkit-box-ordinal-group': (u'<group_number>',),
+    '-webkit-box-orient': (u'block-axis', u'horizontal', u'inline-axis', u'vertical'),
+    '-webkit-box-pack': (u'center', u'end', u'justify', u'start'),
+    '-webkit-box-reflect': (u'above', u'below', u'left', u'right'),
+    '-webkit-box-shadow': (u'none',),
+    '-webkit-box-sizing': (u'border-box', u'content-box'),
+    '-webkit-column-break-after': (u'always', u'auto', u'avoid', u'left', u'right'),
+    '-webkit-column-break-before': (u'always', u'auto', u'avoid', u'left', u'right'),
+    '-webkit-column-break-inside': (u'auto', u'avoid'),
+    '-webkit-column-count': (u'auto', u'<number_of_columns>'),
+    '-webkit-column-gap': (u'normal', u'<width>'),
+    '-webkit-column-rule': (u'color', u'style', u'width'),
+    '-webkit-column-rule-color': (u'activeborder', u'activecaption', u'appworkspace', u'aqua', u'background', u'black', u'blue', u'buttonface', u'buttonhighlight', u'buttonshadow', u'buttontext', u'captiontext', u'currentcolor', u'fuchsia', u'gray', u'graytext', u'green', u'grey', u'highlight', u'highlighttext', u'inactiveborder', u'inactivecaption', u'inactivecaptiontext', u'infobackground', u'infotext', u'lime', u'maroon', u'match', u'menu', u'menutext', u'navy', u'olive', u'orange', u'purple', u'red', u'scrollbar', u'silver', u'teal', u'threeddarkshadow', u'threedface', u'threedhighlight', u'threedlightshadow', u'threedshadow', u'transparent', u'white', u'window', u'windowframe', u'windowtext', u'yellow', u'-webkit-activelink', u'-webkit-focus-ring-color', u'-webkit-link', u'-webkit-text'),
+    '-webkit-column-rule-style': (u'dashed', u'dotted', u'double', u'groove', u'hidden', u'inset', u'none', u'outset', u'ridge', u'solid'),
+    '-webkit-column-rule-width': (u'medium', u'thick', u'thin', u'<width>'),
+    '-webkit-column-width': (u'auto', u'<width>'),
+    '-webkit-columns': (u'count', u'width'),
+    '-webkit-dashboard-region': (u'none',),
+    '-webkit-line-break': (u'after-white-space', u'normal'),
+    '-webkit-margin-bottom-collapse': (u'collapse', u'discard', u'separate'),
+    '-webkit-margin-collapse': (u'collapse_behavior',),
+    '-webkit-margin-start': (u'auto', u'<width>'),
+    '-webkit-margin-top-collapse': (u'collapse', u'discard', u'separate'),
+    '-webkit-marquee': (u'direction', u'increment', u'repetition', u'speed', u'style'),
+    '-webkit-marquee-direction': (u'ahead', u'auto', u'backwards', u'down', u'forwards', u'left', u'reverse', u'right', u'up'),
+    '-webkit-marquee-increment': (u'large', u'medium', u'small', u'<distance>'),
+    '-webkit-marquee-repetition': (u'infinite', u'<iterations>'),
+    '-webkit-marquee-speed': (u'fast', u'normal', u'slow', u'<distance>', u'<time>'),
+    '-webkit-marquee-style': (u'alternate', u'none', u'scroll', u'slide'),
+    '-webkit-mask': (u'attachment', u'clip', u'composite', u'image', u'origin', u'repeat'),
+    '-webkit-mask-attachment': (u'fixed', u'scroll'),
+    '-webkit-mask-box-image': (u'bottom', u'left', u'right', u'top', u'uri', u'x_repeat', u'y_repeat'),
+    '-webkit-mask-clip': (u'behavior',),
+    '-webkit-mask-composite': (u'border', u'padding'),
+    '-webkit-mask-image': (u'value',),
+    '-webkit-mask-origin': (u'border', u'content', u'padding'),
+    '-webkit-mask-position': (u'bottom', u'center', u'left', u'right', u'top', u'<position>'),
+    '-webkit-mask-position-x': (u'value',),
+    '-webkit-mask-position-y': (u'value',),
+    '-webkit-mask-repeat': (u'value',),
+    '-webkit-mask-size': (u'length', u'length_x', u'length_y'),
+    '-webkit-nbsp-mode': (u'normal', u'space'),
+    '-webkit-padding-start': (u'<length>', u'<percentage>'),
+    '-webkit-perspective': (u'none', u'<distance>'),
+    '-webkit-perspective-origin': (u'50%', u'bottom', u'center', u'left', u'right', u'top', u'<percentage>'),
+    '-webkit-rtl-ordering': (u'logical', u'visual'),
+    '-webkit-tap-highlight-color': (u'color',),
+    '-webkit-text-fill-color': (u'activeborder', u'activecaption', u'appworkspace', u'aqua', u'background', u'black', u'blue', u'buttonface', u'buttonhighlight', u'buttonshadow', u'buttontext', u'captiontext', u'currentcolor', u'fuchsia', u'gray', u'graytext', u'green', u'grey', u'highlight', u'highlighttext', u'inactiveborder', u'inactivecaption', u'inactivecaptiontext', u'infobackground', u'infotext', u'lime', u'maroon', u'match', u'menu', u'menutext', u'navy', u'olive', u'orange', u'purple', u'red', u'scrollbar', u'silver', u'teal', u'threeddarkshadow', u'threedface', u'threedhighlight', u'threedlightshadow', u'threedshadow', u'transparent', u'white', u'window', u'windowframe', u'windowtext', u'yellow', u'-webkit-activelink', u'-webkit-focus-ring-color', u'-webkit-link', u'-webkit-text'),
+    '-webkit-text-security': (u'circle', u'disc', u'none', u'square'),
+    '-webkit-text-size-adjust': (u'auto', u'none', u'<percentage>'),
+    '-webkit-text-stroke': (u'color', u'width'),
+    '-webkit-text-stroke-color': (u'activeborder', u'activecaption', u'appworkspace', u'aqua', u'background', u'black', u'blue', u'buttonface', u'buttonhighlight', u'buttonshadow', u'buttontext', u'captiontext', u'currentcolor', u'fuchsia', u'gray', u'graytext', u'green', u'grey', u'highlight', u'highlighttext', u'inactiveborder', u'inactivecaption', u'inactivecaptiontext', u'infobackground', u'infotext', u'lime', u'maroon', u'match', u'menu', u'menutext', u'navy', u'olive', u'orange', u'purple', u'red', u'scrollbar', u'silver', u'teal', u'threeddarkshadow', u'threedface', u'threedhighlight', u'threedlightshadow', u'threedshadow', u'transparent', u'white', u'window', u'windowframe', u'windowtext', u'yellow', u'-webkit-activelink', u'-webkit-focus-ring-color', u'-webkit-link', u'-webkit-text'),
+    '-webkit-text-stroke-width': (u'medium', u'thick', u'thin', u'<width>'),
+    '-webkit-touch-callout': (u'inherit', u'none'),
+    '-webkit-transform': (u'none', u'<function>'),
+    '-webkit-transform-origin': (u'50%', u'bottom', u'center', u'left', u'right', u'top'),
+    '-webkit-transform-origin-x': (u'posx',),
+    '-webkit-transform-origin-y': (u'posy',),
+    '-webkit-transform-origin-z': (u'posz',),
+    '-webkit-transform-style': (u'flat', u'preserve-3d'),
+    '-webkit-transition': (u'delay', u'duration', u'property', u'timing_function'),
+    '-webkit-transition-delay': (u'0', u'now'),
+    '-webkit-transition-duration': (u'0',),
+    '-webkit-transition-property': (u'all', u'none', u'<name>'),
+    '-webkit-transition-timing-function': (u'ease', u'ease-in', u'ease-in-out', u'ease-out', u'linear', u'<timing_function>'),
+    '-webkit-user-drag': (u'auto', u'element', u'none'),
+    '-webkit-user-modify': (u'read-only', u'read-write', u'read-write-plaintext-only'),
+    '-webkit-user-select': (u'auto', u'none', u'text'),
+    'alignment-adjust': ('after-edge', 'alphabetic', 'auto', 'baseline', 'before-edge', 'central', 'hanging', 'ideographic', 'mathematical', 'middle', 'text-after-edge', 'text-before-edge', '<length>', '<percentage>'),
+    'alignment-baseline': ('after-edge', 'alphabetic', 'baseline', 'before-edge', 'central', 'hanging', 'ideographic', 'mathematical', 'middle', 'text-after-edge', 'text-before-edge', 'use-script'),
+    'animation': (),
+    'animation-delay': (),
+    'animation-direction': (),
+    'animation-duration': (),
+    'animation-iteration-count': (),
+    'animation-name': (),
+    'animation-play-state': (),
+    'animation-timing-function': (),
+    'appearance': (),
+    'background': ('bottom', 'center', 'fixed', 'inherit', 'left', 'none', 'no-repeat', 'repeat', 'repeat-x', 'repeat-y', 'rgb(', 'right', 'scroll', 'top', 'transparent', 'url(', '!important', '#'),
+    'background-attachment': ('fixed', 'inherit', 'scroll', '!important'),
+    'background-clip': ('border-box', 'content-box', 'padding-box'),
+    'background-color': ('inherit', 'rgb(', 'transparent', '!important', '#'),
+    'background-image': ('inherit', 'none', 'url(', '!important'),
+    'background-origin': ('content-box',),
+    'background-position': ('bottom', 'center', 'inherit', 'left', 'right', 'top', '!important'),
+    'background-repeat': ('inherit', 'no-repeat', 'repeat', 'repeat-x', 'repeat-y', '!important'),
+    'background-size': ('auto', 'contain', 'cover'),
+    'baseline-shift': ('baseline', 'sub', 'super', '<length>', '<percentage>'),
+    'binding': ('none', 'url('),
+    'bookmark-label': (),
+    'bookmark-level': (),
+    'bookmark-target': (),
+    'border': ('dashed', 'dotted', 'double', 'groove', 'hidden', 'inherit', 'inset', 'medium', 'none', 'outset', 'rgb(', 'ridge', 'solid', 'thick', 'thin', '!important', '#'),
+    'border-bottom': ('dashed', 'dotted', 'double', 'groove', 'hidden', 'inherit', 'inset', 'medium', 'none', 'outset', 'rgb(', 'ridge', 'solid', 'thick', 'thin', '!important', '#'),
+    'border-bottom-color': ('inherit', 'rgb(', '!important', '#'),
+    'border-bottom-left-radius': (),
+    'border-bottom-right-radius': (),
+    'border-bottom-style': ('dashed', 'dotted', 'double', 'groove', 'hidden', 'inherit', 'inset', 'none', 'outset', 'ridge', 'solid', '!important'),
+    'border-bottom-width': ('inherit', 'medium', 'thick', 'thin', '!important'),
+    'border-collapse': ('collapse', 'inherit', 'separate', '!important'),
+    'border-color': ('inherit', 'rgb(', 'transparent', '!important', '#'),
+    'border-image': (),
+    'border-left': ('dashed', 'dotted', 'double', 'groove', 'hidden', 'inherit', 'inset', 'medium', 'none', 'outset', 'rgb(', 'ridge', 'solid', 'thick', 'thin', '!important', '#'),
+    'border-left-color': ('inherit', 'rgb(', '!important', '#'),
+    'border-left-style': ('dashed', 'dotted', 'double', 'groove', 'hidden', 'inherit', 'inset', 'none', 'outset', 'ridge', 'solid', '!important'),
+    'border-left-width': ('inherit', 'medium', 'thick', 'thin', '!important'),
+    'border-radius': (),
+    'border-right': ('dashed', 'dotted', 'double', 'groove', 'hidden', 'inherit', 'inset', 'medium', 'none', 'outset', 'rgb(', 'ridge', 'solid', 'thick', 'thin', '!important', '#'),
+    'border-right-color': ('inherit', 'rgb(', '!important', '#'),
+    'border-right-style': ('dashed', 'dotted', 'double', 'groove', 'hidden', 'inherit', 'inset', 'none', 'outset', 'ridge', 'solid', '!important'),
+    'border-right-width': ('inherit', 'medium', 'thick', 'thin', '!important'),
+    'border-spacing': ('inherit', '!important'),
+    'border-style': ('dashed', 'dotted', 'double', 'groove', 'hidden', 'inherit', 'inset', 'none', 'outset', 'ridge', 'solid', '!important'),
+    'border-top': ('dashed', 'dotted', 'double', 'groove', 'hidden', 'inherit', 'inset', 'medium', 'none', 'outset', 'rgb(', 'ridge', 'solid', 'thick', 'thin', '!important', '#'),
+    'border-top-color': ('inherit', 'rgb(', '!important', '#'),
+    'border-top-left-radius': (),
+    'border-top-right-radius': (),
+    'border-top-style': ('dashed', 'dotted', 'double', 'groove', 'hidden', 'inherit', 'inset', 'none', 'outset', 'ridge', 'solid', '!important'),
+    'border-top-width': ('inherit', 'medium', 'thick', 'thin', '!important'),
+    'border-width': ('inherit', 'medium', 'thick', 'thin', '!important'),
+    'bottom': ('auto', 'inherit', '!important'),
+    'box-align': ('baseline', 'center', 'end', 'start', 'stretch'),
+    'box-decoration-break': ('slice',),
+    'box-direction': ('normal', 'reverse'),
+    'box-flex': (),
+    'box-flex-group': (),
+    'box-lines': (),
+    'box-ordinal-group': (),
+    'box-orient': ('block-axis', 'horizontal', 'inline-axis', 'vertical'),
+    'box-pack': ('center', 'end', 'justify', 'start'),
+    'box-shadow': (),
+    'box-sizing': ('border-box', 'content-box'),
+    'break-after': ('always', 'auto', 'avoid', 'left', 'right'),
+    'break-before': ('always', 'auto', 'avoid', 'left', 'right'),
+    'break-inside': ('always', 'auto', 'avoid', 'left', 'right'),
+    'caption-side': ('bottom', 'inherit', 'left', 'right', 'top', '!important'),
+    'clear': ('both', 'inherit', 'left', 'none', 'right', '!important'),
+    'color': ('inherit', 'rgb(', '!important', '#'),
+    'color-profile': ('auto', 'sRGB', 'url(', '<name>'),
+    'column-count': ('auto', '<integer>'),
+    'column-fill': ('auto', 'balance'),
+    'column-gap': (),
+    'column-rule': (),
+    'column-rule-color': (),
+    'column-rule-style': (),
+    'column-rule-width': (),
+    'column-span': ('1', 'all'),
+    'column-width': ('auto', '<length>'),
+    'columns': (),
+    'content': ('close-quote', 'counter(', 'inherit', 'no-close-quote', 'no-open-quote', 'open-quote', 'url(', '!important'),
+    'counter-increment': ('inherit', 'none', '!important'),
+    'counter-reset': ('inherit', 'none', '!important'),
+    'crop': ('auto', 'inset-rect', 'rect'),
+    'cue': ('inherit', 'none', 'url(', '!important'),
+    'cue-after': ('inherit', 'none', 'url(', '!important'),
+    'cue-before': ('inherit', 'none', 'url(', '!important'),
+    'cursor': ('auto', 'crosshair', 'default', 'e-resize', 'help', 'inherit', 'move', 'ne-resize', 'nw-resize', 'n-resize', 'pointer', 'se-resize', 'sw-resize', 's-resize', 'text', 'url(', 'wait', 'w-resize', '!important'),
+    'direction': ('inherit', 'ltr', 'rtl', '!important'),
+    'display': ('block', 'compact', 'inherit', 'inline', 'inline-block', 'inline-table', 'list-item', 'marker', 'none', 'run-in', 'table', 'table-caption', 'table-cell', 'table-column', 'table-column-group', 'table-footer-group', 'table-header-group', 'table-row', 'table-row-group', '!important'),
+    'dominant-baseline': ('alphabetic', 'auto', 'central', 'hanging', 'ideographic', 'mathematical', 'middle', 'no-change', 'reset-size', 'text-after-edge', 'text-before-edge', 'use-script'),
+    'drop-initial-after-adjust': ('after-edge', 'alphabetic', 'central', 'hanging', 'ideographic', 'mathematical', 'middle', 'text-after-edge', '<length>', '<percentage>'),
+    'drop-initial-after-align': ('after-edge', 'alphabetic', 'central', 'hanging', 'ideographic', 'mathematical', 'middle', 'text-after-edge', '<length>', '<percentage>'),
+    'drop-initial-before-adjust': ('before-edge', 'central', 'hanging', 'mathematical', 'middle', 'text-before-edge', '<length>', '<percentage>'),
+    'drop-initial-before-align': ('caps-height', '<alignment-baseline>'),
+    'drop-initial-size': ('auto', '<length>', '<line>', '<percentage>'),
+    'drop-initial-value': ('initial', '<integer>'),
+    'elevation': ('above', 'below', 'higher', 'inherit', 'level', 'lower', '!important'),
+    'empty-cells': ('hide', 'inherit', 'show', '!important'),
+    'fit': ('fill', 'hidden', 'meet', 'slice'),
+    'fit-position': ('fill', 'hidden', 'meet', 'slice'),
+    'float': ('inherit', 'left', 'none', 'right', '!important'),
+    'float-offset': (),
+    'font': ('100', '200', '300', '400', '500', '600', '700', '800', '900', 'bold', 'bolder', 'caption', 'cursive', 'fantasy', 'icon', 'inherit', 'italic', 'large', 'larger', 'lighter', 'medium', 'menu', 'message-box', 'monospace', 'normal', 'oblique', 'sans-serif', 'serif', 'small', 'smaller', 'small-caps', 'small-caption', 'status-bar', 'xx-large', 'xx-small', 'x-large', 'x-small', '!important'),
+    'font-family': ('cursive', 'fantasy', 'inherit', 'monospace', 'sans-serif', 'serif', '!important'),
+    'font-size': ('inherit', 'large', 'larger', 'medium', 'small', 'smaller', 'xx-large', 'xx-small', 'x-large', 'x-small', '!important'),
+    'font-size-adjust': ('none', '<number>'),
+    'font-stretch': ('condensed', 'expanded', 'extra-condensed', 'extra-expanded', 'narrower', 'semi-condensed', 'semi-expanded', 'ultra-condensed', 'ultra-expanded', 'wider'),
+    'font-style': ('inherit', 'italic', 'normal', 'oblique', '!important'),
+    'font-variant': ('inherit', 'normal', 'small-caps', '!important'),
+    'font-weight': ('100', '200', '300', '400', '500', '600', '700', '800', '900', 'bold', 'bolder', 'inherit', 'lighter', 'normal', '!important'),
+    'grid-columns': (),
+    'grid-rows': (),
+    'hanging-punctuation': ('end', 'end-edge', 'start'),
+    'height': ('auto', 'inherit', '!important'),
+    'hyphenate-after': (),
+    'hyphenate-before': (),
+    'hyphenate-character': (),
+    'hyphenate-lines': (),
+    'hyphenate-resource': (),
+    'hyphens': ('auto', 'manual', 'none'),
+    'icon': ('auto', 'url('),
+    'image-orientation': ('auto', '<angle>'),
+    'image-resolution': ('from-image', 'normal', '<dpi>'),
+    'inline-box-align': ('initial', 'last', '<integer>'),
+    'left': ('auto', 'inherit', '!important'),
+    'letter-spacing': ('inherit', 'normal', '!important'),
+    'line-height': ('inherit', 'normal', '!important'),
+    'line-stacking': (),
+    'line-stacking-ruby': ('exclude-ruby', 'include-ruby'),
+    'line-stacking-shift': ('consider-shifts', 'disregard-shifts'),
+    'line-stacking-strategy': ('block-line-height', 'grid-height', 'inline-line-height', 'max-height'),
+    'list-style': ('armenian', 'circle', 'cjk-ideographic', 'decimal', 'decimal-leading-zero', 'disc', 'georgian', 'hebrew', 'hiragana', 'hiragana-iroha', 'inherit', 'inside', 'katakana', 'katakana-iroha', 'lower-alpha', 'lower-greek', 'lower-latin', 'lower-roman', 'none', 'outside', 'square', 'upper-alpha', 'upper-latin', 'upper-roman', 'url(', '!important'),
+    'list-style-image': ('inherit', 'none', 'url(', '!important'),
+    'list-style-position': ('inherit', 'inside', 'outside', '!important'),
+    'list-style-type': ('armenian', 'circle', 'cjk-ideographic', 'decimal', 'decimal-leading-zero', 'disc', 'georgian', 'hebrew', 'hiragana', 'hiragana-iroha', 'inherit', 'katakana', 'katakana-iroha', 'lower-alpha', 'lower-greek', 'lower-latin', 'lower-roman', 'none', 'square', 'upper-alpha', 'upper-latin', 'upper-roman', '!important'),
+    'margin': ('auto', 'inherit', '!important'),
+    'margin-bottom': ('auto', 'inherit', '!important'),
+    'margin-left': ('auto', 'inherit', '!important'),
+    'margin-right': ('auto', 'inherit', '!important'),
+    'margin-top': ('auto', 'inherit', '!important'),
+    'mark': (),
+    'mark-after': ('<string>',),
+    'mark-before': ('<string>',),
+    'marker-offset': ('auto', 'inherit', '!important'),
+    'marks': ('crop', 'cross', 'inherit', 'none', '!important'),
+    'marquee-direction': (),
+    'marquee-play-count': (),
+    'marquee-speed': (),
+    'marquee-style': ('alternate', 'scroll', 'slide'),
+    'max-height': ('inherit', 'none', '!important'),
+    'max-width': ('inherit', 'none', '!important'),
+    'min-height': ('inherit', '!important'),
+    'min-width': ('inherit', '!important'),
+    'move-to': ('here', 'normal', '<identifier>'),
+    'nav-down': ('auto', '<id>', '<target-name>'),
+    'nav-index': ('auto', '<number>'),
+    'nav-left': ('auto', '<id>', '<target-name>'),
+    'nav-right': ('auto', '<id>', '<target-name>'),
+    'nav-up': ('auto', '<id>', '<target-name>'),
+    'opacity': ('<alphavalue>',),
+    'orphans': ('inherit', '!important'),
+    'outline': ('dashed', 'dotted', 'double', 'groove', 'hidden', 'inherit', 'inset', 'invert', 'medium', 'none', 'outset', 'rgb(', 'ridge', 'solid', 'thick', 'thin', '!important', '#'),
+    'outline-color': ('inherit', 'invert', 'rgb(', '!important', '#'),
+    'outline-offset': (),
+    'outline-style': ('dashed', 'dotted', 'double', 'groove', 'hidden', 'inherit', 'inset', 'none', 'outset', 'ridge', 'solid', '!important'),
+    'outline-width': ('inherit', 'medium', 'thick', 'thin', '!important'),
+    'overflow': ('auto', 'hidden', 'inherit', 'scroll', 'visible', '!important'),
+    'overflow-style': ('auto', 'marquee-block', 'marquee-line'),
+    'overflow-x': ('auto', 'hidden', 'no-content', 'no-display', 'scroll', 'visible'),
+    'overflow-y': ('auto', 'hidden', 'no-content', 'no-display', 'scroll', 'visible'),
+    'padding': ('inherit', '!important'),
+    'padding-bottom': ('inherit', '!important'),
+    'padding-left': ('inherit', '!important'),
+    'padding-right': ('inherit', '!important'),
+    'padding-top': ('inherit', '!important'),
+    'page': ('auto',),
+    'page-break-after': ('always', 'auto', 'avoid', 'inherit', 'left', 'right', '!important'),
+    'page-break-before': ('always', 'auto', 'avoid', 'inherit', 'left', 'right', '!important'),
+    'page-break-inside': ('auto', 'avoid', 'inherit', '!important'),
+    'page-policy': ('first', 'last', 'start'),
+    'pause': ('inherit', 'ms', 's', '!important'),
+    'pause-after': ('inherit', 'ms', 's', '!important'),
+    'pause-before': ('inherit', 'ms', 's', '!important'),
+    'phonemes': (),
+    'pitch': ('high', 'Hz', 'inherit', 'kHz', 'low', 'medium', 'x-high', 'x-low', '!important'),
+    'pitch-range': ('inherit', '!important'),
+    'play-during': ('auto', 'inherit', 'none', 'url(', '!important'),
+    'position': ('absolute', 'fixed', 'inherit', 'relative', 'static', '!important'),
+    'presentation-level': (),
+    'punctuation-trim': ('adjacent', 'end', 'none', 'start'),
+    'quotes': ('inherit', 'none', '!important'),
+    'rendering-intent': ('auto',),
+    'resize': ('both', 'horizontal', 'none', 'vertical'),
+    'rest': (),
+    'rest-after': ('none', '<time>'),
+    'rest-before': ('none', '<time>'),
+    'richness': ('inherit', '!important'),
+    'right': ('auto', 'inherit', '!important'),
+    'rotation': (),
+    'rotation-point': (),
+    'ruby-align': ('auto', 'center', 'distribute-letter', 'distribute-space', 'left', 'line-edge', 'right'),
+    'ruby-overhang': ('auto', 'end', 'none', 'start'),
+    'ruby-position': ('after', 'before', 'right'),
+    'ruby-span': ('attr', 'none'),
+    'size': ('auto', 'inherit', 'landscape', 'portrait', '!important'),
+    'speak': ('inherit', 'none', 'normal', 'spell-out', '!important'),
+    'speak-header': ('always', 'inherit', 'once', '!important'),
+    'speak-numeral': ('continuous', 'digits', 'inherit', '!important'),
+    'speak-punctuation': ('code', 'inherit', 'none', '!important'),
+    'speech-rate': ('fast', 'faster', 'inherit', 'medium', 'slow', 'slower', 'x-fast', 'x-slow', '!important'),
+    'stress': ('inherit', '!important'),
+    'string-set': ('<content>', '<counter>', '<string>'),
+    'table-layout': ('auto', 'fixed', 'inherit', '!important'),
+    'target': (),
+    'target-name': ('current', 'modal', 'new', 'parent', 'root', '<string>'),
+    'target-new': ('none', 'tab', 'window'),
+    'target-position': ('above', 'back', 'behind', 'front'),
+    'text-align': ('center', 'inherit', 'justify', 'left', 'right', '!important'),
+    'text-align-last': (),
+    'text-decoration': ('blink', 'inherit', 'line-through', 'none', 'overline', 'underline', '!important'),
+    'text-emphasis': ('accent', 'after', 'before', 'circle', 'disc', 'dot', 'none'),
+    'text-height': ('auto', 'font-size', 'max-size', 'text-size'),
+    'text-indent': ('inherit', '!important'),
+    'text-justify': ('auto', 'distribute', 'inter-cluster', 'inter-ideograph', 'inter-word', 'kashida', 'tibetan'),
+    'text-outline': (),
+    'text-shadow': ('inherit', 'none', 'rgb(', '!important', '#'),
+    'text-transform': ('capitalize', 'inherit', 'lowercase', 'none', 'uppercase', '!important'),
+    'text-wrap': ('none', 'normal', 'suppress', 'unrestricted'),
+    'top': ('auto', 'inherit', '!important'),
+    'transition': (),
+    'transition-delay': (),
+    'transition-duration': (),
+    'transition-property': (),
+    'transition-timing-function': ('cubic-bezier', 'ease', 'ease-in', 'ease-in-out', 'ease-out', 'linear'),
+    'unicode-bidi': ('bidi-override', 'embed', 'inherit', 'normal', '!important'),
+    'vertical-align': ('baseline', 'bottom', 'inherit', 'middle', 'sub', 'super', 'text-bottom', 'text-top', 'top', '!important'),
+    'visibility': ('collapse', 'hidden', 'inherit', 'visible', '!important'),
+    'voice-balance': ('center', 'left', 'leftwards', 'right', 'rightwards', '<number>'),
+    'voice-duration': ('<time>',),
+    'voice-family': ('child', 'female', 'inherit', 'male', '!important'),
+    'voice-pitch': ('high', 'low', 'medium', 'x-high', 'x-low', '<number>', '<percentage>'),
+    'voice-pitch-range': ('high', 'low', 'medium', 'x-high', 'x-low', '<number>', '<percentage>'),
+    'voice-rate': ('fast', 'medium', 'slow', 'x-fast', 'x-slow', '<percentage>'),
+    'voice-stress': ('moderate', 'none', 'reduced', 'strong'),
+    'voice-volume': ('loud', 'medium', 'silent', 'soft', 'x-loud', 'x-soft', '<number>', '<percentage>'),
+    'volume': ('inherit', 'loud', 'medium', 'silent', 'soft', 'x-loud', 'x-soft', '!important'),
+    'white-space': ('inherit', 'normal', 'nowrap', 'pre', 'pre-line', 'pre-wrap', '!important'),
+    'white-space-collapse': ('collapse', 'discard', 'preserve', 'preserve-breaks'),
+    'widows': ('inherit', '!important'),
+    'width': ('auto', 'inherit', '!important'),
+    'word-break': ('break-all', 'break-strict', 'keep-all', 'loose', 'normal'),
+    'word-spacing': ('inherit', 'normal', '!important'),
+    'word-wrap': ('break-word', 'normal'),
+    'z-index': ('auto', 'inherit', '!important'),
+}
+
+# Calltips for the CSS properties.
+CSS_PROPERTY_ATTRIBUTE_CALLTIPS_DICT = {
+    '-moz-appearance': 'The -moz-appearance CSS property is used in Gecko (Firefox)\nto display an element using a platform-native styling based\non the operating system\'s theme.\n\n  \'checkbox\': The element is drawn like a\n        checkbox, including only the actual "checkbox"\n        portion.\n  \'checkbox-container\': The element is drawn like\n        a container for a checkbox, which may include a\n        prelighting background effect under certain\n        platforms. Normally a would contain a label and a\n        checkbox.\n  \'radio\': The element is drawn like a radio\n        button, including only the actual "radio button"\n        portion.\n  \'scrollbartrack-horizontal\':\n  \'menulist\':\n  \'scrollbarbutton-up\':\n  \'treetwistyopen\':\n  \'-moz-win-media-toolbox\': New in Firefox 3.\n        Windows Vista and later. This toolbox style is\n        meant to be used in applications that manage media\n        objects. Corresponding foreground color is -moz-\n        win-mediatext .\n  \'menulist-button\': The element is styled as a\n        button that would indicate a menulist can be\n        opened.\n  \'window\':\n  \'tab-left-edge\': Obsolete.\n  \'scrollbarbutton-right\':\n  \'treetwisty\':\n  \'-moz-mac-unified-toolbar\': New in Firefox 3.5.\n        Mac OS X only. This causes the toolbar and title\n        bar to render using the unified toolbar style\n        common to Mac OS X 10.4 and later applications.\n  \'checkbox-small\':\n  \'textfield\':\n  \'none\': No special styling is applied. (Default)\n  \'radio-small\':\n  \'scrollbartrack-vertical\':\n  \'button\': The element is drawn like a button.\n  \'scrollbar\':\n  \'scrollbarbutton-left\':\n  \'treeview\':\n  \'resizer\':\n  \'treeheadercell\':\n  \'menupopup\':\n  \'-moz-win-glass\': New in Firefox 3.5. Windows\n        Vista and later. This style applies the Aero Glass\n        effect to the element.\n  \'toolbarbutton\':\n  \'treeheadersortarrow\':\n  \'tab\':\n  \'menulist-textfield\': The element is styled as\n        the text field for a menulist.\n  \'listbox\':\n  \'radio-container\': The element is drawn like a\n        container for a radio button, which may include a\n        prelighting background effect under certain\n        platforms. Normally would contain a label and a\n        radio button.\n  \'tooltip\':\n  \'-moz-win-communications-toolbox\': New in\n        Firefox 3. Windows Vista and later. This toolbox\n        style is meant to be used in communications and\n        productivity applications. Corresponding\n        foreground color is -moz-win-communicationstext .\n  \'-moz-win-browsertabbar-toolbox\': New in Firefox\n        3. Windows Vista and later. This toolbox style is\n        meant to be used for the tab bar in a browser.\n  \'toolbox\':\n  \'treeitem\':\n  \'scrollbarbutton-down\':\n  \'menuitem\': The element is styled as menu item,\n        item is highlighted when hovered.\n  \'toolbar\':\n  \'statusbar\':\n  \'tabpanels\':\n  \'progressbar\': The element is styled like a\n        progress bar.\n  \'separator\':\n  \'dialog\': The element is styled like a dialog\n        box, which includes background color and other\n        properties.',
+    '-moz-background-clip': "The background-clip CSS property specifies whether an\nelement's background, either the color or image, extends\nunderneath its border. -moz-background-clip is supported up\nto Gecko version 1.9.2 (Firefox 3.6). Warning: To support\nboth, older and newer versions of Gecko (Firefox), you have\nto add both properties in the stylesheet. See examples.\n\n  'border-box': (Requires Gecko 1.9.3). The\n        background extends to the outside edge of the\n        border (but underneath the border in z-ordering).\n        Default value, but see Browser compatibility\n        section below for special case Internet Explorer\n        7.\n  'content-box': Requires Gecko 1.9.3. The\n        background is painted within (clipped to) the\n        content box.\n  'padding': (Firefox 1.0-3.6). No background is\n        drawn below the border (background extends to the\n        outside edge of the padding).\n  'border': (Firefox 1.0-3.6). The background\n        extends to the outside edge of the border (but\n        underneath the border in z-ordering). Default\n        value, but see Browser compatibility section below\n        for special case Internet Explorer 7.\n  'padding-box': (Requires Gecko 1.9.3). No\n        background is drawn below the border (background\n        extends to the outside edge of the padding).",
+    '-moz-background-inline-policy': "In Gecko -based applications like Firefox, the -moz-\nbackground-inline-policy CSS property specifies how the\nbackground image of an inline element is determined when the\ncontent of the inline element wraps onto multiple lines. The\nchoice of position has significant effects on repetition.\n\n  'continuous': The background image is positioned\n        (and repeated) as if the inline box were not\n        broken across lines, and then this long rectangle\n        is sliced into pieces for each line.\n  'bounding-box': The background image is\n        positioned (and repeated) in the smallest\n        rectangle that contains all of the inline boxes\n        for the element. It is then clipped to be visible\n        only within those boxes, according to the -moz-\n        background-clip property.\n  'each-box': The background image is positioned\n        (and repeated) separately for each box of the\n        inline element. This means that an image with\n        background-repeat : no-repeat may be repeated\n        multiple times.",
+    '-moz-background-origin': 'The background-origin CSS property determines the background\npositioning area (the origin of a background-image).\nbackground-origin does not apply when background-attachment\nis fixed . -moz-background-origin is supported up to Gecko\nversion 1.9.2 (Firefox 3.6). Warning: To support both, older\nand newer versions of Gecko (Firefox), you have to add both\nproperties in the stylesheet. See examples.\n\n  \'padding\': (Firefox 1.0-3.6). Default value. The\n        background position is relative to the padding.\n        (For single boxes " 0 0 " is the upper left corner\n        of the padding edge, " 100% 100% " is the lower\n        right corner.)\n  \'content-box\': (New in Firefox 4). The\n        background position is relative to the content.\n  \'padding-box\': (New in Firefox 4). Default\n        value. The background position is relative to the\n        padding. (For single boxes " 0 0 " is the upper\n        left corner of the padding edge, " 100% 100% " is\n        the lower right corner.)\n  \'content\': (Firefox 1.0-3.6). The background\n        position is relative to the content.\n  \'border-box\': (New in Firefox 4). The background\n        position is relative to the border, so the image\n        can go behind the border.\n  \'border\': (Firefox 1.0-3.6). The background\n        position is relative to the border, so the image\n        can go behind the border.',
+    '-moz-background-size': "The background-size CSS property specifies the size of the\nbackground images. -moz-background-size is supported by\nGecko version 1.9.2 (Firefox 3.6). Warning: To support both,\nFirefox 3.6 and newer versions, you have to include both\nproperties in the stylesheet. See examples.\n\n  'auto': Scales the background image in the\n        relevant direction such that its intrinsic\n        proportions are maintained.\n  'cover': Specifies that the background image\n        should be scaled to be as small as possible while\n        ensuring both its dimensions are greater than or\n        equal to the corresponding dimensions of the\n        background positioning area.\n  '<percentage>': Scales the background image in\n        the desired dimension to the specified percentage\n        of the background positioning area, which is\n        determined by the value of -moz-background-origin\n        . The background positioning area is, by default,\n        the area containing the content of the box and its\n        padding; the area may also be changed to just the\n        content or to the area containing borders,\n        padding, and content. If the background's\n        attachment is fixed , the background positioning\n        area is instead the entire area of the browser\n        window, not including the area covered by\n        scrollbars if they are present.\n  '<length>': Scales the background image to the\n        specified length in the desired dimension.\n  'contain': Specifies that the background image\n        should be scaled to be as large as possible while\n        ensuring both its dimensions are less than or\n        equal to the corresponding dimensions of the\n        background positioning area.",
+    '-moz-binding': "The -moz-binding CSS property is used by Mozilla-based\napplications to attach an XBL binding to a DOM element.\n\n  'none': no XBL binding is applied to the\n        element.\n  '<uri>': The URI for the XBL binding (including\n        the fragment identifier).",
+    '-moz-border-bottom-colors': 'In Mozilla applications like Firefox, -moz-border-bottom-\ncolors sets a list of colors for the bottom border.',
+    '-moz-border-image': "The border-image CSS property allows drawing an image on the\nborders of elements. This makes drawing complex looking\nwidgets much simpler than it has been and removes the need\nfor nine boxes in some cases.\n\n  '<image>': (required). The image value is a\n        <uri> , e.g. url(http://example.org/image.png)\n  'stretch': | round | repeat (optional). One or\n        two keywords, that specify how the images for the\n        sides and the middle part are scaled and tiled.\n        stretch (default value) will cause images to be\n        scaled to fit their box. round will tile the\n        images, but also scale them so that a whole number\n        fit in the box. repeat simply tiles the images\n        inside the box. The first keyword describes how to\n        draw the top, middle, and bottom images, while the\n        second describes the left and right borders. If\n        the second is absent, it is assumed to be the same\n        as the first. If both are absent, the default\n        value stretch is used.\n  'none': No image displayed, other border styles\n        are used.\n  '<number>': | <percentage> (required). One, two,\n        three or four values represent inward offsets from\n        the top, right, bottom, and left edges of the\n        image (respectively), dividing it into nine\n        regions: four corners, four edges and a middle.\n        One value belongs to all four sides of the image.\n        Two values belong 1. to top and bottom and 2. to\n        right and left side. Three values belong 1. to\n        top, 2. to the right and left side and 3. to\n        bottom. Four values belong to the top, right,\n        bottom and left edge of the image in that order.\n        In Gecko 1.9.1 (Firefox 3.5) the middle part of\n        the image is drawn like a background-image of the\n        element. This may change in future versions.\n        Percentages are relative to the width/height of\n        the image. Numbers represent pixels in the image\n        (if the image is a raster image) or vector\n        coordinates (if the image is an SVG image).\n  '<border-width>': (optional). If the slash / is\n        present in the property value, the one, two, three\n        or four values after it are used for the width of\n        the border instead of the border-width properties.\n        The order of the values is the same as for border-\n        width .",
+    '-moz-border-left-colors': 'In Mozilla applications like Firefox, the -moz-border-left-\ncolors sets a list of colors for the left border.',
+    '-moz-border-radius': "In Mozilla applications like Firefox, the -moz-border-radius\nCSS property can be used to give borders rounded corners.\nThe radius applies also to the background even if the\nelement has no border.\n\n  '<percentage>': In Gecko (Firefox) Non-standard\n        : A percentage, relative to the width of the box\n        (the percentage is relative to the width even when\n        specifying the radius for a height). In CSS 3:\n        Percentages for the horizontal radius refer to the\n        width of the box, whereas percentages for the\n        vertical radius refer to the height of the box.\n  '<length>': See <length> for possible units.",
+    '-moz-border-radius-bottomleft': 'In Mozilla applications, -moz-border-radius-bottomleft sets\nthe rounding of the bottom-left corner of the border.',
+    '-moz-border-radius-bottomright': 'In Mozilla applications, -moz-border-radius-bottomright sets\nthe rounding of the bottom-right corner of the border.',
+    '-moz-border-radius-topleft': "In Mozilla applications like Firefox, the -moz-border-\nradius-topleft CSS property sets the rounding of the top-\nleft corner of the element.\n\n  '<percentage>': In Gecko (Firefox) Non-standard\n        : Relative to the width of the box (the percentage\n        is relative to the width even when specifying the\n        radius for a height). In CSS 3: Percentages for\n        the horizontal radius refer to the width of the\n        box, whereas percentages for the vertical radius\n        refer to the height of the box.\n  '<length>': See <length> for possible units.",
+    '-moz-border-radius-topright': 'In Mozilla applications like Firefox, the -moz-border-\nradius-topright CSS property sets the rounding of the top-\nright corner of the border.',
+    '-moz-border-right-colors': 'In Mozilla applications like Firefox, -moz-border-right-\ncolors sets a list of colors for the right border.',
+    '-moz-border-top-colors': "In Mozilla applications like Firefox, the -moz-border-top-\ncolors CSS property sets a list of colors for the top\nborder.\n\n  '<color>': Specifies the color of a line of\n        pixels in the bottom border. transparent is valid.\n        See <color> values for possible units.\n  'none': Default, no colors are drawn or border-\n        color is used, if specified.",
+    '-moz-box-align': "In Mozilla applications, -moz-box-align specifies how a XUL\nbox aligns its contents across (perpendicular to) the\ndirection of its layout. The effect of this is only visible\nif there is extra space in the box.\n\n  'stretch': The box stretches the contents so\n        that there is no extra space in the box.\n  'start': The box aligns contents at the start,\n        leaving any extra space at the end.\n  'end': The box aligns contents at the end,\n        leaving any extra space at the start.\n  'baseline': The box aligns the baselines of the\n        contents (lining up the text). This only applies\n        if the box'sorientation is horizontal.\n  'center': The box aligns contents in the center,\n        dividing any extra space equally between the start\n        and the end.",
+    '-moz-box-direction': "In Mozilla applications, -moz-box-direction specifies\nwhether a box lays out its contents normally (from the top\nor left edge), or in reverse (from the bottom or right\nedge).\n\n  'reverse': The box lays out its contents from\n        the end (the right or bottom edge).\n  'normal': The box lays out its contents from the\n        start (the left or top edge).",
+    '-moz-box-flex': "In Mozilla applications, -moz-box-flex specifies how a box\ngrows to fill the box that contains it, in the direction of\nthe containing box's layout.\n\n  '0': The box does not grow.",
+    '-moz-box-ordinal-group': 'Indicates the ordinal group the element belongs to. Elements\nwith a lower ordinal group are displayed before those with a\nhigher ordinal group.',
+    '-moz-box-orient': "In Mozilla applications, -moz-box-orient specifies whether a\nbox lays out its contents horizontally or vertically.\n\n  'horizontal': The box lays out its contents\n        horizontally.\n  'vertical': The box lays out its contents\n        vertically.",
+    '-moz-box-pack': "In Mozilla applications, -moz-box-pack specifies how a box\npacks its contents in the direction of its layout. The\neffect of this is only visible if there is extra space in\nthe box.\n\n  'start': The box packs contents at the start,\n        leaving any extra space at the end.\n  'end': The box packs contents at the end,\n        leaving any extra space at the start.\n  'center': The box packs contents in the center,\n        dividing any extra space equally between the start\n        and the end.\n  'justify': ?",
+    '-moz-box-shadow': "The box-shadow CSS property accepts one or more shadow\neffects as a comma-separated list. It allows to cast a drop\nshadow from the frame of almost any arbitrary element. If a\nborder-radius is specified on the element with a box shadow,\nthe box shadow will take on the same rounded corners. The\nz-ordering of multiple box shadows is the same as multiple\ntext-shadows (the first specified shadow is on top).\n\n  'inset': (optional). If not specified (default),\n        the shadow is assumed to be a drop shadow (as if\n        the box were raised above the content). The\n        presence of the inset keyword changes the shadow\n        to one inside the frame (as if the content was\n        depressed inside the box). Inset shadows are drawn\n        above background, but below border and content.\n  '<spread-radius>': (optional). This is a fourth\n        <length> value. Positive values will cause the\n        shadow to expand and grow bigger, negative values\n        will cause the shadow to shrink. If not specified,\n        it will be 0 (the shadow will be the same size as\n        the element).\n  '<color>': (optional). See <color> values for\n        possible keywords and notations. If not specified,\n        the color depends on the browser. In Gecko\n        (Firefox), the value of the color property is\n        used. WebKit's shadow is transparent and therefore\n        useless if <color> is omitted.\n  '<blur-radius>': (optional). This is a third\n        <length> value. The larger this value, the bigger\n        the blur, so the shadow becomes bigger and\n        lighter. Negative values are not allowed. If not\n        specified, it will be 0 (the shadow's edge is\n        sharp).\n  '<offset-x>': <offset-y> (required). This are\n        two <length> values to set the shadow offset.\n        <offset-x> specifies the horizontal distance.\n        Negative values place the shadow to the left of\n        the element. <offset-y> specifies the vertical\n        distance. Negative values place the shadow above\n        the element. See <length> for possible units. If\n        both values are 0 , the shadow is placed behind\n        the element (and may generate a blur effect if\n        <blur-radius> and/or <spread-radius> is set).",
+    '-moz-box-sizing': '< CSS < CSS Reference < CSS Reference:Mozilla Extensions',
+    '-moz-column-count': "In Mozilla applications like Firefox, the -moz-column-count\nCSS property can be used to set the ideal number of columns\ninto which the content of the element will be flowed.\n\n  '<integer>': Describes the ideal number of\n        columns into which the content of the element will\n        be flowed.",
+    '-moz-column-gap': "In Mozilla applications like Firefox, the -moz-column-gap\nCSS property sets the gap between columns for block elements\nwhich are specified to display as a multi-column element.\n\n  '<length>': A non-negative value in any of the\n        CSS <length> units to specify the gap between\n        columns.\n  'normal': Default value, depends on the user\n        agent. In desktop browsers like Firefox this is\n        1em. In Gecko 1.8.1 (Firefox 2.0) and before the\n        default value was 0 .",
+    '-moz-column-rule': 'In multi-column layouts, the -moz-column-rule CSS property\nspecifies a straight line, or "rule", to be drawn between\neach column. -moz-column-rule is a convenient shorthand to\navoid setting each of the individual -moz-column-rule-*\nproperties separately: -moz-column-rule-width , -moz-column-\nrule-style and -moz-column-rule-color .\n\n  \'<color>\': Optional , see <color> value. Default\n        value if absent: currentColor , the value of the\n        element\'s color property (foreground color).\n  \'<border-style>\': Required , default value none\n        is used if absent. See border-style for possible\n        values and details.\n  \'<border-width>\': Optional, is one value or\n        keyword of: <length> | thin | medium | thick\n        Default value medium is used if absent. See\n        border-width for details.',
+    '-moz-column-rule-color': "The -moz-column-rule-color CSS property lets you set the\ncolor of the rule drawn between columns in multi-column\nlayouts.\n\n  '<color>': See <color> values.",
+    '-moz-column-rule-style': "The -moz-column-rule-style CSS property lets you set the\nstyle of the rule drawn between columns in multi-column\nlayouts.\n\n  '<border-style>': See border-style",
+    '-moz-column-rule-width': "The -moz-column-rule-width CSS property lets you set the\nwidth of the rule drawn between columns in multi-column\nlayouts.\n\n  '<border-width>': See border-width .",
+    '-moz-column-width': "In Mozilla applications like Firefox, the -moz-column-width\nCSS property suggests an optimal column width. The actual\ncolumn width may be wider (to fill the available space), or\nnarrower (only if the available space is smaller than the\nspecified column width).\n\n  '<length>': See <length> value for possible\n        units.",
+    '-moz-float-edge': 'bug 432891',
+    '-moz-force-broken-image-icon': "-moz-force-broken-image-icon is an extended CSS property,\nfor more info see bug 58646 . The value 1 forces a broken\nimage icon even if the image has alt text\n\n  '<integer>':",
+    '-moz-image-region': 'For certain XUL elements and pseudo-elements that use an\nimage from the list-style-image property, this property\nspecifies a region of the image that is used in place of the\nwhole image. This allows elements to use different pieces of\nthe same image to improve performance.',
+    '-moz-margin-end': "In left to right (LTR) situations, the -moz-margin-end CSS\nproperty specifies the right margin and is synonymous with\nmargin-right . In RTL cases it sets the left margin (same as\nmargin-left ).\n\n  '<percentage>': A percentage with respect to the\n        width of the containing block.\n  '<length>': Specifies a fixed width.",
+    '-moz-margin-start': "In left to right (LTR) situations the -moz-margin-start CSS\nproperty specifies the left margin and is synonymous with\nmargin-left . In RTL cases it sets the right margin (same as\nmargin-right ).\n\n  '<percentage>': a percentage with respect to the\n        width of the containing block.\n  '<length>': Specifies a fixed width.",
+    '-moz-opacity': "The opacity CSS property specifies the transparency of an\nelement, i.e. the degree to which the background behind the\nelement is overlaid.\n\n  '1': The element is fully opaque (solid).\n  '0': < number < 1. The element is translucent\n        (background can be seen).",
+    '-moz-outline': '(OBSOLETE) Starting with Gecko 1.8 (Firefox 1.5), the\nstandard CSS 2.1 outline property is supported as well. Use\nof outline is preferred to -moz-outline .',
+    '-moz-outline-color': '(OBSOLETE) Starting with Gecko 1.8 / Firefox 1.5, the\nstandard CSS 2.1 outline-color property is supported as\nwell. Use of outline-color is preferred to -moz-outline-\ncolor .',
+    '-moz-outline-offset': '(OBSOLETE) Support since Gecko 1.8 (Firefox 1.5)\ncontemporary with the standard CSS 3 outline-offset\nproperty. Use only outline-offset .',
+    '-moz-outline-radius': "In Mozilla applications like Firefox, the -moz-outline-\nradius CSS property can be used to give outlines rounded\ncorners. An outline is a line that is drawn around elements,\noutside the border edge, to make the element stand out.\n\n  '<percentage>': A <percentage> , relative to the\n        width of the box\n  '<length>': See <length> for possible values",
+    '-moz-outline-radius-bottomleft': 'In Mozilla applications, -moz-outline-radius-bottomleft sets\nthe rounding of the bottom-left corner of the outline.',
+    '-moz-outline-radius-bottomright': 'In Mozilla applications, -moz-outline-radius-bottomright\nsets the rounding of the bottom-right corner of the outline.',
+    '-moz-outline-radius-topleft': 'In Mozilla applications, -moz-outline-radius-topleft sets\nthe rounding of the top-left corner of the outline.',
+    '-moz-outline-radius-topright': 'In Mozilla applications, -moz-outline-radius-topright sets\nthe rounding of the top-right corner of the outline.',
+    '-moz-outline-style': '(OBSOLETE) Starting with Gecko 1.8 / Firefox 1.5, the\nstandard CSS 2.1 outline-style property is supported as\nwell. Use of outline-style is preferred to -moz-outline-\nstyle .',
+    '-moz-outline-width': '(OBSOLETE) Starting with Gecko 1.8 / Firefox 1.5, the\nstandard CSS 2.1 outline-width property is supported as\nwell. Use of outline-width is preferred to -moz-outline-\nwidth .',
+    '-moz-padding-end': "When rendering right-to-left text, -moz-padding-end flips\nthe element's padding without having to specify absolute\nleft or right. In a left-to-right text display -moz-padding-\nend is treated as a right sided padding, while in a right-\nto-left display it is padded on the left.\n\n  '<percentage>': a percentage with respect to the\n        width of the containing block.\n  '<length>': Specifies a fixed width.",
+    '-moz-padding-start': "In Right to Left situations -moz-padding-start flips the\nelements padding without having to specify absolute left or\nright. In a Left to Right display -moz-padding-start would\nbe treated as a left sided padding, and alternately in a\nRight to Left display it would become the right.\n\n  '<percentage>': a percentage with respect to the\n        width of the containing block.\n  '<length>': Specifies a fixed width.",
+    '-moz-stack-sizing': "-moz-stack-sizing is an extended CSS property. Normally, a\nstack will change its size so that all of its child elements\nare completely visible. For example, moving a child of the\nstack far to the right will widen the stack so the child\nremains visible.\n\n  'ignore': The stack won't consider this child\n        when calculating the its size.\n  'stretch-to-fit': The child will influence the\n        stack's size.",
+    '-moz-transform': "< CSS < CSS Reference < CSS Reference:Mozilla Extensions\nIntroduced in Gecko 1.9.1 (Firefox 3.5 / Thunderbird 3 /\nSeaMonkey 2)\n\n  'none': Specifies that no transform should be\n        applied.\n  'transform-function': One or more of the CSS\n        transform functions to be applied, see below.",
+    '-moz-transform-origin': "The -moz-transform-origin CSS property lets you modify the\norigin for transformations of an element. For example, the\ntransform-origin of the rotate() function is the centre of\nrotation. (This property is applied by first translating the\nelement by the negated value of the property, then applying\nthe element's transform, then translating by the property\nvalue.)\n\n  'right': | right center | center right. Same as\n        100% 50%\n  'center': | center center. Same as 50% 50%\n        (default value)\n  'bottom': right | right bottom. Same as 100%\n        100%\n  'top': | top center | center top. Same as 50% 0\n  '<length>': With a value pair of e.g. 2cm 1cm ,\n        the transform-origin is placed 2cm to the right\n        and 1cm below the upper left corner of the\n        element.\n  '<percentage>': With a value pair of 0% 0% , (or\n        just 0 0 ) the transform-origin is the upper left\n        corner of the box. A value pair of 100% 100%\n        places the transform-origin to the lower right\n        corner. With a value pair of 14% 84% , the point\n        14% across and 84% down the box is the transform-\n        origin.\n  'left': | left center | center left. Same as 0\n        50%",
+    '-moz-transition': 'The -moz-transition CSS property is a shorthand property for\n-moz-transition-property , -moz-transition-duration , -moz-\ntransition-timing-function , and -moz-transition-delay .',
+    '-moz-transition-delay': "The -moz-transition-delay CSS property specifies the number\nof seconds to wait between a change being requested to a\nproperty that is to be transitioned and the start of the\ntransition effect .\n\n  'time': The number of seconds to wait between a\n        property's value changing and the start of the\n        animation effect.",
+    '-moz-transition-duration': "The -moz-transition-duration CSS property specifies the\nnumber of seconds a transition animation should take to\ncomplete. By default, the value is 0, meaning that no\nanimation will occur.\n\n  'time': The number of seconds the transition\n        from the old value of a property to the new value\n        should take.",
+    '-moz-transition-property': "The -moz-transition-property CSS property is used to specify\nthe names of CSS properties to which a transition effect\nshould be applied.\n\n  'property-name': A property to which a\n        transition effect should be applied when its value\n        changes.\n  'all': All properties that can have an animated\n        transition will do so.\n  'none': No properties will transition.",
+    '-moz-transition-timing-function': "The -moz-transition-timing-function CSS property is used to\ndescribe how the intermediate values of the CSS properties\nbeing affected by a transition effect are calculated. This\nin essence lets you establish an acceleration curve, so that\nthe speed of the transition can vary over its duration.\n\n  'ease': This keyword sets the easing function to\n        cubic-bezier(0.25, 0.1, 0.25, 1.0) .\n  'linear': This keyword sets the easing function\n        to cubic-bezier(0.0, 0.0, 1.0, 1.0) .\n  'ease-in-out': This keyword sets the easing\n        function to cubic-bezier(0.42, 0.0, 0.58, 1.0) .\n  'ease-out': This keyword sets the easing\n        function to cubic-bezier(0.0, 0.0, 0.58, 1.0) .\n  'ease-in': This keyword sets the easing function\n        to cubic-bezier(0.42, 0.0, 1.0, 1.0) .\n  'cubic-bezier': Specifies a cubic bezier curve\n        to use as the easing function. The four number\n        values specify the P 1 and P 2 points of the curve\n        as (x 1 , y 1 , x 2 , y 2 ). All values must be in\n        the range [0.0, 1.0] inclusive.",
+    '-moz-user-focus': "Used to indicate whether the element can have the focus. By\nsetting this to 'ignore', you can disable focusing the\nelement, which means that the user will not be able to\nactivate the element. The element will be skipped in the tab\nsequence. A similar property 'user-focus' has been proposed\nfor CSS3.\n\n  'ignore': The element does not accept the\n        keyboard focus and will be skipped in the tab\n        order.\n  'normal': The element can accept the keyboard\n        focus.",
+    '-moz-user-input': "In Mozilla applications, -moz-user-input determines if an\nelement will accept user input.\n\n  'disabled': The element does not accept user\n        input. However, this is not the same as setting\n        disabled to true, in that the element is drawn\n        normally.\n  'none': The element does not respond to user\n        input, and it does not become :active .\n  'enabled': The element accepts user input. For\n        textboxes, this is the default behavior.",
+    '-moz-user-select': "Controls the appearance (only) of selection. This does not\nhave any affect on actual selection operation. This doesn't\nhave any effect on content loaded as chrome, except in\ntextboxes.\n\n  '-moz-none': The text of the element and sub-\n        elements cannot be selected, but selection can be\n        enabled on sub-elements using -moz-user-\n        select:text .\n  'all': In HTML editor, if double-click or\n        context-click occurred in sub-elements, the\n        highest ancestor with this value will be selected.\n  'none': The text of the element and sub-elements\n        will appear as if they cannot be selected. Any use\n        of Selection however will contain these elements.\n  'text': The text can be selected by the user.",
+    '-moz-window-shadow': "-moz-window-shadow specifies whether a window will have a\nshadow. Currently it only works on Mac OS X.\n\n  'default': The window will have a shadow with\n        the default window shadow style.\n  'none': The window won't have a shadow.",
+    '-ms-accelerator': 'Extension',
+    '-ms-background-position-x': 'CSS3 - Working Draft',
+    '-ms-background-position-y': 'CSS3 - Working Draft',
+    '-ms-behavior': 'Extension',
+    '-ms-block-progression': "CSS3 - Editor's Draft",
+    '-ms-filter': "Extension - Sets or retrieves the filter or collection of\nfilters applied to the object.\n\n  'progid:DXImageTransform.Microsoft.MaskFilter':\n        Displays transparent pixels of the object content\n        as a color mask, and makes the nontransparent\n        pixels transparent.\n  'progid:DXImageTransform.Microsoft.Compositor':\n        Displays new content of the object as a logical\n        color combination of the new and original content.\n        The color and alpha values of each version of the\n        content are evaluated to determine the final color\n        on the output image.\n  'progid:DXImageTransform.Microsoft.MotionBlur':\n        Causes the content of the object to appear to be\n        in motion.\n  'progid:DXImageTransform.Microsoft.Wave':\n        Performs a sine wave distortion of the content of\n        the object  along the vertical axis.\n  'progid:DXImageTransform.Microsoft.Alpha':\n        Adjusts the opacity of the content of the object.\n  'progid:DXImageTransform.Microsoft.Emboss':\n        Displays the content of the object as an embossed\n        texture using grayscale values.\n  'progid:DXImageTransform.Microsoft.Matrix':\n        Resizes, rotates, or reverses the content of the\n        object using matrix transformation.\n  'progid:DXImageTransform.Microsoft.Engrave':\n        Displays the content of the object as an engraved\n        texture using grayscale values.\n  'progid:DXImageTransform.Microsoft.Chroma':\n        Displays a specific color of the content of the\n        object as transparent.\n  'progid:DXImageTransform.Microsoft.Glow': Adds\n        radiance around the outside edges of the content\n        of the object so that it appears to glow.\n  'progid:DXImageTransform.Microsoft.Blur': Blurs\n        the content of the object so that it appears out\n        of focus.\n  'progid:DXImageTransform.Microsoft.DropShadow':\n        Creates a solid silhouette of the content of the\n        object, offset in the specified direction. This\n        creates the illusion that the content is floating\n        and casting a shadow.\n  'progid:DXImageTransform.Microsoft.ICMFilter':\n        Converts the color content of the object based on\n        an Image Color Management (ICM) profile. This\n        enables improved display of specific content, or\n        simulated display for hardware devices, such as\n        printers or monitors.\n  'progid:DXImageTransform.Microsoft.BasicImage':\n        Adjusts the color processing, image rotation, or\n        opacity of the content of the object.\n  'progid:DXImageTransform.Microsoft.Shadow':\n        Creates a solid silhouette of the content of the\n        object, offset in the specified direction. This\n        creates the illusion of a shadow.\n  'progid:DXImageTransform.Microsoft.Light':\n        Creates the effect of a light shining on the\n        content of the object.",
+    '-ms-ime-mode': 'Extension',
+    '-ms-interpolation-mode': 'Extension',
+    '-ms-layout-grid': "CSS3 - Editor's Draft",
+    '-ms-layout-grid-char': "CSS3 - Editor's Draft",
+    '-ms-layout-grid-line': "CSS3 - Editor's Draft",
+    '-ms-layout-grid-mode': "CSS3 - Editor's Draft",
+    '-ms-layout-grid-type': "CSS3 - Editor's Draft",
+    '-ms-line-break': 'CSS3 - Working Draft',
+    '-ms-line-grid-mode': "CSS3 - Editor's Draft",
+    '-ms-overflow-x': 'CSS3 - Working Draft',
+    '-ms-overflow-y': 'CSS3 - Working Draft',
+    '-ms-scrollbar-3dlight-color': 'Extension',
+    '-ms-scrollbar-arrow-color': 'Extension',
+    '-ms-scrollbar-base-color': 'Extension',
+    '-ms-scrollbar-darkshadow-color': 'Extension',
+    '-ms-scrollbar-face-color': 'Extension',
+    '-ms-scrollbar-highlight-color': 'Extension',
+    '-ms-scrollbar-shadow-color': 'Extension',
+    '-ms-scrollbar-track-color': 'Extension',
+    '-ms-text-align-last': 'CSS3 - Working Draft',
+    '-ms-text-autospace': 'CSS3 - Working Draft',
+    '-ms-text-justify': 'CSS3 - Working Draft',
+    '-ms-text-kashida-space': 'CSS3 - Working Draft',
+    '-ms-text-overflow': 'CSS3 - Working Draft',
+    '-ms-text-underline-position': 'Extension',
+    '-ms-word-break': 'CSS3 - Working Draft',
+    '-ms-word-wrap': 'CSS3 - Working Draft',
+    '-ms-writing-mode': "CSS3 - Editor's Draft",
+    '-ms-zoom': 'Extension',
+    '-webkit-animation': "Combines common animation properties into a single property.\nVersions: Safari 4.0, iPhone OS 2.0\n\n  u'direction': Determines whether the animation\n        should play in reverse on alternate iterations.\n  u'name': The name of the animation.\n  u'delay': Defines when an animation starts.\n  u'duration': Specifies the length of time that\n        an animation takes to complete one iteration.\n  u'iteration_count': Specifies the number of\n        times an animation iterates.\n  u'timing_function': Defines how an animation\n        progresses between keyframes.",
+    '-webkit-animation-delay': "Defines when an animation starts. Versions: Safari 4.0,\niPhone OS 2.0\n\n  u'0': (by default)\n  u'now': The animation begins immediately.\n        Available in iPhone OS 2.0 and later.",
+    '-webkit-animation-direction': "Determines whether the animation should play in reverse on\nalternate iterations. Versions: Safari 4.0, iPhone OS 2.0\n\n  u'alternate': Play even-numbered iterations of\n        the animation in the forward direction and odd-\n        numbered iterations in the reverse direction.\n        When an animation is played in reverse, the timing\n        functions are also reversed. For example, when\n        played in reverse, an ease-in animation appears as\n        an ease-out animation.\n  u'normal': (by default) Play each iteration of\n        the animation in the forward direction.",
+    '-webkit-animation-duration': "Specifies the length of time that an animation takes to\ncomplete one iteration. Versions: Safari 4.0, iPhone OS 2.0\n\n  u'0': (by default)\n  u'<time>':",
+    '-webkit-animation-iteration-count': "Specifies the number of times an animation iterates.\nVersions: Safari 4.0, iPhone OS 2.0\n\n  u'1': (by default)\n  u'infinite': Repeats the animation forever.",
+    '-webkit-animation-name': "Specifies the name of an animation. Versions: Safari 4.0,\niPhone OS 2.0\n\n  u'name': The name of the animation.",
+    '-webkit-animation-play-state': "Determines whether the animation is running or paused.\nVersions: Safari 4.0, iPhone OS 2.0\n\n  u'paused': Pauses the animation.\n  u'running': (by default) Plays the animation.",
+    '-webkit-animation-timing-function': "Defines how an animation progresses between keyframes.\nVersions: Safari 4.0, iPhone OS 2.0\n\n  u'linear': Equivalent to  cubic-bezier(0.0, 0.0,\n        1.0, 1.0) .\n  u'ease': (by default) Equivalent to  cubic-\n        bezier(0.25, 0.1, 0.25, 1.0) .\n  u'ease-out': Equivalent to  cubic-bezier(0, 0,\n        0.58, 1.0) .\n  u'ease-in-out': Equivalent to  cubic-\n        bezier(0.42, 0, 0.58, 1.0) .\n  u'<function>':\n  u'ease-in': Equivalent to  cubic-bezier(0.42, 0,\n        1.0, 1.0) .",
+    '-webkit-appearance': "Changes the appearance of buttons and other controls to\nresemble native controls. Versions: Safari 3.0, iPhone OS\n1.0\n\n  u'checkbox':\n  u'sliderthumb-horizontal':\n  u'menulist-text':\n  u'media-slider':\n  u'media-seek-forward-button':\n  u'radio':\n  u'scrollbartrack-horizontal': Unsupported in\n        Safari 4.0\n  u'menulist':\n  u'caret':\n  u'scrollbarbutton-up': Unsupported in Safari 4.0\n  u'menulist-button':\n  u'scrollbarthumb-horizontal': Unsupported in\n        Safari 4.0\n  u'scrollbarbutton-right': Unsupported in Safari\n        4.0\n  u'scrollbarthumb-vertical': Unsupported in\n        Safari 4.0\n  u'media-seek-back-button':\n  u'searchfield-decoration':\n  u'square-button':\n  u'none':\n  u'scrollbartrack-vertical': Unsupported in\n        Safari 4.0\n  u'button':\n  u'textfield':\n  u'scrollbarbutton-left': Unsupported in Safari\n        4.0\n  u'slider-vertical':\n  u'media-play-button':\n  u'default-button':\n  u'push-button':\n  u'listbox':\n  u'scrollbargripper-horizontal': Unsupported in\n        Safari 4.0\n  u'searchfield':\n  u'listitem':\n  u'media-sliderthumb':\n  u'searchfield-results-button':\n  u'scrollbargripper-vertical': Unsupported in\n        Safari 4.0\n  u'scrollbarbutton-down': Unsupported in Safari\n        4.0\n  u'searchfield-cancel-button':\n  u'media-mute-button':\n  u'button-bevel':\n  u'slider-horizontal':\n  u'media-fullscreen-button':\n  u'searchfield-results-decoration':\n  u'sliderthumb-vertical':\n  u'textarea':\n  u'menulist-textfield':\n  u'caps-lock-indicator': The indicator that\n        appears in a password field when Caps Lock is\n        active. Available in Safari 4.0 and later.\n        Available in iPhone OS 2.0 and later.",
+    '-webkit-backface-visibility': "Determines whether or not a transformed element is visible\nwhen it is not facing the screen. Versions: iPhone OS 2.0\n\n  u'visible': (by default) The element is always\n        visible even when it is not facing the screen.\n  u'hidden': The element is invisible if it is not\n        facing the screen.",
+    '-webkit-background-clip': "Specifies the clipping behavior of the background of a box.\nVersions: Safari 3.0, iPhone OS 1.0\n\n  u'content': The background clips to the content\n        of the box.\n  u'padding': The background clips to the padding\n        of the box.\n  u'border': The background clips to the border of\n        the box.\n  u'text': The background clips to the text of the\n        box. Available in Safari 4.0 and later.",
+    '-webkit-background-composite': "Sets a compositing style for background images and colors.\nVersions: Safari 3.0, iPhone OS 1.0\n\n  u'padding': The background extends only into the\n        padding area enclosed by the border\n  u'border': (by default) The background extends\n        into the border area",
+    '-webkit-background-origin': "Determines where the  background-position  property is\nanchored. Versions: Safari 3.0, iPhone OS 1.0\n\n  u'origin': The origin of the background\n        position.",
+    '-webkit-background-size': "Overrides the size of a background image. Versions: Safari\n3.0, iPhone OS 1.0\n\n  u'length_y': The height of the background image.\n  u'length_x': The width of the background image.\n  u'length': The width and height of the\n        background image.",
+    '-webkit-border-bottom-left-radius': "Specifies that the bottom-left corner of a box be rounded\nwith the specified radius. Versions: Safari 3.0, iPhone OS\n1.0\n\n  u'horizontal_radius': The horizontal radius of\n        the rounded corner.\n  u'vertical_radius': The vertical radius of the\n        rounded corner.\n  u'radius': The radius of the rounded corner.",
+    '-webkit-border-bottom-right-radius': "Specifies that the bottom-right corner of a box be rounded\nwith the specified radius. Versions: Safari 3.0, iPhone OS\n1.0\n\n  u'horizontal_radius': The horizontal radius of\n        the rounded corner.\n  u'vertical_radius': The vertical radius of the\n        rounded corner.\n  u'radius': The radius of the rounded corner.",
+    '-webkit-border-horizontal-spacing': "Defines the spacing between the horizontal portion of an\nelement?s border and the content within. Versions: Safari\n3.0, iPhone OS 1.0\n\n  u'value': The amount of horizontal spacing.",
+    '-webkit-border-image': "Specifies an image as the border for a box. Versions: Safari\n3.0, iPhone OS 1.0\n\n  u'stretch': The image is stretched to the size\n        of the border.\n  u'repeat': The image is tiled.\n  u'round': The image is stretched before it is\n        tiled to prevent partial tiles.",
+    '-webkit-border-radius': "Specifies that the corners of a box be rounded with the\nspecified radius. Versions: Safari 3.0, iPhone OS 1.0\n\n  u'horizontal_radius': The horizontal radius of\n        the rounded corners.\n  u'vertical_radius': The vertical radius of the\n        rounded corners.\n  u'radius': The radius of the rounded corners.",
+    '-webkit-border-top-left-radius': "Specifies that the top-left corner of a box be rounded with\nthe specified radius. Versions: Safari 3.0, iPhone OS 1.0\n\n  u'horizontal_radius': The horizontal radius of\n        the rounded corner.\n  u'vertical_radius': The vertical radius of the\n        rounded corner.\n  u'radius': The radius of the rounded corner.",
+    '-webkit-border-top-right-radius': "Specifies that the top-right corner of a box be rounded with\nthe specified radius. Versions: Safari 3.0, iPhone OS 1.0\n\n  u'horizontal_radius': The horizontal radius of\n        the rounded corner.\n  u'vertical_radius': The vertical radius of the\n        rounded corner.\n  u'radius': The radius of the rounded corner.",
+    '-webkit-border-vertical-spacing': "Defines the spacing between the vertical portion of an\nelement?s border and the content within. Versions: Safari\n3.0, iPhone OS 1.0\n\n  u'value': The amount of vertical spacing.",
+    '-webkit-box-align': "Specifies the alignment of nested elements within an outer\nflexible box element. Versions: Safari 3.0, iPhone OS 1.0\n\n  u'stretch': Elements are stretched to fill the\n        box.\n  u'start': Elements are aligned with the start of\n        the box.\n  u'end': Elements are aligned with the end of the\n        box.\n  u'baseline': Elements are aligned with the\n        baseline of the box.\n  u'center': Elements are aligned with the center\n        of the box.",
+    '-webkit-box-direction': "Specifies the direction in which child elements of a\nflexible box element are laid out. Versions: Safari 3.0,\niPhone OS 1.0\n\n  u'reverse': Elements are laid out in the reverse\n        direction.\n  u'normal': (by default) Elements are laid out in\n        the default direction.",
+    '-webkit-box-flex': "Specifies an element?s flexibility. Versions: Safari 3.0,\niPhone OS 1.0\n\n  u'<flexvalue>': Floating-point number",
+    '-webkit-box-flex-group': "Specifies groups of dynamically resizing elements that are\nadjusted to be the same size. Versions: Safari 3.0, iPhone\nOS 1.0\n\n  u'<group_number>': Integer, nonnegative value",
+    '-webkit-box-lines': "Specifies whether a flexible box should contain multiple\nlines of content. Versions: Safari 3.0, iPhone OS 1.0\n\n  u'single': The box can contain only one line of\n        content.\n  u'multiple': The box can contain multiple lines\n        of content.",
+    '-webkit-box-ordinal-group': "Specifies a rough ordering of elements in a flexible box.\nVersions: Safari 3.0, iPhone OS 1.0\n\n  u'<group_number>': Integer, nonnegative value",
+    '-webkit-box-orient': "Specifies the layout of elements nested within a flexible\nbox element. Versions: Safari 3.0, iPhone OS 1.0\n\n  u'inline-axis': Elements are oriented along the\n        inline axis.\n  u'horizontal': Elements are oriented\n        horizontally.\n  u'block-axis': Elements are oriented along the\n        box's axis.\n  u'vertical': Elements are oriented vertically.",
+    '-webkit-box-pack': "Specifies alignment of child elements within the current\nelement in the direction of orientation. Versions: Safari\n3.0, iPhone OS 1.0\n\n  u'start': Child elements are aligned to the\n        start of the element.\n  u'end': Child elements are aligned to the end of\n        the element.\n  u'center': Child elements are aligned to the\n        center of the element.\n  u'justify': Child elements are justified with\n        both the start and end of the element.",
+    '-webkit-box-reflect': "Defines a reflection of a border box. Versions: iPhone OS\n2.0\n\n  u'below': The reflection appears below the\n        border box.\n  u'right': The reflection appears to the right of\n        the border box.\n  u'above': The reflection appears above the\n        border box.\n  u'left': The reflection appears to the left of\n        the border box.",
+    '-webkit-box-shadow': "Applies a drop shadow effect to the border box of an object.\nVersions: Safari 3.0, iPhone OS 2.0\n\n  u'none': (by default) The box has no shadow.",
+    '-webkit-box-sizing': "Specifies that the size of a box be measured according to\neither its content (default) or its total size including\nborders. Versions: Safari 3.0, iPhone OS 1.0\n\n  u'border-box': The box size includes borders in\n        addition to content.\n  u'content-box': (by default) The box size only\n        includes content.",
+    '-webkit-column-break-after': "Determines whether a column break can and should occur after\nan element in a multicolumn flow layout. Versions: Safari\n3.0, iPhone OS 2.0\n\n  u'always': A column break is always inserted\n        after the element.\n  u'avoid': Column breaks are avoided after the\n        element.\n  u'left': A left column break is inserted after\n        the element.\n  u'right': A right column break is inserted after\n        the element.\n  u'auto': (by default) A right column break is\n        inserted after the element where appropriate.",
+    '-webkit-column-break-before': "Determines whether a column break can and should occur\nbefore an element in a multicolumn flow layout. Versions:\nSafari 3.0, iPhone OS 2.0\n\n  u'always': A column break is always inserted\n        before the element.\n  u'avoid': Column breaks are avoided before the\n        element.\n  u'left': A left column break is inserted before\n        the element.\n  u'right': A right column break is inserted\n        before the element.\n  u'auto': (by default) A right column break is\n        inserted before the element where appropriate.",
+    '-webkit-column-break-inside': "Determines whether a column break should be avoided within\nthe bounds of an element in a multicolumn flow layout.\nVersions: Safari 3.0, iPhone OS 2.0\n\n  u'auto': (by default) A right column break is\n        inserted within the element where appropriate.\n  u'avoid': Column breaks are avoided within the\n        element.",
+    '-webkit-column-count': "Specifies the number of columns desired in a multicolumn\nflow. Versions: Safari 3.0, iPhone OS 2.0\n\n  u'auto': (by default) The element has one\n        column.\n  u'<number_of_columns>': Integer, nonnegative\n        value",
+    '-webkit-column-gap': "Specifies the space between columns in a multicolumn flow.\nVersions: Safari 3.0, iPhone OS 2.0\n\n  u'<width>': Length unit\n  u'normal': (by default) Columns in the element\n        have the normal gap width between them.",
+    '-webkit-column-rule': "Specifies the color, style, and width of the column rule.\nVersions: Safari 3.0, iPhone OS 2.0\n\n  u'color': The color of the column rule.\n  u'width': The width of the column rule.\n  u'style': The style of the column rule.",
+    '-webkit-column-rule-color': "Specifies the color of the column rule. Versions: Safari\n3.0, iPhone OS 2.0\n\n  u'-webkit-text': The default text color.\n  u'appworkspace':\n  u'yellow':\n  u'graytext':\n  u'threeddarkshadow':\n  u'buttonshadow':\n  u'inactivecaptiontext':\n  u'activecaption':\n  u'menu':\n  u'threedhighlight':\n  u'fuchsia':\n  u'transparent':\n  u'window':\n  u'black':\n  u'orange':\n  u'white':\n  u'threedface':\n  u'match':\n  u'currentcolor': (by default) The value of the\n        element's color property.\n  u'buttonface':\n  u'-webkit-activelink': The default color of a\n        hyperlink that is being clicked.\n  u'background':\n  u'olive':\n  u'silver':\n  u'gray':\n  u'grey':\n  u'scrollbar':\n  u'teal':\n  u'highlight':\n  u'activeborder':\n  u'-webkit-focus-ring-color': The color that\n        surrounds a UI element, such as a text field, that\n        has focus.\n  u'buttontext':\n  u'threedshadow':\n  u'maroon':\n  u'-webkit-link': The default color of a\n        hyperlink that has been visited.\n  u'menutext':\n  u'inactivecaption':\n  u'blue':\n  u'threedlightshadow':\n  u'purple':\n  u'windowtext':\n  u'lime':\n  u'red':\n  u'infotext':\n  u'infobackground':\n  u'captiontext':\n  u'highlighttext':\n  u'navy':\n  u'aqua':\n  u'green':\n  u'inactiveborder':\n  u'windowframe':\n  u'buttonhighlight':",
+    '-webkit-column-rule-style': "Specifies the style of the column rule. Versions: Safari\n3.0, iPhone OS 2.0\n\n  u'inset': The column rule has an inset style.\n  u'outset': The column rule has an outset style.\n  u'ridge': The column rule has a ridged style.\n  u'dotted': The column rule has a dotted line\n        style.\n  u'double': The column rule has a double solid\n        line style.\n  u'solid': The column rule has a solid line\n        style.\n  u'dashed': The column rule has a dashed line\n        style.\n  u'hidden': The column rule is hidden.\n  u'groove': The column rule has a grooved style.\n  u'none': The column rule has no style.",
+    '-webkit-column-rule-width': "Specifies the width of the column rule. Versions: Safari\n3.0, iPhone OS 2.0\n\n  u'<width>': Length unit\n  u'thick': The column rule has a thick width.\n  u'medium': The column rule has a medium width.\n  u'thin': The column rule has a thin width.",
+    '-webkit-column-width': "Specifies the width of the column in a multicolumn flow.\nVersions: Safari 3.0, iPhone OS 2.0\n\n  u'<width>': Length unit\n  u'auto': (by default) Columns in the element are\n        of normal width.",
+    '-webkit-columns': "A composite property that specifies the width and number of\ncolumns in a multicolumn flow layout. Versions: Safari 3.0,\niPhone OS 2.0\n\n  u'count': The number of columns.\n  u'width': The width of each column.",
+    '-webkit-dashboard-region': "Specifies the behavior of regions in a Dashboard widget.\nVersions: Safari 3.0\n\n  u'none': No behavior is specified.",
+    '-webkit-line-break': "Specifies line-breaking rules for CJK (Chinese, Japanese,\nand Korean) text. Versions: Safari 3.0, iPhone OS 1.0\n\n  u'after-white-space': The line breaks after\n        white space.\n  u'normal': (by default) A standard line-breaking\n        rule.",
+    '-webkit-margin-bottom-collapse': "Specifies the behavior of an element's bottom margin if it\nis adjacent to an element with a margin. Elements can\nmaintain their respective margins or share a single margin\nbetween them. Versions: Safari 3.0, iPhone OS 1.0\n\n  u'discard': The element?s margin is discarded if\n        it is adjacent to another element with a margin.\n  u'collapse': Two adjacent margins are collapsed\n        into a single margin.\n  u'separate': Two adjacent margins remain\n        separate.",
+    '-webkit-margin-collapse': "Specifies the behavior of an element?s vertical margins if\nit is adjacent to an element with a margin. Elements can\nmaintain their respective margins or share a single margin\nbetween them. Versions: Safari 3.0, iPhone OS 1.0\n\n  u'collapse_behavior': The behavior of the\n        vertical margins.",
+    '-webkit-margin-start': "Provides the width of the starting margin. Versions: Safari\n3.0, iPhone OS 1.0\n\n  u'<width>': Number as a percentage, length unit\n  u'auto': (by default) The margin is\n        automatically determined.",
+    '-webkit-margin-top-collapse': "Specifies the behavior of an element?s top margin if it is\nadjacent to an element with a margin. Elements can maintain\ntheir respective margins or share a single margin between\nthem. Versions: Safari 3.0, iPhone OS 1.0\n\n  u'discard': The element?s margin is discarded if\n        it is adjacent to another element with a margin.\n  u'collapse': Two adjacent margins are collapsed\n        into a single margin.\n  u'separate': Two adjacent margins remain\n        separate.",
+    '-webkit-marquee': "Defines properties for showing content as though displayed\non an electronic marquee sign. Versions: Safari 3.0, iPhone\nOS 1.0\n\n  u'direction': The direction of the marquee.\n  u'repetition': The number of times the marquee\n        repeats.\n  u'speed': The scroll or slide speed of the\n        marquee.\n  u'style': The style of the marquee?s motion.\n  u'increment': The distance the marquee moves in\n        each increment",
+    '-webkit-marquee-direction': "Specifies the direction of motion for a marquee box.\nVersions: Safari 3.0, iPhone OS 1.0\n\n  u'down': The marquee moves from bottom to top.\n  u'backwards': The marquee moves from right to\n        left.\n  u'right': The marquee moves from left to right.\n  u'forwards': The marquee moves from left to\n        right.\n  u'ahead': The marquee moves from bottom to top.\n  u'reverse': The marquee moves from top to\n        bottom.\n  u'auto': (by default) The marquee moves in the\n        default direction.\n  u'up': The marquee moves from bottom to top.\n  u'left': The marquee moves from right to left.",
+    '-webkit-marquee-increment': "Defines the distance the marquee moves in each increment.\nVersions: Safari 3.0, iPhone OS 1.0\n\n  u'large': The marquee moves a large amount in\n        each increment.\n  u'small': The marquee moves a small amount in\n        each increment.\n  u'medium': The marquee moves a medium amount in\n        each increment.\n  u'<distance>': Number as a percentage, length\n        unit",
+    '-webkit-marquee-repetition': "Specifies the number of times a marquee box repeats (or\ninfinite ). Versions: Safari 3.0, iPhone OS 1.0\n\n  u'infinite': (by default) The marquee repeats\n        infinitely.\n  u'<iterations>': Integer, nonnegative value",
+    '-webkit-marquee-speed': "Defines the scroll or slide speed of a marquee box.\nVersions: Safari 3.0, iPhone OS 1.0\n\n  u'slow': The marquee moves at a slow speed.\n  u'<distance>': Integer, nonnegative value\n  u'<time>': Time unit, nonnegative value\n  u'fast': The marquee moves at a fast speed.\n  u'normal': The marquee moves at a normal speed.",
+    '-webkit-marquee-style': "Specifies the style of marquee motion. Versions: Safari 3.0,\niPhone OS 1.0\n\n  u'slide': The marquee moves in its specified\n        direction, but stops either when the entirety of\n        its content has been displayed or the content\n        reaches the opposite border of its box, whichever\n        comes second.\n  u'none': The marquee does not move.\n  u'alternate': The marquee shifts back and forth.\n  u'scroll': The marquee loops in its specified\n        direction.",
+    '-webkit-mask': "Defines a variety of mask properties within one declaration.\nVersions: Safari 4.0\n\n  u'origin': Determines where the  -webkit-mask-\n        position  property is anchored. See  -webkit-mask-\n        origin .\n  u'repeat': Defines the repeating qualities of a\n        mask. See  -webkit-mask-repeat .\n  u'clip': Specifies whether the mask should\n        extend into the border of a box. See  -webkit-\n        mask-clip .\n  u'composite': Sets a compositing style for a\n        mask. See  -webkit-mask-composite .\n  u'image': Defines an image to be used as a mask\n        for an element. See  -webkit-mask-image .\n  u'attachment': Defines the scrolling or fixed\n        nature of the image mask. See  -webkit-mask-\n        attachment .",
+    '-webkit-mask-attachment': "Defines the scrolling or fixed nature of the image mask.\nVersions: Safari 4.0\n\n  u'fixed': The mask does not move when the page\n        scrolls.\n  u'scroll': The image moves when the page\n        scrolls.",
+    '-webkit-mask-box-image': "Defines an image to be used as a mask for a border box.\nVersions: Safari 4.0\n\n  u'right': The distance from the right edge of\n        the image.\n  u'x_repeat': The horizontal repeat style.\n  u'bottom': The distance from the bottom edge of\n        the image.\n  u'top': The distance from the top edge of the\n        image.\n  u'uri': The file path of the image.\n  u'y_repeat': The vertical repeat style.\n  u'left': The distance from the left edge of the\n        image.",
+    '-webkit-mask-clip': "Specifies whether the mask should extend into the border of\na box. Versions: Safari 4.0\n\n  u'behavior': The clipping behavior of the mask.",
+    '-webkit-mask-composite': "Sets a compositing style for a mask. Versions: Safari 4.0\n\n  u'padding':\n  u'border': (by default)",
+    '-webkit-mask-image': "Defines an image to be used as a mask for an element.\nVersions: Safari 4.0\n\n  u'value': The file path of the image.",
+    '-webkit-mask-origin': "Determines where the -webkit-mask-position property is\nanchored. Versions: Safari 4.0\n\n  u'content': The mask's position is anchored at\n        the upper-left corner of the element's content.\n  u'padding': The mask's position is anchored at\n        the upper-left corner of the element's padding.\n  u'border': The mask's position is anchored at\n        the upper-left corner of the element's border.",
+    '-webkit-mask-position': "Defines the position of a mask. Versions: Safari 4.0\n\n  u'<position>':\n  u'center':\n  u'bottom':\n  u'top':\n  u'right':\n  u'left':",
+    '-webkit-mask-position-x': "Defines the x-coordinate of the position of a mask.\nVersions: Safari 4.0\n\n  u'value': The x-coordinate of the position of\n        the mask.",
+    '-webkit-mask-position-y': "Defines the y-coordinate of the position of a mask.\nVersions: Safari 4.0\n\n  u'value': The y-coordinate of the position of\n        the mask.",
+    '-webkit-mask-repeat': "Defines the repeating qualities of a mask. Versions: Safari\n4.0\n\n  u'value': The repeating behavior of the mask.",
+    '-webkit-mask-size': "Overrides the size of a mask. Versions: Safari 4.0\n\n  u'length_y': The height of the mask.\n  u'length_x': The width of the mask.\n  u'length': The width and height of the mask.",
+    '-webkit-nbsp-mode': "Defines the behavior of nonbreaking spaces within text.\nVersions: Safari 3.0, iPhone OS 1.0\n\n  u'space': Nonbreaking spaces are treated like\n        standard spaces.\n  u'normal': Nonbreaking spaces are treated as\n        usual.",
+    '-webkit-padding-start': "Provides the width of the starting padding. Versions: Safari\n3.0, iPhone OS 1.0\n\n  u'<percentage>':\n  u'<length>':",
+    '-webkit-perspective': "Gives depth to a scene, causing elements farther away from\nthe viewer to appear smaller. Versions: iPhone OS 2.0\n\n  u'none': (by default) No perspective transform\n        is applied.\n  u'<distance>': Length in pixel",
+    '-webkit-perspective-origin': 'Sets the origin of the  -webkit-perspective  property\ndescribed in  "-webkit-perspective." Versions: iPhone OS 2.0\n\n  u\'right\': Sets the x-origin to the right side of\n        the border box.\n  u\'center\': Sets the x or y origin to the center\n        of the element?s border box. If this constant\n        appears before  left  or  right , specifies the\n        y-origin. If it appears after  top  or  bottom ,\n        specifies the x-origin. If appears alone, centers\n        both the x and y origin.\n  u\'bottom\': Sets the y-origin to the bottom of\n        the element?s border box.\n  u\'top\': Sets the y-origin to the top of the\n        element?s border box.\n  u\'50%\': 50% (by default)\n  u\'<percentage>\':\n  u\'left\': Sets the x-origin to the left side of\n        the border box.',
+    '-webkit-rtl-ordering': "Overrides ordering defaults for right-to-left content.\nVersions: Safari 3.0, iPhone OS 2.0\n\n  u'visual': Right-to-left content is encoded in\n        reverse order so an entire line of text can be\n        rendered from left to right in a unidirectional\n        fashion.\n  u'logical': Raw content is in mixed order\n        (requiring a bidirectional renderer).",
+    '-webkit-tap-highlight-color': "Overrides the highlight color shown when the user taps a\nlink or a JavaScript clickable element in Safari on iPhone.\nVersions: iPhone OS 1.1.1\n\n  u'color': The tapped link color.",
+    '-webkit-text-fill-color': "Specifies a fill color for text. Versions: Safari 3.0,\niPhone OS 2.0\n\n  u'-webkit-text': The default text color.\n  u'appworkspace':\n  u'yellow':\n  u'graytext':\n  u'threeddarkshadow':\n  u'buttonshadow':\n  u'inactivecaptiontext':\n  u'activecaption':\n  u'menu':\n  u'threedhighlight':\n  u'fuchsia':\n  u'transparent':\n  u'window':\n  u'black':\n  u'orange':\n  u'white':\n  u'threedface':\n  u'match':\n  u'currentcolor': (by default) The value of the\n        element?s color property.\n  u'buttonface':\n  u'-webkit-activelink': The default color of a\n        hyperlink that is being clicked.\n  u'background':\n  u'olive':\n  u'silver':\n  u'gray':\n  u'grey':\n  u'scrollbar':\n  u'teal':\n  u'highlight':\n  u'activeborder':\n  u'-webkit-focus-ring-color': The color that\n        surrounds a UI element, such as a text field, that\n        has focus.\n  u'buttontext':\n  u'threedshadow':\n  u'maroon':\n  u'-webkit-link': The default color of a\n        hyperlink that has been visited.\n  u'menutext':\n  u'inactivecaption':\n  u'blue':\n  u'threedlightshadow':\n  u'purple':\n  u'windowtext':\n  u'lime':\n  u'red':\n  u'infotext':\n  u'infobackground':\n  u'captiontext':\n  u'highlighttext':\n  u'navy':\n  u'aqua':\n  u'green':\n  u'inactiveborder':\n  u'windowframe':\n  u'buttonhighlight':",
+    '-webkit-text-security': "Specifies the shape to use in place of letters in a password\ninput field. Versions: Safari 3.0, iPhone OS 1.0\n\n  u'circle': A circle shape.\n  u'disc': A disc shape.\n  u'square': A square shape.\n  u'none': No shape is used.",
+    '-webkit-text-size-adjust': "Specifies a size adjustment for displaying text content in\nSafari on iPhone. Versions: iPhone OS 1.0\n\n  u'auto': The text size is automatically adjusted\n        for Safari on iPhone.\n  u'none': (by default) The text size is not\n        adjusted.\n  u'<percentage>': The size in percentage at which\n        to display text in Safari on iPhone.",
+    '-webkit-text-stroke': "Specifies the width and color of the outline (stroke) of\ntext. Versions: Safari 3.0, iPhone OS 2.0\n\n  u'color': The color of the stroke.\n  u'width': The width of the stroke.",
+    '-webkit-text-stroke-color': "Specifies the color of the outline (stroke) of text.\nVersions: Safari 3.0, iPhone OS 2.0\n\n  u'-webkit-text': The default text color.\n  u'appworkspace':\n  u'yellow':\n  u'graytext':\n  u'threeddarkshadow':\n  u'buttonshadow':\n  u'inactivecaptiontext':\n  u'activecaption':\n  u'menu':\n  u'threedhighlight':\n  u'fuchsia':\n  u'transparent':\n  u'window':\n  u'black':\n  u'orange':\n  u'white':\n  u'threedface':\n  u'match':\n  u'currentcolor': (by default) The value of the\n        element's color property.\n  u'buttonface':\n  u'-webkit-activelink': The default color of a\n        hyperlink that is being clicked.\n  u'background':\n  u'olive':\n  u'silver':\n  u'gray':\n  u'grey':\n  u'scrollbar':\n  u'teal':\n  u'highlight':\n  u'activeborder':\n  u'-webkit-focus-ring-color': The color that\n        surrounds a UI element, such as a text field, that\n        has focus.\n  u'buttontext':\n  u'threedshadow':\n  u'maroon':\n  u'-webkit-link': The default color of a\n        hyperlink that has been visited.\n  u'menutext':\n  u'inactivecaption':\n  u'blue':\n  u'threedlightshadow':\n  u'purple':\n  u'windowtext':\n  u'lime':\n  u'red':\n  u'infotext':\n  u'infobackground':\n  u'captiontext':\n  u'highlighttext':\n  u'navy':\n  u'aqua':\n  u'green':\n  u'inactiveborder':\n  u'windowframe':\n  u'buttonhighlight':",
+    '-webkit-text-stroke-width': "Specifies the width for the text outline. Versions: Safari\n3.0, iPhone OS 2.0\n\n  u'<width>': Length unit\n  u'thick': A thick stroke.\n  u'medium': A medium stroke.\n  u'thin': A thin stroke.",
+    '-webkit-touch-callout': "Disables the default callout shown when you touch and hold a\ntouch target. Versions: iPhone OS 2.0\n\n  u'none':\n  u'inherit':",
+    '-webkit-transform': "Specifies transformations to be applied to an element.\nVersions: Safari 3.1, iPhone OS 2.0\n\n  u'<function>':\n  u'none': (by default) No transforms are applied.",
+    '-webkit-transform-origin': "Sets the origin for the  -webkit-transform  property.\nVersions: Safari 3.1, iPhone OS 2.0\n\n  u'right':\n  u'center':\n  u'bottom':\n  u'top':\n  u'50%': 50% (by default)\n  u'left':",
+    '-webkit-transform-origin-x': "The x coordinate of the origin for transforms applied to an\nelement with respect to its border box. Versions: Safari\n3.1, iPhone OS 2.0\n\n  u'posx': The x origin as a percentage or value.",
+    '-webkit-transform-origin-y': "The y coordinate of the origin for transforms applied to an\nelement with respect to its border box. Versions: Safari\n3.1, iPhone OS 2.0\n\n  u'posy': The y origin as a percentage or value.",
+    '-webkit-transform-origin-z': "The z coordinate of the origin for transforms applied to an\nelement with respect to its border box. Versions: iPhone OS\n2.0\n\n  u'posz': The z origin as a percentage or value.",
+    '-webkit-transform-style': "Defines how nested, transformed elements are rendered in 3D\nspace. Versions: iPhone OS 2.0\n\n  u'flat': (by default) Flatten all children of\n        this element into the 2D plane.\n  u'preserve-3d': Preserve the 3D perspective.",
+    '-webkit-transition': "Combines  -webkit-transition-delay ,  -webkit-transition-\nduration ,  -webkit-transition-property , and  -webkit-\ntransition-timing-function  into a single property.\nVersions: Safari 3.1, iPhone OS 2.0\n\n  u'delay': Defines when the transition starts.\n        See  -webkit-transition-delay .\n  u'duration': Defines how long the transition\n        from the old value to the new value should take.\n        See  -webkit-transition-duration .\n  u'timing_function': Specifies how the\n        intermediate values used during a transition are\n        calculated. See  -webkit-transition-timing-\n        function .\n  u'property': Specifies the name of the CSS\n        property to which the transition is applied. See\n        -webkit-transition-property .",
+    '-webkit-transition-delay': "Defines when the transition starts. Versions: Safari 4.0,\niPhone OS 2.0\n\n  u'0': (by default)\n  u'now': The transition begins immediately.\n        Available in iPhone OS 2.0 and later.",
+    '-webkit-transition-duration': "Defines how long the transition from the old value to the\nnew value should take. Versions: Safari 3.1, iPhone OS 2.0\n\n  u'0': (by default)",
+    '-webkit-transition-property': "Specifies the name of the CSS property to which the\ntransition is applied. Versions: Safari 3.1, iPhone OS 2.0\n\n  u'all': (by default) The default transition\n        name.\n  u'none': No transition specified.\n  u'<name>': CSS property name",
+    '-webkit-transition-timing-function': "Specifies how the intermediate values used during a\ntransition are calculated. Versions: Safari 3.1, iPhone OS\n2.0\n\n  u'linear': Equivalent to  cubic-bezier(0.0, 0.0,\n        1.0, 1.0)\n  u'ease-in-out': Equivalent to  cubic-\n        bezier(0.42, 0, 0.58, 1.0)\n  u'ease-out': Equivalent to  cubic-bezier(0, 0,\n        0.58, 1.0)\n  u'ease-in': Equivalent to  cubic-bezier(0.42, 0,\n        1.0, 1.0)\n  u'<timing_function>':\n  u'ease': (by default) Equivalent to  cubic-\n        bezier(0.25, 0.1, 0.25, 1.0)",
+    '-webkit-user-drag': "Specifies that an entire element should be draggable instead\nof its contents. Versions: Safari 3.0\n\n  u'auto': (by default) The default dragging\n        behavior is used.\n  u'none': The element cannot be dragged at all.\n  u'element': The entire element is draggable\n        instead of its contents.",
+    '-webkit-user-modify': "Determines whether a user can edit the content of an\nelement. Versions: Safari 3.0\n\n  u'read-write': The content can be read and\n        written.\n  u'read-write-plaintext-only': The content can be\n        read and written, but any rich formatting of\n        pasted text is lost.\n  u'read-only': The content is read-only.",
+    '-webkit-user-select': "Determines whether a user can select the content of an\nelement. Versions: Safari 3.0, iPhone OS 3.0\n\n  u'auto': (by default) The user can select\n        content in the element.\n  u'none': The user cannot select any content.\n  u'text': The user can select text in the\n        element.",
+    'alignment-adjust': "The 'alignment-adjust' property allows more precise\nalignment of elements, such as graphics, that do not have a\nbaseline-table or lack the desired baseline in their\nbaseline-table. With the 'alignment-adjust' property, the\nposition of the baseline identified by the 'alignment-\nbaseline' can be explicitly determined. It also determines\nprecisely the alignment point for each glyph within a\ntextual element. The user agent should use heuristics to\ndetermine the position of a non existing baseline for a\ngiven element. Values for the property have the following\nmeaning: 4.7. Repositioning the dominant baseline: the\n'baseline-shift' property Name: baseline-shift Value:\nbaseline | sub | super | <percentage> | <length> Initial:\nbaseline Applies to: inline-level elements Inherited: no\nPercentages: refers to the 'line-height' of the parent\nelement Media: visual Computed value: see text\n\n  'mathematical': The alignment point is at the\n        intersection of the start-edge of the element and\n        the 'mathematical' baseline of the element.\n  'auto': For each glyph corresponding to textual\n        information within the element, the alignment-\n        point is the intersection of the start-edge of the\n        glyph box and the block-progression-direction\n        position of the alignment point from the font.\n        Padding, border or margin do not affect that\n        alignment point. The alignment point of the\n        inline-level element itself is at the intersection\n        of the start-edge of the first inline box and the\n        baseline identified by the 'alignment-baseline'\n        property if this baseline exists in the baseline-\n        table for the element dominant-baseline. If that\n        specific baseline does not exist, the user agent\n        may use heuristics to determine where that missing\n        baseline would be. For other inline box content\n        like images, the user agent will use heuristics to\n        determine the position of the alignment point. For\n        example when the resulting baseline is\n        'alphabetic' or 'ideographic', it is expected that\n        the alignment point will be at the intersection of\n        the start-edge and the after-edge of the inline\n        box, including its respective margin. If the\n        resulting baseline is 'hanging', the intersection\n        of the start-edge and the before-edge of the\n        inline box, including its respective margin should\n        be used instead.\n  'ideographic': The alignment point is at the\n        intersection of the start-edge of the element and\n        the 'ideographic' baseline of the element.\n  'middle': The alignment point is at the\n        intersection of the start-edge of the element and\n        the 'middle' baseline of the element.\n  '<percentage>': The computed value of the\n        property is this percentage multiplied by the\n        computed 'line-height' of the element. The\n        alignment point is on the start-edge of the inline\n        box. Its position along the start-edge relative to\n        the intersection of the dominant-baseline and the\n        start-edge is offset by the computed value. The\n        offset is opposite to the shift-direction\n        (positive value) or in the shift-direction\n        (negative value). A value of '0%' makes the\n        dominant-baseline the alignment point.\n  'hanging': The alignment point is at the\n        intersection of the start-edge of the element and\n        the 'hanging' baseline of the element.\n  'text-before-edge': The alignment point is at\n        the intersection of the start-edge of the element\n        and the 'text-before-edge' baseline of the\n        element.\n  'after-edge': The alignment point is at the\n        intersection of the start-edge of the element and\n        the after-edge of the extended inline box of the\n        element. This may include or not the line-height\n        of the element, depending on the line-stacking-\n        strategy.\n  'before-edge': The alignment point is at the\n        intersection of the start-edge of the element and\n        the before-edge of the extended inline box of the\n        element. This may include or not the line-height\n        of the element, depending on the line-stacking-\n        strategy.\n  'central': The alignment point is at the\n        intersection of the start-edge of the element and\n        the 'central' baseline of the element.\n  'baseline': The alignment point is at the\n        intersection of the start-edge of the element and\n        the dominant-baseline of the element.\n  '<length>': The alignment-point is on the start-\n        edge of the inline box. Its position along the\n        start-edge relative to the intersection of the\n        dominant-baseline and the start-edge is offset by\n        the <length> value. The offset is opposite to the\n        shift-direction (positive value) or in the shift-\n        direction (negative value). A value of '0cm' makes\n        the dominant-baseline the alignment point.\n  'alphabetic': The alignment point is at the\n        intersection of the start-edge of the element and\n        the 'alphabetic' baseline of the element.\n  'text-after-edge': The alignment point is at the\n        intersection of the start-edge of the element and\n        the 'text-after-edge' baseline of the element.\n(CSS3)",
+    'alignment-baseline': "This property specifies how an inline-level element is\naligned with respect to its parent. That is, to which of the\nparent's baselines the alignment point of this element is\naligned. Unlike the 'dominant-baseline' property the\n'alignment-baseline' property has no effect on its children\ndominant-baselines. Note: The 'alignment-adjust' property\nspecifies how the alignment point is determined and defaults\nto the baseline with the same name as the computed value of\nthe alignment-baseline property. Except for 'use-script',\nall baseline values refer to the respective baseline-\nidentifier components of the dominant-baseline of the\nparent, and glyphs within the element are aligned similarly\nto the element itself. The description for 'use-script'\ncovers these points specifically. The property values have\nthe following meanings:\n\n  'mathematical': The alignment-point of the\n        element being aligned is aligned with the\n        mathematical baseline of the parent.\n  'use-script': If the element 'script' property\n        value is 'auto', the alignment point of each glyph\n        is aligned with the baseline-identifier of the\n        script to which the glyph belongs. If the element\n        'script' property value is other than 'auto', the\n        alignment point of each glyph is aligned with the\n        baseline-identifier specified by the 'script'\n        property. The baseline-identifier position is\n        determined by using the relevant information\n        related to the parent element dominant-baseline\n        set. The alignment point of the element itself is\n        aligned as for the 'baseline' value.\n  'ideographic': The alignment-point of the\n        element being aligned is aligned with the\n        'ideographic' baseline of the parent.\n  'middle': The alignment point of the box is\n        aligned with the 'middle' baseline of the parent.\n  'hanging': The alignment-point of the element\n        being aligned is aligned with the hanging baseline\n        of the parent.\n  'text-before-edge': The alignment-point of the\n        element being aligned is aligned with the 'text-\n        before-edge' baseline of the parent.\n  'after-edge': The alignment point of the box is\n        aligned with the 'after-edge' baseline of the line\n        box.\n  'before-edge': The alignment point of the box is\n        aligned with the 'before-edge' baseline of the\n        line box.\n  'central': The alignment point of the box is\n        aligned with the 'central' baseline of the parent.\n  'baseline': The alignment-point of the element\n        being aligned is aligned with the dominant\n        baseline of the parent.\n  'alphabetic': The alignment-point of the element\n        being aligned is aligned with the lower baseline\n        of the parent.\n  'text-after-edge': The alignment-point of the\n        element being aligned is aligned with the 'text-\n        after-edge' baseline of the parent.\n(CSS3)",
+    'animation': "The 'animation' shorthand property combines six of the\nanimation properties into a single property. Name: animation\nValue: [<animation-name> || <animation-duration> ||\n<animation-timing-function> || <animation-delay> ||\n<animation-iteration-count> || <animation-direction>] [,\n[<animation-name> || <animation-duration> || <animation-\ntiming-function> || <animation-delay> || <animation-\niteration-count> || <animation-direction>] ]* Initial: see\nindividual properties Applies to: block-level and inline-\nlevel elements Inherited: no Percentages: N/A Media: visual\nComputed value: Same as specified value. ===================\n============================================================\n======================== 4 Animation Events\n(CSS3)",
+    'animation-delay': "The 'animation-delay' property defines when the animation\nwill start. It allows an animation to begin execution some\ntime after it is applied. An 'animation-delay' value of '0'\nmeans the animation will execute as soon as it is applied.\nOtherwise, the value specifies an offset from the moment the\nanimation is applied, and the animation will delay execution\nby that offset. If the value for 'animation-delay' is a\nnegative time offset then the animation will execute the\nmoment it is applied, but will appear to have begun\nexecution at the specified offset. That is, the animation\nwill appear to begin part-way through its play cycle. In the\ncase where an animation has implied starting values and a\nnegative 'animation-delay', the starting values are taken\nfrom the moment the animation is applied. Name: animation-\ndelay Value: <time> [, <time>]* Initial: 0 Applies to:\nblock-level and inline-level elements Inherited: no\nPercentages: N/A Media: visual Computed value: Same as\nspecified value. ===========================================\n============================================================\n3.9 The 'animation' Shorthand Property\n(CSS3)",
+    'animation-direction': "The 'animation-direction' property defines whether or not\nthe animation should play in reverse on alternate cycles. If\n'alternate' is specified, the animation cycle iterations\nthat are odd counts are played in the normal direction, and\nthe animation cycle iterations that are even counts are\nplayed in a reverse direction. When an animation is played\nin reverse the timing functions are also reversed. For\nexample, when played in reverse an ease-in animation would\nappear to be an ease-out animation. Name: animation-\ndirection Value: normal | alternate [, normal | alternate]*\nInitial: normal Applies to: block-level and inline-level\nelements Inherited: no Percentages: N/A Media: visual\nComputed value: Same as specified value. ===================\n============================================================\n======================== 3.7 The 'animation-play-state'\nProperty We are considering removing 'animation-play-state'\nsince its behaviour can be replicated using other\ntechniques. For example, by querying the computed style,\nremoving the animation and then setting style.\n(CSS3)",
+    'animation-duration': "The 'animation-duration' property defines the length of time\nthat an animation takes to complete one cycle. Name:\nanimation-duration Value: <time> [, <time>]* Initial: 0\nApplies to: block-level and inline-level elements Inherited:\nno Percentages: N/A Media: visual Computed value: Same as\nspecified value. By default the value is '0', meaning that\nthe animation cycle is immediate (i.e. there will be no\nanimation). A negative value for animation-duration is\ntreated as '0'.\n(CSS3)",
+    'animation-iteration-count': "The 'animation-iteration-count' property defines the number\nof times an animation cycle is played. The default value is\none, meaning the animation will play from beginning to end\nonce. A value of 'infinite' will cause the animation to\nrepeat forever. Non-integer numbers will cause the animation\nto end part-way through a cycle. Negative values for\n'animation-iteration-count' are treated as zero. This\nproperty is often used with an 'animation-direction' value\nof 'alternate', which will cause the animation to play in\nreverse on alternate cycles. Name: animation-iteration-count\nValue: infinite | <number> [, infinite | <number>]* Initial:\n1 Applies to: block-level and inline-level elements\nInherited: no Percentages: N/A Media: visual Computed value:\nSame as specified value. ===================================\n============================================================\n======== 3.6 The 'animation-direction' Property\n(CSS3)",
+    'animation-name': 'The \'animation-name\' property defines a list of animations\nthat apply. Each name is used to select the keyframe at-rule\nthat provides the property values for the animation. If the\nname does not match any keyframe at-rule, there are no\nproperties to be animated and the animation will not\nexecute. Furthermore, if the animation name is \'none\' then\nthere will be no animation. This can be used to override any\nanimations coming from the cascade. Name: animation-name\nValue: none | IDENT [, none | IDENT ]* Initial: none Applies\nto: block-level and inline-level elements Inherited: no\nPercentages: N/A Media: visual Computed value: Same as\nspecified value. <p> It is possible for elements to have\nmultiple animations running that change the same property or\nproperties. In this case the animations combine in a manner\ndefined by the property. For example, animations on <span\nclass="prop-name">opacity</span> will add together and\nanimations on <span class="prop-name">transform</span> will\nhave their transformation matrices multiplied. </p> <div\nclass="example"> <p style="display:none"> Example(s): </p>\n<pre> @keyframes \'border-bloat\' { from { border-width: 0; }\nto { border-width: 10px; } } @keyframes \'border-diet\' { from\n{ border-width: 4px; } to { border-width: 2px; } } div {\nanimation-name: \'border-bloat\', \'border-diet\'; animation-\nduration: 10s, 4s; } </pre> <p> The above example has two\nanimations executing on the same property, <span class\n="prop-name">border-width</span>. The animations are\nadditive. That is, the resulting value for the property will\nbe the addition of the values from the two animations. </p>\n<p> At time \'<code class=css>0s</code>\' the element\'s border\nwill be 4px wide (0px from \'<code class=property>border-\nbloat</code>\' plus 4px from \'<code class=property>border-\ndiet</code>\'). At time \'<code class=css>4s</code>\' the\nelement\'s border will be 6px wide (4px from \'<code\nclass=property>border-bloat</code>\' plus 2px from \'<code\nclass=property>border-diet</code>\'). At time \'<code\nclass=css>10s</code>\' the element\'s border will be 10px wide\n(10px from \'<code class=property>border-bloat</code>\' and no\naddition from \'<code class=property>border-diet</code>\' as\nit is no longer executing). </p> </div> ====================\n============================================================\n======================= 3.3 The \'animation-duration\'\nProperty\n(CSS3)',
+    'animation-play-state': "The 'animation-play-state' property defines whether the\nanimation is running or paused. A running animation can be\npaused by setting this property to 'paused'. To continue\nrunning a paused animation this property can be set to\n'running'. A paused animation will continue to display the\ncurrent value of the animation in a static state, as if the\ntime of the animation is constant. When a paused animation\nis resumed, it restarts from the current value, not\nnecessarily from the beginning of the animation. Name:\nanimation-play-state Value: running | paused [, running |\npaused]* Initial: running Applies to: block-level and\ninline-level elements Inherited: no Percentages: N/A Media:\nvisual Computed value: Same as specified value. ============\n============================================================\n=============================== 3.8 The 'animation-delay'\nProperty\n(CSS3)",
+    'animation-timing-function': "The 'animation-timing-function' property describes how the\nanimation will progress over one cycle of its duration. See\nthe 'transition-timing-function' property [CSS3-TRANSITIONS]\n{{!CSS3-TRANSITIONS}} for a complete description of timing\nfunction calculation. Name: animation-timing-function Value:\nease | linear | ease-in | ease-out | ease-in-out | cubic-\nbezier(<number>, <number>, <number>, <number>) [, ease |\nlinear | ease-in | ease-out | ease-in-out | cubic-\nbezier(<number>, <number>, <number>, <number>)]* Initial:\nease Applies to: block-level and inline-level elements\nInherited: no Percentages: N/A Media: visual Computed value:\nSame as specified value. For a keyframed animation, the\n'animation-timing-function' applies between keyframes, not\nover the entire animation. For example, in the case of an\nease-in-out timing function, an animation will ease in at\nthe start of the keyframe and ease out at the end of the\nkeyframe. A 'animation-timing-function' defined within a\nkeyframe block applies to that keyframe, otherwise the\ntiming function specified for the animation is used.\n(CSS3)",
+    'appearance': 'This document introduces the \'appearance\' property which can\nbe used to make an element look like a standard user\ninterface element on the platform. Example(s): A few\n\'appearance\' values demonstrated using HTML4 \'appearance\'\nHTML4 demonstration normal hello button Search push-button\nhyperlink CSS home page radio-button Sticky checkbox Gift\nwrap pop-up-menu Honey Water White Extra White White Extra\nLight Amber Light Amber Amber Dark Amber list-menu Honey\nWater White Extra White White Extra Light Amber Light Amber\nAmber Dark Amber radio-group tea Earl Grey lemon ginger\ngreen tea jasmine tea checkbox-group pizza toppings fresh\nbasil fresh garlic fresh spinach green peppers mushrooms\nolives onions pineapple tomatoes field Note to self.\npassword \'appearance\' property detailsExample(s):The\n\'appearance\' property is a shorthand for \'appearance \',\n\'color \', \'font \', and \'cursor \'. It sets \'appearance\' to\nthe specified value and the other properties to their\nappropriate system value; \'normal\' resets \'appearance\'to\'\nnormal \' and the others to \'inherit\'. The \'appearance\'\nproperty does not affect the specified or computed values of\nany other properties. If \'appearance\' is not \'normal\', the\nUA must render the element as if it was the specified user\ninterface (UI) control from the platform. The UA should use\nthe computed values of the \'background-*\', \'border-*\',\n\'padding-*\', \'outline-*\', and \'text-decoration\' properties\nwhen they do not have their initial values and the computed\nvalues of \'color\', \'font\', and \'cursor\' (whatever their\nvalues) to influence the rendering where possible. Any\nvalues from those properties that cannot be used to\ninfluence the rendering of the UI control must not affect\nthe rendering at all. For example, the UA should not draw a\nsecond border around a UI control that already has a border.\nIf \'background-color\'or\'background-image\' have non-initial\nvalues and the UA is using their values for influencing the\nrendering of the UI control, then the UA must ensure that\nthe \'color\' property is also used to influence the\nrendering. Similarly if <span\nclass="property">\'color\'</span> is used to influence the\nrendering, then <span class="property">\'background-\ncolor\'</span> must be used to influence the rendering, and\nthe other <span class="property">\'background-*\'</span>\nproperties should be used to influence the rendering as\nwell. Other properties must not affect the handling of\n\'appearance\' and must instead be applied according to normal\nCSS rules. In particular \'margin\', \'display\', \'float\',\n\'height\', \'width\', and \'line-height\', are not ignored and\naffect the element as normal. This specification does not\ndefine the term "platform". For example, it could be the\nnative graphical rendering engine of the operating system,\nor it could be a user-agent-specific skin. In addition,\nwhich of several toolkits to use could also be decided on an\nelement-by-element basis depending on the values of the\n\'background-color\', \'background-image\', \'border-*-style\',\nand \'outline-style\' properties, so that the author styles\ncould be honored while still honoring \'appearance\' even\nthough the UA is unable to influence the rendering of OS\nnative UI controls. Note. The exact list of properties set\nby, influencing, and not affected by \'appearance\' given in\nthe lists above may be adjusted based on UA implementor\nfeedback. Appearance values take into account the user\ninterface state (if any) of the element; thus there is no\nneed for separate values for enabled vs. disabled checkboxes\nfor example. Example(s): Influencing the color and\nbackground-color of a button This example demonstrates\nsetting the color and background-color of an element that is\nset to \' appearance:push-button \'. sample CSS:\ninput[type=button] { appearance:push-button; /* expected\nfrom UA defaults */ } input[type=button].custom { color:\n#393; background-color: #9cf; } sample (X)HTML fragment:\n<input type="button" value="Plain button" /> <input\ntype="button" value="With color" class="custom" /> A\ngraphical browser might render these buttons as follows:\nFirst, a rounded button with black text on a white\nbackground, with shades of gray being used near the edges to\ngive the impression of depth. Second, a similar rounded\nbutton but with blue text on a light blue background, and\nwith shades of blue used to give the impression of depth.\nYour browser on your system: 5.3. System\nfontsExample(s):This example demonstrates setting the color\nand background-color of an element that is set to \'\nappearance:push-button \'. First, a rounded button with black\ntext on a white background, with shades of gray being used\nnear the edges to give the impression of depth. Second, a\nsimilar rounded button but with blue text on a light blue\nbackground, and with shades of blue used to give the\nimpression of depth.\n(CSS3)',
+    'background': 'Shorthand for setting the individual\nbackground properties\n(CSS1, CSS2, CSS3)',
+    'background-attachment': "If background image is specified, this\nspecifies whether it is fixed with\nregard to the viewport ('fixed') or\nscrolls along with the document\n('scroll').\n(CSS1, CSS2, CSS3)",
+    'background-clip': "Determines the background painting area.\n\n  'border-box': The background is painted within\n        (clipped to) the border box.\n  'content-box': The background is painted within\n        (clipped to) the content box.\n  'padding-box': The background is painted within\n        (clipped to) the padding box.\n(CSS3)",
+    'background-color': "Sets the background color of an element,\neither a <color> value or the keyword\n'transparent', to make the underlying\ncolors shine through\n(CSS1, CSS2, CSS3)",
+    'background-image': 'Sets the background image of an element.\nWhen setting a background image, authors\nshould also specify a background color\nthat will be used when the image is\nunavailable. When the image is\navailable, it is rendered on top of the\nbackground color\n(CSS1, CSS2, CSS3)',
+    'background-origin': "For elements rendered as a single box, specifies the\nbackground positioning area. For elements rendered as\nmultiple boxes (e.g., inline boxes on several lines, boxes\non several pages) specifies which boxes 'box-decoration-\nbreak' operates on to determine the background positioning\narea(s).\n\n  'content-box': The position is relative to the\n        content box.\n(CSS3)",
+    'background-position': 'If a background image has been\nspecified, this property specifies its\ninitial position\n(CSS1, CSS2, CSS3)',
+    'background-repeat': 'If a background image is specified, this\nproperty specifies whether the image is\nrepeated (tiled), and how\n(CSS1, CSS2, CSS3)',
+    'background-size': "Specifies the size of the background images. Where <bg-size>\n= [ <length> | <percentage> | auto ]{1,2} | cover | contain.\nValues have the following meanings: Here are some examples.\nThe first example stretches the background image\nindependently in both dimensions to completely cover the\ncontent area: div { background-image: url(plasma.png);\nbackground-repeat: no-repeat; background-size: 100% 100%;\nbackground-origin: content-box } The second example\nstretches the image so that exactly two copies fit\nhorizontally. The aspect ratio is preserved: p { background-\nimage: url(tubes.png); background-size: 50% auto;\nbackground-origin: border-box } This example forces the\nbackground image to be 15 by 15 pixels: para { background-\nsize: 15px 15px; background-image: url(tile.png)} This\nexample uses the image's intrinsic size. Note that this is\nthe only possible behavior in CSS level 1 and 2. body {\nbackground-size: auto; /* default */ background-image:\nurl(flower.png) } The following example rounds the height of\nthe image to 25%, down from the specified value of 30%. At\n30%, three images would fit entirely and a fourth only\npartially. After rounding, four images fit. The width of the\nimage is 20% of the background area width and is not\nrounded. p { background-image: url(chain.png); background-\nrepeat: no-repeat round; background-size: 20% 30% }\n\n  'auto': [ <length> | <percentage> | auto ]{1,2}.\n        The first value gives the width of the\n        corresponding image, the second value its height.\n        If only one value is given the second is assumed\n        to be 'auto'. A percentage is relative to the\n        background positioning area. An 'auto' value for\n        one dimension is resolved by using the image's\n        intrinsic ratio and the size of the other\n        dimension, or failing that, using the image's\n        intrinsic size, or failing that, treating it as\n        100%. If both values are 'auto' then the intrinsic\n        width and/or height of the image should be used,\n        if any, the missing dimension (if any) behaving as\n        ''auto'' as described above. If the image has\n        neither an intrinsic width nor an intrinsic\n        height, its size is determined as for 'contain'.\n        Negative values are not allowed.\n  'cover': Scale the image, while preserving its\n        intrinsic aspect ratio (if any), to the smallest\n        size such that both its width and its height can\n        completely cover the background positioning area.\n  'contain': Specifies that the background image\n        should be scaled to be as large as possible while\n        ensuring both its dimensions are less than or\n        equal to the corresponding dimensions of the\n        background positioning area.\n(CSS3)",
+    'baseline-shift': "The 'baseline-shift' property allows repositioning of the\ndominant-baseline relative to the dominant-baseline. The\nshifted object might be a sub- or superscript. Within the\nshifted element, the whole baseline table is offset; not\njust a single baseline. For sub- and superscript, the amount\nof offset is determined from the nominal font of the parent.\nValues for the property have the following meaning:\n\n  'sub': The dominant baseline is shifted to the\n        default position for subscripts. The offset for\n        this position is determined by the font data for\n        the parent nominal font as adjusted by the\n        dominant baseline-table font-size of the parent\n        element. If there is no applicable font data the\n        User Agent may use heuristic to determine the\n        offset.\n  'super': The dominant baseline is shifted to the\n        default position for superscripts. The offset for\n        this position is determined by the font data for\n        the parent nominal font as adjusted by the\n        dominant baseline-table font-size of the parent\n        element. If there is no applicable font data the\n        User Agent may use heuristic to determine the\n        offset.\n  '<percentage>': The computed value of the\n        property is this percentage multiplied by the\n        computed 'line-height' of the parent element. The\n        dominant-baseline is shifted in the shift-\n        direction (positive value) or opposite to the\n        shift-direction (negative value) of the parent\n        area by the computed value. A value of '0%' is\n        equivalent to 'baseline'.\n  '<length>': The dominant-baseline is shifted in\n        the shift-direction (positive value) or opposite\n        to the shift-direction (negative value) of the\n        parent area by the <length> value. A value of\n        '0cm' is equivalent to 'baseline'.\n  'baseline': There is no baseline shift; the\n        dominant baseline remains in its original\n        position.\n(CSS3)",
+    'binding': "A property to attach a binding to a particular element.\n\n  'none': No bindings are to be attached through\n        CSS.\n  'url(': The specified binding is attached. More\n        than one binding can be specified, resulting in\n        the bindings being attached in the specified\n        order. The relevant language specification(s)\n        define how multiple bindings interact. When the\n        bindings interact through linear inheritance, the\n        last binding specified must inherit from the\n        previous one, and so forth, up to the first\n        binding.\n(CSS3)",
+    'bookmark-label': 'This property specifies the label of the bookmark, i.e., the\ntext that will represent the bookmark in the bookmark\nstructure. a { bookmark-label: attr(title, string) } h1 {\nbookmark-label: content() } h2 { bookmark-label:\ncontent(before) } #frog { bookmark-label: "The green frog" }\nName: bookmark-target Value: none | <uri> | <attr> Initial:\nnone Applies to: all elements Inherited: no Percentages: N/A\nMedia: all Computed value: For URI values, the absolute URI;\nfor attr() values, the resulting URI or string; for other\nkeywords, as specified. This property specifies the target\nof the bookmark link..bookmark { bookmark-label: attr(title,\nstring); bookmark-target: attr(href, url); } ... <a\nclass="bookmark" title="The green pear"\nhref="#pears"/>.exable { bookmark-label:\nurl(http://www.example.com) } Name: bookmark-state Value:\nopen | closed Initial: open Applies to: block-level elements\nInherited: no Percentages: N/A Media: all Computed value:\nspecified valueThis property describes the initial state of\na bookmark. * { bookmark-state: closed } #open { bookmark-\nstate: open } 11. CMYK colors\n(CSS3)',
+    'bookmark-level': 'This property describes what level a certain bookmark has in\na hierarchical bookmark structure. The highest level is 1,\nthen 2, 3 etc. h1 { bookmark-level: 1 } h2 { bookmark-level:\n2 } h3 { bookmark-level: 3 } Name: bookmark-label Value:\ncontent() | attr() | <string> Initial: content() Applies to:\nall elements Inherited: no Percentages: N/A Media: all\nComputed value: specified valueThis property specifies the\nlabel of the bookmark, i.e., the text that will represent\nthe bookmark in the bookmark structure. a { bookmark-label:\nattr(title, string) } h1 { bookmark-label: content() } h2 {\nbookmark-label: content(before) } #frog { bookmark-label:\n"The green frog" } Name: bookmark-target Value: none | <uri>\n| <attr> Initial: none Applies to: all elements Inherited:\nno Percentages: N/A Media: all Computed value: For URI\nvalues, the absolute URI; for attr() values, the resulting\nURI or string; for other keywords, as specified. This\nproperty specifies the target of the bookmark link..bookmark\n{ bookmark-label: attr(title, string); bookmark-target:\nattr(href, url); } ... <a class="bookmark" title="The green\npear" href="#pears"/>.exable { bookmark-label:\nurl(http://www.example.com) } Name: bookmark-state Value:\nopen | closed Initial: open Applies to: block-level elements\nInherited: no Percentages: N/A Media: all Computed value:\nspecified valueThis property describes the initial state of\na bookmark. * { bookmark-state: closed } #open { bookmark-\nstate: open } 11. CMYK colors\n(CSS3)',
+    'bookmark-target': 'This property specifies the target of the bookmark\nlink..bookmark { bookmark-label: attr(title, string);\nbookmark-target: attr(href, url); } ... <a class="bookmark"\ntitle="The green pear" href="#pears"/>.exable { bookmark-\nlabel: url(http://www.example.com) } Name: bookmark-state\nValue: open | closed Initial: open Applies to: block-level\nelements Inherited: no Percentages: N/A Media: all Computed\nvalue: specified valueThis property describes the initial\nstate of a bookmark. * { bookmark-state: closed } #open {\nbookmark-state: open } 11. CMYK colors\n(CSS3)',
+    'border': 'Shorthand for border-width, border-style\nand border-color affecting all 4 borders\n(CSS1, CSS2, CSS3)',
+    'border-bottom': 'Shorthand for border-width, border-style\nand border-color affecting the bottom\nborder\n(CSS1, CSS2, CSS3)',
+    'border-bottom-color': 'Sets the color of the bottom border\n(CSS2, CSS3)',
+    'border-bottom-left-radius': "The two length or percentage values of the 'border-*-radius'\nproperties define the radii of a quarter ellipse that\ndefines the shape of the corner of the outer border edge\n(see the diagram below). The first value is the horizontal\nradius, the second the vertical radius. If the second value\nis omitted it is copied from the first. If either length is\nzero, the corner is square, not rounded. Percentages for the\nhorizontal radius refer to the width of the border box,\nwhereas percentages for the vertical radius refer to the\nheight of the border box. The two values of ' border-top-\nleft-radius: 55pt 25pt ' define the curvature of the corner.\nThe two values of ' border-top-left-radius: 55pt 25pt '\ndefine the curvature of the corner. The 'border-radius'\nshorthand sets all four 'border-*-radius' properties. If\nvalues are given before and after the slash, then the values\nbefore the slash set the horizontal radius and the values\nafter the slash set the vertical radius. If there is no\nslash, then the values set both radii equally. The four\nvalues for each radii are given in the order top-left, top-\nright, bottom-right, bottom-left. If bottom-left is omitted\nit is the same as top-right. If bottom-right is omitted it\nis the same as top-left. If top-right is omitted it is the\nsame as top-left. border-radius: 4em; is equivalent to\nborder-top-left-radius: 4em; border-top-right-radius: 4em;\nborder-bottom-right-radius: 4em; border-bottom-left-radius:\n4em; and border-radius: 2em 1em 4em / 0.5em 3em; is\nequivalent to border-top-left-radius: 2em 0.5em; border-top-\nright-radius: 1em 3em; border-bottom-right-radius: 4em\n0.5em; border-bottom-left-radius: 1em 3em; 4.4.1. Corner\nShapingThe padding edge (inner border) radius is the outer\nborder radius minus the corresponding border thickness. In\nthe case where this results in a negative value, the inner\nradius is zero. (In such cases its center might not coincide\nwith that of the outer border curve.) Likewise the content\nedge radius is the padding edge radius minus the\ncorresponding padding, or if that is negative, zero. The\nborder and padding thicknesses in the curved region are thus\ninterpolated from the adjoining sides, and when two\nadjoining borders are of different thicknesses the corner\nwill show a smooth transition between the thicker and\nthinner borders. Note that this means that if the outer\ncurve extends past the adjacent corner's padding edge, the\ninner curve may not be a full quarter ellipse. All border\nstyles ('solid', 'dotted', 'inset', etc.) follow the curve\nof the border. The effect of a rounded corner when the two\nborders it connects are of unequal thickness (left) and the\neffect of a rounded corner on borders that are thicker than\nthe radius of the corner (right). 4.4.2. Corner ClippingThe\neffect of a rounded corner when the two borders it connects\nare of unequal thickness (left) and the effect of a rounded\ncorner on borders that are thicker than the radius of the\ncorner (right). A box's backgrounds, but not its border-\nimage, are clipped to the appropriate curve (as determined\nby 'background-clip'). Other effects that clip to the border\nor padding edge (such as 'overflow' other than 'visible')\nalso must clip to the curve. The content of replaced\nelements is always trimmed to the content edge curve. Also,\nthe area outside the curve of the border edge does not\naccept mouse events on behalf of the element. This example\nadds appropriate padding, so that the contents do not\noverflow the corners. Note that there is no border, but the\nbackground will still have rounded corners. DIV {\nbackground: black; color: white; border-radius: 1em;\npadding: 1em } 4.4.3. Color and Style TransitionsThis\nexample adds appropriate padding, so that the contents do\nnot overflow the corners. Note that there is no border, but\nthe background will still have rounded corners. DIV {\nbackground: black; color: white; border-radius: 1em;\npadding: 1em }Color and style transitions must be contained\nwithin the segment of the border that intersects the\nsmallest rectangle that contains both border radii as well\nas the center of the inner curve (which may be a point\nrepresenting the corner of the padding edge, if the border\nradii are smaller than the border-width). The center of\ncolor and style transitions between adjoining borders is at\nthe point on the curve that is at an angle that is\nproportional to the ratio of the border widths. For example,\nif the top and right border widths are equal, that point is\nat a 45 angle from the horizontal, and if the top is twice\nthe width of the right the point is at a 30 angle from the\nhorizontal. The line demarcating this transition is drawn\nbetween the point at that angle on the outer arc and the\npoint at that angle on the inner arc. It is not defined what\nthese transitions look like, but a gradient is recommended\nfor color transitions that don't involve dotted or dashed\nborders. Given these corner shapes, color and style\ntransitions must be contained within the green region. In\ncase D the rectangle defined by the border radii does not\ninclude the center of the inner curve (which is a sharp\ncorner), so the transition region is expanded to include\nthat corner. Transitions may take up the entire transition\nregion, but are not required to: For example, a gradient\ncolor transition between two solid border styles might take\nup only the region bounded by the tips of the outer radii\nand the tips of the inner radii (represented in case D by\nthe dark green region). 4.4.4. Overlapping CurvesGiven these\ncorner shapes, color and style transitions must be contained\nwithin the green region. In case D the rectangle defined by\nthe border radii does not include the center of the inner\ncurve (which is a sharp corner), so the transition region is\nexpanded to include that corner. Transitions may take up the\nentire transition region, but are not required to: For\nexample, a gradient color transition between two solid\nborder styles might take up only the region bounded by the\ntips of the outer radii and the tips of the inner radii\n(represented in case D by the dark green region). Corner\ncurves must not overlap: When the sum of any two adjacent\nborder radii exceeds the size of the border box, UAs must\nproportionally reduce the used value of all border radii\nuntil none of them overlap. The algorithm for reducing radii\nis as follows:Let f = min( L i / S i ), where i ? {top,\nright, bottom, left}, S i is the sum of the radii of the\ncorners on side i, and L top = L bottom = the width of the\nbox, and L left = L right = the height of the box. If f < 1,\nthen all corner radii are reduced by multiplying them by f.\nNote that this formula ensures that quarter circles remain\nquarter circles and large radii remain larger than smaller\nones, but it may reduce corners that were already small\nenough, which may make borders of nearby elements that\nshould look the same look different. If the curve interferes\nwith UI elements such as scrollbars, the UA may further\nreduce the used value of the affected border radii (and only\nthe affected border radii) as much as necessary, but no\nmore. The rendering of the box must be exactly the same as\nif the reduced border-radius values were those originally\nspecified. For example, the borders A and D of the figure\nbelow might be the result of box-sizing: border-box; width:\n6em; height: 2.5em; border-radius: 0.5em 2em 0.5em 2em The\nheight (2.5em) is enough for the specified radii (0.5em plus\n2.5em). However, if the height is only 2em, box-sizing:\nborder-box; width: 6em; height: 2em; border-radius: 0.5em\n2em 0.5em 2em all corners need to be reduced by a factor 0.8\nto make them fit. The used border radii thus are 0.4em\n(instead of 0.5em) and 1.6em (instead of 2em). See borders B\nand C in the figure. These rounded corner might be the\nresult of ' width: 6em; height: 2.5em; border-radius: 0.5em\n2em 0.5em 2em ' for A and D; and ditto but with ' height:\n2em ' for B and C. 4.4.5. Effect on TablesFor example, the\nborders A and D of the figure below might be the result of\nbox-sizing: border-box; width: 6em; height: 2.5em; border-\nradius: 0.5em 2em 0.5em 2emThe height (2.5em) is enough for\nthe specified radii (0.5em plus 2.5em). However, if the\nheight is only 2em, box-sizing: border-box; width: 6em;\nheight: 2em; border-radius: 0.5em 2em 0.5em 2emall corners\nneed to be reduced by a factor 0.8 to make them fit. The\nused border radii thus are 0.4em (instead of 0.5em) and\n1.6em (instead of 2em). See borders B and C in the figure.\nThese rounded corner might be the result of ' width: 6em;\nheight: 2.5em; border-radius: 0.5em 2em 0.5em 2em ' for A\nand D; and ditto but with ' height: 2em ' for B and C. These\nrounded corner might be the result of ' width: 6em; height:\n2.5em; border-radius: 0.5em 2em 0.5em 2em ' for A and D; and\nditto but with ' height: 2em ' for B and C. The 'border-\nradius' properties do apply to 'table'and'inline-table'\nelements. When 'border-collapse'is'collapse', the UA may\napply the border-radius properties to 'table'and'inline-\ntable' elements, but is not required to. In this case not\nonly must the border radii of adjacent corners not\nintersect, but the horizontal and vertical radii of a single\ncorner may not extend past the boundaries of the cell at\nthat corner (i.e. the cell's other corners must not be\naffected by this corner's border-radius). If the computed\nvalues of the border radii would cause this effect, then the\nused values of all the border radii of the table must be\nreduced by the same factor so that the radii neither\nintersect nor extend past the boundaries of their respective\ncorner cells. The effect of border-radius on internal table\nelements is undefined in CSS3 Backgrounds and Borders, but\nmay be defined in a future specification. CSS3 UAs should\nignore border-radius properties applied to internal table\nelements when 'border-collapse'is'collapse'. This example\ndraws ovals of 15em wide and 10em high: DIV.standout {\nwidth: 13em; height: 8em; border: solid black 1em; border-\nradius: 7.5em 5em } 4.5. The border shorthand properties\nName: border-top, border-right, border-bottom, border-left\nValue: <border-width> || <border-style> || <color> Initial:\nSee individual properties Applies to: all elements\nInherited: no Percentages: N/A Media: visual Computed value:\nsee individual propertiesThis example draws ovals of 15em\nwide and 10em high: DIV.standout { width: 13em; height: 8em;\nborder: solid black 1em; border-radius: 7.5em 5em }\n(CSS3)",
+    'border-bottom-right-radius': "The two length or percentage values of the 'border-*-radius'\nproperties define the radii of a quarter ellipse that\ndefines the shape of the corner of the outer border edge\n(see the diagram below). The first value is the horizontal\nradius, the second the vertical radius. If the second value\nis omitted it is copied from the first. If either length is\nzero, the corner is square, not rounded. Percentages for the\nhorizontal radius refer to the width of the border box,\nwhereas percentages for the vertical radius refer to the\nheight of the border box. The two values of ' border-top-\nleft-radius: 55pt 25pt ' define the curvature of the corner.\nThe two values of ' border-top-left-radius: 55pt 25pt '\ndefine the curvature of the corner. The 'border-radius'\nshorthand sets all four 'border-*-radius' properties. If\nvalues are given before and after the slash, then the values\nbefore the slash set the horizontal radius and the values\nafter the slash set the vertical radius. If there is no\nslash, then the values set both radii equally. The four\nvalues for each radii are given in the order top-left, top-\nright, bottom-right, bottom-left. If bottom-left is omitted\nit is the same as top-right. If bottom-right is omitted it\nis the same as top-left. If top-right is omitted it is the\nsame as top-left. border-radius: 4em; is equivalent to\nborder-top-left-radius: 4em; border-top-right-radius: 4em;\nborder-bottom-right-radius: 4em; border-bottom-left-radius:\n4em; and border-radius: 2em 1em 4em / 0.5em 3em; is\nequivalent to border-top-left-radius: 2em 0.5em; border-top-\nright-radius: 1em 3em; border-bottom-right-radius: 4em\n0.5em; border-bottom-left-radius: 1em 3em; 4.4.1. Corner\nShapingThe padding edge (inner border) radius is the outer\nborder radius minus the corresponding border thickness. In\nthe case where this results in a negative value, the inner\nradius is zero. (In such cases its center might not coincide\nwith that of the outer border curve.) Likewise the content\nedge radius is the padding edge radius minus the\ncorresponding padding, or if that is negative, zero. The\nborder and padding thicknesses in the curved region are thus\ninterpolated from the adjoining sides, and when two\nadjoining borders are of different thicknesses the corner\nwill show a smooth transition between the thicker and\nthinner borders. Note that this means that if the outer\ncurve extends past the adjacent corner's padding edge, the\ninner curve may not be a full quarter ellipse. All border\nstyles ('solid', 'dotted', 'inset', etc.) follow the curve\nof the border. The effect of a rounded corner when the two\nborders it connects are of unequal thickness (left) and the\neffect of a rounded corner on borders that are thicker than\nthe radius of the corner (right). 4.4.2. Corner ClippingThe\neffect of a rounded corner when the two borders it connects\nare of unequal thickness (left) and the effect of a rounded\ncorner on borders that are thicker than the radius of the\ncorner (right). A box's backgrounds, but not its border-\nimage, are clipped to the appropriate curve (as determined\nby 'background-clip'). Other effects that clip to the border\nor padding edge (such as 'overflow' other than 'visible')\nalso must clip to the curve. The content of replaced\nelements is always trimmed to the content edge curve. Also,\nthe area outside the curve of the border edge does not\naccept mouse events on behalf of the element. This example\nadds appropriate padding, so that the contents do not\noverflow the corners. Note that there is no border, but the\nbackground will still have rounded corners. DIV {\nbackground: black; color: white; border-radius: 1em;\npadding: 1em } 4.4.3. Color and Style TransitionsThis\nexample adds appropriate padding, so that the contents do\nnot overflow the corners. Note that there is no border, but\nthe background will still have rounded corners. DIV {\nbackground: black; color: white; border-radius: 1em;\npadding: 1em }Color and style transitions must be contained\nwithin the segment of the border that intersects the\nsmallest rectangle that contains both border radii as well\nas the center of the inner curve (which may be a point\nrepresenting the corner of the padding edge, if the border\nradii are smaller than the border-width). The center of\ncolor and style transitions between adjoining borders is at\nthe point on the curve that is at an angle that is\nproportional to the ratio of the border widths. For example,\nif the top and right border widths are equal, that point is\nat a 45 angle from the horizontal, and if the top is twice\nthe width of the right the point is at a 30 angle from the\nhorizontal. The line demarcating this transition is drawn\nbetween the point at that angle on the outer arc and the\npoint at that angle on the inner arc. It is not defined what\nthese transitions look like, but a gradient is recommended\nfor color transitions that don't involve dotted or dashed\nborders. Given these corner shapes, color and style\ntransitions must be contained within the green region. In\ncase D the rectangle defined by the border radii does not\ninclude the center of the inner curve (which is a sharp\ncorner), so the transition region is expanded to include\nthat corner. Transitions may take up the entire transition\nregion, but are not required to: For example, a gradient\ncolor transition between two solid border styles might take\nup only the region bounded by the tips of the outer radii\nand the tips of the inner radii (represented in case D by\nthe dark green region). 4.4.4. Overlapping CurvesGiven these\ncorner shapes, color and style transitions must be contained\nwithin the green region. In case D the rectangle defined by\nthe border radii does not include the center of the inner\ncurve (which is a sharp corner), so the transition region is\nexpanded to include that corner. Transitions may take up the\nentire transition region, but are not required to: For\nexample, a gradient color transition between two solid\nborder styles might take up only the region bounded by the\ntips of the outer radii and the tips of the inner radii\n(represented in case D by the dark green region). Corner\ncurves must not overlap: When the sum of any two adjacent\nborder radii exceeds the size of the border box, UAs must\nproportionally reduce the used value of all border radii\nuntil none of them overlap. The algorithm for reducing radii\nis as follows:Let f = min( L i / S i ), where i ? {top,\nright, bottom, left}, S i is the sum of the radii of the\ncorners on side i, and L top = L bottom = the width of the\nbox, and L left = L right = the height of the box. If f < 1,\nthen all corner radii are reduced by multiplying them by f.\nNote that this formula ensures that quarter circles remain\nquarter circles and large radii remain larger than smaller\nones, but it may reduce corners that were already small\nenough, which may make borders of nearby elements that\nshould look the same look different. If the curve interferes\nwith UI elements such as scrollbars, the UA may further\nreduce the used value of the affected border radii (and only\nthe affected border radii) as much as necessary, but no\nmore. The rendering of the box must be exactly the same as\nif the reduced border-radius values were those originally\nspecified. For example, the borders A and D of the figure\nbelow might be the result of box-sizing: border-box; width:\n6em; height: 2.5em; border-radius: 0.5em 2em 0.5em 2em The\nheight (2.5em) is enough for the specified radii (0.5em plus\n2.5em). However, if the height is only 2em, box-sizing:\nborder-box; width: 6em; height: 2em; border-radius: 0.5em\n2em 0.5em 2em all corners need to be reduced by a factor 0.8\nto make them fit. The used border radii thus are 0.4em\n(instead of 0.5em) and 1.6em (instead of 2em). See borders B\nand C in the figure. These rounded corner might be the\nresult of ' width: 6em; height: 2.5em; border-radius: 0.5em\n2em 0.5em 2em ' for A and D; and ditto but with ' height:\n2em ' for B and C. 4.4.5. Effect on TablesFor example, the\nborders A and D of the figure below might be the result of\nbox-sizing: border-box; width: 6em; height: 2.5em; border-\nradius: 0.5em 2em 0.5em 2emThe height (2.5em) is enough for\nthe specified radii (0.5em plus 2.5em). However, if the\nheight is only 2em, box-sizing: border-box; width: 6em;\nheight: 2em; border-radius: 0.5em 2em 0.5em 2emall corners\nneed to be reduced by a factor 0.8 to make them fit. The\nused border radii thus are 0.4em (instead of 0.5em) and\n1.6em (instead of 2em). See borders B and C in the figure.\nThese rounded corner might be the result of ' width: 6em;\nheight: 2.5em; border-radius: 0.5em 2em 0.5em 2em ' for A\nand D; and ditto but with ' height: 2em ' for B and C. These\nrounded corner might be the result of ' width: 6em; height:\n2.5em; border-radius: 0.5em 2em 0.5em 2em ' for A and D; and\nditto but with ' height: 2em ' for B and C. The 'border-\nradius' properties do apply to 'table'and'inline-table'\nelements. When 'border-collapse'is'collapse', the UA may\napply the border-radius properties to 'table'and'inline-\ntable' elements, but is not required to. In this case not\nonly must the border radii of adjacent corners not\nintersect, but the horizontal and vertical radii of a single\ncorner may not extend past the boundaries of the cell at\nthat corner (i.e. the cell's other corners must not be\naffected by this corner's border-radius). If the computed\nvalues of the border radii would cause this effect, then the\nused values of all the border radii of the table must be\nreduced by the same factor so that the radii neither\nintersect nor extend past the boundaries of their respective\ncorner cells. The effect of border-radius on internal table\nelements is undefined in CSS3 Backgrounds and Borders, but\nmay be defined in a future specification. CSS3 UAs should\nignore border-radius properties applied to internal table\nelements when 'border-collapse'is'collapse'. This example\ndraws ovals of 15em wide and 10em high: DIV.standout {\nwidth: 13em; height: 8em; border: solid black 1em; border-\nradius: 7.5em 5em } 4.5. The border shorthand properties\nName: border-top, border-right, border-bottom, border-left\nValue: <border-width> || <border-style> || <color> Initial:\nSee individual properties Applies to: all elements\nInherited: no Percentages: N/A Media: visual Computed value:\nsee individual propertiesThis example draws ovals of 15em\nwide and 10em high: DIV.standout { width: 13em; height: 8em;\nborder: solid black 1em; border-radius: 7.5em 5em }\n(CSS3)",
+    'border-bottom-style': "Specifies the line style of a box's bottom border (solid, double, dashed, hidden, etc.)\n(CSS2, CSS3)",
+    'border-bottom-width': 'Sets the width of the bottom border of a\nbox\n(CSS1, CSS2, CSS3)',
+    'border-collapse': "This property selects a table's border model.\n(CSS2, CSS3)",
+    'border-color': 'Sets the color of the four borders\n(CSS1, CSS2, CSS3)',
+    'border-image': "This is a shorthand property for setting 'border-image-\nsource', 'border-image-slice', 'border-image-width',\n'border-image-outset'and'border-image-repeat'. Omitted\nvalues are set to their initial values. 6. Miscellaneous\nEffects 6.1. The 'box-decoration-break' property Name: box-\ndecoration-break Value: slice | clone Initial: slice Applies\nto: all elements Inherited: no Percentages: N/A Media:\nvisual Computed value: as specified\n(CSS3)",
+    'border-left': 'Shorthand for border-width, border-style\nand border-color affecting the left\nborder\n(CSS1, CSS2, CSS3)',
+    'border-left-color': 'Sets the color of the left border\n(CSS2, CSS3)',
+    'border-left-style': "Specifies the line style of a box's left border (solid, double, dashed, hidden, etc.)\n(CSS2, CSS3)",
+    'border-left-width': 'Sets the width of the left border of a\nbox\n(CSS1, CSS2, CSS3)',
+    'border-radius': "The two length or percentage values of the 'border-*-radius'\nproperties define the radii of a quarter ellipse that\ndefines the shape of the corner of the outer border edge\n(see the diagram below). The first value is the horizontal\nradius, the second the vertical radius. If the second value\nis omitted it is copied from the first. If either length is\nzero, the corner is square, not rounded. Percentages for the\nhorizontal radius refer to the width of the border box,\nwhereas percentages for the vertical radius refer to the\nheight of the border box. The two values of ' border-top-\nleft-radius: 55pt 25pt ' define the curvature of the corner.\nThe two values of ' border-top-left-radius: 55pt 25pt '\ndefine the curvature of the corner. The 'border-radius'\nshorthand sets all four 'border-*-radius' properties. If\nvalues are given before and after the slash, then the values\nbefore the slash set the horizontal radius and the values\nafter the slash set the vertical radius. If there is no\nslash, then the values set both radii equally. The four\nvalues for each radii are given in the order top-left, top-\nright, bottom-right, bottom-left. If bottom-left is omitted\nit is the same as top-right. If bottom-right is omitted it\nis the same as top-left. If top-right is omitted it is the\nsame as top-left. border-radius: 4em; is equivalent to\nborder-top-left-radius: 4em; border-top-right-radius: 4em;\nborder-bottom-right-radius: 4em; border-bottom-left-radius:\n4em; and border-radius: 2em 1em 4em / 0.5em 3em; is\nequivalent to border-top-left-radius: 2em 0.5em; border-top-\nright-radius: 1em 3em; border-bottom-right-radius: 4em\n0.5em; border-bottom-left-radius: 1em 3em; 4.4.1. Corner\nShapingThe padding edge (inner border) radius is the outer\nborder radius minus the corresponding border thickness. In\nthe case where this results in a negative value, the inner\nradius is zero. (In such cases its center might not coincide\nwith that of the outer border curve.) Likewise the content\nedge radius is the padding edge radius minus the\ncorresponding padding, or if that is negative, zero. The\nborder and padding thicknesses in the curved region are thus\ninterpolated from the adjoining sides, and when two\nadjoining borders are of different thicknesses the corner\nwill show a smooth transition between the thicker and\nthinner borders. Note that this means that if the outer\ncurve extends past the adjacent corner's padding edge, the\ninner curve may not be a full quarter ellipse. All border\nstyles ('solid', 'dotted', 'inset', etc.) follow the curve\nof the border. The effect of a rounded corner when the two\nborders it connects are of unequal thickness (left) and the\neffect of a rounded corner on borders that are thicker than\nthe radius of the corner (right). 4.4.2. Corner ClippingThe\neffect of a rounded corner when the two borders it connects\nare of unequal thickness (left) and the effect of a rounded\ncorner on borders that are thicker than the radius of the\ncorner (right). A box's backgrounds, but not its border-\nimage, are clipped to the appropriate curve (as determined\nby 'background-clip'). Other effects that clip to the border\nor padding edge (such as 'overflow' other than 'visible')\nalso must clip to the curve. The content of replaced\nelements is always trimmed to the content edge curve. Also,\nthe area outside the curve of the border edge does not\naccept mouse events on behalf of the element. This example\nadds appropriate padding, so that the contents do not\noverflow the corners. Note that there is no border, but the\nbackground will still have rounded corners. DIV {\nbackground: black; color: white; border-radius: 1em;\npadding: 1em } 4.4.3. Color and Style TransitionsThis\nexample adds appropriate padding, so that the contents do\nnot overflow the corners. Note that there is no border, but\nthe background will still have rounded corners. DIV {\nbackground: black; color: white; border-radius: 1em;\npadding: 1em }Color and style transitions must be contained\nwithin the segment of the border that intersects the\nsmallest rectangle that contains both border radii as well\nas the center of the inner curve (which may be a point\nrepresenting the corner of the padding edge, if the border\nradii are smaller than the border-width). The center of\ncolor and style transitions between adjoining borders is at\nthe point on the curve that is at an angle that is\nproportional to the ratio of the border widths. For example,\nif the top and right border widths are equal, that point is\nat a 45 angle from the horizontal, and if the top is twice\nthe width of the right the point is at a 30 angle from the\nhorizontal. The line demarcating this transition is drawn\nbetween the point at that angle on the outer arc and the\npoint at that angle on the inner arc. It is not defined what\nthese transitions look like, but a gradient is recommended\nfor color transitions that don't involve dotted or dashed\nborders. Given these corner shapes, color and style\ntransitions must be contained within the green region. In\ncase D the rectangle defined by the border radii does not\ninclude the center of the inner curve (which is a sharp\ncorner), so the transition region is expanded to include\nthat corner. Transitions may take up the entire transition\nregion, but are not required to: For example, a gradient\ncolor transition between two solid border styles might take\nup only the region bounded by the tips of the outer radii\nand the tips of the inner radii (represented in case D by\nthe dark green region). 4.4.4. Overlapping CurvesGiven these\ncorner shapes, color and style transitions must be contained\nwithin the green region. In case D the rectangle defined by\nthe border radii does not include the center of the inner\ncurve (which is a sharp corner), so the transition region is\nexpanded to include that corner. Transitions may take up the\nentire transition region, but are not required to: For\nexample, a gradient color transition between two solid\nborder styles might take up only the region bounded by the\ntips of the outer radii and the tips of the inner radii\n(represented in case D by the dark green region). Corner\ncurves must not overlap: When the sum of any two adjacent\nborder radii exceeds the size of the border box, UAs must\nproportionally reduce the used value of all border radii\nuntil none of them overlap. The algorithm for reducing radii\nis as follows:Let f = min( L i / S i ), where i ? {top,\nright, bottom, left}, S i is the sum of the radii of the\ncorners on side i, and L top = L bottom = the width of the\nbox, and L left = L right = the height of the box. If f < 1,\nthen all corner radii are reduced by multiplying them by f.\nNote that this formula ensures that quarter circles remain\nquarter circles and large radii remain larger than smaller\nones, but it may reduce corners that were already small\nenough, which may make borders of nearby elements that\nshould look the same look different. If the curve interferes\nwith UI elements such as scrollbars, the UA may further\nreduce the used value of the affected border radii (and only\nthe affected border radii) as much as necessary, but no\nmore. The rendering of the box must be exactly the same as\nif the reduced border-radius values were those originally\nspecified. For example, the borders A and D of the figure\nbelow might be the result of box-sizing: border-box; width:\n6em; height: 2.5em; border-radius: 0.5em 2em 0.5em 2em The\nheight (2.5em) is enough for the specified radii (0.5em plus\n2.5em). However, if the height is only 2em, box-sizing:\nborder-box; width: 6em; height: 2em; border-radius: 0.5em\n2em 0.5em 2em all corners need to be reduced by a factor 0.8\nto make them fit. The used border radii thus are 0.4em\n(instead of 0.5em) and 1.6em (instead of 2em). See borders B\nand C in the figure. These rounded corner might be the\nresult of ' width: 6em; height: 2.5em; border-radius: 0.5em\n2em 0.5em 2em ' for A and D; and ditto but with ' height:\n2em ' for B and C. 4.4.5. Effect on TablesFor example, the\nborders A and D of the figure below might be the result of\nbox-sizing: border-box; width: 6em; height: 2.5em; border-\nradius: 0.5em 2em 0.5em 2emThe height (2.5em) is enough for\nthe specified radii (0.5em plus 2.5em). However, if the\nheight is only 2em, box-sizing: border-box; width: 6em;\nheight: 2em; border-radius: 0.5em 2em 0.5em 2emall corners\nneed to be reduced by a factor 0.8 to make them fit. The\nused border radii thus are 0.4em (instead of 0.5em) and\n1.6em (instead of 2em). See borders B and C in the figure.\nThese rounded corner might be the result of ' width: 6em;\nheight: 2.5em; border-radius: 0.5em 2em 0.5em 2em ' for A\nand D; and ditto but with ' height: 2em ' for B and C. These\nrounded corner might be the result of ' width: 6em; height:\n2.5em; border-radius: 0.5em 2em 0.5em 2em ' for A and D; and\nditto but with ' height: 2em ' for B and C. The 'border-\nradius' properties do apply to 'table'and'inline-table'\nelements. When 'border-collapse'is'collapse', the UA may\napply the border-radius properties to 'table'and'inline-\ntable' elements, but is not required to. In this case not\nonly must the border radii of adjacent corners not\nintersect, but the horizontal and vertical radii of a single\ncorner may not extend past the boundaries of the cell at\nthat corner (i.e. the cell's other corners must not be\naffected by this corner's border-radius). If the computed\nvalues of the border radii would cause this effect, then the\nused values of all the border radii of the table must be\nreduced by the same factor so that the radii neither\nintersect nor extend past the boundaries of their respective\ncorner cells. The effect of border-radius on internal table\nelements is undefined in CSS3 Backgrounds and Borders, but\nmay be defined in a future specification. CSS3 UAs should\nignore border-radius properties applied to internal table\nelements when 'border-collapse'is'collapse'. This example\ndraws ovals of 15em wide and 10em high: DIV.standout {\nwidth: 13em; height: 8em; border: solid black 1em; border-\nradius: 7.5em 5em } 4.5. The border shorthand properties\nName: border-top, border-right, border-bottom, border-left\nValue: <border-width> || <border-style> || <color> Initial:\nSee individual properties Applies to: all elements\nInherited: no Percentages: N/A Media: visual Computed value:\nsee individual propertiesThis example draws ovals of 15em\nwide and 10em high: DIV.standout { width: 13em; height: 8em;\nborder: solid black 1em; border-radius: 7.5em 5em }\n(CSS3)",
+    'border-right': 'Shorthand for border-width, border-style\nand border-color affecting the right\nborder\n(CSS1, CSS2, CSS3)',
+    'border-right-color': 'Sets the color of the right border\n(CSS2, CSS3)',
+    'border-right-style': "Specifies the line style of a box's right border (solid, double, dashed, hidden, etc.)\n(CSS2, CSS3)",
+    'border-right-width': 'Sets the width of the right border of a\nbox\n(CSS1, CSS2, CSS3)',
+    'border-spacing': 'The lengths specify the distance that separates adjacent cell borders. If one length is specified, it gives both the horizontal and vertical spacing. If two are specified, the first gives the horizontal spacing and the second the vertical spacing. Lengths may not be negative.\n(CSS2, CSS3)',
+    'border-style': "Specifies the line style of a box's four\nborders (solid, double, dashed, hidden,\netc.)\n(CSS1, CSS2, CSS3)",
+    'border-top': 'Shorthand for border-width, border-style\nand border-color affecting the top\nborder\n(CSS1, CSS2, CSS3)',
+    'border-top-color': 'Sets the color of the top border\n(CSS2, CSS3)',
+    'border-top-left-radius': "The two length or percentage values of the 'border-*-radius'\nproperties define the radii of a quarter ellipse that\ndefines the shape of the corner of the outer border edge\n(see the diagram below). The first value is the horizontal\nradius, the second the vertical radius. If the second value\nis omitted it is copied from the first. If either length is\nzero, the corner is square, not rounded. Percentages for the\nhorizontal radius refer to the width of the border box,\nwhereas percentages for the vertical radius refer to the\nheight of the border box. The two values of ' border-top-\nleft-radius: 55pt 25pt ' define the curvature of the corner.\nThe two values of ' border-top-left-radius: 55pt 25pt '\ndefine the curvature of the corner. The 'border-radius'\nshorthand sets all four 'border-*-radius' properties. If\nvalues are given before and after the slash, then the values\nbefore the slash set the horizontal radius and the values\nafter the slash set the vertical radius. If there is no\nslash, then the values set both radii equally. The four\nvalues for each radii are given in the order top-left, top-\nright, bottom-right, bottom-left. If bottom-left is omitted\nit is the same as top-right. If bottom-right is omitted it\nis the same as top-left. If top-right is omitted it is the\nsame as top-left. border-radius: 4em; is equivalent to\nborder-top-left-radius: 4em; border-top-right-radius: 4em;\nborder-bottom-right-radius: 4em; border-bottom-left-radius:\n4em; and border-radius: 2em 1em 4em / 0.5em 3em; is\nequivalent to border-top-left-radius: 2em 0.5em; border-top-\nright-radius: 1em 3em; border-bottom-right-radius: 4em\n0.5em; border-bottom-left-radius: 1em 3em; 4.4.1. Corner\nShapingThe padding edge (inner border) radius is the outer\nborder radius minus the corresponding border thickness. In\nthe case where this results in a negative value, the inner\nradius is zero. (In such cases its center might not coincide\nwith that of the outer border curve.) Likewise the content\nedge radius is the padding edge radius minus the\ncorresponding padding, or if that is negative, zero. The\nborder and padding thicknesses in the curved region are thus\ninterpolated from the adjoining sides, and when two\nadjoining borders are of different thicknesses the corner\nwill show a smooth transition between the thicker and\nthinner borders. Note that this means that if the outer\ncurve extends past the adjacent corner's padding edge, the\ninner curve may not be a full quarter ellipse. All border\nstyles ('solid', 'dotted', 'inset', etc.) follow the curve\nof the border. The effect of a rounded corner when the two\nborders it connects are of unequal thickness (left) and the\neffect of a rounded corner on borders that are thicker than\nthe radius of the corner (right). 4.4.2. Corner ClippingThe\neffect of a rounded corner when the two borders it connects\nare of unequal thickness (left) and the effect of a rounded\ncorner on borders that are thicker than the radius of the\ncorner (right). A box's backgrounds, but not its border-\nimage, are clipped to the appropriate curve (as determined\nby 'background-clip'). Other effects that clip to the border\nor padding edge (such as 'overflow' other than 'visible')\nalso must clip to the curve. The content of replaced\nelements is always trimmed to the content edge curve. Also,\nthe area outside the curve of the border edge does not\naccept mouse events on behalf of the element. This example\nadds appropriate padding, so that the contents do not\noverflow the corners. Note that there is no border, but the\nbackground will still have rounded corners. DIV {\nbackground: black; color: white; border-radius: 1em;\npadding: 1em } 4.4.3. Color and Style TransitionsThis\nexample adds appropriate padding, so that the contents do\nnot overflow the corners. Note that there is no border, but\nthe background will still have rounded corners. DIV {\nbackground: black; color: white; border-radius: 1em;\npadding: 1em }Color and style transitions must be contained\nwithin the segment of the border that intersects the\nsmallest rectangle that contains both border radii as well\nas the center of the inner curve (which may be a point\nrepresenting the corner of the padding edge, if the border\nradii are smaller than the border-width). The center of\ncolor and style transitions between adjoining borders is at\nthe point on the curve that is at an angle that is\nproportional to the ratio of the border widths. For example,\nif the top and right border widths are equal, that point is\nat a 45 angle from the horizontal, and if the top is twice\nthe width of the right the point is at a 30 angle from the\nhorizontal. The line demarcating this transition is drawn\nbetween the point at that angle on the outer arc and the\npoint at that angle on the inner arc. It is not defined what\nthese transitions look like, but a gradient is recommended\nfor color transitions that don't involve dotted or dashed\nborders. Given these corner shapes, color and style\ntransitions must be contained within the green region. In\ncase D the rectangle defined by the border radii does not\ninclude the center of the inner curve (which is a sharp\ncorner), so the transition region is expanded to include\nthat corner. Transitions may take up the entire transition\nregion, but are not required to: For example, a gradient\ncolor transition between two solid border styles might take\nup only the region bounded by the tips of the outer radii\nand the tips of the inner radii (represented in case D by\nthe dark green region). 4.4.4. Overlapping CurvesGiven these\ncorner shapes, color and style transitions must be contained\nwithin the green region. In case D the rectangle defined by\nthe border radii does not include the center of the inner\ncurve (which is a sharp corner), so the transition region is\nexpanded to include that corner. Transitions may take up the\nentire transition region, but are not required to: For\nexample, a gradient color transition between two solid\nborder styles might take up only the region bounded by the\ntips of the outer radii and the tips of the inner radii\n(represented in case D by the dark green region). Corner\ncurves must not overlap: When the sum of any two adjacent\nborder radii exceeds the size of the border box, UAs must\nproportionally reduce the used value of all border radii\nuntil none of them overlap. The algorithm for reducing radii\nis as follows:Let f = min( L i / S i ), where i ? {top,\nright, bottom, left}, S i is the sum of the radii of the\ncorners on side i, and L top = L bottom = the width of the\nbox, and L left = L right = the height of the box. If f < 1,\nthen all corner radii are reduced by multiplying them by f.\nNote that this formula ensures that quarter circles remain\nquarter circles and large radii remain larger than smaller\nones, but it may reduce corners that were already small\nenough, which may make borders of nearby elements that\nshould look the same look different. If the curve interferes\nwith UI elements such as scrollbars, the UA may further\nreduce the used value of the affected border radii (and only\nthe affected border radii) as much as necessary, but no\nmore. The rendering of the box must be exactly the same as\nif the reduced border-radius values were those originally\nspecified. For example, the borders A and D of the figure\nbelow might be the result of box-sizing: border-box; width:\n6em; height: 2.5em; border-radius: 0.5em 2em 0.5em 2em The\nheight (2.5em) is enough for the specified radii (0.5em plus\n2.5em). However, if the height is only 2em, box-sizing:\nborder-box; width: 6em; height: 2em; border-radius: 0.5em\n2em 0.5em 2em all corners need to be reduced by a factor 0.8\nto make them fit. The used border radii thus are 0.4em\n(instead of 0.5em) and 1.6em (instead of 2em). See borders B\nand C in the figure. These rounded corner might be the\nresult of ' width: 6em; height: 2.5em; border-radius: 0.5em\n2em 0.5em 2em ' for A and D; and ditto but with ' height:\n2em ' for B and C. 4.4.5. Effect on TablesFor example, the\nborders A and D of the figure below might be the result of\nbox-sizing: border-box; width: 6em; height: 2.5em; border-\nradius: 0.5em 2em 0.5em 2emThe height (2.5em) is enough for\nthe specified radii (0.5em plus 2.5em). However, if the\nheight is only 2em, box-sizing: border-box; width: 6em;\nheight: 2em; border-radius: 0.5em 2em 0.5em 2emall corners\nneed to be reduced by a factor 0.8 to make them fit. The\nused border radii thus are 0.4em (instead of 0.5em) and\n1.6em (instead of 2em). See borders B and C in the figure.\nThese rounded corner might be the result of ' width: 6em;\nheight: 2.5em; border-radius: 0.5em 2em 0.5em 2em ' for A\nand D; and ditto but with ' height: 2em ' for B and C. These\nrounded corner might be the result of ' width: 6em; height:\n2.5em; border-radius: 0.5em 2em 0.5em 2em ' for A and D; and\nditto but with ' height: 2em ' for B and C. The 'border-\nradius' properties do apply to 'table'and'inline-table'\nelements. When 'border-collapse'is'collapse', the UA may\napply the border-radius properties to 'table'and'inline-\ntable' elements, but is not required to. In this case not\nonly must the border radii of adjacent corners not\nintersect, but the horizontal and vertical radii of a single\ncorner may not extend past the boundaries of the cell at\nthat corner (i.e. the cell's other corners must not be\naffected by this corner's border-radius). If the computed\nvalues of the border radii would cause this effect, then the\nused values of all the border radii of the table must be\nreduced by the same factor so that the radii neither\nintersect nor extend past the boundaries of their respective\ncorner cells. The effect of border-radius on internal table\nelements is undefined in CSS3 Backgrounds and Borders, but\nmay be defined in a future specification. CSS3 UAs should\nignore border-radius properties applied to internal table\nelements when 'border-collapse'is'collapse'. This example\ndraws ovals of 15em wide and 10em high: DIV.standout {\nwidth: 13em; height: 8em; border: solid black 1em; border-\nradius: 7.5em 5em } 4.5. The border shorthand properties\nName: border-top, border-right, border-bottom, border-left\nValue: <border-width> || <border-style> || <color> Initial:\nSee individual properties Applies to: all elements\nInherited: no Percentages: N/A Media: visual Computed value:\nsee individual propertiesThis example draws ovals of 15em\nwide and 10em high: DIV.standout { width: 13em; height: 8em;\nborder: solid black 1em; border-radius: 7.5em 5em }\n(CSS3)",
+    'border-top-right-radius': "The two length or percentage values of the 'border-*-radius'\nproperties define the radii of a quarter ellipse that\ndefines the shape of the corner of the outer border edge\n(see the diagram below). The first value is the horizontal\nradius, the second the vertical radius. If the second value\nis omitted it is copied from the first. If either length is\nzero, the corner is square, not rounded. Percentages for the\nhorizontal radius refer to the width of the border box,\nwhereas percentages for the vertical radius refer to the\nheight of the border box. The two values of ' border-top-\nleft-radius: 55pt 25pt ' define the curvature of the corner.\nThe two values of ' border-top-left-radius: 55pt 25pt '\ndefine the curvature of the corner. The 'border-radius'\nshorthand sets all four 'border-*-radius' properties. If\nvalues are given before and after the slash, then the values\nbefore the slash set the horizontal radius and the values\nafter the slash set the vertical radius. If there is no\nslash, then the values set both radii equally. The four\nvalues for each radii are given in the order top-left, top-\nright, bottom-right, bottom-left. If bottom-left is omitted\nit is the same as top-right. If bottom-right is omitted it\nis the same as top-left. If top-right is omitted it is the\nsame as top-left. border-radius: 4em; is equivalent to\nborder-top-left-radius: 4em; border-top-right-radius: 4em;\nborder-bottom-right-radius: 4em; border-bottom-left-radius:\n4em; and border-radius: 2em 1em 4em / 0.5em 3em; is\nequivalent to border-top-left-radius: 2em 0.5em; border-top-\nright-radius: 1em 3em; border-bottom-right-radius: 4em\n0.5em; border-bottom-left-radius: 1em 3em; 4.4.1. Corner\nShapingThe padding edge (inner border) radius is the outer\nborder radius minus the corresponding border thickness. In\nthe case where this results in a negative value, the inner\nradius is zero. (In such cases its center might not coincide\nwith that of the outer border curve.) Likewise the content\nedge radius is the padding edge radius minus the\ncorresponding padding, or if that is negative, zero. The\nborder and padding thicknesses in the curved region are thus\ninterpolated from the adjoining sides, and when two\nadjoining borders are of different thicknesses the corner\nwill show a smooth transition between the thicker and\nthinner borders. Note that this means that if the outer\ncurve extends past the adjacent corner's padding edge, the\ninner curve may not be a full quarter ellipse. All border\nstyles ('solid', 'dotted', 'inset', etc.) follow the curve\nof the border. The effect of a rounded corner when the two\nborders it connects are of unequal thickness (left) and the\neffect of a rounded corner on borders that are thicker than\nthe radius of the corner (right). 4.4.2. Corner ClippingThe\neffect of a rounded corner when the two borders it connects\nare of unequal thickness (left) and the effect of a rounded\ncorner on borders that are thicker than the radius of the\ncorner (right). A box's backgrounds, but not its border-\nimage, are clipped to the appropriate curve (as determined\nby 'background-clip'). Other effects that clip to the border\nor padding edge (such as 'overflow' other than 'visible')\nalso must clip to the curve. The content of replaced\nelements is always trimmed to the content edge curve. Also,\nthe area outside the curve of the border edge does not\naccept mouse events on behalf of the element. This example\nadds appropriate padding, so that the contents do not\noverflow the corners. Note that there is no border, but the\nbackground will still have rounded corners. DIV {\nbackground: black; color: white; border-radius: 1em;\npadding: 1em } 4.4.3. Color and Style TransitionsThis\nexample adds appropriate padding, so that the contents do\nnot overflow the corners. Note that there is no border, but\nthe background will still have rounded corners. DIV {\nbackground: black; color: white; border-radius: 1em;\npadding: 1em }Color and style transitions must be contained\nwithin the segment of the border that intersects the\nsmallest rectangle that contains both border radii as well\nas the center of the inner curve (which may be a point\nrepresenting the corner of the padding edge, if the border\nradii are smaller than the border-width). The center of\ncolor and style transitions between adjoining borders is at\nthe point on the curve that is at an angle that is\nproportional to the ratio of the border widths. For example,\nif the top and right border widths are equal, that point is\nat a 45 angle from the horizontal, and if the top is twice\nthe width of the right the point is at a 30 angle from the\nhorizontal. The line demarcating this transition is drawn\nbetween the point at that angle on the outer arc and the\npoint at that angle on the inner arc. It is not defined what\nthese transitions look like, but a gradient is recommended\nfor color transitions that don't involve dotted or dashed\nborders. Given these corner shapes, color and style\ntransitions must be contained within the green region. In\ncase D the rectangle defined by the border radii does not\ninclude the center of the inner curve (which is a sharp\ncorner), so the transition region is expanded to include\nthat corner. Transitions may take up the entire transition\nregion, but are not required to: For example, a gradient\ncolor transition between two solid border styles might take\nup only the region bounded by the tips of the outer radii\nand the tips of the inner radii (represented in case D by\nthe dark green region). 4.4.4. Overlapping CurvesGiven these\ncorner shapes, color and style transitions must be contained\nwithin the green region. In case D the rectangle defined by\nthe border radii does not include the center of the inner\ncurve (which is a sharp corner), so the transition region is\nexpanded to include that corner. Transitions may take up the\nentire transition region, but are not required to: For\nexample, a gradient color transition between two solid\nborder styles might take up only the region bounded by the\ntips of the outer radii and the tips of the inner radii\n(represented in case D by the dark green region). Corner\ncurves must not overlap: When the sum of any two adjacent\nborder radii exceeds the size of the border box, UAs must\nproportionally reduce the used value of all border radii\nuntil none of them overlap. The algorithm for reducing radii\nis as follows:Let f = min( L i / S i ), where i ? {top,\nright, bottom, left}, S i is the sum of the radii of the\ncorners on side i, and L top = L bottom = the width of the\nbox, and L left = L right = the height of the box. If f < 1,\nthen all corner radii are reduced by multiplying them by f.\nNote that this formula ensures that quarter circles remain\nquarter circles and large radii remain larger than smaller\nones, but it may reduce corners that were already small\nenough, which may make borders of nearby elements that\nshould look the same look different. If the curve interferes\nwith UI elements such as scrollbars, the UA may further\nreduce the used value of the affected border radii (and only\nthe affected border radii) as much as necessary, but no\nmore. The rendering of the box must be exactly the same as\nif the reduced border-radius values were those originally\nspecified. For example, the borders A and D of the figure\nbelow might be the result of box-sizing: border-box; width:\n6em; height: 2.5em; border-radius: 0.5em 2em 0.5em 2em The\nheight (2.5em) is enough for the specified radii (0.5em plus\n2.5em). However, if the height is only 2em, box-sizing:\nborder-box; width: 6em; height: 2em; border-radius: 0.5em\n2em 0.5em 2em all corners need to be reduced by a factor 0.8\nto make them fit. The used border radii thus are 0.4em\n(instead of 0.5em) and 1.6em (instead of 2em). See borders B\nand C in the figure. These rounded corner might be the\nresult of ' width: 6em; height: 2.5em; border-radius: 0.5em\n2em 0.5em 2em ' for A and D; and ditto but with ' height:\n2em ' for B and C. 4.4.5. Effect on TablesFor example, the\nborders A and D of the figure below might be the result of\nbox-sizing: border-box; width: 6em; height: 2.5em; border-\nradius: 0.5em 2em 0.5em 2emThe height (2.5em) is enough for\nthe specified radii (0.5em plus 2.5em). However, if the\nheight is only 2em, box-sizing: border-box; width: 6em;\nheight: 2em; border-radius: 0.5em 2em 0.5em 2emall corners\nneed to be reduced by a factor 0.8 to make them fit. The\nused border radii thus are 0.4em (instead of 0.5em) and\n1.6em (instead of 2em). See borders B and C in the figure.\nThese rounded corner might be the result of ' width: 6em;\nheight: 2.5em; border-radius: 0.5em 2em 0.5em 2em ' for A\nand D; and ditto but with ' height: 2em ' for B and C. These\nrounded corner might be the result of ' width: 6em; height:\n2.5em; border-radius: 0.5em 2em 0.5em 2em ' for A and D; and\nditto but with ' height: 2em ' for B and C. The 'border-\nradius' properties do apply to 'table'and'inline-table'\nelements. When 'border-collapse'is'collapse', the UA may\napply the border-radius properties to 'table'and'inline-\ntable' elements, but is not required to. In this case not\nonly must the border radii of adjacent corners not\nintersect, but the horizontal and vertical radii of a single\ncorner may not extend past the boundaries of the cell at\nthat corner (i.e. the cell's other corners must not be\naffected by this corner's border-radius). If the computed\nvalues of the border radii would cause this effect, then the\nused values of all the border radii of the table must be\nreduced by the same factor so that the radii neither\nintersect nor extend past the boundaries of their respective\ncorner cells. The effect of border-radius on internal table\nelements is undefined in CSS3 Backgrounds and Borders, but\nmay be defined in a future specification. CSS3 UAs should\nignore border-radius properties applied to internal table\nelements when 'border-collapse'is'collapse'. This example\ndraws ovals of 15em wide and 10em high: DIV.standout {\nwidth: 13em; height: 8em; border: solid black 1em; border-\nradius: 7.5em 5em } 4.5. The border shorthand properties\nName: border-top, border-right, border-bottom, border-left\nValue: <border-width> || <border-style> || <color> Initial:\nSee individual properties Applies to: all elements\nInherited: no Percentages: N/A Media: visual Computed value:\nsee individual propertiesThis example draws ovals of 15em\nwide and 10em high: DIV.standout { width: 13em; height: 8em;\nborder: solid black 1em; border-radius: 7.5em 5em }\n(CSS3)",
+    'border-top-style': "Specifies the line style of a box's top border (solid, double, dashed, hidden, etc.)\n(CSS2, CSS3)",
+    'border-top-width': 'Sets the width of the top border of a\nbox\n(CSS1, CSS2, CSS3)',
+    'border-width': "Shorthand for setting 'border-top-\nwidth', 'border-right-width', 'border-\nbottom-width', and 'border-left-width'\nat the same place in the style sheet. If\nthere is only one value, it applies to\nall sides. If there are two values, the\ntop and bottom borders are set to the\nfirst value and the right and left are\nset to the second. If there are three\nvalues, the top is set to the first\nvalue, the left and right are set to the\nsecond, and the bottom is set to the\nthird. If there are four values, they\napply to the top, right, bottom, and\nleft, respectively.\n(CSS1, CSS2, CSS3)",
+    'bottom': "Specifies how far a box's bottom content edge is offset above the bottom of the box's containing block\n(CSS2, CSS3)",
+    'box-align': "When the size of the containing box is larger than the size\nof a child, extra space will be available. The 'box-align'\nproperty specifies how a box's children are placed and\naligned along the direction perpendicular to the box\norientation, and where the extra space, if any, is\npositioned. For horizontal orientation, it specifies how the\nchildren are positioned vertically. For vertical\norientation, it specifies how the children are positioned\nhorizontally. The amount of extra space may be different for\neach child. For example, if the containing box has a height\nof 200 pixels, and it contains two children at 100 and 150\npixels respectively, there will be 100 pixels of extra space\nfor the first child and 50 pixels of space for the second\nchild. The following values are valid for the box-align\nproperty, but see the text afterward for more specifics as\nto how children are positioned.\n\n  'stretch': The height of each child is adjusted\n        to that of the containing block. However, note the\n        text below.\n  'start': For normal direction boxes, the top\n        edge of each child is placed along the top of the\n        box. Extra space is placed below the element. For\n        reverse direction boxes, the bottom edge of each\n        child is placed along the bottom of the box. Extra\n        space is placed above the element.\n  'end': For normal direction boxes, the bottom\n        edge of each child is placed along the bottom of\n        the box. Extra space is placed above the element.\n        For reverse direction boxes, the top edge of each\n        child is placed along the top of the box. Extra\n        space is placed below the element.\n  'baseline': If this box orientation is inline-\n        axis or horizontal, all children are placed with\n        their baselines aligned, and extra space placed\n        before or after as necessary. For block flows, the\n        baseline of the first non-empty line box located\n        within the element is used. For tables, the\n        baseline of the first cell is used. The children,\n        once aligned on their baselines, should then be\n        placed into the box so that the child with the\n        earliest extent margin has its top margin edge (or\n        bottom margin edge for reverse direction boxes)\n        flush with the top (or bottom) edge of the box's\n        content area. If the box does not have an 'auto'\n        height, overflow will always be on the bottom (or\n        top for reverse direction boxes) edge. If the box\n        orientation is block-axis or vertical, then\n        baseline is interpreted as center.\n  'center': Any extra space is divided evenly,\n        with half placed above the child and the other\n        half placed after the child.\n(CSS3)",
+    'box-decoration-break': "When a box is broken at a page break, column break, or, for\ninline elements, at a line break, the 'box-decoration-break'\nproperty specifies whether individual boxes are treated as\nbroken pieces of one continuous box, or whether each box is\nindividually wrapped with the border and padding. For\nbackgrounds it defines how the background positioning area\nis derived from these multiple boxes and how the element's\nbackground is drawn within them. Values have the following\nmeanings: Two possibilities for 'box-decoration-break': on\nthe left, the value 'slice', on the right the value 'clone'.\n\n  'slice': No border and no padding are inserted\n        at the break. No box-shadow is drawn at the broken\n        edge; 'border-radius' has no effect at its\n        corners; and the 'border-image' is rendered for\n        the whole box as if it were unbroken. The effect\n        is as though the element were rendered with no\n        break present, and then sliced by the break\n        afterward. Backgrounds are drawn as if, after the\n        element has been laid out (including any\n        justification, bidi reordering, page breaks,\n        etc.), all the element's boxes are taken and put\n        one after the other in visual order. The\n        background is applied to the bounding box of this\n        composite box and then the boxes are put back,\n        with their share of the background. For boxes\n        broken across lines, first boxes on the same line\n        are connected in visual order. Then boxes on\n        subsequent lines are ordered according to the\n        element's inline progression direction and aligned\n        on the baseline. For example in a left-to-right\n        containing block ('direction'is'ltr'), the first\n        box is the leftmost box on the first line and\n        boxes from subsequent lines are put to the right\n        of it. In a right-to-left containing block, the\n        first box is the rightmost on the first line and\n        subsequent boxes are put to the left of it. For\n        boxes broken across columns, the columns are\n        treated as one continuous element, as if the\n        column boxes were glued together in the block\n        progression direction of the multi-column element.\n        For boxes broken across pages, the page content\n        areas are glued together in the block progression\n        direction of the root element. In these cases, if\n        the pieces have different widths (heights, if the\n        root element / multi-column element is in vertical\n        text mode), then each piece draws its background\n        assuming that the whole element has the same width\n        (height) as this piece. This ensures that right-\n        aligned images stay aligned to the right edge,\n        left-aligned images stay aligned to the left edge,\n        and centered images stay centered.\n(CSS3)",
+    'box-direction': "The 'box-direction' property specifies the direction in\nwhich children of a box are displayed.\n\n  'reverse': A box with a computed value of\n        horizontal for box-orient displays its children\n        from right to left. A box with a computed value of\n        vertical displays its children from bottom to top.\n  'normal': A box with a computed value of\n        horizontal for box-orient displays its children\n        from left to right. A box with a computed value of\n        vertical displays its children from top to bottom.\n(CSS3)",
+    'box-flex': 'An element is flexible when the box-flex property is\nspecified. The box-flex property is a floating point value\nrepresenting the flexibility of the element. Its initial\nvalue is 0, which indicates that the element is inflexible.\nElements that are flexible can shrink or grow as the box\nshrinks and grows. Whenever there is extra space left over\nin a box, the flexible elements are expanded to fill that\nspace. All flex is relative. For example, a child with a\nbox-flex of 2 is twice as flexible as a child with a box-\nflex of 1. A negative value for box-flex is not allowed.\nFlexible elements can be assigned to flex groups using the\n\'box-flex-group\' property. This property is a natural number\nvalue (the first flex group is 1 and higher values are later\nflex groups). The initial value is 1. In a horizontally\noriented box, the preferred width of each child is computed.\nIf the width of the margin box of each child is equal to the\nwidth of the containing block, then there is no extra space\navailable, so the preferred widths are used for each child.\nIf the width of the margin box adds up to a value smaller\nthan the width of the containing block, then extra space is\navailable. This extra space is divided up among the flexible\nchildren, as described below. If the width of the margin box\nadds up to a value larger than the width of the containing\nblock, then the flexible children shrink as much as\nnecessary to prevent overflow. Flexibility only applies to\nelements in normal flow. As absolute and fixed positioned\nelements are not in flow, any flexibility or flexgroup\nspecified on them is ignored. In addition, as the \'float\'\nproperty does not apply to children of flexible boxes, they\nare considered part of normal flow and flexibility does\napply. When dividing up extra space, first take all elements\nwithin the first flex group. Each element within that group\nshould be given extra width based on the ratio of that\nelement\'s flexibility compared to the flexibility of other\nelements within the same flex group. However, if the\npreferred width of the element plus the extra width allotted\nto it is larger than the maximum width of the element, then\nthe width is set to that maximum width, and any remaining\nextra width beyond that is divided up among the other\nchildren. In this example there is 60 pixels of extra space\navailable in the containing box. #div1 { display: box;\nwidth: 300px; } #button1 { box-flex: 1.0; width: 100px; }\n#button2 { box-flex: 2.0; width: 140px; } <div id="div1">\n<button id="button1">Hello</button> <button\nid="button2">Goodbye</button> </div> As both child buttons\nare flexible, the extra space will be divided up between\nthem. The first child button has a flexibility of 1.0 and\nthe second child button has a flexibility of 2.0. The first\nbutton will receive 20 pixels of extra width and the second\nbutton will receive 40 pixels of extra width, maintaining\nthe same ratio of extra width to flexibility values. This\nextra width is added to the preferred size of the element.\nHowever, if the second button had a maximum width of 150\npixels, it could only grow by 10 pixels before hitting this\nmaximum size, so the remaining 30 pixels would instead be\ngiven to the first element, breaking the flexibility ratio.\nIn this example there is 60 pixels of extra space available\nin the containing box. As both child buttons are flexible,\nthe extra space will be divided up between them. The first\nchild button has a flexibility of 1.0 and the second child\nbutton has a flexibility of 2.0. The first button will\nreceive 20 pixels of extra width and the second button will\nreceive 40 pixels of extra width, maintaining the same ratio\nof extra width to flexibility values. This extra width is\nadded to the preferred size of the element. However, if the\nsecond button had a maximum width of 150 pixels, it could\nonly grow by 10 pixels before hitting this maximum size, so\nthe remaining 30 pixels would instead be given to the first\nelement, breaking the flexibility ratio. More specifically,\nthe percentage of extra space that an element may receive is\ncalculated as follows:\' box-flex of child \' / \' total of\nbox-flex values of child and all siblings \'If the width of\nall flexible children within the group has been increased to\ntheir maximum widths, the process repeats for the children\nwithin the next flex group, using any space left over from\nthe previous flex group. Once there are no more flex groups,\nand there is still space remaining, the extra space is\ndivided within the containing box according to the box-pack\nproperty. If the box would overflow after the preferred\nwidth of the children have been computed, then width is\nremoved from flexible elements in a manner similar to that\nused when adding extra space. Each flex group is examined in\nturn and space is removed according to the ratio of the\nflexibility of each element. Elements do not shrink below\ntheir minimum widths. If all children have been shrunk to\ntheir minimum sizes, then the box overflows, although if the\nbox-lines property is set to multiple, the box may be able\nto move elements to additional lines to prevent this. For\nvertically oriented boxes, the algorithm as described above\nis similar except using the height instead of the width.\nWhen a child box of a horizontally oriented box contains an\ninline element, it is likely that shrinking the width of the\nelement due to flexibility may cause the inline element to\ngrow in height, as the text within it may need to wrap to\nadditional lines. Examples: #div1 { display: box; box-\norient: vertical; height: 200px } <div id="div1">\n<button>Cat</button> <button style="box-flex:\n1">Piranha</button>\n<button>Antidisestablishmentarianism</button> </div> In the\nexample above, the box is 200 pixels tall and is more than\nenough room for the three buttons. Because the first and\nthird buttons are inflexible, they remain the same size,\nwhich is their intrinsic size. The second button is\nspecified as being flexible, and because it is the only\nflexible element in the box, it receives all of the extra\nspace. <div style="display: box; box-orient: vertical;">\n<button style="box-flex: 1; height: 1000px;"> Cat </button>\n</div> In this example, if the height of the box is reduced,\nfor instance, because the user resized the containing\nviewport, the height of the flexible button also shrinks\nwith the box, despite the specification of 1000 pixels as\nthe preferred height. It continues to shrink until the\nminimum required height for the button is reached, which\nhere will likely be the height needed to display the\nbutton\'s label and border. After that, the button can shrink\nno further. Elements within a box can therefore have their\nown notions of minimum and maximum intrinsic sizes. In the\nabove example, the button could not get any smaller than the\nminimum height required to draw its borders and its text.\n#div1 { display: box; } #iframe1 { box-flex: 1; min-width:\n100px; max-width: 300px; height: 300px; } <div id="div1">\n<iframe id="iframe1" src="http://www.mozilla.org/"/> </div>\nIn this example, the iframe has a minimum width of 100\npixels and a maximum width of 300 pixels. If the containing\nbox is less than 100 pixels wide, the iframe will overflow\nits containing div. If the containing box is between 100\npixels and 300 pixels inclusive, the width of the iframe\nwould be set to that size, minus any necessary padding,\nborders and margins. If the width of the containing box is\nlarger than 300 pixels, the extra space will be added inside\nthe div. The extra space is added after the iframe inside\nthe box. <p style="display: box;"> <button style="box-flex:\n1; max-width: 50px;">Child 1</button> <button style="box-\nflex: 1; min-width: 50px;">Child 2</button> </p> In this\nexample, the box has been stretched so that it is very wide.\nThe first child has a maximum width of 50 pixels, and it\ndivides the excess space equally with the second child until\nits maximum width has been reached. After that, since it is\nnot allowed to grow any further, the remaining space all\ngoes to the second child. 6 Packing along the box axis Name:\nbox-pack Value: start | end | center | justify Initial:\nstart Applies to: box elements Inherited: no Percentages: no\nMedia: visual Computed value: specified valueExamples:In the\nexample above, the box is 200 pixels tall and is more than\nenough room for the three buttons. Because the first and\nthird buttons are inflexible, they remain the same size,\nwhich is their intrinsic size. The second button is\nspecified as being flexible, and because it is the only\nflexible element in the box, it receives all of the extra\nspace. In this example, if the height of the box is reduced,\nfor instance, because the user resized the containing\nviewport, the height of the flexible button also shrinks\nwith the box, despite the specification of 1000 pixels as\nthe preferred height. It continues to shrink until the\nminimum required height for the button is reached, which\nhere will likely be the height needed to display the\nbutton\'s label and border. After that, the button can shrink\nno further. Elements within a box can therefore have their\nown notions of minimum and maximum intrinsic sizes. In the\nabove example, the button could not get any smaller than the\nminimum height required to draw its borders and its text. In\nthis example, the iframe has a minimum width of 100 pixels\nand a maximum width of 300 pixels. If the containing box is\nless than 100 pixels wide, the iframe will overflow its\ncontaining div. If the containing box is between 100 pixels\nand 300 pixels inclusive, the width of the iframe would be\nset to that size, minus any necessary padding, borders and\nmargins. If the width of the containing box is larger than\n300 pixels, the extra space will be added inside the div.\nThe extra space is added after the iframe inside the box. In\nthis example, the box has been stretched so that it is very\nwide. The first child has a maximum width of 50 pixels, and\nit divides the excess space equally with the second child\nuntil its maximum width has been reached. After that, since\nit is not allowed to grow any further, the remaining space\nall goes to the second child.\n(CSS3)',
+    'box-flex-group': 'An element is flexible when the box-flex property is\nspecified. The box-flex property is a floating point value\nrepresenting the flexibility of the element. Its initial\nvalue is 0, which indicates that the element is inflexible.\nElements that are flexible can shrink or grow as the box\nshrinks and grows. Whenever there is extra space left over\nin a box, the flexible elements are expanded to fill that\nspace. All flex is relative. For example, a child with a\nbox-flex of 2 is twice as flexible as a child with a box-\nflex of 1. A negative value for box-flex is not allowed.\nFlexible elements can be assigned to flex groups using the\n\'box-flex-group\' property. This property is a natural number\nvalue (the first flex group is 1 and higher values are later\nflex groups). The initial value is 1. In a horizontally\noriented box, the preferred width of each child is computed.\nIf the width of the margin box of each child is equal to the\nwidth of the containing block, then there is no extra space\navailable, so the preferred widths are used for each child.\nIf the width of the margin box adds up to a value smaller\nthan the width of the containing block, then extra space is\navailable. This extra space is divided up among the flexible\nchildren, as described below. If the width of the margin box\nadds up to a value larger than the width of the containing\nblock, then the flexible children shrink as much as\nnecessary to prevent overflow. Flexibility only applies to\nelements in normal flow. As absolute and fixed positioned\nelements are not in flow, any flexibility or flexgroup\nspecified on them is ignored. In addition, as the \'float\'\nproperty does not apply to children of flexible boxes, they\nare considered part of normal flow and flexibility does\napply. When dividing up extra space, first take all elements\nwithin the first flex group. Each element within that group\nshould be given extra width based on the ratio of that\nelement\'s flexibility compared to the flexibility of other\nelements within the same flex group. However, if the\npreferred width of the element plus the extra width allotted\nto it is larger than the maximum width of the element, then\nthe width is set to that maximum width, and any remaining\nextra width beyond that is divided up among the other\nchildren. In this example there is 60 pixels of extra space\navailable in the containing box. #div1 { display: box;\nwidth: 300px; } #button1 { box-flex: 1.0; width: 100px; }\n#button2 { box-flex: 2.0; width: 140px; } <div id="div1">\n<button id="button1">Hello</button> <button\nid="button2">Goodbye</button> </div> As both child buttons\nare flexible, the extra space will be divided up between\nthem. The first child button has a flexibility of 1.0 and\nthe second child button has a flexibility of 2.0. The first\nbutton will receive 20 pixels of extra width and the second\nbutton will receive 40 pixels of extra width, maintaining\nthe same ratio of extra width to flexibility values. This\nextra width is added to the preferred size of the element.\nHowever, if the second button had a maximum width of 150\npixels, it could only grow by 10 pixels before hitting this\nmaximum size, so the remaining 30 pixels would instead be\ngiven to the first element, breaking the flexibility ratio.\nIn this example there is 60 pixels of extra space available\nin the containing box. As both child buttons are flexible,\nthe extra space will be divided up between them. The first\nchild button has a flexibility of 1.0 and the second child\nbutton has a flexibility of 2.0. The first button will\nreceive 20 pixels of extra width and the second button will\nreceive 40 pixels of extra width, maintaining the same ratio\nof extra width to flexibility values. This extra width is\nadded to the preferred size of the element. However, if the\nsecond button had a maximum width of 150 pixels, it could\nonly grow by 10 pixels before hitting this maximum size, so\nthe remaining 30 pixels would instead be given to the first\nelement, breaking the flexibility ratio. More specifically,\nthe percentage of extra space that an element may receive is\ncalculated as follows:\' box-flex of child \' / \' total of\nbox-flex values of child and all siblings \'If the width of\nall flexible children within the group has been increased to\ntheir maximum widths, the process repeats for the children\nwithin the next flex group, using any space left over from\nthe previous flex group. Once there are no more flex groups,\nand there is still space remaining, the extra space is\ndivided within the containing box according to the box-pack\nproperty. If the box would overflow after the preferred\nwidth of the children have been computed, then width is\nremoved from flexible elements in a manner similar to that\nused when adding extra space. Each flex group is examined in\nturn and space is removed according to the ratio of the\nflexibility of each element. Elements do not shrink below\ntheir minimum widths. If all children have been shrunk to\ntheir minimum sizes, then the box overflows, although if the\nbox-lines property is set to multiple, the box may be able\nto move elements to additional lines to prevent this. For\nvertically oriented boxes, the algorithm as described above\nis similar except using the height instead of the width.\nWhen a child box of a horizontally oriented box contains an\ninline element, it is likely that shrinking the width of the\nelement due to flexibility may cause the inline element to\ngrow in height, as the text within it may need to wrap to\nadditional lines. Examples: #div1 { display: box; box-\norient: vertical; height: 200px } <div id="div1">\n<button>Cat</button> <button style="box-flex:\n1">Piranha</button>\n<button>Antidisestablishmentarianism</button> </div> In the\nexample above, the box is 200 pixels tall and is more than\nenough room for the three buttons. Because the first and\nthird buttons are inflexible, they remain the same size,\nwhich is their intrinsic size. The second button is\nspecified as being flexible, and because it is the only\nflexible element in the box, it receives all of the extra\nspace. <div style="display: box; box-orient: vertical;">\n<button style="box-flex: 1; height: 1000px;"> Cat </button>\n</div> In this example, if the height of the box is reduced,\nfor instance, because the user resized the containing\nviewport, the height of the flexible button also shrinks\nwith the box, despite the specification of 1000 pixels as\nthe preferred height. It continues to shrink until the\nminimum required height for the button is reached, which\nhere will likely be the height needed to display the\nbutton\'s label and border. After that, the button can shrink\nno further. Elements within a box can therefore have their\nown notions of minimum and maximum intrinsic sizes. In the\nabove example, the button could not get any smaller than the\nminimum height required to draw its borders and its text.\n#div1 { display: box; } #iframe1 { box-flex: 1; min-width:\n100px; max-width: 300px; height: 300px; } <div id="div1">\n<iframe id="iframe1" src="http://www.mozilla.org/"/> </div>\nIn this example, the iframe has a minimum width of 100\npixels and a maximum width of 300 pixels. If the containing\nbox is less than 100 pixels wide, the iframe will overflow\nits containing div. If the containing box is between 100\npixels and 300 pixels inclusive, the width of the iframe\nwould be set to that size, minus any necessary padding,\nborders and margins. If the width of the containing box is\nlarger than 300 pixels, the extra space will be added inside\nthe div. The extra space is added after the iframe inside\nthe box. <p style="display: box;"> <button style="box-flex:\n1; max-width: 50px;">Child 1</button> <button style="box-\nflex: 1; min-width: 50px;">Child 2</button> </p> In this\nexample, the box has been stretched so that it is very wide.\nThe first child has a maximum width of 50 pixels, and it\ndivides the excess space equally with the second child until\nits maximum width has been reached. After that, since it is\nnot allowed to grow any further, the remaining space all\ngoes to the second child. 6 Packing along the box axis Name:\nbox-pack Value: start | end | center | justify Initial:\nstart Applies to: box elements Inherited: no Percentages: no\nMedia: visual Computed value: specified valueExamples:In the\nexample above, the box is 200 pixels tall and is more than\nenough room for the three buttons. Because the first and\nthird buttons are inflexible, they remain the same size,\nwhich is their intrinsic size. The second button is\nspecified as being flexible, and because it is the only\nflexible element in the box, it receives all of the extra\nspace. In this example, if the height of the box is reduced,\nfor instance, because the user resized the containing\nviewport, the height of the flexible button also shrinks\nwith the box, despite the specification of 1000 pixels as\nthe preferred height. It continues to shrink until the\nminimum required height for the button is reached, which\nhere will likely be the height needed to display the\nbutton\'s label and border. After that, the button can shrink\nno further. Elements within a box can therefore have their\nown notions of minimum and maximum intrinsic sizes. In the\nabove example, the button could not get any smaller than the\nminimum height required to draw its borders and its text. In\nthis example, the iframe has a minimum width of 100 pixels\nand a maximum width of 300 pixels. If the containing box is\nless than 100 pixels wide, the iframe will overflow its\ncontaining div. If the containing box is between 100 pixels\nand 300 pixels inclusive, the width of the iframe would be\nset to that size, minus any necessary padding, borders and\nmargins. If the width of the containing box is larger than\n300 pixels, the extra space will be added inside the div.\nThe extra space is added after the iframe inside the box. In\nthis example, the box has been stretched so that it is very\nwide. The first child has a maximum width of 50 pixels, and\nit divides the excess space equally with the second child\nuntil its maximum width has been reached. After that, since\nit is not allowed to grow any further, the remaining space\nall goes to the second child.\n(CSS3)',
+    'box-lines': 'By default a horizontal box will lay out its children in a\nsingle row, and a vertical box will lay out its children in\na single column. This behavior can be changed using the box-\nlines property. The default value is single, which means\nthat all elements will be placed in a single row or column,\nand any elements that don\'t fit will simply be considered\noverflow. If a value of multiple is specified, however, then\nthe box is allowed to expand to multiple lines (that is,\nmultiple rows or columns) in order to accommodate all of its\nchildren. The box must attempt to fit its children on as few\nlines as possible by shrinking all elements down to their\nminimum widths or heights if necessary. If the children in a\nhorizontal box still do not fit on a line after being\nreduced to their minimum widths, then children are moved one\nby one onto a new line, until the elements remaining on the\nprevious line fit. This process can repeat to an arbitrary\nnumber of lines. If a line contains only a single element\nthat doesn\'t fit, then the element should stay on that line\nand overflow out of the box. The later lines are placed\nbelow the earlier lines in normal direction boxes and above\nin reverse direction boxes. The height of a line is the\nheight of the largest child in that line. No additional\nspace appears between the lines apart from the margins on\nthe largest elements in each line. For calculating the\nheight of a line, margins with a computed value of auto\nshould be treated as having a value of 0. A similar process\noccurs for children in a vertical box. Later lines in normal\ndirection boxes are placed to the right of earlier lines and\nto the left in reverse direction boxes. Once the number of\nlines has been determined, elements with a computed value\nfor box-flex other than 0 stretch as necessary in an attempt\nto fill the remaining space on the lines. Each line computes\nflexes independently, so only elements on that line are\nconsidered when evaluating flex and flex-groups. The packing\nof elements in a line, as specified by the box-pack\nproperty, is also computed independently for each line. This\nexample shows four buttons that do not fit horizontally.\n#div1 { display: box; box-lines: multiple; width: 300px; }\nbutton { box-flex: 1.0; width: 100px; } <div id="div1">\n<button id="button1">Elephant</button> <button\nid="button2">Tiger</button> <button\nid="button1">Antelope</button> <button\nid="button2">Wildebeest</button> </div> The buttons are\nshrunk to their minimum widths, in this case calculated\nintrinsically. Assume that the four buttons have a minimum\nintrinsic width of 80 pixels. This will allow the first\nthree buttons to fit in 240 pixels with 60 pixels left over\nof remaining space. Because the box-lines property has a\nspecified value of multiple, the fourth button may be moved\nonto a second line. Flexibility is applied to each element,\nseparately for each line. The first line has 60 pixels of\nremaining space, so each of the three buttons on that line\nwill receive 20 pixels of extra width. The remaining button\non a line of its own will stretch to the entire width of the\ncontaining box, or 300 pixels. If the box was resized, the\nbuttons may rearrange onto different lines as necessary. If\nthe style rules in the example above were changed to the\nfollowing: #div1 { display: box; box-lines: multiple; box-\npack: center; width: 300px; } button { box-flex: 1.0; width:\n90px; max-width: 90px; } Now, each of the buttons will only\nstretch to include an additional 10 pixels of width, as the\nmaximum width of 90 pixels is only 10 pixels larger than the\nminimum intrinsic width of the buttons. The remaining 30\npixels of space left over is divided up and placed inside\nthe box outside of the buttons, as the value of box-pack is\ncenter. The fourth button will also appear at 90 pixels\nwide, centered within the box. 7.1 Multiple Lines and\nalignmentThis example shows four buttons that do not fit\nhorizontally. The buttons are shrunk to their minimum\nwidths, in this case calculated intrinsically. Assume that\nthe four buttons have a minimum intrinsic width of 80\npixels. This will allow the first three buttons to fit in\n240 pixels with 60 pixels left over of remaining space.\nBecause the box-lines property has a specified value of\nmultiple, the fourth button may be moved onto a second line.\nFlexibility is applied to each element, separately for each\nline. The first line has 60 pixels of remaining space, so\neach of the three buttons on that line will receive 20\npixels of extra width. The remaining button on a line of its\nown will stretch to the entire width of the containing box,\nor 300 pixels. If the box was resized, the buttons may\nrearrange onto different lines as necessary. If the style\nrules in the example above were changed to the\nfollowing:Now, each of the buttons will only stretch to\ninclude an additional 10 pixels of width, as the maximum\nwidth of 90 pixels is only 10 pixels larger than the minimum\nintrinsic width of the buttons. The remaining 30 pixels of\nspace left over is divided up and placed inside the box\noutside of the buttons, as the value of box-pack is center.\nThe fourth button will also appear at 90 pixels wide,\ncentered within the box.\n(CSS3)',
+    'box-ordinal-group': 'The children of a box element may be assigned to ordinal\ngroups using the \'box-ordinal-group\' property. This property\nis a natural number value with an initial value is 1.\nOrdinal groups can be used in conjunction with the \'box-\ndirection\' property to control the order in which the direct\nchildren of a box appear. When the computed box-direction is\nnormal, a box will display its elements starting from the\nlowest numbered ordinal group and ensure that those elements\nappear to the left (for horizontal boxes) or at the top (for\nvertical boxes) of the container. Elements with the same\nordinal group are flowed in the order they appear in the\nsource document tree. In the reverse direction, the ordinal\ngroups are examined in the same order, except the elements\nappear reversed. This example shows how ordinal groups might\nbe used. #div1 { display: box; } #span1 { box-ordinal-group:\n2; } #span3 { box-ordinal-group: 2; } #span4 { box-ordinal-\ngroup: 1; } <div id="div1"> <span id="span1" >Sentence\nOne</span> <span id="span2" >Sentence Two</span> <span\nid="span3" >Sentence Three</span> <span id="span4" >Sentence\nFour</span> </div> The first ordinal group, 1, contains\nspan2 and span4. As span2 does not specify an ordinal group,\nit will default to 1. The elements will be displayed in\ndocument order, so span2 will be displayed before span4. The\nsecond ordinal group, 2, contains the remaining two spans.\nThe resulting display order will be: span2 span4 span1\nspan3This example shows how ordinal groups might be used.\nThe first ordinal group, 1, contains span2 and span4. As\nspan2 does not specify an ordinal group, it will default to\n1. The elements will be displayed in document order, so\nspan2 will be displayed before span4. The second ordinal\ngroup, 2, contains the remaining two spans. The resulting\ndisplay order will be:Elements within a box can use the\n\'visibility\' property to render themselves invisible. Boxes\nbehave like tables in that the value collapsed can be used\nto specify that an element within a box should not take up\nany space at all. The computed width and height of a\ncollapsed element are both 0, and the element is not\nconsidered when calculating flexibility. Other non-collapsed\nflexible elements may expand as needed to fill in any space\nleft open by a collapsed element. <h2 id="boxsizing">Box\nsizing</h2> <table class="propdef"> <tbody> <tr\nvalign=baseline><td><em>Name:</em> <td><dfn id="propdef-box-\nsizing">box-sizing</dfn> <tr\nvalign=baseline><td><em>Value:</em> <td>content-box |\npadding-box | border-box | margin-box <tr\nvalign=baseline><td><em>Initial:</em> <td>1 <tr\nvalign=baseline><td><em>Applies to:</em> <td>box and block\nelements <tr valign=baseline><td><em>Inherited:</em> <td>no\n<tr valign=baseline><td><em>Percentages:</em> <td>no <tr\nvalign=baseline><td><em>Media:</em> <td>visual</a> <tr\nvalign=baseline><td><em>Computed value:</em> <td>specified\nvalue </tbody> </table> <p>The <span class="property">\'<code\nclass=property>box-sizing</code>\'</span> property determines\nhow the <span class="property">\'<code\nclass=property>height</code>\'</span> and <span\nclass="property">\'<code class=property>width</code>\'</span>\nproperties should be interpreted. </p><dl> <dt>content-box\n</dt><dd>This is the behavior of width and height as\nspecified by CSS2. The specified width and height apply to\nthe width and height respectively of the content box of the\nelement. The padding and border of the element are drawn\noutside the specified width and height. </dd><dt>padding-box\n</dt><dd>The specified width and height of this element\ndetermine the padding box of the element. That is, any\npadding specified on the element is drawn inside this\nspecified width and height. The content width and height is\ncomputed by subtracting the padding of the respective sides\nfrom the specified width and height. The padding-box size is\nthe dimension used for the containing block of absolutely\npositioned blocks. </dd><dt>border-box </dt><dd>The\nspecified width and height of this element determine the\nborder box of the element. That is, any padding or border\nspecified on the element is laid out and drawn inside this\nspecified width and height. The content width and height is\ncomputed by subtracting the border and padding of the\nrespective sides from the specified width and height. This\nis the behavior of width and height as commonly implemented\nby legacy HTML user agents for replaced elements and input\nelements. </dd><dt>margin-box </dt><dd>The specified width\nand height of this element determine the margin box of the\nelement. That is, any margin, padding or border specified on\nthe element is laid out and drawn inside this specified\nwidth and height. The content width and height is computed\nby subtracting the margin, border and padding of the\nrespective sides from the specified width and height. When\nmargins collapse, the height (or width, for horizontal block\nlayout) is calculated before applying any collapsing\nalgorithms. </dd></dl> <p>Note that despite the name of the\nproperty, <span class="property">\'<code class=property>box-\nsizing</code>\'</span> applies to block and table-level\nelements as well as boxes. 4 Alignment Name: box-align\nValue: start | end | center | baseline | stretch Initial:\nstretch Applies to: box elements Inherited: no Percentages:\nno Media: visual Computed value: specified value\n(CSS3)',
+    'box-orient': "A box may lay out its children either horizontally or\nvertically.\n\n  'inline-axis': The box displays its children\n        along the inline axis.\n  'horizontal': The box displays its children from\n        left to right in a horizontal line.\n  'block-axis': The box displays its children\n        along the block axis.\n  'vertical': The box displays its children from\n        stacked from top to bottom vertically.\n(CSS3)",
+    'box-pack': 'When all of the elements within a box are inflexible or when\nall elements have grown to their maximum sizes and can\nstretch no further, extra space may be left over in the box.\nThe box-pack property may be used to dictate how any\nadditional space along the box-axis should be distributed\nbetween elements. The box-pack property does not affect the\nposition of elements in the opposite direction. That is,\nbox-pack affects only the horizontal position in\nhorizontally oriented boxes and only the vertical position\nin vertically oriented boxes. <p style="box-align: center;\nbox-pack: center; width: 300px; height: 300px;">\n<button>centered</button> </p> In the example above, the\nbutton is centered within the box using the \'box-align\' and\n\'box-pack\' properties together. The former centers the\nbutton vertically, and the latter centers the button\nhorizontally. 7 Multiple Lines Name: box-lines Value: single\n| multiple Initial: single Applies to: box elements\nInherited: no Percentages: no Media: visual Computed value:\nspecified value\n\n  \'start\': For normal direction boxes, the left\n        edge of the first child is placed at the left\n        side, with all extra space placed after the last\n        child. For reverse direction boxes, the right edge\n        of the last child is placed at the right side,\n        with all extra space placed before the first\n        child.\n  \'end\': For normal direction boxes, the right\n        edge of the last child is placed at the right\n        side, with all extra space placed before the first\n        child. For reverse direction boxes, the left edge\n        of the first child is placed at the left side,\n        with all extra space placed after the last child.\n  \'center\': The extra space is divided evenly,\n        with half placed before the first child and the\n        other half placed after the last child.\n  \'justify\': The space is divided evenly in-\n        between each child, with none of the extra space\n        placed before the first child or after the last\n        child. If there is only one child, treat the pack\n        value as if it were start.\n(CSS3)',
+    'box-shadow': "The 'box-shadow' property attaches one or more drop-shadows\nto the box. The property is a comma-separated list of\nshadows, each specified by 2-4 length values, an optional\ncolor, and an optional 'inset' keyword. Omitted lengths are\n0; omitted colors are a UA-chosen color. Where <shadow> =\ninset? && [ <length> {2,4} && <color> ? ]The components of\neach <shadow> are interpreted as follows: The first length\nis the horizontal offset of the shadow. A positive value\ndraws a shadow that is offset to the right of the box, a\nnegative length to the left. The second length is the\nvertical offset. A positive value offsets the shadow down, a\nnegative one up. The third length is a blur distance.\nNegative values are not allowed. If the blur value is zero,\nthe shadow's edge is sharp. Otherwise, the larger the value,\nthe more the shadow's edge is blurred. See below. The fourth\nlength is a spread distance. Positive values cause the\nshadow shape to expand in all directions by the specified\nradius. Negative values cause the shadow shape to contract.\nSee below. Note that for inner shadows, expanding the shadow\n(creating more shadow area) means contracting the shadow's\nperimeter shape. The color is the color of the shadow. The\n'inset' keyword, if present, changes the drop shadow from an\nouter shadow (one that shadows the box onto the canvas, as\nif it were lifted above the canvas) to an inner shadow (one\nthat shadows the canvas onto the box, as if the box were cut\nout of the canvas and shifted behind it). An outer box-\nshadow casts a shadow as if the border-box of the element\nwere opaque. The shadow is drawn outside the border edge\nonly: it is clipped inside the border-box of the element. An\ninner box-shadow casts a shadow as if everything outside the\npadding edge were opaque. The inner shadow is drawn inside\nthe padding edge only: it is clipped outside the padding box\nof the element. If the box has a nonzero 'border-radius',\nthe shadow shape is rounded in the same way. The 'border-\nimage' does not affect the shape of the box-shadow. If a\nspread distance is defined, the shadow is expanded outward\nor contracted inward by an operation equivalent to applying\ntwice the absolute value of the spread value to a blur\noperation as defined below and thresholding the result such\nthat for a positive spread distance all non-transparent\npixels are given the full shadow color and for a negative\nspread distance all non-opaque pixels are made transparent.\nThe UA may approximate this operation by taking an outward\noutset of the specified amount normal to the original shadow\nperimeter. Alternatively the UA may approximate the\ntransformed shadow perimeter shape by outsetting (insetting,\nfor inner shadows) the shadow's straight edges by the spread\ndistance and increasing (decreasing, for inner shadows) and\nflooring at zero the corner radii by the same amount. (The\nUA may even combine these methods, using one method for\nouter shadows and another for inner ones.) For corners with\na zero border-radius, however, the corner must remain sharp-\nthe operation is equivalent to scaling the shadow shape. In\nany case, the effective width and height of the shadow shape\nis floored at zero. (A zero-sized shadow shape would cause\nan outer shadow to disappear, and an inner shadow to cover\nthe entire padding-box.)A non-zero blur distance indicates\nthat the resulting shadow should be blurred, such as by a\nGaussian filter. The exact algorithm is not defined; however\nfor a long, straight shadow edge, this should create a color\ntransition the length of the blur distance that is\nperpendicular to and centered on the shadow's edge, and that\nranges from the full shadow color at the radius endpoint\ninside the shadow to fully transparent at the endpoint\noutside it. The example below demonstrates the effects of\nspread and blur on the shadow:The example below demonstrates\nthe effects of spread and blur on the shadow:The shadow\neffects are applied front-to-back: the first shadow is on\ntop and the others are layered behind. Shadows do not\ninfluence layout and may overlap other boxes or their\nshadows. In terms of stacking contexts and the painting\norder, the outer shadows of an element are drawn immediately\nbelow the background of that element, and the inner shadows\nof an element are drawn immediately above the background of\nthat element (below the borders and border image, if any).\nIf an element has multiple boxes, all of them get drop\nshadows, but shadows are only drawn where borders would also\nbe drawn; see 'box-decoration-break'. Shadows do not trigger\nscrolling or increase the size of the scrollable area. Below\nare some examples of an orange box with a blue border being\nbeing given a drop shadow. border:5px solid blue;\nbackground-color:orange; width: 144px; height: 144px;\nborder-radius: 20px; border-radius: 0; box-shadow:\nrgba(0,0,0,0.4) 10px 10px; box-shadow: rgba(0,0,0,0.4) 10px\n10px inset box-shadow: rgba(0,0,0,0.4) 10px 10px 0 10px /*\nspread */ box-shadow: rgba(0,0,0,0.4) 10px 10px 0 10px /*\nspread */ insetBelow are some examples of an orange box with\na blue border being being given a drop shadow. The 'box-\nshadow' property applies to the ' ::first-letter ' pseudo-\nelement, but not the ' ::first-line ' pseudo-element. Outer\nshadows have no effect on internal table elements in the\ncollapsing border model. If a shadow is defined for single\nborder edge in the collapsing border model that has multiple\nborder thicknesses (e.g. an outer shadow on a table where\none row has thicker borders than the others, or an inner\nshadow on a rowspanning table cell that adjoins cells with\ndifferent border thicknesses), the exact position and\nrendering of its shadows are undefined. 7. Definitions 7.1.\nGlossary\n(CSS3)",
+    'break-after': "These properties describe page/column break behavior\nbefore/after/inside the generated box. These are normatively\ndefined in [CSS21] {{!CSS21}} :\n\n  'always': Always force a page break before\n        (after) the generated box.\n  'avoid': Avoid a page/column break before\n        (after, inside) the generated box.\n  'left': Force one or two page breaks before\n        (after) the generated box so that the next page is\n        formatted as a left page.\n  'right': Force one or two page breaks before\n        (after) the generated box so that the next page is\n        formatted as a right page.\n  'auto': Neither force nor forbid a page/column\n        break before (after, inside) the generated box.\n(CSS3)",
+    'break-before': "These properties describe page/column break behavior\nbefore/after/inside the generated box. These are normatively\ndefined in [CSS21] {{!CSS21}} :\n\n  'always': Always force a page break before\n        (after) the generated box.\n  'avoid': Avoid a page/column break before\n        (after, inside) the generated box.\n  'left': Force one or two page breaks before\n        (after) the generated box so that the next page is\n        formatted as a left page.\n  'right': Force one or two page breaks before\n        (after) the generated box so that the next page is\n        formatted as a right page.\n  'auto': Neither force nor forbid a page/column\n        break before (after, inside) the generated box.\n(CSS3)",
+    'break-inside': "These properties describe page/column break behavior\nbefore/after/inside the generated box. These are normatively\ndefined in [CSS21] {{!CSS21}} :\n\n  'always': Always force a page break before\n        (after) the generated box.\n  'avoid': Avoid a page/column break before\n        (after, inside) the generated box.\n  'left': Force one or two page breaks before\n        (after) the generated box so that the next page is\n        formatted as a left page.\n  'right': Force one or two page breaks before\n        (after) the generated box so that the next page is\n        formatted as a right page.\n  'auto': Neither force nor forbid a page/column\n        break before (after, inside) the generated box.\n(CSS3)",
+    'caption-side': 'Specifies the position of the caption box with respect to the table box\n(CSS2, CSS3)',
+    'clear': "Indicates which sides of an element's\nbox(es) may not be adjacent to an\nearlier floating box\n(CSS1, CSS2, CSS3)",
+    'color': "This property describes the foreground\ncolor of an element's text content\n(CSS1, CSS2, CSS3)",
+    'color-profile': 'This property permits the specification of a source color\nprofile other than the default. <dt><strong>none</strong>\n<dd>Any profile information embedded within image data\nshould be ignored. The image should be rendered as if it is\nalready in the destination color space. <i>This value is\nmost useful for demonstration purposes.</i> Example(s): /*\nuse the specified profile, even if the image contains an\nembedded profile */ IMG { color-profile:\nurl("http://example.com/profiles/eg.icm") } 3.4. The\n\'rendering-intent\' property Name: rendering-intent Value:\nauto | perceptual | relative-colorimetric | saturation |\nabsolute-colorimetric | inherit Initial: auto Applies to:\nall elements Inherited: yes Percentages: N/A Media: visual\nComputed value: specified value\n\n  \'auto\': This is the default behavior. All colors\n        are presumed to be defined in the sRGB color space\n        unless a more precise embedded profile is\n        specified within content data. For images that do\n        have a profile built into their data, that profile\n        is used. For images that do not have a profile,\n        the sRGB profile is used so that the colors in\n        these images can be kept "in synch" with the\n        colors specified in CSS and HTML.\n  \'sRGB\': The source profile is assumed to be\n        sRGB. This differs from auto in that it overrides\n        an embedded profile inside an image. For\n        consistency with CSS lexical scanning and parsing\n        rules, the keyword "sRGB" is case-insensitive;\n        however, it is recommended that the mixed\n        capitalization "sRGB" be used for consistency with\n        common industry practice.\n  \'url(\': The location of a standard ICC profile\n        resource. Just like specifying sRGB, it overrides\n        an embedded profile.\n  \'<name>\': A name corresponding to a defined\n        color profile that is in the user agent\'s color\n        profile description database. The user agent\n        searches the color profile description database\n        for a color profile description entry whose name\n        descriptor matches <name> and uses the last\n        matching entry that is found. If a match is found,\n        the corresponding profile overrides an embedded\n        profile inside an image. If no match is found,\n        then the embedded profile inside the image is\n        used.\n(CSS3)',
+    'column-count': "This property describes the number of columns of a multicol\nelement. Example: body { column-count: 3 } 3.3. 'columns'\nName: columns Value: <'column-width'> || <'column-count'>\nInitial: see individual properties Applies to: non-replaced\nblock-level elements (except table elements), table cells,\nand inline-block elements Inherited: no Percentages: N/A\nMedia: visual Computed value: see individual properties\n\n  '<integer>': describes the optimal number of\n        columns into which the content of the element will\n        be flowed. Values must be greater than 0. If both\n        'column-width'and'column-count' have non-auto\n        values, the integer value describes the maximum\n        number of columns.\n  'auto': means that the number of columns will be\n        determined by other properties (e.g., 'column-\n        width', if it has a non-auto value).\n(CSS3)",
+    'column-fill': "The values are:\n\n  'auto': Fills columns sequentially.\n  'balance': Balance content equally between\n        columns, if possible.\n(CSS3)",
+    'column-gap': "The 'column-gap' property sets the gap between columns. If\nthere is a column rule between columns, it will appear in\nthe middle of the gap. The 'normal' value is UA-specific. A\nvalue of '1em' is suggested. Column gaps cannot be negative.\n4.2. 'column-rule-color' Name: column-rule-color Value:\n<color> Initial: same as for 'color' property [CSS21]\n{{!CSS21}} Applies to: multicol elements Inherited: no\nPercentages: N/A Media: visual Computed value: the same as\nthe computed value for the 'color' property [CSS21]\n{{!CSS21}}\n(CSS3)",
+    'column-rule': "This property is a shorthand for setting 'column-rule-\nwidth', 'column-rule-style', and 'column-rule-color' at the\nsame place in the style sheet. Omitted values are set to\ntheir initial values. In this example, the column rule and\nthe column gap have the same width. Therefore, they will\noccupy exactly the same space. body { column-gap: 1em;\ncolumn-rule-width: 1em; column-rule-style: solid; column-\nrule-color: black; } If a tall image is moved to a column on\nthe next page to find room for it, its natural column may be\nleft empty. If so, the column is is still considered to have\ncontent for the purpose of deciding if the column rule\nshould be drawn. 5. Column breaksIn this example, the column\nrule and the column gap have the same width. Therefore, they\nwill occupy exactly the same space. body { column-gap: 1em;\ncolumn-rule-width: 1em; column-rule-style: solid; column-\nrule-color: black; }If a tall image is moved to a column on\nthe next page to find room for it, its natural column may be\nleft empty. If so, the column is is still considered to have\ncontent for the purpose of deciding if the column rule\nshould be drawn.\n(CSS3)",
+    'column-rule-color': "This property sets the color of the column rule. The <color>\nvalues are defined in [CSS21] {{!CSS21}}. 4.3. 'column-rule-\nstyle' Name: column-rule-style Value: <'border-style'>\nInitial: none Applies to: multicol elements Inherited: no\nPercentages: N/A Media: visual Computed value: specified\nvalue\n(CSS3)",
+    'column-rule-style': "The 'column-rule-style' property sets the style of the rule\nbetween columns of an element. The <border-style> values are\ndefined in [CSS21] {{!CSS21}}. The 'inset' keyword value is\nshown like the 'ridge' value. The 'outset' value is shown\nlike 'groove'. The 'none' value forces the computed value of\n'column-rule-width' to be '0'. 4.4. 'column-rule-width'\nName: column-rule-width Value: <'border-width'> Initial:\nmedium Applies to: multicol elements Inherited: no\nPercentages: N/A Media: visual Computed value: absolute\nlength; '0' if the column rule style is 'none'or'hidden'\n(CSS3)",
+    'column-rule-width': "This property sets the width of the rule between columns.\nNegative values are not allowed. 4.5. 'column-rule' Name:\ncolumn-rule Value: <column-rule-width> || <border-style> ||\n[ <color> | transparent ] Initial: see individual properties\nApplies to: multicol elements Inherited: no Percentages: N/A\nMedia: visual Computed value: see individual properties\n(CSS3)",
+    'column-span': "This property describes how many columns an element spans\nacross. Values are:\n\n  '1': The element does not span multiple columns.\n  'all': The element spans across all columns.\n        Content in the normal flow that appears before the\n        element is automatically balanced across all\n        columns before the element appears.\n(CSS3)",
+    'column-width': "This property describes the width of columns in multicol\nelements. For example, consider this style sheet: div {\nwidth: 100px; column-width: 45px; column-gap: 0; column-\nrule: none; } There is room for two 45px wide columns inside\nthe 100px wide element. In order to fill the available space\nthe actual column width will be increased to 50px. Also,\nconsider this style sheet: div { width: 40px; column-width:\n45px; column-gap: 0; column-rule: none; } The available\nspace is smaller than the specified column width and the\nactual column width will therefore be decreased.\n\n  'auto': means that the column width will be\n        determined by other properties (e.g., 'column-\n        count', if it has a non-auto value).\n  '<length>': describes the optimal column width.\n        The actual column width may be wider (to fill the\n        available space), or narrower (only if the\n        available space is smaller than the specified\n        column width). Values must be greater than 0.\n(CSS3)",
+    'columns': "This is a shorthand property for setting 'column-width'and\n'column-count'. Omitted values are set to their initial\nvalues. Here are some valid declarations using the 'columns'\nproperty: columns: 12em; /* column-width: 12em; column-\ncount: auto */ columns: auto 12em; /* column-width: 12em;\ncolumn-count: auto */ columns: 2; /* column-width: auto;\ncolumn-count: 2 */ columns: 2 auto; /* column-width: auto;\ncolumn-count: 2 */ columns: auto; /* column-width: auto;\ncolumn-count: auto */ columns: auto auto; /* column-width:\nauto; column-count: auto */ 3.4. Pseudo-algorithmHere are\nsome valid declarations using the 'columns' property:\ncolumns: 12em; /* column-width: 12em; column-count: auto */\ncolumns: auto 12em; /* column-width: 12em; column-count:\nauto */ columns: 2; /* column-width: auto; column-count: 2\n*/ columns: 2 auto; /* column-width: auto; column-count: 2\n*/ columns: auto; /* column-width: auto; column-count: auto\n*/ columns: auto auto; /* column-width: auto; column-count:\nauto */\n(CSS3)",
+    'content': 'This property is used with the :before and :after pseudo-elements to generate content in a document\n(CSS2, CSS3)',
+    'counter-increment': 'Indicates by how much the counter is incremented for every occurrence of the element. The default increment is 1. Zero and negative integers are allowed.\n(CSS2, CSS3)',
+    'counter-reset': 'Specifies the value that the counter is set to on each occurrence of the element\n(CSS2, CSS3)',
+    'crop': 'This property allows a replaced element to be just a\nrectangular area of an object, instead of the whole object.\nThe \'crop\' property adds a step when determining the\nintrinsic dimensions of an element. With \'crop\', the notion\nof computed intrinsic width and height are introduced. When\nthe layout algorithms reference the "intrinsic width"\n(and/or height), they are referring to the computed\nintrinsic width and height. The computed intrinsic width and\nheight of an element are the result of applying the crop to\nthe actual intrinsic width and height of the element.\n\n  \'inset-rect\': inset-rect( top, right, bottom,\n        left ). Like rect(), except that the values are\n        offsets relative to the respective edges of the\n        element.\n  \'auto\': The element\'s computed intrinsic width\n        and height are the same as its actual intrinsic\n        width and height.\n  \'rect\': rect( top, right, bottom, left ). Each\n        of the four arguments can be a <length> or a\n        <percentage>. All percentage values are computed\n        relative to the intrinsic dimensions of the\n        element, if there is one. Values are offsets\n        relative to the top left of the element. The\n        computed intrinsic width and height of the element\n        are determined by subtracting the left from the\n        right for the width, and similarly top from bottom\n        for the height. However, if this computation\n        results in a negative value, it is considered to\n        be zero.\n(CSS3)',
+    'cue': "Audio: Shorthand for setting 'cue-before' and 'cue-after'. If two values are given, the first value is 'cue-before' and the second is 'cue-after'. If only one value is given, it applies to both properties.\n(CSS2, CSS3)",
+    'cue-after': 'Audio: Sound to be played after the element to delimit it\n(CSS2, CSS3)',
+    'cue-before': 'Audio: Sound to be played before the element to delimit it\n(CSS2, CSS3)',
+    'cursor': 'Specifies the type of cursor to be displayed for the pointing device\n(CSS2, CSS3)',
+    'direction': "Specifies the base writing direction of blocks and the direction of embeddings and overrides (see 'unicode-bidi') for the Unicode bidirectional algorithm.\n(CSS2, CSS3)",
+    'display': 'How the element is to be displayed,\ndenotes the box type format\n(CSS1, CSS2, CSS3)',
+    'dominant-baseline': "The 'dominant-baseline' property is used to determine or re-\ndetermine a scaled-baseline-table. A scaled-baseline-table\nis a compound value with three components: a baseline-\nidentifier for the dominant baseline; it can be qualified as\nthe 'dominant' baseline-identifier (or 'dominant baseline'\nin short); the baseline-identifier is basically an\n'alignment-baseline' value. a derived baseline-table which\ncontains definition for additional baseline-identifiers\nrelated to various scripts, and a baseline-table font-size.\nSome values of the property re-determine all three values;\nother only reestablish the baseline-table font-size. Values\nfor the property have the following meaning:\n\n  'mathematical': The dominant baseline-identifier\n        is set to the 'mathematical' baseline, the derived\n        baseline- table is constructed using the\n        'mathematical' baseline-table in the nominal font,\n        and the baseline-table font-size is changed to the\n        value of the 'font-size' property on this element.\n  'use-script': The dominant baseline-identifier\n        is set using the computed value of the 'script'\n        property. The 'writing-mode' value, whether\n        horizontal or vertical is used to select the\n        baseline-table that correspond to that baseline-\n        identifier. The baseline-table font-size component\n        is set to the value of the 'font-size' property on\n        this element.\n  'auto': If this property occurs on a block or\n        inline-block element, then the user agent behavior\n        depends on the value of the 'script' property. If\n        the value of the script property is 'auto, the\n        'auto' value is equivalent to 'alphabetic' for\n        horizontal 'writing-mode' values and 'central' for\n        vertical 'writing-mode' values. If the value of\n        the script property is other than 'auto', the\n        'auto' value is equivalent to 'use-script'\n  'middle': The dominant baseline-identifier is\n        set to be 'middle'. The derived baseline-table is\n        constructed from the defined baselines in a\n        baseline-table in the nominal font. That font\n        baseline-table is chosen using the following\n        priority order of baseline-table names:\n        'alphabetic', 'ideographic',\n        'hanging'and'mathematical'. The baseline-table is\n        changed to the value of the 'font-size' property\n        on this element.\n  'hanging': The dominant baseline-identifier is\n        set to the 'hanging' baseline, the derived\n        baseline- table is constructed using the 'hanging'\n        baseline-table in the nominal font, and the\n        baseline-table font-size is changed to the value\n        of the 'font-size' property on this element.\n  'text-before-edge': The dominant baseline-\n        identifier is set to be 'text-before-edge'. The\n        derived baseline-table is constructed from the\n        defined baselines in a baseline-table in the\n        nominal font. That font baseline-table is chosen\n        using the following priority order of baseline-\n        table names: 'alphabetic', 'ideographic',\n        'hanging'and'mathematical'. The baseline-table is\n        changed to the value of the 'font-size' property\n        on this element.\n  'ideographic': The dominant baseline-identifier\n        is set to the 'ideographic' baseline, the derived\n        baseline- table is constructed using the\n        'ideographic' baseline-table in the nominal font,\n        and the baseline-table font-size is changed to the\n        value of the 'font-size' property on this element.\n  'central': The dominant baseline-identifier is\n        set to be 'central'. The derived baseline-table is\n        constructed from the defined baselines in a\n        baseline-table in the nominal font. That font\n        baseline-table is chosen using the following\n        priority order of baseline-table names:\n        'ideographic', 'alphabetic',\n        'hanging'and'mathematical'. The baseline-table is\n        changed to the value of the 'font-size' property\n        on this element.\n  'reset-size': The dominant baseline-identifier\n        and the baseline table remain the same, but the\n        baseline-table font-size is changed to the value\n        of the 'font-size' property on this element. This\n        re-scales the baseline table for the current\n        'font-size'.\n  'alphabetic': The dominant baseline-identifier\n        is set to the 'alphabetic' baseline, the derived\n        baseline-table is constructed using the\n        'alphabetic' baseline-table in the nominal font,\n        and the baseline-table font-size is changed to the\n        value of the 'font-size' property on this element.\n        (The 'alphabetic' baseline is the standard\n        baseline for Roman scripts.)\n  'text-after-edge': The dominant baseline-\n        identifier is set to be 'text-after-edge'. The\n        derived baseline-table is constructed from the\n        defined baselines in a baseline-table in the\n        nominal font. That font baseline-table is chosen\n        using the following priority order of baseline-\n        table names: 'alphabetic', 'ideographic',\n        'hanging'and'mathematical'. The baseline-table is\n        changed to the value of the 'font-size' property\n        on this element.\n  'no-change': The dominant baseline-identifier,\n        the baseline-table and the baseline-table font-\n        size remain the same as that of the parent.\n(CSS3)",
+    'drop-initial-after-adjust': "The 'drop-initial-after-adjust' property sets the alignment\npoint of the drop initial for the primary connection point.\nPossible values: Name: drop-initial-before-align Value:\ncaps-height | <'alignment-baseline'> Initial: caps-height\nApplies to: ::first-letter pseudo element Inherited: no\nPercentages: N/A Media: visual Computed value: specified\nvalues (except for initial and inherit)\n\n  'mathematical': The alignment point is at the\n        intersection of the end-edge of the element and\n        the 'mathematical' baseline of the element.\n  'middle': The alignment point is at the\n        intersection of the end-edge of the element and\n        the 'middle' baseline of the element.\n  'ideographic': The alignment point is at the\n        intersection of the end-edge of the element and\n        the 'ideographic' baseline of the element.\n  'central': The alignment point is at the\n        intersection of the end-edge of the element and\n        the 'central' baseline of the element.\n  'after-edge': The alignment point is at the\n        intersection of the end-edge of the element and\n        the 'after-edge' of the extended inline box of the\n        element. This may include or not the line-height\n        of the element, depending on the line-stacking-\n        strategy.\n  '<percentage>': The computed value of the\n        property is this percentage multiplied by the\n        computed 'line-height' of the element. The\n        alignment point is on the end-edge of the inline\n        box and is offset from the after-edge by the\n        computed value. A value of '0%' makes the text-\n        after-edge the alignment point.\n  'alphabetic': The alignment point is at the\n        intersection of the end-edge of the element and\n        the 'alphabetic' baseline of the element.\n  'hanging': The alignment point is at the\n        intersection of the end-edge of the element and\n        the 'hanging' baseline of the element.\n  'text-after-edge': The alignment point is at the\n        intersection of the end-edge of the element and\n        the 'text-after-edge' baseline of the element.\n  '<length>': The alignment-point is on the end-\n        edge of the inline box. Its position along the\n        end-edge is offset from the after-edge by the\n        <length> value. A value of '0cm' makes the text-\n        after-edge the alignment point.\n(CSS3)",
+    'drop-initial-after-align': "The 'drop-initial-after-align' property determines which\nalignment line within the nth line box (n being defined by\nthe 'drop-initial-value' property) is used at the primary\nconnection point with the initial letter box. The values are\nthe same as the 'alignment-baseline' property values. Name:\ndrop-initial-after-adjust Value: central | middle | after-\nedge | text-after-edge | ideographic | alphabetic |\nmathematical | <percentage> | <length> Initial: text-after-\nedge Applies to: ::first-letter pseudo element Inherited: no\nPercentages: refer to combined line height size as provided\nby drop-initial-value Media: visual Computed value:\nspecified values (except for initial and inherit)The 'drop-\ninitial-after-adjust' property sets the alignment point of\nthe drop initial for the primary connection point. Possible\nvalues: Name: drop-initial-before-align Value: caps-height |\n<'alignment-baseline'> Initial: caps-height Applies to:\n::first-letter pseudo element Inherited: no Percentages: N/A\nMedia: visual Computed value: specified values (except for\ninitial and inherit)\n\n  'mathematical': The alignment point is at the\n        intersection of the end-edge of the element and\n        the 'mathematical' baseline of the element.\n  'middle': The alignment point is at the\n        intersection of the end-edge of the element and\n        the 'middle' baseline of the element.\n  'ideographic': The alignment point is at the\n        intersection of the end-edge of the element and\n        the 'ideographic' baseline of the element.\n  'central': The alignment point is at the\n        intersection of the end-edge of the element and\n        the 'central' baseline of the element.\n  'after-edge': The alignment point is at the\n        intersection of the end-edge of the element and\n        the 'after-edge' of the extended inline box of the\n        element. This may include or not the line-height\n        of the element, depending on the line-stacking-\n        strategy.\n  '<percentage>': The computed value of the\n        property is this percentage multiplied by the\n        computed 'line-height' of the element. The\n        alignment point is on the end-edge of the inline\n        box and is offset from the after-edge by the\n        computed value. A value of '0%' makes the text-\n        after-edge the alignment point.\n  'alphabetic': The alignment point is at the\n        intersection of the end-edge of the element and\n        the 'alphabetic' baseline of the element.\n  'hanging': The alignment point is at the\n        intersection of the end-edge of the element and\n        the 'hanging' baseline of the element.\n  'text-after-edge': The alignment point is at the\n        intersection of the end-edge of the element and\n        the 'text-after-edge' baseline of the element.\n  '<length>': The alignment-point is on the end-\n        edge of the inline box. Its position along the\n        end-edge is offset from the after-edge by the\n        <length> value. A value of '0cm' makes the text-\n        after-edge the alignment point.\n(CSS3)",
+    'drop-initial-before-adjust': "The 'drop-initial-before-adjust' property sets the alignment\npoint of the drop initial for the secondary connection\npoint. This property is only effective is the value of the\n'drop-initial-size' property is 'auto'. Possible values: 6.\nProperties index\n\n  'mathematical': The alignment point is at the\n        intersection of the end-edge of the element and\n        the 'mathematical' baseline of the element.\n  'middle': The alignment point is at the\n        intersection of the end-edge of the element and\n        the 'middle' baseline of the element.\n  'before-edge': The alignment point is at the\n        intersection of the end-edge of the element and\n        the 'before-edge' of the extended inline box of\n        the element. This may include or not the line-\n        height of the element, depending on the line-\n        stacking-strategy.\n  'central': The alignment point is at the\n        intersection of the end-edge of the element and\n        the 'central' baseline of the element.\n  '<percentage>': The computed value of the\n        property is this percentage multiplied by the\n        computed 'line-height' of the element. The\n        alignment point is on the end-edge of the inline\n        box and is offset from the text-before-edge by the\n        computed value. A value of '0%' makes the text-\n        before-edge the alignment point.\n  'hanging': The alignment point is at the\n        intersection of the end-edge of the element and\n        the 'hanging' baseline of the element.\n  'text-before-edge': The alignment point is at\n        the intersection of the end-edge of the element\n        and the 'text-before-edge' baseline of the\n        element.\n  '<length>': The alignment-point is on the end-\n        edge of the inline box. Its position along the\n        end-edge is offset from the text-before-edge by\n        the <length> value. A value of '0cm' makes the\n        text-before-edge the alignment point.\n(CSS3)",
+    'drop-initial-before-align': "The 'drop-initial-before-align' property determines which\nalignment line within the initial line box is used at the\nsecondary connection point with the initial letter box. This\nproperty is only effective is the value of the 'drop-\ninitial-size' property is 'auto'. Possible values: Name:\ndrop-initial-before-adjust Value: before-edge | text-before-\nedge | central | middle | hanging | mathematical |\n<percentage> | <length> Initial: text-before-edge Applies\nto: ::first-letter pseudo element Inherited: no Percentages:\nrefer to combined line height size as provided by drop-\ninitial-value Media: visual Computed value: specified values\n(except for initial and inherit)\n\n  '<alignment-baseline>': The values are the same\n        as the 'alignment-baseline' property values.\n  'caps-height': The caps-height alignment line is\n        used.\n(CSS3)",
+    'drop-initial-size': "The 'drop-initial-size' property controls the partial\nsinking of the initial letter. Using any other value than\n'auto' removes the secondary connection line constraint.\nPossible values: 5.4. Aligning drop initial: the 'drop-\ninitial-before-align', 'drop-initial-before-adjust', 'drop-\ninitial-after-align'and'drop-initial-after-adjust'\nproperties Name: drop-initial-after-align Value:\n<'alignment-baseline'> Initial: baseline Applies to:\n::first-letter pseudo element Inherited: no Percentages: N/A\nMedia: visual Computed value: specified values (except for\ninitial and inherit)\n\n  '<percentage>': The drop initial letter is sized\n        relatively to the combined line height of the n\n        lines determined by the 'drop-initial-value'\n        property value.\n  '<line>': The drop initial letter is sized using\n        the combined line height of the nth lines (as\n        determined by the line value). The letter may be\n        stretched on one dimension if the line height of\n        each line is variable to avoid circular issues.\n  '<length>': The drop initial letter is sized\n        using the length value.\n  'auto': The drop initial letter is sized\n        according to the constraints created by the the\n        ink filling strategy and the two connection lines.\n(CSS3)",
+    'drop-initial-value': "The 'drop-initial-value' property is the basic property that\nactivates a drop-initial effect. By providing a value\ndifferent than 'initial or '1', the primary connection point\nis moved after the initial line. Possible values: Name:\ndrop-initial-size Value: auto | <line> | <length> |\n<percentage> Initial: auto Applies to: ::first-letter pseudo\nelement Inherited: no Percentages: refer to combined line\nheight size as provided by drop-initial-value Media: visual\nComputed value: specified values (except for initial and\ninherit)\n\n  '<integer>': The drop initial letter is sunken\n        to the nth line (as determined by the integer\n        value).\n  'initial': The drop initial letter is aligned on\n        the initial line\n(CSS3)",
+    'elevation': 'Audio: Spatial elevation direction for aural presentation.\n(CSS2, CSS3)',
+    'empty-cells': 'Controls the rendering of borders around cells that have no visible content\n(CSS2, CSS3)',
+    'fit': "The 'fit' property gives a hint for how to scale a replaced\nelement if neither its 'width' nor its 'height' property is\n'auto'. Not all replaced objects can be scaled, but images\ntypically can.\n\n  'meet': Make the object as large as possible\n        with its width <= 'width' and height <= 'height',\n        while preserving its aspect ratio. Position the\n        object as for the 'hidden' value.\n  'hidden': Do not scale the object.\n  'slice': Make the object as small as possible\n        with its width >= 'width' and height >= 'height',\n        while preserving its aspect ratio. Position the\n        object as for the 'hidden' value.\n  'fill': Scale the object's height and width\n        independently so that the content just touches all\n        edges of the containing box.\n(CSS3)",
+    'fit-position': "The 'fit' property gives a hint for how to scale a replaced\nelement if neither its 'width' nor its 'height' property is\n'auto'. Not all replaced objects can be scaled, but images\ntypically can.\n\n  'meet': Make the object as large as possible\n        with its width <= 'width' and height <= 'height',\n        while preserving its aspect ratio. Position the\n        object as for the 'hidden' value.\n  'hidden': Do not scale the object.\n  'slice': Make the object as small as possible\n        with its width >= 'width' and height >= 'height',\n        while preserving its aspect ratio. Position the\n        object as for the 'hidden' value.\n  'fill': Scale the object's height and width\n        independently so that the content just touches all\n        edges of the containing box.\n(CSS3)",
+    'float': 'Specifies whether a box should float to\nthe left, right, or not at all\n(CSS1, CSS2, CSS3)',
+    'float-offset': 'This property pushes floated elements in the opposite\ndirection of the where they have been floated with \'float\'.\nIf one value is specified, it is the horizontal offset. If\ntwo values are specified, the first is the horizontal and\nthe second is the vertical offset. If an element has only\nbeen floated horizontally (e.g., by setting \' float: right\n\'), this property will only offset the float horizontally,\neven if a vertical value also has been specified. Likewise,\nif an element has only been floated vertically, this\nproperty will only offset the float vertically. If an\nelement has been floated both horizontally and vertically,\nthis property will offset both horizontally and vertically.\nIf no vertical value has been specified, the vertical offset\nis set to zero. If the \'gr\' unit or percentage unit is used,\nit means that the middle of the float should be aligned with\nthe specified grid line (or portion thereof). If another\nunit is used, it means that the float is pushed a distance\nequal to the specified length.\'float-offset\' is a good\nconcept for moving a float into the right position. For\ncompleteness it should apply to absolute positioning as\nwell. We should reuse existing naming conventions already in\nplace for abspos elements (e.g., \'offset-left, \'right\', or\ncall it \' shift left, \'shift right\' etc.). This code serves\nas the base document for the examples of this section:\n<html> <style> div { column-width: 15em; column-gap: 2em; /*\nshown in red below */ column-rule: thin solid black; /*\nshown in black below */ padding: 1em; /* shown in blue below\n*/ } img { display: block; /* shown in dark gray below */ }\n</style> <body> <div> Lorem ipsum dolor sit amet. Nam at\njus. <img src="foo"/> Sed imp er di et ris. Cur abi tur et\nsapen. ... </div> </body> </html> This code can be rendered\nas: Lorem ipsum dolor sit amet. Nam at jus. Sed imp er di et\nris. Cur abi tur et sapen. Lorem ipsum dolor sit amet. Nam\nat jus. Sed imp er di et ris. Cur abi tur et sapen. Vivamus\na metus. Aenean at risus pharetra ante luctu feugiat quis\nenim. Cum sociis natoque penatibus et magni. Lorem ipsum\ndolor sit amet. Nam at jus. Sed imp er di et ris. Cur abi\ntur et sapen. Vivamus a metus. Aenean at risus pharetra ante\nluctu feugiat quis enim. Cum sociis natoque penatibus et\nmagni. If this code is added to the base document: img {\nfloat: right } it may be rendered as: Lorem ipsum dolor sit\namet. Nam at jus. Sed imp er di et ris. Cur abi tur et\nsapen. Fusce sed ligula a turpis. Lorem ipsum dolor sit\namet. Nam at jus. Sed imp er di et ris. Cur abi tur et\nsapen. Vivamus a metus. Aenean at risus pharetra ante luctu\nfeugiat quis enim. Cum sociis natoque penatibus et magni.\nLorem ipsum dolor sit amet. Nam at jus. Sed imp er di et\nris. Cur abi tur et sapen. Vivamus a metus. Aenean at risus\npharetra ante luctu feugiat quis enim. Cum sociis natoque\npenatibus et magni. This code floats images to the bottom of\ntheir containing block and sets the width to be that of the\ncolumn: img { float: bottom; width: 1gr; } The column box is\nthe containing block for floats, so if an image naturally\nappears in the first column it will float to its bottom:\nLorem ipsum dolor sit amet. Nam at jus. Sed imp er di et\nris. Cur abi tur et sapen. Lorem ipsum dolor sit amet. Nam\nat jus. Sed imp er di et ris. Cur abi tur et sapen. Vivamus\na metus. Aenean at risus pharetra ante luctu feugiat quis\nenim. Cum sociis natoque penatibus et magni. Lorem ipsum\ndolor sit amet. Nam at jus. Sed imp er di et ris. Cur abi\ntur et sapen. Vivamus a metus. Aenean at risus pharetra ante\nluctu feugiat quis enim. Cum sociis natoque penatibus et\nmagni. This code floats figures to the top of the multi-\ncolumn element. div.figure { float: top right multicol;\nwidth: 1gr } The \'1gr\' value on \'width\' is equal to the\nwidth of the containing block. Here is a possible rendering:\nLorem ipsum dolor sit amet. Nam at jus. Sed imp er di et\nris. Cur abi tur et sapen. Vivamus a metus. Aenean at risus\npharetra ante luctu feugiat quis enim. Cum sociis natoque\npenatibus et magni. Lorem ipsum dolor sit amet. Nam at jus.\nSed imp er di et ris. Cur abi tur et sapen. Vivamus a metus.\nAenean at risus pharetra ante luctu feugiat quis enim. Cum\nsociis natoque penatibus et magni. Lorem ipsum dolor sit\namet. Nam at jus. Sed imp er di et ris. Cur abi tur et\nsapen. In this code, the \'float\' property floats the element\nto the top left of the multi-column element, while the\n\'float-offset\' property pushes it to the right so that it\nends up in the column next to it: div.quote { float: top\nleft multicol; float-offset: 2.5gr; width: 1gr } Lorem ipsum\ndolor sit amet. Nam at jus. Sed imp er di et ris. Cur abi\ntur et sapen. Vivamus a metus. Aenean at risus pharetra ante\nluctu feugiat quis enim. Cum sociis natoque penatibus et\nmagni. Lorem ipsum dolor sit amet. Nam at jus. Sed imp er di\net ris. Cur abi tur et sapen. Lorem ipsum dolor sit amet.\nNam at jus. Sed imp er di et ris. Cur abi tur et sapen.\nVivamus a metus. Aenean at risus pharetra ante luctu feugiat\nquis enim. Cum sociis natoque penatibus et magni. Assuming a\nthree-column layout, the same rendering can be achieved by\nfloating the element to the right instead: div.quote {\nfloat: top right multicol; float-offset: 2gr; width: 1gr\n}This code serves as the base document for the examples of\nthis section: <html> <style> div { column-width: 15em;\ncolumn-gap: 2em; /* shown in red below */ column-rule: thin\nsolid black; /* shown in black below */ padding: 1em; /*\nshown in blue below */ } img { display: block; /* shown in\ndark gray below */ } </style> <body> <div> Lorem ipsum dolor\nsit amet. Nam at jus. <img src="foo"/> Sed imp er di et ris.\nCur abi tur et sapen. ... </div> </body> </html>This code\ncan be rendered as: Lorem ipsum dolor sit amet. Nam at jus.\nSed imp er di et ris. Cur abi tur et sapen. Lorem ipsum\ndolor sit amet. Nam at jus. Sed imp er di et ris. Cur abi\ntur et sapen. Vivamus a metus. Aenean at risus pharetra ante\nluctu feugiat quis enim. Cum sociis natoque penatibus et\nmagni. Lorem ipsum dolor sit amet. Nam at jus. Sed imp er di\net ris. Cur abi tur et sapen. Vivamus a metus. Aenean at\nrisus pharetra ante luctu feugiat quis enim. Cum sociis\nnatoque penatibus et magni. Lorem ipsum dolor sit amet. Nam\nat jus. Sed imp er di et ris. Cur abi tur et sapen. Lorem\nipsum dolor sit amet. Nam at jus. Sed imp er di et ris. Cur\nabi tur et sapen. Vivamus a metus. Aenean at risus pharetra\nante luctu feugiat quis enim. Cum sociis natoque penatibus\net magni. Lorem ipsum dolor sit amet. Nam at jus. Sed imp er\ndi et ris. Cur abi tur et sapen. Vivamus a metus. Aenean at\nrisus pharetra ante luctu feugiat quis enim. Cum sociis\nnatoque penatibus et magni. Lorem ipsum dolor sit amet. Nam\nat jus. Sed imp er di et ris. Cur abi tur et sapen. Vivamus\na metus. Aenean at risus pharetra ante luctu feugiat quis\nenim. Cum sociis natoque penatibus et magni. Lorem ipsum\ndolor sit amet. Nam at jus. Sed imp er di et ris. Cur abi\ntur et sapen. Vivamus a metus. Aenean at risus pharetra ante\nluctu feugiat quis enim. Cum sociis natoque penatibus et\nmagni. If this code is added to the base document: img {\nfloat: right }it may be rendered as: Lorem ipsum dolor sit\namet. Nam at jus. Sed imp er di et ris. Cur abi tur et\nsapen. Fusce sed ligula a turpis. Lorem ipsum dolor sit\namet. Nam at jus. Sed imp er di et ris. Cur abi tur et\nsapen. Vivamus a metus. Aenean at risus pharetra ante luctu\nfeugiat quis enim. Cum sociis natoque penatibus et magni.\nLorem ipsum dolor sit amet. Nam at jus. Sed imp er di et\nris. Cur abi tur et sapen. Vivamus a metus. Aenean at risus\npharetra ante luctu feugiat quis enim. Cum sociis natoque\npenatibus et magni. Lorem ipsum dolor sit amet. Nam at jus.\nSed imp er di et ris. Cur abi tur et sapen. Fusce sed ligula\na turpis. Lorem ipsum dolor sit amet. Nam at jus. Sed imp er\ndi et ris. Cur abi tur et sapen. Vivamus a metus. Aenean at\nrisus pharetra ante luctu feugiat quis enim. Cum sociis\nnatoque penatibus et magni. Lorem ipsum dolor sit amet. Nam\nat jus. Sed imp er di et ris. Cur abi tur et sapen. Vivamus\na metus. Aenean at risus pharetra ante luctu feugiat quis\nenim. Cum sociis natoque penatibus et magni. Lorem ipsum\ndolor sit amet. Nam at jus. Sed imp er di et ris. Cur abi\ntur et sapen. Vivamus a metus. Aenean at risus pharetra ante\nluctu feugiat quis enim. Cum sociis natoque penatibus et\nmagni. Lorem ipsum dolor sit amet. Nam at jus. Sed imp er di\net ris. Cur abi tur et sapen. Vivamus a metus. Aenean at\nrisus pharetra ante luctu feugiat quis enim. Cum sociis\nnatoque penatibus et magni. This code floats images to the\nbottom of their containing block and sets the width to be\nthat of the column: img { float: bottom; width: 1gr; }The\ncolumn box is the containing block for floats, so if an\nimage naturally appears in the first column it will float to\nits bottom: Lorem ipsum dolor sit amet. Nam at jus. Sed imp\ner di et ris. Cur abi tur et sapen. Lorem ipsum dolor sit\namet. Nam at jus. Sed imp er di et ris. Cur abi tur et\nsapen. Vivamus a metus. Aenean at risus pharetra ante luctu\nfeugiat quis enim. Cum sociis natoque penatibus et magni.\nLorem ipsum dolor sit amet. Nam at jus. Sed imp er di et\nris. Cur abi tur et sapen. Vivamus a metus. Aenean at risus\npharetra ante luctu feugiat quis enim. Cum sociis natoque\npenatibus et magni. Lorem ipsum dolor sit amet. Nam at jus.\nSed imp er di et ris. Cur abi tur et sapen. Lorem ipsum\ndolor sit amet. Nam at jus. Sed imp er di et ris. Cur abi\ntur et sapen. Vivamus a metus. Aenean at risus pharetra ante\nluctu feugiat quis enim. Cum sociis natoque penatibus et\nmagni. Lorem ipsum dolor sit amet. Nam at jus. Sed imp er di\net ris. Cur abi tur et sapen. Vivamus a metus. Aenean at\nrisus pharetra ante luctu feugiat quis enim. Cum sociis\nnatoque penatibus et magni. Lorem ipsum dolor sit amet. Nam\nat jus. Sed imp er di et ris. Cur abi tur et sapen. Vivamus\na metus. Aenean at risus pharetra ante luctu feugiat quis\nenim. Cum sociis natoque penatibus et magni. Lorem ipsum\ndolor sit amet. Nam at jus. Sed imp er di et ris. Cur abi\ntur et sapen. Vivamus a metus. Aenean at risus pharetra ante\nluctu feugiat quis enim. Cum sociis natoque penatibus et\nmagni. This code floats figures to the top of the multi-\ncolumn element. div.figure { float: top right multicol;\nwidth: 1gr }The \'1gr\' value on \'width\' is equal to the width\nof the containing block. Here is a possible rendering: Lorem\nipsum dolor sit amet. Nam at jus. Sed imp er di et ris. Cur\nabi tur et sapen. Vivamus a metus. Aenean at risus pharetra\nante luctu feugiat quis enim. Cum sociis natoque penatibus\net magni. Lorem ipsum dolor sit amet. Nam at jus. Sed imp er\ndi et ris. Cur abi tur et sapen. Vivamus a metus. Aenean at\nrisus pharetra ante luctu feugiat quis enim. Cum sociis\nnatoque penatibus et magni. Lorem ipsum dolor sit amet. Nam\nat jus. Sed imp er di et ris. Cur abi tur et sapen. Lorem\nipsum dolor sit amet. Nam at jus. Sed imp er di et ris. Cur\nabi tur et sapen. Vivamus a metus. Aenean at risus pharetra\nante luctu feugiat quis enim. Cum sociis natoque penatibus\net magni. Lorem ipsum dolor sit amet. Nam at jus. Sed imp er\ndi et ris. Cur abi tur et sapen. Vivamus a metus. Aenean at\nrisus pharetra ante luctu feugiat quis enim. Cum sociis\nnatoque penatibus et magni. Lorem ipsum dolor sit amet. Nam\nat jus. Sed imp er di et ris. Cur abi tur et sapen. Lorem\nipsum dolor sit amet. Nam at jus. Sed imp er di et ris. Cur\nabi tur et sapen. Vivamus a metus. Aenean at risus pharetra\nante luctu feugiat quis enim. Cum sociis natoque penatibus\net magni. Lorem ipsum dolor sit amet. Nam at jus. Sed imp er\ndi et ris. Cur abi tur et sapen. In this code, the \'float\'\nproperty floats the element to the top left of the multi-\ncolumn element, while the \'float-offset\' property pushes it\nto the right so that it ends up in the column next to it:\ndiv.quote { float: top left multicol; float-offset: 2.5gr;\nwidth: 1gr } Lorem ipsum dolor sit amet. Nam at jus. Sed imp\ner di et ris. Cur abi tur et sapen. Vivamus a metus. Aenean\nat risus pharetra ante luctu feugiat quis enim. Cum sociis\nnatoque penatibus et magni. Lorem ipsum dolor sit amet. Nam\nat jus. Sed imp er di et ris. Cur abi tur et sapen. Lorem\nipsum dolor sit amet. Nam at jus. Sed imp er di et ris. Cur\nabi tur et sapen. Vivamus a metus. Aenean at risus pharetra\nante luctu feugiat quis enim. Cum sociis natoque penatibus\net magni. Lorem ipsum dolor sit amet. Nam at jus. Sed imp er\ndi et ris. Cur abi tur et sapen. Vivamus a metus. Aenean at\nrisus pharetra ante luctu feugiat quis enim. Cum sociis\nnatoque penatibus et magni. Lorem ipsum dolor sit amet. Nam\nat jus. Sed imp er di et ris. Cur abi tur et sapen. Lorem\nipsum dolor sit amet. Nam at jus. Sed imp er di et ris. Cur\nabi tur et sapen. Vivamus a metus. Aenean at risus pharetra\nante luctu feugiat quis enim. Cum sociis natoque penatibus\net magni. Lorem ipsum dolor sit amet. Nam at jus. Sed imp er\ndi et ris. Cur abi tur et sapen. Lorem ipsum dolor sit amet.\nNam at jus. Sed imp er di et ris. Cur abi tur et sapen.\nVivamus a metus. Aenean at risus pharetra ante luctu feugiat\nquis enim. Cum sociis natoque penatibus et magni. Assuming a\nthree-column layout, the same rendering can be achieved by\nfloating the element to the right instead: div.quote {\nfloat: top right multicol; float-offset: 2gr; width: 1gr\n}The floated element will never be pushed outside the\ncontent edges of the multicol element due to \'float-offset\'.\nimg { float: top right multicol; width: 3gr; } The code\nabove floats the element to the top right of the multi-\ncolumn element. Further, it sets the width of images to the\nwidth of two columns plus the gap between them. Here is a\npossible rendering. Lorem ipsum dolor sit amet. Nam at jus.\nSed imp er di et ris. Cur abi tur et sapen. Vivamus a metus.\nAenean at risus pharetra ante luctu feugiat quis enim. Cum\nsociis natoque penatibus et magni. Lorem ipsum dolor sit\namet. Nam at jus. Sed imp er di et ris. Cur abi tur et\nsapen. Lorem ipsum dolor sit amet. Nam at jus. Sed imp er di\net ris. Cur abi tur et sapen. img { float: top right\nmulticol; width: 2gr; } The code above floats the element to\nthe top right of the multi-column element. Further, it sets\nthe width of the image to the width of one column plus one\ncolumn gap. Here is a possible rendering. Lorem ipsum dolor\nsit amet. Nam at jus. Sed imp er di et ris. Cur abi tur et\nsapen. Vivamus a metus. Aenean at risus pharetra ante luctu\nfeugiat quis enim. Cum sociis natoque penatibus et magni.\nLorem ipsum dolor sit amet. Nam at jus. Sed imp er di et\nris. Cur abi tur et sapen. Vivamus a metus. Aenean at risus\npharetra ante luctu feugiat quis enim. Cum sociis natoque\npenatibus et magni. Lorem ipsum dolor sit amet. Nam at jus.\nSed imp er di et ris. Cur abi tur et sapen. img { float: top\nright multicol; width: 1.5gr; } The code above floats the\nelement to the top right of the multi-column element.\nFurther, it sets the width of the image to the width of one\ncolumn plus half the column gap. Lorem ipsum dolor sit amet.\nNam at jus. Sed imp er di et ris. Cur abi tur et sapen.\nVivamus a metus. Aenean at risus pharetra ante luctu feugiat\nquis enim. Cum sociis natoque penatibus et magni. Lorem\nipsum dolor sit amet. Nam at jus. Sed imp er di et ris. Cur\nabi tur et sapen. Vivamus a metus. Aenean at risus pharetra\nante luctu feugiat quis enim. Cum sociis natoque penatibus\net magni. Lorem ipsum dolor sit amet. Nam at jus. Sed imp er\ndi et ris. Cur abi tur et sapen. img { float: top left\nmulticol; float-offset: 1.5gr 50%; width: 8em; } The first\nrule in the code above floats images to the top left of the\nmulti-column element. The second rule pushes the float in\nthe opposite directions: to the right and downwards. The\nhorizontal component (\' 1.5gr \') means that the horizontal\nmiddle of the element should be in the middle of the gap\nbetween the left-most column and the one next to it.\nVertically, element should be in the middle of the column.\nHere is a possible rendering: Lorem ipsum dolor sit amet.\nNam at jus. Sed imp er di et ris. Cur abi tur et sapen.\nFusce sed ligula a turpis. Lorem ipsum dolor sit amet. Nam\nat jus. Sed imp er di et ris. Cur abi tur et sapen. Fusce\nsed ligula a turpis. Lorem ipsum dolor sit amet. Nam at jus.\nSed imp er di et ris. Cur abi tur et sapen. Vivamus a metus.\nAenean at risus pharetra ante luctu feugiat quis enim. Cum\nsociis natoque penatibus et magni. Consider this code: img {\nfloat: top left multicol; float-offset: 1.25gr 50%; width:\n6em; } The only difference between this and the previous\nexample is the horizontal value on \'float-offset\'. The value\n\' 1.25gr \' means that a point 25% into the image in the\ninline direction will be aligned with a point 25% into the\ncolumn gap. Here is a possible rendering: Lorem ipsum dolor\nsit amet. Nam at jus. Sed imper di et ris. Cur abi tur et\nsapen. Fusce sed ligula a sic turpis. Lorem ipsum dolor sit\namet. Namat jus. Sed imper di et ris curit. Lorem ipsum\ndolor sit amet. Nam at jus. Sed imp er di et ris. Cur abi\ntur et sapen. Fusce sed ligula a turpis. Lorem ipsum dolor\nsit amet. Nam at jus. Sed imp er di et ris. Cur abi tur et\nsapen. Vivamus a metus. Aenean at risus pharetra ante luctu\nfeugiat quis enim. Cum sociis natoque penatibus et magni.\n15. Conformance User agents that support hyphenation and\nsupport this specification must a 16. Appendix A: Default\nstyle sheetThe code above floats the element to the top\nright of the multi-column element. Further, it sets the\nwidth of images to the width of two columns plus the gap\nbetween them. Here is a possible rendering. Lorem ipsum\ndolor sit amet. Nam at jus. Sed imp er di et ris. Cur abi\ntur et sapen. Vivamus a metus. Aenean at risus pharetra ante\nluctu feugiat quis enim. Cum sociis natoque penatibus et\nmagni. Lorem ipsum dolor sit amet. Nam at jus. Sed imp er di\net ris. Cur abi tur et sapen. Lorem ipsum dolor sit amet.\nNam at jus. Sed imp er di et ris. Cur abi tur et sapen.\nLorem ipsum dolor sit amet. Nam at jus. Sed imp er di et\nris. Cur abi tur et sapen. Vivamus a metus. Aenean at risus\npharetra ante luctu feugiat quis enim. Cum sociis natoque\npenatibus et magni. Lorem ipsum dolor sit amet. Nam at jus.\nSed imp er di et ris. Cur abi tur et sapen. Lorem ipsum\ndolor sit amet. Nam at jus. Sed imp er di et ris. Cur abi\ntur et sapen. Lorem ipsum dolor sit amet. Nam at jus. Sed\nimp er di et ris. Cur abi tur et sapen. Lorem ipsum dolor\nsit amet. Nam at jus. Sed imp er di et ris. Cur abi tur et\nsapen. The code above floats the element to the top right of\nthe multi-column element. Further, it sets the width of the\nimage to the width of one column plus one column gap. Here\nis a possible rendering. Lorem ipsum dolor sit amet. Nam at\njus. Sed imp er di et ris. Cur abi tur et sapen. Vivamus a\nmetus. Aenean at risus pharetra ante luctu feugiat quis\nenim. Cum sociis natoque penatibus et magni. Lorem ipsum\ndolor sit amet. Nam at jus. Sed imp er di et ris. Cur abi\ntur et sapen. Vivamus a metus. Aenean at risus pharetra ante\nluctu feugiat quis enim. Cum sociis natoque penatibus et\nmagni. Lorem ipsum dolor sit amet. Nam at jus. Sed imp er di\net ris. Cur abi tur et sapen. Lorem ipsum dolor sit amet.\nNam at jus. Sed imp er di et ris. Cur abi tur et sapen.\nVivamus a metus. Aenean at risus pharetra ante luctu feugiat\nquis enim. Cum sociis natoque penatibus et magni. Lorem\nipsum dolor sit amet. Nam at jus. Sed imp er di et ris. Cur\nabi tur et sapen. Vivamus a metus. Aenean at risus pharetra\nante luctu feugiat quis enim. Cum sociis natoque penatibus\net magni. Lorem ipsum dolor sit amet. Nam at jus. Sed imp er\ndi et ris. Cur abi tur et sapen. Lorem ipsum dolor sit amet.\nNam at jus. Sed imp er di et ris. Cur abi tur et sapen.\nVivamus a metus. Aenean at risus pharetra ante luctu feugiat\nquis enim. Cum sociis natoque penatibus et magni. Lorem\nipsum dolor sit amet. Nam at jus. Sed imp er di et ris. Cur\nabi tur et sapen. The code above floats the element to the\ntop right of the multi-column element. Further, it sets the\nwidth of the image to the width of one column plus half the\ncolumn gap. Lorem ipsum dolor sit amet. Nam at jus. Sed imp\ner di et ris. Cur abi tur et sapen. Vivamus a metus. Aenean\nat risus pharetra ante luctu feugiat quis enim. Cum sociis\nnatoque penatibus et magni. Lorem ipsum dolor sit amet. Nam\nat jus. Sed imp er di et ris. Cur abi tur et sapen. Vivamus\na metus. Aenean at risus pharetra ante luctu feugiat quis\nenim. Cum sociis natoque penatibus et magni. Lorem ipsum\ndolor sit amet. Nam at jus. Sed imp er di et ris. Cur abi\ntur et sapen. Lorem ipsum dolor sit amet. Nam at jus. Sed\nimp er di et ris. Cur abi tur et sapen. Vivamus a metus.\nAenean at risus pharetra ante luctu feugiat quis enim. Cum\nsociis natoque penatibus et magni. Lorem ipsum dolor sit\namet. Nam at jus. Sed imp er di et ris. Cur abi tur et\nsapen. Vivamus a metus. Aenean at risus pharetra ante luctu\nfeugiat quis enim. Cum sociis natoque penatibus et magni.\nLorem ipsum dolor sit amet. Nam at jus. Sed imp er di et\nris. Cur abi tur et sapen. Lorem ipsum dolor sit amet. Nam\nat jus. Sed imp er di et ris. Cur abi tur et sapen. Vivamus\na metus. Aenean at risus pharetra ante luctu feugiat quis\nenim. Cum sociis natoque penatibus et magni. Lorem ipsum\ndolor sit amet. Nam at jus. Sed imp er di et ris. Cur abi\ntur et sapen. The first rule in the code above floats images\nto the top left of the multi-column element. The second rule\npushes the float in the opposite directions: to the right\nand downwards. The horizontal component (\' 1.5gr \') means\nthat the horizontal middle of the element should be in the\nmiddle of the gap between the left-most column and the one\nnext to it. Vertically, element should be in the middle of\nthe column. Here is a possible rendering: Lorem ipsum dolor\nsit amet. Nam at jus. Sed imp er di et ris. Cur abi tur et\nsapen. Fusce sed ligula a turpis. Lorem ipsum dolor sit\namet. Nam at jus. Sed imp er di et ris. Cur abi tur et\nsapen. Fusce sed ligula a turpis. Lorem ipsum dolor sit\namet. Nam at jus. Sed imp er di et ris. Cur abi tur et\nsapen. Vivamus a metus. Aenean at risus pharetra ante luctu\nfeugiat quis enim. Cum sociis natoque penatibus et magni.\nLorem ipsum dolor sit amet. Nam at jus. Sed imp er di et\nris. Cur abi tur et sapen. Fusce sed ligula a turpis. Lorem\nipsum dolor sit amet. Nam at jus. Sed imp er di et ris. Cur\nabi tur et sapen. Fusce sed ligula a turpis. Lorem ipsum\ndolor sit amet. Nam at jus. Sed imp er di et ris. Cur abi\ntur et sapen. Vivamus a metus. Aenean at risus pharetra ante\nluctu feugiat quis enim. Cum sociis natoque penatibus et\nmagni. Lorem ipsum dolor sit amet. Nam at jus. Sed imp er di\net ris. Cur abi tur et sapen. Fusce sed ligula a turpis.\nLorem ipsum dolor sit amet. Nam at jus. Sed imp er di et\nris. Cur abi tur et sapen. Vivamus a metus. Aenean at risus\npharetra ante luctu feugiat quis enim. Cum sociis natoque\npenatibus et magni. Consider this code: img { float: top\nleft multicol; float-offset: 1.25gr 50%; width: 6em; }The\nonly difference between this and the previous example is the\nhorizontal value on \'float-offset\'. The value \' 1.25gr \'\nmeans that a point 25% into the image in the inline\ndirection will be aligned with a point 25% into the column\ngap. Here is a possible rendering: Lorem ipsum dolor sit\namet. Nam at jus. Sed imper di et ris. Cur abi tur et sapen.\nFusce sed ligula a sic turpis. Lorem ipsum dolor sit amet.\nNamat jus. Sed imper di et ris curit. Lorem ipsum dolor sit\namet. Nam at jus. Sed imp er di et ris. Cur abi tur et\nsapen. Fusce sed ligula a turpis. Lorem ipsum dolor sit\namet. Nam at jus. Sed imp er di et ris. Cur abi tur et\nsapen. Vivamus a metus. Aenean at risus pharetra ante luctu\nfeugiat quis enim. Cum sociis natoque penatibus et magni.\nLorem ipsum dolor sit amet. Nam at jus. Sed imper di et ris.\nCur abi tur et sapen. Fusce sed ligula a sic turpis. Lorem\nipsum dolor sit amet. Namat jus. Sed imper di et ris curit.\nLorem ipsum dolor sit amet. Nam at jus. Sed imp er di et\nris. Cur abi tur et sapen. Fusce sed ligula a turpis. Lorem\nipsum dolor sit amet. Nam at jus. Sed imp er di et ris. Cur\nabi tur et sapen. Vivamus a metus. Aenean at risus pharetra\nante luctu feugiat quis enim. Cum sociis natoque penatibus\net magni. Lorem ipsum dolor sit amet. Nam at jus. Sed imp er\ndi et ris. Cur abi tur et sapen. Fusce sed ligula a turpis.\nLorem ipsum dolor sit amet. Nam at jus. Sed imp er di et\nris. Cur abi tur et sapen. Vivamus a metus. Aenean at risus\npharetra ante luctu feugiat quis enim. Cum sociis natoque\npenatibus et magni.\n(CSS3)',
+    'font': "Shorthand for setting 'font-style',\n'font-variant', 'font-weight', 'font-\nsize', 'line-height', and 'font-family',\nat the same place in the style sheet\n(CSS1, CSS2, CSS3)",
+    'font-family': 'Specifies a prioritized list of font\nfamily names and/or generic family names\n(CSS1, CSS2, CSS3)',
+    'font-size': 'Describes the size of the font when set\nsolid\n(CSS1, CSS2, CSS3)',
+    'font-size-adjust': "For any given font size, the apparent size and legibility of\ntext varies across fonts. For scripts such as Latin or\nCyrillic that distinguish between upper and lowercase\nletters, the relative height of lowercase letters compared\nto their uppercase counterparts is a determining factor of\nlegibility. This is commonly referred to as the aspect\nvalue. Precisely defined, it is equal to the x-height of a\nfont divided by the font size. In situations where font\nfallback occurs, fallback fonts may not share the same\naspect ratio as the desired font family and will thus appear\nless readable. The font-size-adjust property is a way to\npreserve the readability of text when font fallback occurs.\nIt does this by adjusting the font-size so that the x-height\nis the same irregardless of the font used. The style defined\nbelow defines Verdana as the desired font family, but if\nVerdana is not available Futura or Times will be used. p {\nfont-family: Verdana, Futura, Times; } <p>Lorem ipsum dolor\nsit amet,...</p> Verdana has a relatively high aspect ratio,\nlowercase letters are relatively tall compared to uppercase\nletters, so at small sizes text appears legible. Times has a\nlower aspect ratio and so if fallback occurs, the text will\nbe less legible at small sizes than Verdana. The style\ndefined below defines Verdana as the desired font family,\nbut if Verdana is not available Futura or Times will be\nused. Verdana has a relatively high aspect ratio, lowercase\nletters are relatively tall compared to uppercase letters,\nso at small sizes text appears legible. Times has a lower\naspect ratio and so if fallback occurs, the text will be\nless legible at small sizes than Verdana. How text rendered\nin each of these fonts compares is shown below, the columns\nshow text rendered in Verdana, Futura and Times. The same\nfont-size value is used across cells within each row and red\nlines are included to show the differences in x-height. In\nthe upper half each row is rendered in the same font-size\nvalue. The same is true for the lower half but in this half\nthe font-size-adjust property is also set so that the actual\nfont size is adjusted to perserve the x-height across each\nrow. Note how small text remains relatively legible across\neach row in the lower half. Text with and without the use of\nfont-size-adjustText with and without the use of font-size-\nadjustThis property allows authors to specify an aspect\nvalue for an element that will effectively preserve the\nx-height of the first choice font, whether it is substituted\nor not. Values have the following meanings:\n\n  'none': Do not preserve the font's x-height.\n  '<number>': Specifies the aspect value used in\n        the calculation below to calculate the adjusted\n        font size: c = ( a / a' ) s where: s = font-size\n        value a = aspect value as specified by the font-\n        size-adjust property a' = aspect value of actual\n        font c = adjusted font-size to use This value\n        applies to any font that is selected but in\n        typical usage it should be based on the aspect\n        value of the first font in the font-family list.\n        If this is specified accurately, the (a/a') term\n        in the formula above is effectively 1 for the\n        first font and no adjustment occurs. If the value\n        is specified inaccurately, text rendered using the\n        first font in the family list will display\n        differently in older user agents that don't\n        support font-size-adjust.\n(CSS3)",
+    'font-stretch': "Sets a normal, condensed, or expanded face from a font\nfamily. When a face does not exist for a given width, normal\nor condensed values map to a narrower face, otherwise a\nwider face. Conversely, expanded values map to a wider face,\notherwise a narrower face.\n\n  'condensed': Specifies a font face that is the\n        condensed from normal.\n  'semi-condensed': Specifies a font face that is\n        slighly more condensed from normal.\n  'extra-condensed': Specifies a font face that is\n        very condensed from normal.\n  'ultra-expanded': Specifies a font face that is\n        the most expanded from normal.\n  'semi-expanded': Specifies a font face that is\n        slighly more expanded from normal.\n  'wider': Specifies a font face that is more\n        expanded than normal.\n  'ultra-condensed': Specifies a font face that is\n        the most condensed from normal.\n  'extra-expanded': Specifies a font face that is\n        very expanded from normal.\n  'expanded': Specifies a font face that is the\n        expanded from normal.\n  'narrower': Specifies a font face that is more\n        condensed than normal.\n(CSS3)",
+    'font-style': 'Sets normal (sometimes referred to as\n"roman" or "upright"), italic, and\noblique faces within a font family\n(CSS1, CSS2, CSS3)',
+    'font-variant': "Can be used to select font casing\n'normal' or 'small-caps'\n(CSS1, CSS2, CSS3)",
+    'font-weight': 'Specifies the weight of the font\n(CSS1, CSS2, CSS3)',
+    'grid-columns': 'Space for each column or row of the grid can be defined as\nLength. Note that gr unit can also be used here (it refers\nto grid of the containing block) Percentage of containing\nblock height and width Relative length (as defined in multi-\nlength type in [HTML401] {{!HTML401}} ): A relative length\nhas the form "i*", where "i" is an integer. When allotting\nspace among elements competing for that space, user agents\nallot pixel and percentage lengths first, then divide up\nremaining available space among relative lengths. Each\nrelative length receives a portion of the available space\nthat is proportional to the integer preceding the "*". The\nvalue "*" is equivalent to "1*". Thus, if 60 pixels of space\nare available after the user agent allots pixel and\npercentage space, and the competing relative lengths are 1*,\n2*, and 3*, the 1* will be allotted 10 pixels, the 2* will\nbe allotted 20 pixels, and the 3* will be allotted 30\npixels. This definition is taken directly from HTML4.01. But\nit doesn\'t have to be exactly same. The number doesn\'t have\nto be integer. And maybe the number should be required for\nconsistency with other units. A relative length has the form\n"i*", where "i" is an integer. When allotting space among\nelements competing for that space, user agents allot pixel\nand percentage lengths first, then divide up remaining\navailable space among relative lengths. Each relative length\nreceives a portion of the available space that is\nproportional to the integer preceding the "*". The value "*"\nis equivalent to "1*". Thus, if 60 pixels of space are\navailable after the user agent allots pixel and percentage\nspace, and the competing relative lengths are 1*, 2*, and\n3*, the 1* will be allotted 10 pixels, the 2* will be\nallotted 20 pixels, and the 3* will be allotted 30 pixels.\nThis definition is taken directly from HTML4.01. But it\ndoesn\'t have to be exactly same. The number doesn\'t have to\nbe integer. And maybe the number should be required for\nconsistency with other units. For example this rule div {\ngrid-columns: 50% * * 4em } adds one grid line in the middle\nof containing block, another one 4em from the right another\none in the middle of remaining spaceAlso, grid lines can be\ndefined in repeating groups. A group is enclosed in\nparentheses and optionally specifies a maximum number of\nrepetitions in square brackets. Nested repeating groups are\nnot allowed. For example this rule div { grid-rows: 4em\n(0.25em 1em); } defines a header row of 4em adds as many\nadditional rows as necessary, alternating heights of 0.25em\nand 1em. For another example this rule div { grid-columns: *\n(1em *)[2]; }defines 3 columns of equal widths with 1em\ngaps, which matches a multi-column layout defined as div {\ncolumn-count: 3; }(assuming 1em is the default value of\ncolumn gap). 4.2. Natural grid\n(CSS3)',
+    'grid-rows': 'Space for each column or row of the grid can be defined as\nLength. Note that gr unit can also be used here (it refers\nto grid of the containing block) Percentage of containing\nblock height and width Relative length (as defined in multi-\nlength type in [HTML401] {{!HTML401}} ): A relative length\nhas the form "i*", where "i" is an integer. When allotting\nspace among elements competing for that space, user agents\nallot pixel and percentage lengths first, then divide up\nremaining available space among relative lengths. Each\nrelative length receives a portion of the available space\nthat is proportional to the integer preceding the "*". The\nvalue "*" is equivalent to "1*". Thus, if 60 pixels of space\nare available after the user agent allots pixel and\npercentage space, and the competing relative lengths are 1*,\n2*, and 3*, the 1* will be allotted 10 pixels, the 2* will\nbe allotted 20 pixels, and the 3* will be allotted 30\npixels. This definition is taken directly from HTML4.01. But\nit doesn\'t have to be exactly same. The number doesn\'t have\nto be integer. And maybe the number should be required for\nconsistency with other units. A relative length has the form\n"i*", where "i" is an integer. When allotting space among\nelements competing for that space, user agents allot pixel\nand percentage lengths first, then divide up remaining\navailable space among relative lengths. Each relative length\nreceives a portion of the available space that is\nproportional to the integer preceding the "*". The value "*"\nis equivalent to "1*". Thus, if 60 pixels of space are\navailable after the user agent allots pixel and percentage\nspace, and the competing relative lengths are 1*, 2*, and\n3*, the 1* will be allotted 10 pixels, the 2* will be\nallotted 20 pixels, and the 3* will be allotted 30 pixels.\nThis definition is taken directly from HTML4.01. But it\ndoesn\'t have to be exactly same. The number doesn\'t have to\nbe integer. And maybe the number should be required for\nconsistency with other units. For example this rule div {\ngrid-columns: 50% * * 4em } adds one grid line in the middle\nof containing block, another one 4em from the right another\none in the middle of remaining spaceAlso, grid lines can be\ndefined in repeating groups. A group is enclosed in\nparentheses and optionally specifies a maximum number of\nrepetitions in square brackets. Nested repeating groups are\nnot allowed. For example this rule div { grid-rows: 4em\n(0.25em 1em); } defines a header row of 4em adds as many\nadditional rows as necessary, alternating heights of 0.25em\nand 1em. For another example this rule div { grid-columns: *\n(1em *)[2]; }defines 3 columns of equal widths with 1em\ngaps, which matches a multi-column layout defined as div {\ncolumn-count: 3; }(assuming 1em is the default value of\ncolumn gap). 4.2. Natural grid\n(CSS3)',
+    'hanging-punctuation': "This property determines whether a punctuation mark, if one\nis present, may be placed outside the line box at the start\nor at the end of a full line of text. If a justified line\ncan fit the punctuation will it expand to push it outside\nthe content area? No. What if the line ends in multiple\npunctuation marks? Which punctuation marks are affected?\nValues have the following meanings:\n\n  'start': Punctuation may hang outside the start\n        edge of the first line.\n  'end': Punctuation may hang outside the end edge\n        of the last line.\n  'end-edge': Punctuation may hang outside the end\n        edge of all lines.\n(CSS3)",
+    'height': 'Specifies the content height of boxes\ngenerated by block-level and replaced\nelements\n(CSS1, CSS2, CSS3)',
+    'hyphenate-after': 'This property specifies the minimum number of characters in\na hyphenated word after the hyphenation character. The\n\'auto\' value means that the UA chooses a value that adapts\nto the current layout. Unless the UA is able to calculate a\nbetter value, it is suggested that \'auto\' means 2. Name:\nhyphenate-lines Value: no-limit | <integer> Initial: no-\nlimit Applies to: all elements Inherited: yes Percentages:\nN/A Media: visual Computed value: specified valueThis\nproperty indicates the maximum number of successive\nhyphenated lines in an element. In some cases, user agents\nmay not be able to honor the specified value. The \'no-limit\'\nvalue means that there is no limit. Name: hyphenate-\ncharacter Value: auto | <string> Initial: auto Applies to:\nall elements Inherited: yes Percentages: N/A Media: visual\nComputed value: specified valueThis property specifies a\nstring that is shown when a hyphenate-break occurs. The\n\'auto\' value means that the user agent should find an\nappropriate value. <p class=issue>Which character is it,\n"minus hyphen" or U+2010? In Latin scripts, the hyphen\ncharacter (U+2010) is often used to indicate that a word has\nbeen split. Normally, it will not be necessary to set it\nexplicitly. However, this can easily be done: article {\nhyphenate-character: "\\2010" } <p class=issue>XSL uses a\ndifferent list of <a href="http://www.w3.org/TR/2006/CR-\nxsl11-20060220/#common-hyphenation-\nproperties">properties</a>. Reuse of these properties has\nbeen considered. 7. New counter styles 7.1. The \'super-\ndecimal\' list-style-typeIn Latin scripts, the hyphen\ncharacter (U+2010) is often used to indicate that a word has\nbeen split. Normally, it will not be necessary to set it\nexplicitly. However, this can easily be done: article {\nhyphenate-character: "\\2010" }\n(CSS3)',
+    'hyphenate-before': 'This property specifies the minimum number of characters in\na hyphenated word before the hyphenation character. The\n\'auto\' value means that the UA chooses a value that adapts\nto the current layout. Unless the UA is able to calculate a\nbetter value, it is suggested that \'auto\' means 2. Name:\nhyphenate-after Value: <integer> | auto Initial: auto\nApplies to: all elements Inherited: yes Percentages: N/A\nMedia: visual Computed value: specified valueThis property\nspecifies the minimum number of characters in a hyphenated\nword after the hyphenation character. The \'auto\' value means\nthat the UA chooses a value that adapts to the current\nlayout. Unless the UA is able to calculate a better value,\nit is suggested that \'auto\' means 2. Name: hyphenate-lines\nValue: no-limit | <integer> Initial: no-limit Applies to:\nall elements Inherited: yes Percentages: N/A Media: visual\nComputed value: specified valueThis property indicates the\nmaximum number of successive hyphenated lines in an element.\nIn some cases, user agents may not be able to honor the\nspecified value. The \'no-limit\' value means that there is no\nlimit. Name: hyphenate-character Value: auto | <string>\nInitial: auto Applies to: all elements Inherited: yes\nPercentages: N/A Media: visual Computed value: specified\nvalueThis property specifies a string that is shown when a\nhyphenate-break occurs. The \'auto\' value means that the user\nagent should find an appropriate value. <p class=issue>Which\ncharacter is it, "minus hyphen" or U+2010? In Latin scripts,\nthe hyphen character (U+2010) is often used to indicate that\na word has been split. Normally, it will not be necessary to\nset it explicitly. However, this can easily be done: article\n{ hyphenate-character: "\\2010" } <p class=issue>XSL uses a\ndifferent list of <a href="http://www.w3.org/TR/2006/CR-\nxsl11-20060220/#common-hyphenation-\nproperties">properties</a>. Reuse of these properties has\nbeen considered. 7. New counter styles 7.1. The \'super-\ndecimal\' list-style-typeIn Latin scripts, the hyphen\ncharacter (U+2010) is often used to indicate that a word has\nbeen split. Normally, it will not be necessary to set it\nexplicitly. However, this can easily be done: article {\nhyphenate-character: "\\2010" }\n(CSS3)',
+    'hyphenate-character': 'This property specifies a string that is shown when a\nhyphenate-break occurs. The \'auto\' value means that the user\nagent should find an appropriate value. <p class=issue>Which\ncharacter is it, "minus hyphen" or U+2010? In Latin scripts,\nthe hyphen character (U+2010) is often used to indicate that\na word has been split. Normally, it will not be necessary to\nset it explicitly. However, this can easily be done: article\n{ hyphenate-character: "\\2010" } <p class=issue>XSL uses a\ndifferent list of <a href="http://www.w3.org/TR/2006/CR-\nxsl11-20060220/#common-hyphenation-\nproperties">properties</a>. Reuse of these properties has\nbeen considered. 7. New counter styles 7.1. The \'super-\ndecimal\' list-style-typeIn Latin scripts, the hyphen\ncharacter (U+2010) is often used to indicate that a word has\nbeen split. Normally, it will not be necessary to set it\nexplicitly. However, this can easily be done: article {\nhyphenate-character: "\\2010" }\n(CSS3)',
+    'hyphenate-lines': 'This property indicates the maximum number of successive\nhyphenated lines in an element. In some cases, user agents\nmay not be able to honor the specified value. The \'no-limit\'\nvalue means that there is no limit. Name: hyphenate-\ncharacter Value: auto | <string> Initial: auto Applies to:\nall elements Inherited: yes Percentages: N/A Media: visual\nComputed value: specified valueThis property specifies a\nstring that is shown when a hyphenate-break occurs. The\n\'auto\' value means that the user agent should find an\nappropriate value. <p class=issue>Which character is it,\n"minus hyphen" or U+2010? In Latin scripts, the hyphen\ncharacter (U+2010) is often used to indicate that a word has\nbeen split. Normally, it will not be necessary to set it\nexplicitly. However, this can easily be done: article {\nhyphenate-character: "\\2010" } <p class=issue>XSL uses a\ndifferent list of <a href="http://www.w3.org/TR/2006/CR-\nxsl11-20060220/#common-hyphenation-\nproperties">properties</a>. Reuse of these properties has\nbeen considered. 7. New counter styles 7.1. The \'super-\ndecimal\' list-style-typeIn Latin scripts, the hyphen\ncharacter (U+2010) is often used to indicate that a word has\nbeen split. Normally, it will not be necessary to set it\nexplicitly. However, this can easily be done: article {\nhyphenate-character: "\\2010" }\n(CSS3)',
+    'hyphenate-resource': 'This property specifies a comma-separated list of external\nresources that can help the UA determine hyphenation points.\nIf more than one resource is specified, the UA should\nconsult each resource until it finds one that is able to\ndetermine hyphenation points in a word. The \'none\' value\nindicates that no external resources are available. In any\ncase, the UA can also use local resources not listed on this\nproperty. Often, finding the right hyphenate resource is\nbased on knowing the language of the text. The lang\nattribute is recommended for encoding the language, and the\ncorresponding selector is used in this example: :lang(dk) {\nhyphenate-resource: url("hyph_da_DK.dic"),\nurl("hyph_da_NO.dic") } Name: hyphenate-before Value:\n<integer> | auto Initial: auto Applies to: all elements\nInherited: yes Percentages: N/A Media: visual Computed\nvalue: specified valueOften, finding the right hyphenate\nresource is based on knowing the language of the text. The\nlang attribute is recommended for encoding the language, and\nthe corresponding selector is used in this example:\n:lang(dk) { hyphenate-resource: url("hyph_da_DK.dic"),\nurl("hyph_da_NO.dic") }This property specifies the minimum\nnumber of characters in a hyphenated word before the\nhyphenation character. The \'auto\' value means that the UA\nchooses a value that adapts to the current layout. Unless\nthe UA is able to calculate a better value, it is suggested\nthat \'auto\' means 2. Name: hyphenate-after Value: <integer>\n| auto Initial: auto Applies to: all elements Inherited: yes\nPercentages: N/A Media: visual Computed value: specified\nvalueThis property specifies the minimum number of\ncharacters in a hyphenated word after the hyphenation\ncharacter. The \'auto\' value means that the UA chooses a\nvalue that adapts to the current layout. Unless the UA is\nable to calculate a better value, it is suggested that\n\'auto\' means 2. Name: hyphenate-lines Value: no-limit |\n<integer> Initial: no-limit Applies to: all elements\nInherited: yes Percentages: N/A Media: visual Computed\nvalue: specified valueThis property indicates the maximum\nnumber of successive hyphenated lines in an element. In some\ncases, user agents may not be able to honor the specified\nvalue. The \'no-limit\' value means that there is no limit.\nName: hyphenate-character Value: auto | <string> Initial:\nauto Applies to: all elements Inherited: yes Percentages:\nN/A Media: visual Computed value: specified valueThis\nproperty specifies a string that is shown when a hyphenate-\nbreak occurs. The \'auto\' value means that the user agent\nshould find an appropriate value. <p class=issue>Which\ncharacter is it, "minus hyphen" or U+2010? In Latin scripts,\nthe hyphen character (U+2010) is often used to indicate that\na word has been split. Normally, it will not be necessary to\nset it explicitly. However, this can easily be done: article\n{ hyphenate-character: "\\2010" } <p class=issue>XSL uses a\ndifferent list of <a href="http://www.w3.org/TR/2006/CR-\nxsl11-20060220/#common-hyphenation-\nproperties">properties</a>. Reuse of these properties has\nbeen considered. 7. New counter styles 7.1. The \'super-\ndecimal\' list-style-typeIn Latin scripts, the hyphen\ncharacter (U+2010) is often used to indicate that a word has\nbeen split. Normally, it will not be necessary to set it\nexplicitly. However, this can easily be done: article {\nhyphenate-character: "\\2010" }\n(CSS3)',
+    'hyphens': 'Values are: Name: hyphenate-resource Value: none | <uri> [,\n<uri> ]* Initial: none Applies to: all elements Inherited:\nyes Percentages: N/A Media: visual Computed value: specified\nvalue\n\n  \'auto\': Words can be broken at appropriate\n        hyphenation points, as determined by characters\n        inside the word, resources listed in \'hyphenate-\n        resource\', or other UA-dependent resources.\n        Characters inside the word take priority over\n        hyphenation points determined by other resources.\n  \'none\': Words are not broken at line breaks,\n        even if characters inside the word suggest line\n        break points.\n  \'manual\': Words are only broken at line breaks\n        where there are characters inside the word that\n        suggest line break opportunities. Characters can\n        be explicit or conditional. In Unicode, U+00AD is\n        a conditional "soft hyphen" and U+2010 is an\n        explicit hyphen. Unicode Standard Annex #14\n        describes the role of soft hyphens in the Unicode\n        Line breaking algorithm. In HTML, represents the\n        soft hyphen character which suggests a line break\n        opportunity. example.\n(CSS3)',
+    'image-orientation': "'image-orientation' specifies a rotation in the right or\nclockwise direction that a user agent applies to an image.\nIn terms of the order of transformations, the image is first\nrotated, then sized, then positioned. Thus height and width\nproperties apply to the rotated rather than the original\nimage dimensions. Two values for the 'image-orientation'\nproperty apply to an image:\n\n  'auto': The image will be set to the orientation\n        of the page. That is, for a pixelated image\n        consisting of rows and columns of pixels, a row is\n        displayed across the width of the display surface\n        and a column along the height.\n  '<angle>': A positive value rotates the image to\n        the right (in a clockwise direction) by the given\n        number of degrees. Negative values rotate to the\n        left or in a counter-clockwise direction.\n        Specified values outside the range of ]-360, 360[\n        degrees are moduloed by 360 to produce a computed\n        value within that range. User agents MUST support\n        values which compute to 0, 90, 180, and 270\n        degrees. Support for other values is optional.\n(CSS3)",
+    'image-resolution': 'Image resolution, as the term is used in this document,\nmeans pixels per physical length, e.g., pixels per inch.\nSome image formats can record information about the\nresolution of images. This information can be helpful when\ndetermining the actual size of the image in the formatting\nprocess. However, the information can also be wrong, in\nwhich case it should be ignored. The \'image-resolution\' and\n\'background-image-resolution\' properties are introduced to\ndetermine the correct resolution of images. Name: image-\nresolution Value: normal | [ from-image || <dpi> ] Initial:\nnormal Applies to: replaced elements and background images?\nInherited: yes Percentages: N/A Media: visual Computed\nvalue: as specified value (or, should it be only one\nvalue?)The values are: This rule specifies that the UA\nshould use the image resolution found in the image itself.\nimg { image-resolution: from-image } Using this rule, the\nimage resolution is set to 300dpi and the resolution in the\nimage, if any, is ignored. img { image-resolution: 300dpi }\nThese rules both specify that the UA should use the image\nresolution found in the image itself. If the image has no\nresolution, the resolution is set to 300dpi. img { image-\nresolution: from-image 300dpi } img { image-resolution:\n300dpi from-image } <table class=propdef> <tr>\n<td><em>Name:</em> <td><dfn>image-resolution</dfn> <tr>\n<td><em>Value:</em> <td>normal | auto | <dpi> [, normal |\n<dpi> ]? <tr> <td><em>Initial:</em> <td>normal <tr>\n<td><em>Applies to:</em> <td>replaced elements <tr>\n<td><em>Inherited:</em> <td>yes <tr>\n<td><em>Percentages:</em> <td>N/A <tr> <td><em>Media:</em>\n<td>visual <tr> <td><em>Computed value:</em> <td>as\nspecified value <span class=issue>(or, should it be only one\nvalue?)</span> </table> <p>This property accepts either a\nsingle value, or a comma-separated list of two values. The\nvalues are: <dl> <dt>normal <dd>The resolution of the image\nis unknown, and UAs should not use the resolution found in\nthe image. Instead, the image resolution will be found by\nmaking image pixels equivalent to CSS pixels. <dt>auto\n<dd>The UA must look for the resolution in the image itself.\nIf the image has no image resolution, the next value in the\ncomma-separated list is evaluated. <dt><dpi> <dd>The value\nconsists of a number with a \'<code\nclass=property>dpi</code>\' unit identifier. The UA should\nuse the specified resolution. </dl> <p>If, after evaluating\nthe specified values, no image resolution has been\ndetermined, the UA should behave as if \'<code\nclass=css>normal</code>\' had been specified. <div\nclass="example"> <p>This rule specifies that the UA should\nuse the image resolution found in the image itself. <pre>\nimg { image-resolution: auto } </pre> </div> <div\nclass="example"> <p>This rule specifies that the UA should\nuse the image resolution found in the image itself. If the\nimage has no resolution, the resolution is set to 300dpi.\n<pre> img { image-resolution: auto, 300dpi } </pre> </div>\n<div class="example"> <p>Using this rule, the image\nresolution is set to 300dpi and the resolution in the image,\nif any, is ignored. <pre> img { image-resolution: 300dpi }\n</pre> </div> <div class="issue"> <p>Should there be a way\nof setting width, height, resolution on images that are\nreferenced by a URL in the style sheet? E.g., <pre>\nbackground-image: url(image.png, width, height, resolution);\nbackground-image: image-url(image.png, width, height,\nresolution); background-image: image(url(image.png), width,\nheight, resolution); </pre> </div> <table class=propdef>\n<tr> <td><em>Name:</em> <td><dfn>background-image-\nresolution</dfn> <tr> <td><em>Value:</em> <td>normal | auto\n| <dpi> [, normal | <dpi> ]? <tr> <td><em>Initial:</em>\n<td>normal <tr> <td><em>Applies to:</em> <td>replaced\nelements <tr> <td><em>Inherited:</em> <td>yes <tr>\n<td><em>Percentages:</em> <td>N/A <tr> <td><em>Media:</em>\n<td>visual <tr> <td><em>Computed value:</em> <td>as\nspecified value <span class=issue>(or, should it be only one\nvalue?)</span> </table> <p class=issue>Introducing one new\nproperty in all places where an image can be loaded may not\nbe a scalable solution. Therefore this property is at risk.\n<p>As \'<code class=property>image-resolution</code>\', except\nthat it describes the resolution of the element\'s background\nimage. 9. Page marks and bleed area\n\n  \'<dpi>\': The value consists of a number with a\n        \'dpi\' unit identifier. The <dpi> value sets the\n        resolution of the image. In combination with\n        \'from-image\', the specified dpi is only used if\n        the image does not have a resolution.\n  \'from-image\': The UA must look for the\n        resolution in the image itself. If the image does\n        not have a resolution, the specified <dpi> value\n        is used. If no <dpi> value is specified, the\n        behavior is as if \'normal\' had been specified.\n  \'normal\': The resolution of the image is\n        unknown, and UAs should not use the resolution\n        found in the image. Instead, the image resolution\n        will be found by converting the dimension of the\n        image into CSS pixels.\n(CSS3)',
+    'inline-box-align': "The 'inline-box-align' property determines which line of a\nmulti-line inline block align with the previous and next\ninline elements within a line. The alignment strategy for\nthe inline lock itself (i.e. the definition of it alignment\npoint and which parent baseline should be used for the\nalignment) is determined by the inline block element\nbaseline alignment properties applicable to the line being\nused for the alignment. This property has no effect for\nsingle line inline block. Possible values: 5. Initial line\nand Drop initial 5.1. Initial line\n\n  '<integer>': Use nth line (as determined by the\n        integer value) of the inline block element for\n        alignment purpose.\n  'initial': Use the initial line of the inline\n        block element for alignment purpose.\n  'last': Use the last line of the inline block\n        element for alignment purpose.\n(CSS3)",
+    'left': "This property specifies how far a box's left content edge is offset to the right of the left edge of the box's containing block\n(CSS2, CSS3)",
+    'letter-spacing': 'Specifies spacing behavior between text\ncharacters\n(CSS1, CSS2, CSS3)',
+    'line-height': 'Specifies the minimal height of each\ngenerated inline box\n(CSS1, CSS2, CSS3)',
+    'line-stacking-ruby': "This property determines the line stacking method for block\nelements containing ruby annotation elements (element with\n'display: ruby-text'or'display: ruby-text-container'). In\nall cases the ruby base elements (elements with 'display:\nruby-base' or display: ruby-base-container') are considered\nfor line stacking. Possible values:\n\n  'exclude-ruby': The ruby annotation elements are\n        ignored for line stacking.\n  'include-ruby': The ruby annotation elements are\n        considered for line stacking.\n(CSS3)",
+    'line-stacking-shift': "This property determines the line stacking method for block\nelements containing elements with base-shift. Possible\nvalues:\n\n  'disregard-shifts': In determining the stack-\n        height, include the unshifted top-edge and bottom-\n        edge of any characters that have a baseline-shift.\n  'consider-shifts': In determining the stack-\n        height, include the adjusted top-edge and bottom-\n        edge of any characters that have a baseline-shift.\n(CSS3)",
+    'line-stacking-strategy': "This property determines the line stacking strategy for\nstacked line boxes within a containing block element. The\nterm 'stack-height' is used in the context of this property\ndescription to indicate the block-progression advance for\nthe line boxes. Possible values:\n\n  'max-height': The stack-height is the smallest\n        value that contains the block progression\n        dimension of all the inline elements on that line\n        when those elements are properly aligned. The\n        'line-height' property value is taken into account\n        only for the block elements.\n  'inline-line-height': The stack-height is the\n        smallest value that contains the extended block\n        progression dimension of all the inline elements\n        on that line when those elements are properly\n        aligned. Since the line spacing information is\n        already included in the computation of the line\n        box, these line boxes are simply stacked adjacent\n        to one another in the formatted block to which\n        they belong. The 'line-height' property value is\n        taken into account for both the inline elements\n        and the block elements. For inline elements, it\n        defines the extended block progression dimension.\n        For block elements, it defines the minimum\n        extended block progression dimension.\n  'block-line-height': The stack-height is\n        determined by the block element 'line-height'\n        property value. The 'line-height' property value\n        is ignored for inline elements. For alignment\n        purpose, this case is similar to the minimum\n        extended block progression dimension case (strut\n        model). This is the only line-stacking strategy\n        that may cause inline boxes within the line to\n        bleed before and after the line box because the\n        line box is not constrained by its inline boxes.\n  'grid-height': The stack-height is the smallest\n        multiple of the block element 'line-height'\n        computed value that can contain the block\n        progression of all the inline elements on that\n        line when those elements are properly aligned. The\n        'line-height' property value is ignored for inline\n        elements.\n(CSS3)",
+    'list-style': "Shorthand notation for setting the three\nproperties 'list-style-type', 'list-\nstyle-image', and 'list-style-position'\nat the same place in the style sheet\n(CSS1, CSS2, CSS3)",
+    'list-style-image': 'Sets the image that will be used as the\nlist item marker\n(CSS1, CSS2, CSS3)',
+    'list-style-position': 'Specifies the position of the marker box\nin the principal block box\n(CSS1, CSS2, CSS3)',
+    'list-style-type': "Specifies appearance of the list item\nmarker if 'list-style-image' has the\nvalue 'none' or if the image pointed to\nby the URI cannot be displayed\n(CSS1, CSS2, CSS3)",
+    'margin': "Shorthand for setting 'margin-top',\n'margin-right', 'margin-bottom', and\n'margin-left' at the same place in the\nstyle sheet\n(CSS1, CSS2, CSS3)",
+    'margin-bottom': 'Specifies the width of the bottom margin\narea of a box\n(CSS1, CSS2, CSS3)',
+    'margin-left': 'Specifies the width of the left margin\narea of a box\n(CSS1, CSS2, CSS3)',
+    'margin-right': 'Specifies the width of the right margin\narea of a box\n(CSS1, CSS2, CSS3)',
+    'margin-top': 'Specifies the width of the top margin\narea of a box\n(CSS1, CSS2, CSS3)',
+    'mark': "The 'mark' property is a shorthand for setting 'mark-before'\nand 'mark-after'. If two values are given the first value is\n'mark-before' and the second is 'mark-after'. If only one\nvalue is given, it applies to both properties. The following\ntwo rules are equivalent:\n(CSS3)",
+    'mark-after': "The mark properties allow named markers to be attached to\nthe audio stream. For compatibility with SSML, this must\nconform to the xsd:token datatype as defined in XML Schema.\nSynthesis processors must do one or both of the following\nwhen encountering a mark:The mark properties have no audible\neffect on the speech and instead just serve to mark points\nin the stream. Values have the following meanings:\n\n  '<string>': A string to be used as the name of\n        the mark.\n(CSS3)",
+    'mark-before': "The mark properties allow named markers to be attached to\nthe audio stream. For compatibility with SSML, this must\nconform to the xsd:token datatype as defined in XML Schema.\nSynthesis processors must do one or both of the following\nwhen encountering a mark:The mark properties have no audible\neffect on the speech and instead just serve to mark points\nin the stream. Values have the following meanings:\n\n  '<string>': A string to be used as the name of\n        the mark.\n(CSS3)",
+    'marker-offset': 'Specifies the distance between the nearest border edges of a marker box and its associated principal box\n(CSS2, CSS3)',
+    'marks': 'Specifies whether cross marks or crop marks or both should be rendered just outside the page box edge. Crop marks indicate where the page should be cut. Cross marks (also known as register marks or registration marks) are used to align sheets\n(CSS2, CSS3)',
+    'marquee-direction': 'This property determines the initial direction in which the\ncontent moves if the marquee effect is used. \'Forward\' moves\nthe text so that hidden text appears in the normal reading\norder, \'reverse\' does the opposite. The actual direction\ntherefore depends on \'direction\' and \'overflow-style\' of the\nelement, as follows: \'overflow-style\' \'direction\' \'forward\'\n\'reverse\' \'marquee-line\' \'ltr\' left right \'rtl\' right left\n\'marquee-block\' up downNote that \' marquee-style: alternate\n\' moves content in the opposite direction from this table on\nevery other loop. Note that the \'direction\' property is\noften set by rules in the UA style sheet based on mark-up in\nthe document, as recommended in CSS 2.1 [CSS21] {{!CSS21}}\nsection 9.10 ("Text direction: the direction and unicode-\nbidi properties"). 9. The \'marquee-speed\' property Name:\nmarquee-speed Value: slow | normal | fast Initial: normal\nApplies to: same as \'overflow\' Inherited: no Percentages:\nN/A Media: visual Computed value: as specified\n(CSS3)',
+    'marquee-play-count': "This property specifies how many times the content moves.\nUAs should restart the loop count every time the element\nturns from completely invisible into (fully or partially)\nvisible. E.g., an element that is outside the viewport\nstarts moving when it is scrolled into view. A UA may also\ntake the visibility of the UA viewport itself into account,\ne.g., if the element is hidden behind a pop-up window or if\nthe UA is iconified. If 'marquee-play-count' is different\nfor different states of the element, e.g., ' p {marquee-\nplay-count: 0} p:hover {marquee-play-count: infinite} ', the\nloop counter must be reset each time the element enters a\nstate with a different computed value. For example, if the\ncontent of an li overflows under the following style rules,\nthe content moves once when the li gets the focus or is\nhovered over. But, when it already has the focus when it is\nhovered over, the 'marquee-play-count' property doesn't\nchange and thus the content doesn't move again: li\n{overflow: auto; overflow-style: marquee; marquee-play-\ncount: 0} li:focus, li:hover {marquee-play-count: 1}For\nexample, if the content of an li overflows under the\nfollowing style rules, the content moves once when the li\ngets the focus or is hovered over. But, when it already has\nthe focus when it is hovered over, the 'marquee-play-count'\nproperty doesn't change and thus the content doesn't move\nagain: li {overflow: auto; overflow-style: marquee; marquee-\nplay-count: 0} li:focus, li:hover {marquee-play-count: 1}If\nthe specified value is 'infinite' or greater than 16, the UA\nmay stop after 16 loops. 8. The 'marquee-direction' property\nName: marquee-direction Value: forward | reverse Initial:\nforward Applies to: same as 'overflow' Inherited: yes\nPercentages: N/A Media: visual Computed value: as specified\n(CSS3)",
+    'marquee-speed': 'This property determines how fast the content scrolls. The\nactual speed depends on the UA and the type of content. But,\nfor a given UA and a given element, the following must\nalways be true: slow < normal < fast. 10. Conformance\n(CSS3)',
+    'marquee-style': "The values are: This figure shows one loop of ' marquee-\nstyle: scroll '. The initial state (1) has all content\noutside the box to the right. (2) shows an intermediate\nstate. And the final state (3) has all content outside the\nbox on the left. This figure shows one loop of ' marquee-\nstyle: slide '. The initial state (1) has all content\noutside the box to the right. (2) shows an intermediate\nstate. And the final state (3) has the right edge of the\ncontent just inside the right edge of the box and some\ncontent overflowing to the left of the box. This figure show\ntwo loops of ' marquee-style: alternate '. The initial state\n(1) has the left edge of the content aligned to the left\nedge of the box and content overflowing on the right. (2)\nshows an intermediate state, while the content moves to the\nleft. The end of the first loop is state (3). (4) is an\nintermediate state of the second loop. (5) is the end of the\nsecond loop and is equal to state (1).\n\n  'slide': Start completely off one side, scroll\n        in, and stop as soon as no more content is off\n        that side. The following pseudo-code defines the\n        behavior when the marquee direction is to the left\n        (see 'marquee-direction'). The other directions\n        are analogous. Set the element to clip the\n        overflow to the left and to the right Create an\n        anonymous box B around the content; set its\n        'width' so as to include all content and all\n        overflow exactly; set its 'margin-right'to'auto'\n        Set n to the value of 'marquee-play-count' While n\n        != 0: Set 'margin-left' of B to 100% (i.e., all\n        contents is off to the right and thus invisible)\n        Decrease 'margin-left' at constant speed (see\n        'marquee-speed') until 'margin-right' is 0\n        Decrease n by one\n  'alternate': Bounce back and forth. The\n        following pseudo-code defines the behavior when\n        the initial marquee direction is to the left (see\n        'marquee-direction'). The other directions are\n        analogous. Set the element to clip the overflow to\n        the left and to the right Create an anonymous box\n        B around the content; set its 'width' so as to\n        include all content and all overflow exactly Set r\n        to false Set n to the value of 'marquee-play-\n        count' While n != 0: If r, set 'margin-right' of B\n        to 0 and 'margin-left'to'auto'; else, set 'margin-\n        left' of B to 0 and 'margin-right'to'auto' If r,\n        decrease 'margin-right' at constant speed (see\n        'marquee-speed') until 'margin-left' is 0; else,\n        decrease 'margin-left' at constant speed until\n        'margin-right' is 0 Set r to !r (i.e., the next\n        loop will move in the opposite direction) Decrease\n        n by one\n  'scroll': Start completely off one side, scroll\n        all the way across and completely off. The\n        following pseudo-code defines the behavior when\n        the marquee direction is to the left (see\n        'marquee-direction'). The other directions are\n        analogous. Set the element to clip the overflow to\n        the left and to the right Create an anonymous box\n        B around the content; set its 'width' so as to\n        include all content and all overflow exactly; set\n        its 'margin-right'to'auto' Set n to the value of\n        'marquee-play-count' While n != 0: Set 'margin-\n        left' of B to 100% (i.e., all contents is off to\n        the right and thus invisible) Decrease 'margin-\n        left' at constant speed (see 'marquee-speed')\n        until 'margin-right' is 100% (i.e., all content is\n        off to the left and thus invisible) Decrease n by\n        one\n(CSS3)",
+    'max-height': 'Maximum height of the containing box\n(CSS2, CSS3)',
+    'max-width': 'Maximum width of the containing box\n(CSS2, CSS3)',
+    'min-height': 'Minimum height of the containing box\n(CSS2, CSS3)',
+    'min-width': 'Minimum width of the containing box\n(CSS2, CSS3)',
+    'move-to': "The 'move-to' property causes the element or pseudo-element\nto be removed from the flow and reinserted at a later point\nin the document. The content is reinserted using the\n'pending()' XXX link value of the 'content' property. This\nproperty applies to all elements as well as the '::before',\n'::after', and '::alternate' pseudo-elements. The\n'::alternate' pseudo-element in fact exists exclusively for\nthe purpose of being moved by this property, e.g. in the\ncreation of footnotes.\n\n  '<identifier>': The element is not displayed at\n        the current location, but at the next occurrence\n        of 'pending(<identifier>)' (where the identifiers\n        match), with all other elements moved to that\n        point, in document order. If at the end af the\n        document (after the '::after' pseudo-elements of\n        the root element) there are outstanding elements,\n        then they are all inserted in document order at\n        that point.\n  'here': The element or pseudo-element is not\n        moved. This value inhibits the creation of\n        '::alternate' pseudo-elements and any pseudo-\n        elements that have such a pseudo-element as a\n        superior.\n  'normal': For '::alternate' pseudo-elements, if\n        the superior parent uses the 'footnote' counter in\n        its 'content' property then the computed value of\n        'move-to'is'footnotes'. For '::alternate' pseudo-\n        elements, if the superior parent uses the\n        'endnote' counter in its 'content' property then\n        the computed value of 'move-to'is'endnotes'. For\n        '::alternate' pseudo-elements, if the superior\n        parent uses the 'section-note' counter in its\n        'content' property then the computed value of\n        'move-to'is'section-notes'. Otherwise the computed\n        value of the move-to property is 'here'.\n(CSS3)",
+    'nav-index': 'The \'nav-index\' property is an input-method-neutral way of\nspecifying the sequential navigation order (also known as\n"tabbing order"). Name: nav-index Value: auto | <number> |\ninherit Initial: auto Applies to: all enabled elements\nInherited: no Percentages: n/a Media: interactive Computed\nvalue: specified value.\n\n  \'auto\': The element\'s sequential navigation\n        order is assigned automatically by the user agent.\n  \'<number>\': The number (which is non-zero and\n        positive) indicates the sequential navigation\n        order for the element. \'1\' means first. Elements\n        with the same nav-index value are navigated in\n        document order when that nav-index value is being\n        navigated.\n(CSS3)',
+    'orphans': 'Specifies the minimum number of lines of a paragraph that must be left at the bottom of a page\n(CSS2, CSS3)',
+    'outline': "Shorthand for setting 'outline-style', 'outline-width', and 'outline-color' at the same place in the style sheet\n(CSS2, CSS3)",
+    'outline-color': 'Outline color around visual object\n(CSS2, CSS3)',
+    'outline-offset': "If the computed value of 'outline-offset' is anything other\nthan 0, then the outline is outset from the border edge by\nthat amount. Example(s): For example, to leave 2 pixels of\nspace between a focus outline and the element that has the\nfocus, or is active, the following rule can be used:\n:focus,:active { outline-offset: 2px } 9.\nResizingExample(s):For example, to leave 2 pixels of space\nbetween a focus outline and the element that has the focus,\nor is active, the following rule can be used:\n(CSS3)",
+    'outline-style': 'Specifies the line style of the outline (solid, double, dashed, etc.)\n(CSS2, CSS3)',
+    'outline-width': 'Specifies the width of the outline around the element\n(CSS2, CSS3)',
+    'overflow': "Specifies whether the content of a block-level element is clipped when it overflows the element's box (which is acting as a containing block for the content)\n(CSS2, CSS3)",
+    'overflow-style': "This property specifies the preferred scrolling method for\nelements that overflow (see the 'overflow' property.) If the\nUA does not support the specified value, it must act as if\nthe value was 'auto'. 6. The 'marquee-style' property Name:\nmarquee-style Value: scroll | slide | alternate Initial:\nscroll Applies to: same as 'overflow' Inherited: no\nPercentages: N/A Media: visual Computed value: as specified\n\n  'auto': The UA chooses the scrolling mechanism.\n        Marquees and scrollbars are common mechanisms, but\n        the UA may also use others.\n  'marquee-line': This selects marquee as the\n        horizontal scrolling mechanism (i.e., for content\n        that overflows to the left or right). The\n        scrolling mechanism in the perpendicular direction\n        is left to the UA, but should not be marquee.\n  'marquee-block': This selects marquee as the\n        vertical scrolling mechanism (i.e., for content\n        that overflows above or below the box). The\n        scrolling mechanism in the perpendicular direction\n        is left to the UA, but should not be marquee.\n(CSS3)",
+    'overflow-x': "These properties specify whether content is clipped when it\noverflows the element's content area. It affects the\nclipping of all of the element's content except any\ndescendant elements (and their respective content and\ndescendants) whose containing block is the viewport or an\nancestor of the element. 'Overflow-x' determines clipping at\nthe left and right edges, 'overflow-y' at the top and bottom\nedges.'Overflow' is a shorthand. If it has one keyword, it\nsets both 'overflow-x'and'overflow-y' to that keyword; if it\nhas two, it sets 'overflow-x' to the first and 'overflow-y'\nto the second. Keywords have the following meanings:\n\n  'no-content': When the content doesn't fit in\n        the content box, the whole content is hidden, as\n        if ' visibility: hidden ' were specified. [This\n        idea is due to Till Halbach <tillh@opera.com>,\n        July 21, 2005]\n  'auto': The behavior of the 'auto' value is UA-\n        dependent, but should cause a scrolling mechanism\n        to be provided for overflowing boxes.\n  'visible': This value indicates that content is\n        not clipped, i.e., it may be rendered outside the\n        content box.\n  'no-display': When the content doesn't fit in\n        the content box, the whole box is removed, as if '\n        display: none ' were specified. [This idea is due\n        to Till Halbach <tillh@opera.com>, July 21, 2005]\n  'hidden': This value indicates that the content\n        is clipped and that no scrolling mechanism should\n        be provided to view the content outside the\n        clipping region.\n  'scroll': This value indicates that the content\n        is clipped and that if the user agent uses a\n        scrolling mechanism that is visible on the screen\n        (such as a scroll bar or a panner), that mechanism\n        should be displayed for a box whether or not any\n        of its content is clipped. This avoids any problem\n        with scrollbars appearing and disappearing in a\n        dynamic environment. When this value is specified\n        and the target medium is 'print', overflowing\n        content may be printed.\n(CSS3)",
+    'overflow-y': "These properties specify whether content is clipped when it\noverflows the element's content area. It affects the\nclipping of all of the element's content except any\ndescendant elements (and their respective content and\ndescendants) whose containing block is the viewport or an\nancestor of the element. 'Overflow-x' determines clipping at\nthe left and right edges, 'overflow-y' at the top and bottom\nedges.'Overflow' is a shorthand. If it has one keyword, it\nsets both 'overflow-x'and'overflow-y' to that keyword; if it\nhas two, it sets 'overflow-x' to the first and 'overflow-y'\nto the second. Keywords have the following meanings:\n\n  'no-content': When the content doesn't fit in\n        the content box, the whole content is hidden, as\n        if ' visibility: hidden ' were specified. [This\n        idea is due to Till Halbach <tillh@opera.com>,\n        July 21, 2005]\n  'auto': The behavior of the 'auto' value is UA-\n        dependent, but should cause a scrolling mechanism\n        to be provided for overflowing boxes.\n  'visible': This value indicates that content is\n        not clipped, i.e., it may be rendered outside the\n        content box.\n  'no-display': When the content doesn't fit in\n        the content box, the whole box is removed, as if '\n        display: none ' were specified. [This idea is due\n        to Till Halbach <tillh@opera.com>, July 21, 2005]\n  'hidden': This value indicates that the content\n        is clipped and that no scrolling mechanism should\n        be provided to view the content outside the\n        clipping region.\n  'scroll': This value indicates that the content\n        is clipped and that if the user agent uses a\n        scrolling mechanism that is visible on the screen\n        (such as a scroll bar or a panner), that mechanism\n        should be displayed for a box whether or not any\n        of its content is clipped. This avoids any problem\n        with scrollbars appearing and disappearing in a\n        dynamic environment. When this value is specified\n        and the target medium is 'print', overflowing\n        content may be printed.\n(CSS3)",
+    'padding': "Shorthand for setting 'padding-top',\n'padding-right', 'padding-bottom', and\n'padding-left' at the same place in the\nstyle sheet\n(CSS1, CSS2, CSS3)",
+    'padding-bottom': 'Sets the bottom width of the containing\nbox\n(CSS1, CSS2, CSS3)',
+    'padding-left': 'Sets the left width of the containing\nbox\n(CSS1, CSS2, CSS3)',
+    'padding-right': 'Sets the right width of the containing\nbox\n(CSS1, CSS2, CSS3)',
+    'padding-top': 'Sets the top width of the containing box\n(CSS1, CSS2, CSS3)',
+    'page': 'Specifies a particular type of page where an element should be displayed\n(CSS2, CSS3)',
+    'page-break-after': 'Indicate the user agent should break the page after here\n(CSS2, CSS3)',
+    'page-break-before': 'Indicate the user agent should break the page before here\n(CSS2, CSS3)',
+    'page-break-inside': 'Indicate the user agent should break the page within here\n(CSS2, CSS3)',
+    'page-policy': "'page-policy' determines which page-based occurance of a\ngiven element is applied to a counter or string value: The\nfollowing example places the chapter name in the header,\nspecifying that it is the value of the string at the end of\nthe page. Example: @string chapter { page-policy: last; }\n@page { size: 21.0cm 29.7cm; /* A4 */ @top { text-align:\nright; vertical-align: center; content: string (chapter); }\n}\n\n  'start': Takes the value of the counter or\n        string at the beginning of the page (before\n        applying style to the elements of the page, but\n        after applying it to the @page context itself).\n  'last': Takes the value following the final\n        state change on the page.\n  'first': Takes the value after the first state\n        change in the counter or string during processing\n        of the page.\n(CSS3)",
+    'pause': "Audio: Shorthand for setting 'pause-before' and 'pause-after'. If two values are given, the first value is 'pause-before' and the second is 'pause-after'. If only one value is given, it applies to both properties\n(CSS2, CSS3)",
+    'pause-after': "Audio: Specifies a pause to be observed after speaking an element's content\n(CSS2, CSS3)",
+    'pause-before': "Audio: Specifies a pause to be observed before speaking an element's content\n(CSS2, CSS3)",
+    'phonemes': 'This allows authors to specify a phonetic pronunciation for\nthe text contained by the corresponding element.\n(CSS3)',
+    'pitch': 'Audio: Specifies the average pitch (a frequency) of the speaking voice\n(CSS2, CSS3)',
+    'pitch-range': 'Audio: Specifies variation in average pitch\n(CSS2, CSS3)',
+    'play-during': "Audio: Similar to the 'cue-before' and 'cue-after' properties, this property specifies a sound to be played as a background while an element's content is spoken\n(CSS2, CSS3)",
+    'position': 'Specifies which of the CSS2 positioning algorithms is used to calculate the position of a box\n(CSS2, CSS3)',
+    'presentation-level': "This property sets the element's presentation level (EPL).\nThe values have the following meanings:\n(CSS3)",
+    'punctuation-trim': "This property determines whether or not a fullwidth\npunctuation character should be trimmed (kerned) if it\nappears at the start or end of a line, or adjacent to\nanother fullwidth punctuation character. Values are defined\nas follows:\n\n  'start': Trim (kern) the blank half of fullwidth\n        opening punctuation at the beginning of each line.\n  'none': Do not trim or kern the blank half of\n        fullwidth opening or closing punctuation glyphs.\n  'end': Trim (kern) the blank half of fullwidth\n        closing punctuation at the end of each line.\n  'adjacent': Trim (kern) the blank half of\n        fullwidth opening punctuation if its previous\n        adjacent character is a fullwidth opening\n        punctuation, fullwidth middle dot punctuation,\n        fullwidth closing punctuation, or ideographic\n        space (U+3000). Trim (kern) the blank half of\n        fullwidth closing punctuation if its next adjacent\n        character is a fullwidth closing punctuation,\n        fullwidth middle dot punctuation, or ideographic\n        space (U+3000).\n(CSS3)",
+    'quotes': 'Specifies quotation marks for any number of embedded quotations\n(CSS2, CSS3)',
+    'rendering-intent': "This property permits the specification of a color profile\nrendering intent other than the default. The behavior of\nvalues other than auto and inherit are defined by the\nInternational Color Consortium standard [ICC32]. 3.5. The\n'@color-profile' at-rule\n\n  'auto': This is the default behavior. The user\n        agent determines the best intent based on the\n        content. For image content containing an embedded\n        profile, it should be assumed that the intent\n        specified within the profile is the desired\n        intent. Otherwise, the user agent should use the\n        current profile (based on the color-profile style)\n        and force the intent, overriding any intent that\n        may be stored in the profile itself.\n(CSS3)",
+    'rest': "The 'rest' property is a shorthand for setting 'rest-before'\nand 'rest-after'. If two values are given, the first value\nis 'rest-before' and the second is 'rest-after'. If only one\nvalue is given, it applies to both properties.\n(CSS3)",
+    'rest-after': 'These properties specify a rest or prosodic boundary to be\nobserved before (or after) speaking an element\'s content.\nValues have the following meanings:\n\n  \'none\': none, x-weak, weak, medium, strong, and\n        x-strong. These values may be used to indicate the\n        prosodic strength of the break in speech output.\n        The synthesis processor may insert a rest as part\n        of its implementation of the prosodic break. The\n        value "none" indicates that no prosodic break\n        boundary should be output, and can be used to\n        inhibit a prosodic break which the processor would\n        otherwise produce. The other values indicate\n        monotonically non-decreasing (conceptually\n        increasing) break strength between words. The\n        stronger boundaries are typically accompanied by\n        rests. "x-weak" and "x-strong" are mnemonics for\n        "extra weak" and "extra strong", respectively.\n  \'<time>\': Expresses the rest in absolute time\n        units (seconds and milliseconds, e.g. "3s",\n        "250ms"). Only positive values are allowed.\n(CSS3)',
+    'rest-before': 'These properties specify a rest or prosodic boundary to be\nobserved before (or after) speaking an element\'s content.\nValues have the following meanings:\n\n  \'none\': none, x-weak, weak, medium, strong, and\n        x-strong. These values may be used to indicate the\n        prosodic strength of the break in speech output.\n        The synthesis processor may insert a rest as part\n        of its implementation of the prosodic break. The\n        value "none" indicates that no prosodic break\n        boundary should be output, and can be used to\n        inhibit a prosodic break which the processor would\n        otherwise produce. The other values indicate\n        monotonically non-decreasing (conceptually\n        increasing) break strength between words. The\n        stronger boundaries are typically accompanied by\n        rests. "x-weak" and "x-strong" are mnemonics for\n        "extra weak" and "extra strong", respectively.\n  \'<time>\': Expresses the rest in absolute time\n        units (seconds and milliseconds, e.g. "3s",\n        "250ms"). Only positive values are allowed.\n(CSS3)',
+    'richness': 'Audio: Specifies the richness, or brightness, of the speaking voice. A rich voice will "carry" in a large room, a smooth voice will not\n(CSS2, CSS3)',
+    'right': "This property specifies how far a box's right content edge is offset to the left of the right edge of the box's containing block\n(CSS2, CSS3)",
+    'rotation': 'Should probably be in the extended Box module instead of\nhere... Name: rotation Value: <angle> Initial: 0 Applies to:\nblock-level elements, inline-table and inline-block\nInherited: no Percentages: N/A Media: visual Computed value:\n0deg <= angle < 360deg Name: rotation-point Value: <bg-\nposition> Initial: 50% 50% Applies to: block-level elements\nInherited: no Percentages: Width and height of border box\nMedia: visual Computed value: for <length> the absolute\nvalue, otherwise a percentageThe value of \'rotation-point\'\nis a pair of values that defines a point as an offset from\nthe top left border edge. Percentages refer to the width and\nheight of the border box. Values may be negative.\'Rotation\'\nrotates a block-level element counterclockwise around the\npoint given by \'rotation-point\'. The border, padding and\ncontent are rotated, and also any background that is not\n\'fixed\'. All static or relatively positioned child elements\n(and their static and relatively positioned children,\nrecursively) are rotated along. But absolutely positioned\nand fixed descendant elements are not. Note that this means\nthat rotation is relative. A child of a box that is rotated\n45deg and that has a rotation of -45deg itself, actually\nends up horizontal (but probably in a different location\nthan when both rotations had been 0). Rotation doesn\'t\naffect parent or sibling elements, they are laid out as if\nthe element\'s rotation was 0. Conceptually, the element is\nfirst laid out without any rotation, then any relative\npositioning is applied to it (see [CSS3POS] {{CSS3POS}} )\nand finally any rotation. The rotation point is relative to\nthe box after relative positioning. Note that, like relative\npositioning, rotation can thus cause an element\'s box to\noverlap other boxes. It is the author\'s responsibility to\ngive the element wide enough margins if such overlapping is\nnot desired. When a box is broken over several columns or\npages, each of the boxes is rotated separately around its\nown rotation point. The computed value of \'rotation\' is the\nangle normalized to fall in 0deg <= angle < 360deg. The\ncomputed value or \'rotation-point\' is a pair in which any\n<length> is made absolute, keywords are replaced by\npercentages and percentages are left as specified. This\nexample puts H1 elements upside down. It relies on the\n\'rotation-point\' having its default value of \' 50% 50% \'. H1\n{rotation: 180deg} This example displays column headers in a\ntable diagonally. It uses \'block-progression\' (see\n[CSS3TEXTLAYOUT] {{!CSS3TEXTLAYOUT}} ) to write the column\nheaders vertically and applies \'rotation\' to rotate the\nheaders 45 degrees to the left. A fairly wide padding is\napplied, to make sure the text of the headings doesn\'t\noverlap. thead th { block-progression: rl; padding: 0.5em\n1em; rotation: 45deg; rotation-point: bottom left } Example\nof a table with rotated column headings. This example puts\nH1 elements upside down. It relies on the \'rotation-point\'\nhaving its default value of \' 50% 50% \'. This example\ndisplays column headers in a table diagonally. It uses\n\'block-progression\' (see [CSS3TEXTLAYOUT]\n{{!CSS3TEXTLAYOUT}} ) to write the column headers vertically\nand applies \'rotation\' to rotate the headers 45 degrees to\nthe left. A fairly wide padding is applied, to make sure the\ntext of the headings doesn\'t overlap. Example of a table\nwith rotated column headings. In the table example, how are\nthe borders rotated? Because the borders belong to two\nelements that are rotated individually. Dave Hyatt proposes\nto generalize the property and call it "transform" with a\nsyntax and functionality like in SVG, i.e., a property that\naccepts a series of transformations (rotations,\ntranslations, arbitrary affine transformations). 14.\nStacking contexts\n(CSS3)',
+    'rotation-point': 'Should probably be in the extended Box module instead of\nhere... Name: rotation Value: <angle> Initial: 0 Applies to:\nblock-level elements, inline-table and inline-block\nInherited: no Percentages: N/A Media: visual Computed value:\n0deg <= angle < 360deg Name: rotation-point Value: <bg-\nposition> Initial: 50% 50% Applies to: block-level elements\nInherited: no Percentages: Width and height of border box\nMedia: visual Computed value: for <length> the absolute\nvalue, otherwise a percentageThe value of \'rotation-point\'\nis a pair of values that defines a point as an offset from\nthe top left border edge. Percentages refer to the width and\nheight of the border box. Values may be negative.\'Rotation\'\nrotates a block-level element counterclockwise around the\npoint given by \'rotation-point\'. The border, padding and\ncontent are rotated, and also any background that is not\n\'fixed\'. All static or relatively positioned child elements\n(and their static and relatively positioned children,\nrecursively) are rotated along. But absolutely positioned\nand fixed descendant elements are not. Note that this means\nthat rotation is relative. A child of a box that is rotated\n45deg and that has a rotation of -45deg itself, actually\nends up horizontal (but probably in a different location\nthan when both rotations had been 0). Rotation doesn\'t\naffect parent or sibling elements, they are laid out as if\nthe element\'s rotation was 0. Conceptually, the element is\nfirst laid out without any rotation, then any relative\npositioning is applied to it (see [CSS3POS] {{CSS3POS}} )\nand finally any rotation. The rotation point is relative to\nthe box after relative positioning. Note that, like relative\npositioning, rotation can thus cause an element\'s box to\noverlap other boxes. It is the author\'s responsibility to\ngive the element wide enough margins if such overlapping is\nnot desired. When a box is broken over several columns or\npages, each of the boxes is rotated separately around its\nown rotation point. The computed value of \'rotation\' is the\nangle normalized to fall in 0deg <= angle < 360deg. The\ncomputed value or \'rotation-point\' is a pair in which any\n<length> is made absolute, keywords are replaced by\npercentages and percentages are left as specified. This\nexample puts H1 elements upside down. It relies on the\n\'rotation-point\' having its default value of \' 50% 50% \'. H1\n{rotation: 180deg} This example displays column headers in a\ntable diagonally. It uses \'block-progression\' (see\n[CSS3TEXTLAYOUT] {{!CSS3TEXTLAYOUT}} ) to write the column\nheaders vertically and applies \'rotation\' to rotate the\nheaders 45 degrees to the left. A fairly wide padding is\napplied, to make sure the text of the headings doesn\'t\noverlap. thead th { block-progression: rl; padding: 0.5em\n1em; rotation: 45deg; rotation-point: bottom left } Example\nof a table with rotated column headings. This example puts\nH1 elements upside down. It relies on the \'rotation-point\'\nhaving its default value of \' 50% 50% \'. This example\ndisplays column headers in a table diagonally. It uses\n\'block-progression\' (see [CSS3TEXTLAYOUT]\n{{!CSS3TEXTLAYOUT}} ) to write the column headers vertically\nand applies \'rotation\' to rotate the headers 45 degrees to\nthe left. A fairly wide padding is applied, to make sure the\ntext of the headings doesn\'t overlap. Example of a table\nwith rotated column headings. In the table example, how are\nthe borders rotated? Because the borders belong to two\nelements that are rotated individually. Dave Hyatt proposes\nto generalize the property and call it "transform" with a\nsyntax and functionality like in SVG, i.e., a property that\naccepts a series of transformations (rotations,\ntranslations, arbitrary affine transformations). 14.\nStacking contexts\n(CSS3)',
+    'ruby-align': 'This property can be used on any element to control the text\nalignment of the ruby text and ruby base contents relative\nto each other. It applies to all the ruby\'s in the element.\nFor simple ruby, the alignment is applied to the ruby child\nelement whose content is shorter: either the rb element or\nthe rt element [ RUBY ]. For complex ruby, the alignment is\nalso applied to the ruby child elements whose content is\nshorter: either the rb element and/or one or two rt elements\nfor each related ruby text and ruby base element within the\nrtc and rbc element. Possible values:\n\n  \'right\': The ruby text content is aligned with\n        the end edge of the base. Figure 4.2.5 : End ruby\n        alignment\n  \'center\': The ruby text content is centered\n        within the width of the base. If the length of the\n        base is smaller than the length of the ruby text,\n        then the base is centered within the width of the\n        ruby text. Figure 4.2.4 : Center ruby alignment\n  \'auto\': The user agent determines how the ruby\n        contents are aligned. This is the initial value.\n        The behavior recommended by [ JIS4051 ] is for a\n        wide-cell ruby is to be aligned in the\n        \'distribute-space\' mode: Figure 4.2.1 : Wide-cell\n        text in \'auto\' ruby alignment is \'distribute-\n        space\' justified The recommended behavior for a\n        narrow-cell glyph ruby is to be aligned in the\n        \'center\' mode. Figure 4.2.2 : Narrow-width ruby\n        text in \'auto\' ruby alignment is centered\n  \'distribute-space\': If the width of the ruby\n        text is smaller than that of the base, then the\n        ruby text contents are evenly distributed across\n        the width of the base, with a certain amount of\n        white space preceding the first and following the\n        last character in the ruby text. That amount of\n        white space is normally equal to half the amount\n        of inter-character space of the ruby text. If the\n        width of the ruby text is at least the width of\n        the base, then the same type of space distribution\n        applies to the base. In other words, if the base\n        is shorter than the ruby text, the base is\n        distribute-space aligned. This type of alignment\n        is sometimes referred to as the "1:2:1" alignment\n        [ JIS4051 ]. Figure 4.2.7 : Distribute-space ruby\n        alignment\n  \'line-edge\': If the ruby text is not adjacent to\n        a line edge, it is aligned as in \'auto\'. If it is\n        adjacent to a line edge, then it is still aligned\n        as in auto, but the side of the ruby text that\n        touches the end of the line is lined up with the\n        corresponding edge of the base. This type of\n        alignment is specified by [ JIS4051 ]. This type\n        of alignment is relevant only to the scenario\n        where the ruby text is longer than the ruby base.\n        In the other scenarios, this is just \'auto\'.\n        Figure 4.2.8 : Line edge ruby alignment\n  \'distribute-letter\': If the width of the ruby\n        text is smaller than that of the base, then the\n        ruby text contents are evenly distributed across\n        the width of the base, with the first and last\n        ruby text glyphs lining up with the corresponding\n        first and last base glyphs. If the width of the\n        ruby text is at least the width of the base, then\n        the letters of the base are evenly distributed\n        across the width of the ruby text. Figure 4.2.6 :\n        Distribute-letter ruby alignment\n  \'left\': The ruby text content is aligned with\n        the start edge of the base. Figure 4.2.3 : Start\n        ruby alignment\n(CSS3)',
+    'ruby-overhang': "This property determines whether, and on which side, ruby\ntext is allowed to partially overhang any adjacent text in\naddition to its own base, when the ruby text is wider than\nthe ruby base. Note that ruby text is never allowed to\noverhang glyphs belonging to another ruby base. Also the\nuser agent is free to assume a maximum amount by which ruby\ntext may overhang adjacent text. The user agent may use the\n[ JIS4051 ] recommendation of using one ruby text character\nlength as the maximum overhang length. Possible values:\n\n  'auto': The ruby text can overhang text adjacent\n        to the base on either side. [ JIS4051 ] specifies\n        the categories of characters that ruby text can\n        overhang. The user agent is free to follow the [\n        JIS4051 ] recommendation or specify its own\n        classes of characters to overhang. This is the\n        initial value. Figure 4.3.1 : Ruby overhanging\n        adjacent text\n  'none': The ruby text cannot overhang any text\n        adjacent to its base, only its own base. Figure\n        4.3.4 : Ruby not allowed to overhang adjacent text\n  'end': The ruby text can overhang the text that\n        follows it. That means, for example, that ruby can\n        overhang text that is to the right of it in\n        horizontal LTR layout, or it can overhang text\n        that is below it in vertical-ideographic layout.\n        Figure 4.3.3 : Ruby overhanging following text\n        only\n  'start': The ruby text can overhang the text\n        that precedes it. That means, for example, that\n        ruby can overhang text that is to the left of it\n        in horizontal LTR layout, or it can overhang text\n        that is above it in vertical-ideographic layout.\n        Figure 4.3.2 : Ruby overhanging preceding text\n        only\n(CSS3)",
+    'ruby-position': 'This property is used by the parent of elements with\ndisplay: ruby-text to control the position of the ruby text\nwith respect to its base. Such parents are typically either\nthe ruby element itself (simple ruby) or the rtc element\n(complex ruby). This assures that all part of a rtc element\nwill be displayed in the same position. Possible values:\n\n  \'after\': The ruby text appears after the base.\n        This is a relatively rare setting used in\n        ideographic East Asian writing systems, most\n        easily found in educational text. Figure 4.1.4 :\n        Bottom ruby in horizontal layout applied to\n        Japanese text If the base appears in a vertical\n        ideographic mode, the bottom ruby appears on the\n        left side of the base and is rendered in the same\n        layout mode as the base (i.e. vertical). Figure\n        4.1.5 : Bottom ruby in vertical ideographic layout\n        applied to Japanese text\n  \'right\': The ruby text appears on the right of\n        the base. Unlike \'before\'and\'after\', this value is\n        not relative to the text flow direction.\n  \'before\': The ruby text appears before the base.\n        This is the most common setting used in\n        ideographic East Asian writing systems. This is\n        the initial value. Figure 4.1.1 : Top ruby in\n        horizontal layout applied to Japanese text If the\n        base appears in a vertical-ideographic layout\n        mode, the ruby appears on the right side of the\n        base and is rendered in the same layout mode as\n        the base (i.e. vertical-ideographic). Figure 4.1.2\n        : Top ruby in vertical ideographic layout applied\n        to Japanese text Note the special case of\n        traditional Chinese as used especially in Taiwan:\n        ruby (made of Bopomofo glyphs) in that context can\n        appear along the right side of the base glyph, as\n        if the text were in vertical layout, but the bases\n        themselves are rendered on a horizontal line,\n        since the actual layout is horizontal: Figure\n        4.1.3 : " Bopomofo " ruby in traditional Chinese\n        (ruby text shown in blue for clarity) in\n        horizontal layout In order to achieve that effect,\n        vertical-ideographic layout should be set on each\n        individual ruby. That can be accomplished with the\n        following simple CSS rule: ruby.bopomofo {\n        writing-mode: tb-rl } Note: The Bopomofo\n        transcription is written in the normal way as part\n        of the ruby text. The user agent is responsible\n        for ensuring the correct relative alignment and\n        positioning of the glyphs, including those\n        corresponding to the tone marks, when displaying\n        as vertical ruby.\n(CSS3)',
+    'ruby-span': "This property controls the spanning behavior of annotation\nelements. Note: A XHTML user agent may also use the rbspan\nattribute to get the same effect. Possible values:\n\n  'none': No spanning. The computed value is '1'.\n  'attr': attr(x). The value of attribute 'x' as a\n        string value. The string value is evaluated as a\n        <number> to determine the number of ruby base\n        elements to be spanned by the annotation element.\n        If the <number> is '0', it is replaced by '1'. The\n        <number> is the computed value.\n(CSS3)",
+    'size': 'Specifies the size and orientation of a page box\n(CSS2, CSS3)',
+    'speak': 'Audio: Specifies whether text will be rendered aurally and if so, in what manner\n(CSS2, CSS3)',
+    'speak-header': 'Audio: Specifies whether table headers are spoken before every cell, or only before a cell when that cell is associated with a different header than the previous cell\n(CSS2, CSS3)',
+    'speak-numeral': 'Audio: Controls how numerals are spoken\n(CSS2, CSS3)',
+    'speak-punctuation': 'Audio: Specifies how punctuation is spoken\n(CSS2, CSS3)',
+    'speech-rate': 'Audio: Specifies the speaking rate. Note that both absolute and relative keyword values are allowed\n(CSS2, CSS3)',
+    'stress': 'Audio: Specifies the height of "local peaks" in the intonation contour of a voice\n(CSS2, CSS3)',
+    'string-set': 'The \'string-set\' property accepts a comma-separated list of\nnamed strings. Each named string is followed by a content\nlist that specifies which text to copy into the named\nstring. Whenever an element with value of \'string-set\'\ndifferent from \'none\' is encountered, the named strings are\nassigned their respective value. For the \'string-set\'\nproperty, <content-list> expands to one or more of these\nvalues, in any order: <p class="issue">Should target-\ncounter() and leader() also be allowed?</p>\n\n  \'<string>\': a string, e.g. "foo"\n  \'<content>\': the \' content() \' function returns\n        the content of elements and pseudo-elements. The\n        functional notation accepts an optional argument:\n        \' content() \' Without any arguments, the function\n        returns the textual content of the element, not\n        including the content of its ::before and ::after\n        pseudo-element. The content of the element\'s\n        descendants, including their respective ::before\n        and ::after pseudo-elements, are included in the\n        returned content. \' content(before) \' The function\n        returns the textual content of the ::before\n        pseudo-element the content of the element. \'\n        content(after) \' The function returns the textual\n        content of the ::after pseudo-element the content\n        of the element. \' content(first-letter) \' The\n        function returns the first letter of the content\n        of the element. The definition of a letter is the\n        same as for :first-letter pseudo-elements. The\n        expected use for \' content(first-letter) \' is to\n        create one-letter headers, e.g., in dictionaries.\n        \' env() \' This function returns data from the\n        local environment of the user at the time of\n        formatting. The function accepts one of these\n        keywords: env(url): returns the URL of the\n        document env(date): returns the date on the user\'s\n        system at the time of formatting env(time):\n        returns the time on the user\'s system at the time\n        of formatting env(date-time): returns the date and\n        time on the user\'s system at the time of\n        formatting Information about date and time is\n        formatted according to the locale of the user\'s\n        system. Or, should there be a way to specify the\n        locale? Or should we simply format all in ISO\n        format (e.g., 2010-03-30)? On many systems,\n        preformatted strings in the user\'s locale can be\n        found through the strftime function. The date,\n        time and date-time strings can be found by using\n        the "%x", "%X" and "%c" conversion strings,\n        respectively. @page { @top-right { content:\n        env(url) } @bottom-right { content: env(date-time)\n        } }\n  \'<counter>\': the counter() or counters()\n        function, as per CSS 2.1 section 4.3.5\n(CSS3)',
+    'table-layout': 'Specifies the algorithm used to lay out\nthe table cells, rows, and columns\n(CSS1, CSS2, CSS3)',
+    'target': 'The \'target\' property is a shorthand property for setting\nthe individual target properties (i.e., \'target-name\',\n\'target-new\'and\'target-position\') at the same place in the\nstyle sheet. Given a valid declaration, the \'target\'\nproperty first sets all the individual target properties to\ntheir initial values, then assigns explicit values given in\nthe declaration. <h2>The :link and :visited pseudo-\nclasses</h2> == These are already described in CSS3\nSelectors == <h2>The ??? property</h2> <p>An element may\nrepresent several links. The ??? property specifies which\nlink to use.</p> <pre>p[href] { link: attr(href) }</pre> ==\nEditor thinks this is not developed enough of an idea to\ninclude here == <p>Primary and secondary links?</p> ==\nperhaps an issue == <h2 id="profiles">Profiles</h2> <p>[This\nsection explains what parts of this module belong in which\nprofiles.]</p> <p>We have at least 4 profiles: level 1,\nlevel 2, level 3 and full</p> == CSS3 Hyperlinks should not\nhave any profiles. This should be all or nothing. == 4.\nConformance\n(CSS3)',
+    'target-name': "The 'target-name' property defines the name of the target\ndestination, including a few keywords for well known\ndestinations. Name: target-name Value: current | root |\nparent | new | modal | <string> Initial: current Applies to:\nhyperlinks Inherited: no Percentages: N/A Media Group(s):\ninteractive visual Computed value: specified value does not\napply if 'target-style'is'auto'. In other cases theThe\nvalues mean the following: 3.3. The 'target-new' property\n\n  '<string>': The target is displayed in the\n        existing frame, window or tab of that name. If no\n        such named destination exists, a new destination\n        (see 'target-new') is created with that name.\n  'parent': The name of the parent of the current\n        frame. If the current frame has no parent this\n        value is treated as 'root'. This value never\n        causes a new destination to be created.\n  'current': The name of the current frame, tab or\n        window where the link resides. This value never\n        causes a new destination to be created.\n  'modal': If 'target-style'is'frame', this value\n        is treated as 'current'. Otherwise a A new modal\n        window is temporarily created.\n  'new': If 'target-style'is'frame', this value is\n        treated as 'current'. Otherwise a A new\n        destination (see 'target-new') is always created.\n  'root': The name of the current tab (if there is\n        one) or window. This value never causes a new\n        destination to be created.\n(CSS3)",
+    'target-new': "The 'target-new' property determines what new target\ndestination (if any) is created. Name: target-new Value:\nwindow | tab | none Initial: window Applies to: hyperlinks\nInherited: no Percentages: N/A Media Group(s): interactive\nvisual Computed value: specified value If a user wanted to\nhave new windows open in new tabs instead, she could use the\nfollowing user style sheet to do so: * { target-new: tab !\nimportant } 3.4. The 'target-position' property\n\n  'none': No new destination is created. The\n        target is not displayed.\n  'window': The target is displayed in a new\n        window.\n  'tab': The target is displayed in a new tab of\n        an existing window.\n(CSS3)",
+    'target-position': "The 'target-position' property indicates where a new\ndestination (if any) is created. Name: target-position\nValue: above | behind | front | back Initial: above Applies\nto: hyperlinks Inherited: no Percentages: N/A Media\nGroup(s): interactive visual Computed value: specified value\n\n  'front': The new destination tab (window) is\n        placed above all other tabs (windows)\n        respectively.\n  'behind': The new destination tab (window) is\n        placed behind the current tab (window)\n        respectively.\n  'back': The new destination tab (window) is\n        placed behind all other tabs (windows)\n        respectively.\n  'above': The new destination tab (window) is\n        placed above the current tab (window)\n        respectively.\n(CSS3)",
+    'text-align': 'Specifies how inline content of a block\nis aligned\n(CSS1, CSS2, CSS3)',
+    'text-align-last': "This property describes how the last line of a block or a\nline right before a forced line break is aligned when 'text-\nalign' is set to 'justify'. Values have the same meaning as\nfor 'text-align'.\n(CSS3)",
+    'text-decoration': 'Specifies decorations that are added to\nthe text of an element\n(CSS1, CSS2, CSS3)',
+    'text-emphasis': "East Asian documents use small symbols on top of each glyph\nto emphasize a run of text. For example:Accent emphasis\n(shown in blue for clarity) applied to Japanese textThis\nproperty applies emphasis formatting applied to text. Unlike\n'text-decoration', emphasis marks can affect the line\nheight. Values have the following meanings:\n\n  'none': No emphasis marks.\n  'after': Draw marks below the text in horizontal\n        layout, to the left in vertical layout.\n  'accent': Draw calligraphic accent strokes as\n        marks.\n  'disc': Draw filled circles as marks.\n  'circle': Draw hollow circles as marks.\n  'dot': Draw calligraphic dots as marks.\n  'before': Draw marks above the text in\n        horizontal layout, to the right in vertical\n        layout. This is the default position.\n(CSS3)",
+    'text-height': "The 'text-height' property determine the block-progression\ndimension of the text content area of an inline box.\nPossible values:\n\n  'max-size': The block-progression dimension is\n        based on the maximum extents toward the before-\n        edge and after-edge of the box obtained by\n        considering all children elements located on the\n        same line, ruby annotations (elements with\n        'display:ruby-text') and baseline shifted\n        elements.\n  'auto': The block-progression dimension is based\n        either on the em square determined by the element\n        font-size property value or the cell-height\n        (ascender + descender) related to the element\n        font-size as chosen by the user agent.\n  'font-size': The block-progression dimension is\n        based on the em square as determined by the\n        element font-size.\n  'text-size': The block-progression dimension is\n        based on the cell-height (ascender + descender)\n        related to the element font-size.\n(CSS3)",
+    'text-indent': 'Specifies the indentation of the first\nline of text in a block\n(CSS1, CSS2, CSS3)',
+    'text-justify': "This property selects the justification method used when\n'text-align' is set to 'justify'. It takes the following\nvalues:\n\n  'inter-ideograph': Justification primarily\n        changes spacing at word separators and at inter-\n        graphemic boundaries in scripts that use no word\n        spaces\n  'inter-word': Justification primarily changes\n        spacing at word separators\n  'auto': The UA determines the justification\n        algorithm to follow, based on a balance between\n        performance and adequate presentation quality.\n  'distribute': Justification primarily changes\n        spacing both at word separators and at grapheme\n        cluster boundaries in all scripts except those in\n        the connected and cursive groups.\n  'inter-cluster': Justification primarily changes\n        spacing at word separators and at grapheme cluster\n        boundaries in cluster scripts.\n  'kashida': Justification primarily stretches\n        Arabic and related scripts through the use of\n        kashida or other calligraphic elongation.\n  'tibetan': Justification primarily stretches\n        spaces after shad if the line contains any and/or\n        pads the end of the line with tsek marks if the\n        line already ends in one.\n(CSS3)",
+    'text-outline': "This property specifies a text outline where the first\nlength represents the outline's thickness and the second\nrepresents an optional blur radius. The outline never\noverlays the text itself. Its effect is the same as that\nobtained by applying text shadows in every radial direction,\ni.e. all text shadows whose offsets satisfy the equation x 2\n+ y 2 = thickness 2. The Timed-Text WG had suggestions for\nsome keywords (text-outline: normal|heavy|light;) as well as\na <length> thickness. Should these be added? How would they\nbe defined? (Maybe use (thin|medium|thick) as in border-\nwidth ?)The blur radius is a length value that indicates the\nboundaries of the blur effect. The exact algorithm for\ncomputing the blur effect is not specified, but it is only\napplied to the outer edge of the outline. If the blur radius\nis not specified, it is equal to zero. Is a second blur\nradius needed for the inner edge? Or should the blur apply\nto both edges? Implementations may choose to ignore the blur\nradius when text outline is combined with a text shadow. A\ncolor value must be specified before or after the length\nvalues of the outline effect. The color value will be used\nas the color of the outline.\n(CSS3)",
+    'text-shadow': 'A comma-separated list of shadow effects to be applied to the text of the element\n(CSS2, CSS3)',
+    'text-transform': "Specifies capitalization effects of an\nelement's text\n(CSS1, CSS2, CSS3)",
+    'text-wrap': "This property specifies the mode for text wrapping. Possible\nvalues:\n\n  'suppress': Line breaking is suppressed within\n        the element: the UA may only break within the\n        element if there are no other valid break points\n        in the line. If the text breaks, line-breaking\n        restrictions are honored as for 'normal'.\n  'none': Lines may not break; text that does not\n        fit within the block box overflows it.\n  'unrestricted': Lines may break between any two\n        grapheme clusters. Line-breaking restrictions have\n        no effect and hyphenation does not take place.\n        Character shaping is performed on each side of the\n        break as if the break had not occurred.\n  'normal': Lines may break at allowed break\n        points, as determined by the line-breaking rules\n        in effect. Line breaking behavior defined for the\n        WJ, ZW, and GL line-breaking classes in [ UAX14 ]\n        must be honored.\n(CSS3)",
+    'top': "This property specifies how far a box's top content edge is offset below the top edge of the box's containing block\n(CSS2, CSS3)",
+    'transition-duration': "This property specifies how long the transition from the old\nvalue to the new value should take. By default the value is\n'0', meaning that the transition is immediate (i.e. there\nwill be no animation). A negative value for transition-\nduration is treated as '0'.\n(CSS3)",
+    'transition-property': 'A value of \'none\' means that no property will transition. A\nvalue of \'all\' means that every property that is able to\nundergo a transition will do so. Otherwise, a list of\nproperties to be transitioned is given. We need to generate\na list of properties that can be transitioned. Is "none"\neven a useful value if the initial value is "all"? The\nsyntax is more elegant if transition-duration defaults to 0\nand this property defaults to "all", but another option is\nto default this property to "none" and duration to something\nreasonable, e.g., 250ms. This would force an author to\nspecify transition-property in the shorthand all the time\nthough. If one of the identifiers listed is not a recognized\nproperty name or is not an animatable property, the\nimplementation must still start transitions on the\nanimatable properties in the list using the duration, delay,\nand timing function at their respective indices in the lists\nfor \'transition-duration\', \'transition-delay\', and\n\'transition-timing-function\'. In other words, unrecognized\nor non-animatable properties must be kept in the list to\npreserve the matching of indices. Are \'all\', \'none\',\n\'inherit\', and \'initial\' allowed as items in a list of\nidentifiers (of length greater than one)?If one of the\nidentifiers listed is a shorthand property, implementations\nmust start transitions for any of its longhand sub-\nproperties that are animatable, using the duration, delay,\nand timing function at the index corresponding to the\nshorthand. If a property is specified multiple times in the\nvalue of \'transition-property\' (either on its own or via a\nshorthand that contains it), then the transition that starts\nuses the duration, delay, and timing function at the index\ncorresponding to the last occurrence of the property.\n(CSS3)',
+    'transition-timing-function': "The timing functions have the following definitions. =======\n============================================================\n==================================== 2.4. The 'transition-\ndelay' Property\n\n  'ease': The ease function is equivalent to\n        cubic-bezier(0.25, 0.1, 0.25, 1.0).\n  'linear': The linear function is equivalent to\n        cubic-bezier(0.0, 0.0, 1.0, 1.0).\n  'ease-in-out': The ease-in-out function is\n        equivalent to cubic-bezier(0.42, 0, 0.58, 1.0)\n  'ease-out': The ease-out function is equivalent\n        to cubic-bezier(0, 0, 0.58, 1.0).\n  'ease-in': The ease-in function is equivalent to\n        cubic-bezier(0.42, 0, 1.0, 1.0).\n  'cubic-bezier': Specifies a cubic-bezier curve.\n        The four values specify points P 1 and P 2 of the\n        curve as (x1, y1, x2, y2). All values must be in\n        the range [0, 1] or the definition is invalid.\n(CSS3)",
+    'unicode-bidi': 'Specifies the level of embedding with respect to the bidirectional algorithm\n(CSS2, CSS3)',
+    'uri': 'An internet reference string.\n(CSS1, CSS2, CSS3)',
+    'vertical-align': 'Affects the vertical positioning inside\na line box of the boxes generated by an\ninline-level element\n(CSS1, CSS2, CSS3)',
+    'visibility': "Specifies whether the boxes generated by an element are rendered. Invisible boxes still affect layout (set the 'display' property to 'none' to suppress box generation altogether)\n(CSS2, CSS3)",
+    'voice-balance': "The 'voice-balance' property refers to the balance between\nleft and right channels, and presumes a two channel (stereo)\nmodel that is widely supported on consumer audio equipment.\nValues have the following meanings:\n\n  '<number>': An integer or floating point number\n        between '-100'and'100'. For '-100' only the left\n        channel is audible. Simarly for '100' or '+100'\n        only the right channel is audible. For '0' both\n        channels have the same level, so that the speech\n        appears to be coming from the center.\n  'center': Same as '0'.\n  'right': Same as '100'or'+100'.\n  'leftwards': Moves the sound to the left,\n        relative to the inherited voice balance. More\n        precisely, subtract 20 from the inherited value\n        and clip the resulting value to the range\n        '-100'and'100'.\n  'rightwards': Moves the sound to the right,\n        relative to the inherited voice balance. More\n        precisely, add 20 to the inherited value and clip\n        the resulting value to the range '-100'and'100'.\n  'left': Same as '-100'.\n(CSS3)",
+    'voice-duration': 'Allows authors to specify how long it should take to render\nthe selected element\'s content. This property overrides the\n\'voice-rate\' property. Values have the following meanings:\n\n  \'<time>\': Specifies a value in seconds or\n        milliseconds for the desired time to take to speak\n        the element contents, for instance, "250ms", or\n        "3s". Only positive numbers are allowed.\n(CSS3)',
+    'voice-family': 'Audio: Value is a comma-separated, prioritized list of voice family names\n(CSS2, CSS3)',
+    'voice-pitch': "Specifies the average pitch (a frequency) of the speaking\nvoice. The average pitch of a voice depends on the voice\nfamily. For example, the average pitch for a standard male\nvoice is around 120Hz, but for a female voice, it's around\n210Hz. Values have the following meanings:\n\n  'x-low': Extra low pitch level.\n  'medium': Medium pitch level.\n  'high': High pitch level.\n  '<number>': A positive integer or floating point\n        number that specifies the average pitch of the\n        speaking voice in Hertz.\n  'low': Low pitch level.\n  '<percentage>': Specifies a relative change to\n        the inherited value.\n  'x-high': Extra high pitch level.\n(CSS3)",
+    'voice-pitch-range': "Specifies variation in average pitch. The perceived pitch of\na human voice is determined by the fundamental frequency and\ntypically has a value of 120Hz for a male voice and 210Hz\nfor a female voice. Human languages are spoken with varying\ninflection and pitch; these variations convey additional\nmeaning and emphasis. Thus, a highly animated voice, i.e.,\none that is heavily inflected, displays a high pitch range.\nThis property specifies the range over which these\nvariations occur, i.e., how much the fundamental frequency\nmay deviate from the average pitch. Values have the\nfollowing meanings:\n\n  'x-low': Extra low pitch range.\n  'medium': Medium pitch range.\n  'high': High pitch range.\n  '<number>': An non-negative integer or floating\n        point number indicating pitch range in Hertz. Low\n        ranges produce a flat, monotonic voice. A high\n        range produces animated voices.\n  'low': Low pitch range.\n  '<percentage>': Specifies a relative change to\n        the inherited value.\n  'x-high': Extra high pitch range.\n(CSS3)",
+    'voice-rate': "This property controls the speaking rate. The default rate\nfor a voice depends on the language and dialect and on the\npersonality of the voice. The default rate for a voice\nshould be such that it is experienced as a normal speaking\nrate for the voice when reading aloud text. Since voices are\nprocessor-specific, the default rate will be as well.\n\n  'medium': Medium voice speed.\n  'x-slow': Extra slow voice speed.\n  'x-fast': Extra fast voice speed.\n  'fast': Fast voice speed.\n  'slow': Slow voice speed.\n  '<percentage>': Applies to the default speaking\n        rate for each voice. Thus 50% means half the\n        normal rate for this voice.\n(CSS3)",
+    'voice-stress': 'Indicates the strength of emphasis to be applied. Emphasis\nis indicated using a combination of pitch change, timing\nchanges, loudness and other acoustic differences) that\nvaries from one language to the next. Values have the\nfollowing meanings:\n\n  \'none\': Inhibits the synthesizer from\n        emphasizing words it would normally emphasize.\n  \'moderate\': Gives a moderare emphasis of a word.\n  \'reduced\': Effectively the opposite of\n        emphasizing a word. For example, when the phrase\n        "going to" is reduced it may be spoken as "gonna".\n  \'strong\': Gives a strong emphasis on a word.\n(CSS3)',
+    'voice-volume': "The 'voice-volume' refers to the amplitude of the waveform\noutput by the speech synthesiser. This may be mixed with\nother audio sources, influencing the perceived loudness of\nsynthetic speech relative to these sources. Note that voice-\nvolume does not apply to audio cues for which there is a\nseparate means to set the relative loudness. Values have the\nfollowing meanings:\n\n  '<number>': An integer or floating point number\n        in the range '0'to'100'. '0' represents silence\n        (the minimum level), and 100 corresponds to the\n        maximum level. The volume scale is linear\n        amplitude.\n  'silent': Zero volume (0).\n  '<percentage>': Percentage values are calculated\n        relative to the inherited value, and are then\n        clipped to the range '0'to'100'.\n  'x-soft': Extra soft volume.\n  'loud': High volume.\n  'medium': Medium volume.\n  'x-loud': Highest volume (100).\n  'soft': Low volume.\n(CSS3)",
+    'volume': 'Audio: Refers to the median volume of the audio\n(CSS2, CSS3)',
+    'white-space': 'Specifies how whitespace inside the\nelement is handled\n(CSS1, CSS2, CSS3)',
+    'white-space-collapse': 'This section is still under discussion and may change in\nfuture drafts. This property declares whether and how white\nspace inside the element is collapsed. Values have the\nfollowing meanings, which must be interpreted according to\nthe white space processing rules :\n\n  \'preserve\': This value prevents user agents from\n        collapsing sequences of white space. Line breaks\n        are preserved.\n  \'discard\': This value directs user agents to\n        "discard" all white space in the element.\n  \'collapse\': This value directs user agents to\n        collapse sequences of white space into a single\n        character (or in some cases, no character).\n  \'preserve-breaks\': This value collapses white\n        space as for \'collapse\', but preserves line\n        breaks.\n(CSS3)',
+    'widows': 'Specifies the minimum number of lines of a paragraph that must be left at the top of a page\n(CSS2, CSS3)',
+    'width': 'Specifies the content width of boxes\ngenerated by block-level and replaced\nelements\n(CSS1, CSS2, CSS3)',
+    'word-break': "CSS distinguishes between two levels of strictness in the\nrules for implicit line breaking in CJK text. The precise\nset of rules in effect for the strict and loose levels is up\nto the UA and should follow language conventions. However,\nthis specification does recommend that the following breaks\nbe forbidden in strict line breaking and allowed in\nloose:Breaks between Hangul syllable blocks are allowed in\nboth strict and loose rules: to restrict breaks in Korean to\nspaces, the 'keep-all' value of 'word-break' can be\nspecified. Information on line breaking conventions can be\nfound in [ JIS4051 ] for Japanese, [ ???? ] for Chinese, and\n[?] for Korean, and in [ UAX14 ] for all scripts in Unicode.\nThe CSS Working Group notes that although UAX 14 contains a\nwealth of information about line breaking conventions, a\nliteral implementation of its algorithm has been found to be\ninadequate in multiple situations. Any guidance for\nappropriate references here would be much appreciated. This\nproperty specifies what set of line breaking restrictions\nare in effect within the element. Values have the following\nmeanings:\n\n  'break-strict': Same as 'normal' for CJK\n        scripts, but non-CJK scripts can break anywhere.\n        This option is used mostly when the text is\n        predominantly CJK characters with few non-CJK\n        excerpts and it is desired that the text be more\n        evenly distributed on each line.\n  'loose': As for 'normal', but CJK scripts use a\n        less restrictive set of line-breaking\n        restrictions.\n  'keep-all': Same as 'normal' for all non-CJK\n        scripts. However, sequences of CJK characters can\n        no longer break on implied break points. This\n        option should only be used where the presence of\n        white space characters still creates line-breaking\n        opportunities, as in Korean.\n  'break-all': As for 'break-strict', except CJK\n        scripts break according to the rules for 'loose'.\n  'normal': Breaks non-CJK scripts according to\n        their own rules while using a strict set of line\n        breaking restrictions for CJK scripts (Hangul,\n        Japanese Kana, and CJK ideographs).\n(CSS3)",
+    'word-spacing': 'Specifies spacing behavior between words\n(CSS1, CSS2, CSS3)',
+    'word-wrap': 'This property specifies whether the UA may break within a\nword to prevent overflow when an otherwise-unbreakable\nstring is too long to fit within the line box. It only has\nan effect when \'text-wrap\' is either \'normal\'or\'suppress\'.\nPossible values:\n\n  \'break-word\': An unbreakable "word" may be\n        broken at an arbitrary point if there are no\n        otherwise-acceptable break points in the line.\n        Shaping characters are still shaped as if the word\n        were not broken, and grapheme clusters must\n        together stay as one unit.\n  \'normal\': Lines may break only at allowed break\n        points.\n(CSS3)',
+    'z-index': 'For a positioned box, specifies the stack level of the box in the current stacking context and also whether the box establishes a local stacking context.\n(CSS2, CSS3)',
+}
+
+# The CSS pseudo-class names, in completion order.
+CSS_PSEUDO_CLASS_NAMES = (
+    'active',
+    'after',
+    'before',
+    'checked',
+    'disabled',
+    'empty',
+    'enabled',
+    'first-child',
+    'first-letter',
+    'first-line',
+    'first-of-type',
+    'focus',
+    'hover',
+    'lang(',
+    'last-child',
+    'last-of-type',
+    'link',
+    'not(',
+    'nth-child(',
+    'nth-last-child(',
+    'nth-last-of-type(',
+    'nth-of-type(',
+    'only-child',
+    'only-of-type',
+    'root',
+    'target',
+    'visited',
+)
+
+### END: Auto generated
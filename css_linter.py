@@ -40,6 +40,7 @@
 
 import copy, os, sys, traceback, re, time
 import logging
+from hashlib import md5
 import SilverCity
 from SilverCity import CSS, ScintillaConstants
 from codeintel2.shared_lexer import EOF_STYLE, Lexer
@@ -214,10 +215,11 @@ class _CSSLexer(Lexer):
             dest_q.append(tok)
             
     def next_token_is_whitespace(self, tok):
-        if not self.q:
+        raw_tok = self.peek_raw_token()
+        if raw_tok is None:
             return False
-        return self.q[0]['style'] in (EOF_STYLE, self.classifier.style_comment,
-                                   self.classifier.style_default)
+        return raw_tok['style'] in (EOF_STYLE, self.classifier.style_comment,
+                                    self.classifier.style_default)
 
     def get_next_token(self):
         res = Lexer.get_next_token(self)
@@ -300,7 +302,13 @@ class _CSSParser(object):
                     message += ", got '%s'" % (text)
             self._results.append(Result(message, line_start, col_start, line_end, col_end, status))
     
-    def parse(self, text):
+    def parse(self, text, region=None, less_mixins=None):
+        """Parse the given text and return a list of Results.
+
+        "region" and "less_mixins" (optional) are the parse state at the
+        end of the text preceding this one, when parsing a stylesheet
+        one part at a time (see CSSLinter.lint_incrementally()).
+        """
         self.token_q = []
         self._results = []
         global _classifier
@@ -309,7 +317,13 @@ class _CSSParser(object):
         self._classifier = _classifier
         self._tokenizer = _CSSLexer(text, self.language)
         if self.language == "Less":
-            self._less_mixins = {} # => name => parameter list
+            self._less_mixins = dict(less_mixins or {}) # => name => parameter list
+        if region is None:
+            region = self._PARSE_REGION_AT_START
+        self._initial_region = region
+        # Set to false if the parse reaches the end of the text in the
+        # middle of something (e.g. while recovering from an error).
+        self._ended_cleanly = True
         self._parse()
         return self._results
 
@@ -1511,7 +1525,7 @@ class _CSSParser(object):
                 return self._parser_putback_recover(tok)
 
     def _parse_top_level(self):
-        self._region = self._PARSE_REGION_AT_START
+        self._region = self._initial_region
         do_declarations_this_time = False # for recovery
         while True:
             if not do_declarations_this_time:
@@ -1535,10 +1549,12 @@ class _CSSParser(object):
                     self._region = self._PARSE_REGION_SAW_OTHER
                     self._parse_ruleset()
             except SyntaxErrorEOF:
+                self._ended_cleanly = False
                 break
             except SyntaxError:
                 tok = self._recover(allowEOF=True, opTokens=("{", "}", "@"))
                 if tok.style == EOF_STYLE:
+                    self._ended_cleanly = False
                     return
                 if self._classifier.is_operator(tok, "{"):
                     self._tokenizer.put_back(tok)
@@ -1568,8 +1584,124 @@ class _CSSParser(object):
         elif getattr(tok, tag) == self._check_tag_tok_count:
             raise Exception("Stuck in a loop with tok %s, tag %d" % (tok.dump_ret(), loop_id))
 
+# The comments, strings and unquoted URLs of a stylesheet (which may
+# contain braces), and the braces, see _gen_part_spans().
+_css_part_re = re.compile(r"""/\*.*?(?:\*/|\Z)|url\([^)'"]*\)"""
+                          r"""|"(?:[^"\\\n]|\\.)*"?|'(?:[^'\\\n]|\\.)*'?|[{}]""",
+                          re.S)
+_less_part_re = re.compile(r"//[^\n]*|" + _css_part_re.pattern, re.S)
+
+def _gen_part_spans(text, language):
+    """Generate the (start, end) offsets of the parts of the given
+    stylesheet that can be parsed one at a time: each part but the last
+    ends with a top-level block (a ruleset, @media block, etc.).
+    """
+    if language in ("Less", "SCSS"):
+        part_re = _less_part_re
+    else:
+        part_re = _css_part_re
+    start = 0
+    depth = 0
+    for match in part_re.finditer(text):
+        tval = match.group()
+        if tval == "{":
+            depth += 1
+        elif tval == "}" and depth > 0:
+            depth -= 1
+            if depth == 0:
+                yield start, match.end()
+                start = match.end()
+    yield start, len(text)
+
+class _LintedPart(object):
+    """The results of linting a part of a stylesheet, and the parse
+    state at the end of it.
+    """
+    def __init__(self, results, region, less_mixins, ended_cleanly):
+        self.results = results  # lines relative to the part
+        self.region = region
+        self.less_mixins = less_mixins
+        self.ended_cleanly = ended_cleanly
+
 class CSSLinter(object):
+    def __init__(self):
+        # The parts linted by the last lint_incrementally() call:
+        #   {(<language>, <region>, <Less mixin names>, <digest>): <_LintedPart>}
+        self._linted_parts = {}
+
     def lint(self, text, language="CSS"):
         self._parser = _CSSParser(language)
         results = self._parser.parse(text)
         return results
+
+    def lint_incrementally(self, text, language="CSS"):
+        """Lint the given stylesheet like lint(), reusing the results of
+        the previous call for the parts of it that haven't changed.
+
+        Use one CSSLinter per document for this. The stylesheet is split
+        after each top-level block and each part is parsed on its own,
+        from the parse state at the end of the previous part. The results
+        of a part are cached by its content and that state, so an edit
+        only re-parses the block it touches; the cached results for the
+        parts after it are moved to their new lines.
+        """
+        spans = list(_gen_part_spans(text, language))
+        linted_parts = {}
+        results = []
+        region = None
+        less_mixins = {}
+        line = 0        # the (0-based) line of the start of the part
+        line_pos = 0    # the offset of the start of that line
+        pos = 0
+        i = 0
+        while i < len(spans):
+            start, end = spans[i]
+            line += text.count("\n", pos, start)
+            line_pos = text.rfind("\n", pos, start) + 1 or line_pos
+            pos = start
+            while True:
+                part = self._lint_part(text[start:end], start - line_pos,
+                                       language, region, less_mixins,
+                                       linted_parts)
+                if part.ended_cleanly or i + 1 == len(spans):
+                    break
+                # The parse went past the end of the part (e.g. to recover
+                # from an error): parse it together with the next part.
+                i += 1
+                end = spans[i][1]
+            i += 1
+            region = part.region
+            less_mixins = part.less_mixins
+            for result in part.results:
+                if result.line_start is not None:
+                    result = Result(result.message,
+                                    result.line_start + line, result.col_start,
+                                    result.line_end + line, result.col_end,
+                                    result.status)
+                # As _CSSParser._add_result_tok_parts() does.
+                if not results or results[-1].line_end < result.line_start:
+                    results.append(result)
+        self._linted_parts = linted_parts
+        return results
+
+    def _lint_part(self, text, column, language, region, less_mixins,
+                   linted_parts):
+        # Indented to its column in the stylesheet, to get the columns of
+        # the results right.
+        text = " " * column + text
+        if isinstance(text, unicode):
+            digest = md5(text.encode("utf-8")).hexdigest()
+        else:
+            digest = md5(text).hexdigest()
+        key = (language, region, frozenset(less_mixins), digest)
+        part = self._linted_parts.get(key) or linted_parts.get(key)
+        if part is None:
+            parser = _CSSParser(language)
+            results = parser.parse(text, region, less_mixins)
+            ended_cleanly = (parser._ended_cleanly
+                             and None not in [r.line_start for r in results])
+            part = _LintedPart(results, parser._region,
+                               getattr(parser, "_less_mixins", {}),
+                               ended_cleanly)
+        linted_parts[key] = part
+        return part
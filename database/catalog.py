@@ -66,6 +66,8 @@ from codeintel2.util import dedent, safe_lang_from_lang, banner, hotshotit
 from codeintel2.tree import tree_from_cix_path
 from codeintel2.database.util import filter_blobnames_for_prefix
 from codeintel2.database.resource import AreaResource
+from codeintel2.metrics import metrics
+from codeintel2.tracing import traced
 
 
 
@@ -83,6 +85,9 @@ class CatalogsZone(object):
 
     TODO: Locking: .cull_mem() and .save() will be called periodically
           on indexer thread. Anything they access needs to be guarded.
+
+    A "read_only" zone (the system tier, see database.py) never writes
+    to its area: use `.is_current()` to determine if it can be used.
     """
     _res_index = None
     _blob_index = None
@@ -91,7 +96,8 @@ class CatalogsZone(object):
     
     _have_updated_at_least_once = False
 
-    def __init__(self, mgr, catalog_dirs=None):
+    def __init__(self, mgr, catalog_dirs=None, base_dir=None,
+                 read_only=False):
         self.mgr = mgr
         self.db = mgr.db
 
@@ -103,7 +109,10 @@ class CatalogsZone(object):
             catalog_dirs.append(std_catalog_dir)
         self.catalog_dirs = catalog_dirs
 
-        self.base_dir = join(self.db.base_dir, "db", "catalogs")
+        if base_dir is None:
+            base_dir = join(self.db.base_dir, "db", "catalogs")
+        self.base_dir = base_dir
+        self.read_only = read_only
 
         self._lib_cache = {} # (lang, selection_res_ids) -> CatalogLib
 
@@ -112,6 +121,8 @@ class CatalogsZone(object):
         self._dbsubpaths_and_lpaths_to_save = []
 
     def __repr__(self):
+        if self.read_only:
+            return "<catalog zone (read-only)>"
         return "<catalog zone>"
 
     def _selection_from_selector(self, selections):
@@ -223,6 +234,8 @@ class CatalogsZone(object):
         return self._toplevelprefix_index
 
     def save(self):
+        if self.read_only:
+            return
         self._lock.acquire()
         try:
             for dbsubpath, lpaths in self._dbsubpaths_and_lpaths_to_save:
@@ -341,6 +354,66 @@ class CatalogsZone(object):
                    "selected": selected,
                    "selection": selection}
 
+    def is_current(self, selections=None):
+        """Return True iff no catalog updates are necessary for the given
+        selections (of the same form as to `.get_lib()').
+        """
+        self._lock.acquire()
+        try:
+            return not self._todos_from_selections(selections)
+        finally:
+            self._lock.release()
+
+    def _todos_from_selections(self, selections=None):
+        """Return a list of (<action>, <res>, <name>) catalog updates
+        necessary for the given selections.
+        """
+        res_name_from_res_path = dict(  # this is our checklist
+            (p, v[2]) for p,v in self.res_index.items())
+        todos = []
+        log.info("checking %s: %d catalog dir(s)", self,
+                 len(self.catalog_dirs))
+        for catalog_info in self.avail_catalogs(selections):
+            cix_path = catalog_info["cix_path"]
+            res = AreaResource(cix_path)
+            # check that the update-time is the mtime (i.e. up-to-date)
+            try:
+                res_id, last_updated, name, res_data \
+                    = self.res_index[res.area_path]
+            except KeyError:
+                # add this new CIX file
+                todos.append(("add", res, catalog_info["name"]))
+            else:
+                mtime = os.stat(cix_path).st_mtime
+                if last_updated != mtime: # epsilon? '>=' instead of '!='?
+                    # update with newer version
+                    todos.append(("update", res, catalog_info["name"]))
+                #else:
+                #    log.debug("not updating '%s' catalog: mtime is unchanged",
+                #              catalog_info["name"])
+                del res_name_from_res_path[res.area_path] # tick it off
+
+        for res_area_path, res_name in res_name_from_res_path.items():
+            # remove this obsolete CIX file
+            try:
+                todos.append( ("remove", AreaResource(res_area_path), res_name) )
+            except ValueError, ex:
+                # Skip resources in unknown areas. This is primarily to
+                # allow debugging/testing (when the set of registered
+                # path_areas may not include the set when running in
+                # Komodo.)
+                pass
+
+        # Filter todos on selections, if any.
+        if selections is not None:
+            selection_from_selector = self._selection_from_selector(selections)
+            before = todos[:]
+            todos = [todo for todo in todos
+                if todo[2].lower() in selection_from_selector
+                or normpath(normcase(todo[1].path)) in selection_from_selector
+            ]
+        return todos
+
     def update(self, selections=None, progress_cb=None):
         """Update the catalog as necessary.
         
@@ -354,6 +427,13 @@ class CatalogsZone(object):
                 and <value> is an integer between 0 and 100 indicating the
                 level of completeness.
         """
+        if self._have_updated_at_least_once:
+            self._update(selections, progress_cb)
+        else:
+            with self.mgr.startup_tracer.phase("first %r update" % self):
+                self._update(selections, progress_cb)
+
+    def _update(self, selections=None, progress_cb=None):
         self._lock.acquire()
         try:
             self._have_updated_at_least_once = True
@@ -362,54 +442,15 @@ class CatalogsZone(object):
             if progress_cb:
                 try:    progress_cb("Determining necessary catalog updates...", 5)
                 except: log.exception("error in progress_cb (ignoring)")
-            res_name_from_res_path = dict(  # this is our checklist
-                (p, v[2]) for p,v in self.res_index.items())
-            todos = []
-            log.info("updating %s: %d catalog dir(s)", self,
-                     len(self.catalog_dirs))
-            for catalog_info in self.avail_catalogs(selections):
-                cix_path = catalog_info["cix_path"]
-                res = AreaResource(cix_path)
-                # check that the update-time is the mtime (i.e. up-to-date)
-                try:
-                    res_id, last_updated, name, res_data \
-                        = self.res_index[res.area_path]
-                except KeyError:
-                    # add this new CIX file
-                    todos.append(("add", res, catalog_info["name"]))
-                else:
-                    mtime = os.stat(cix_path).st_mtime
-                    if last_updated != mtime: # epsilon? '>=' instead of '!='?
-                        # update with newer version
-                        todos.append(("update", res, catalog_info["name"]))
-                    #else:
-                    #    log.debug("not updating '%s' catalog: mtime is unchanged",
-                    #              catalog_info["name"])
-                    del res_name_from_res_path[res.area_path] # tick it off
-    
-            for res_area_path, res_name in res_name_from_res_path.items():
-                # remove this obsolete CIX file
-                try:
-                    todos.append( ("remove", AreaResource(res_area_path), res_name) )
-                except ValueError, ex:
-                    # Skip resources in unknown areas. This is primarily to
-                    # allow debugging/testing (when the set of registered
-                    # path_areas may not include the set when running in
-                    # Komodo.)
-                    pass
-    
-            # Filter todos on selections, if any.
-            if selections is not None:
-                selection_from_selector = self._selection_from_selector(selections)
-                before = todos[:]
-                todos = [todo for todo in todos
-                    if todo[2].lower() in selection_from_selector
-                    or normpath(normcase(todo[1].path)) in selection_from_selector
-                ]
+            todos = self._todos_from_selections(selections)
     
             # ... and then do them.
             if not todos:
                 return
+            if self.read_only:
+                log.warn("%s: %d catalog update(s) necessary but cannot "
+                         "update a read-only zone (skipping)", self, len(todos))
+                return
             for i, (action, res, name) in enumerate(todos):
                 log.debug("%s `%s' catalog (%s)", action, name, res)
                 try:
@@ -610,7 +651,12 @@ class CatalogsZone(object):
                 log.debug("fs-write: mkdir '%s'", dbdir)
                 os.makedirs(dbdir)
             log.debug("fs-write: catalog %s blob '%s'", lang, dbfile)
-            ET.ElementTree(blob).write(join(dbdir, dbfile+".blob"))
+            fout = open(join(dbdir, dbfile+".blob"), 'wb')
+            try:
+                ET.ElementTree(blob).write(fout)
+                metrics.fs_write(fout.tell())
+            finally:
+                fout.close()
 
         # Update 'res_index'.
         last_updated = os.stat(cix_path).st_mtime
@@ -637,6 +683,7 @@ class CatalogsZone(object):
             = self._blob_and_atime_from_blobname_from_lang_cache.setdefault(lang, {})
         if blobname in blob_and_atime_from_blobname:
             log.debug("cache-read: load %s blob `%s'", lang, blobname)
+            metrics.cache_lookup("catalog blob", True)
             blob, atime = blob_and_atime_from_blobname[blobname]
             blob_and_atime_from_blobname[blobname] = (blob, now)
             return blob
@@ -644,6 +691,7 @@ class CatalogsZone(object):
         # Need to load and cache it.
         if look_in_cache_only:
             return None
+        metrics.cache_lookup("catalog blob", False)
         dbsubpath = join(self.base_dir, safe_lang_from_lang(lang), dbfile)
         blob = self.db.load_blob(dbsubpath)
         blob_and_atime_from_blobname[blobname] = (blob, now)
@@ -674,6 +722,8 @@ class CatalogsZone(object):
 
         # Update cache and queue this up to be saved to disk (by .save()).
         blob.cache["lpaths"] = lpaths
+        if self.read_only:
+            return lpaths
         dbfile, res_id = self.blob_index[lang][blobname]
         self._lock.acquire()
         try:
@@ -737,6 +787,7 @@ class CatalogLib(object):
             return True
         return res_id in self.selection_res_id_set
 
+    @traced("db: get_blob", "self", "blobname")
     def get_blob(self, blobname):
         if not self.has_blob(blobname): # knows how to filter on selections
             return None
@@ -800,6 +851,7 @@ class CatalogLib(object):
                         for blobname in blobnames:
                             yield blobname
 
+    @traced("db: hits_from_lpath", "self", "lpath")
     def hits_from_lpath(self, lpath, ctlr=None, curr_buf=None):
         assert isinstance(lpath, tuple)  # common mistake to pass in a string
         
@@ -51,6 +51,7 @@ There are two common modes of interaction:
     Database.get_buf_data(buf)
     Database.get_buf_scan_time(buf)
     Database.update_buf_data(buf, ...)
+    Database.update_bufs_data([(buf, ...), ...])    # batch of buffers
     Database.remove_buf_data(buf)
 
 2. Working with a blob (a.k.a. module) given a list of libs.
@@ -125,6 +126,9 @@ common-implementation lines. E.g. dir under "db" is a zone.
 <base-dir>/                 # E.g. ~/.komodo/6.0/codeintel
     README.txt
     VERSION
+    probes.pickle           # interpreter info probe output, see probecache.py
+    dirlistings.pickle      # listings of import dirs, see dircache.py
+    indexer-journal.pickle  # pending indexer requests, see indexer.py
     db/
         # Any dir at this level is an independent database for a
         # single DB "zone".
@@ -194,6 +198,29 @@ common-implementation lines. E.g. dir under "db" is a zone.
                       from '.cix' files in the project tree.
 
 
+# System-wide (shared) tier
+
+The "stdlibs" and "catalogs" zones only depend on the CIX files shipped
+with codeintel (and the configured catalog dirs), so they are identical
+for every user of a given installation. A Database can be given a
+read-only "system_base_dir" (e.g. /usr/share/codeintel/db) laid out
+exactly like <base-dir> above:
+
+<system-base-dir>/
+    VERSION
+    db/
+        catalogs/
+        stdlibs/
+
+When the system tier's VERSION matches Database.VERSION,
+`get_stdlib()` and `get_catalog_lib()` are served from it and only the
+lang/multilang/project zones are written to the per-user <base-dir>. Any
+stdlib or catalog that is missing or out of date in the system tier
+falls back to the user tier (which is populated on demand as usual).
+A system tier is built by pointing a Database at it as its normal
+"base_dir" and calling `Database.populate_shared_zones()`.
+
+
 # Actions
 
 Optimizing the following actions on the database determines the db
@@ -216,6 +243,8 @@ There are some logging rules for this module to support the test suite.
   with "fs-write: ".
 - All reads from the filesystem should have a log message that begins
   with "fs-read: ". (TODO)
+- The reads and writes of blob and index files, and their size, are
+  also counted in the process-wide metrics (see metrics.py).
 
 Note: Currently only doing this for LangZone stuff. This will be easier
 if/when add fs interaction is moved to one place (on the Database
@@ -245,7 +274,7 @@ class).
 import sys
 import os
 from os.path import (join, dirname, exists, expanduser, splitext, basename,
-                     split, abspath, isabs, isdir, isfile)
+                     split, abspath, isabs, isdir, isfile, normpath)
 import cPickle as pickle
 from cPickle import UnpicklingError
 import threading
@@ -268,6 +297,11 @@ from codeintel2.buffer import Buffer
 from codeintel2.util import dedent, safe_lang_from_lang, banner
 from codeintel2.tree import tree_from_cix_path
 from codeintel2.database.util import rmdir
+from codeintel2.bincache import BinaryScanCache
+from codeintel2.probecache import InterpreterProbeCache
+from codeintel2.dircache import DirListingCache
+from codeintel2.metrics import metrics
+from codeintel2.tracing import traced
 from codeintel2.database.stdlib import StdLibsZone
 from codeintel2.database.catalog import CatalogsZone
 from codeintel2.database.langlib import LangZone
@@ -363,11 +397,16 @@ class Database(object):
 
     def __init__(self, mgr, base_dir=None, catalog_dirs=None,
                  event_reporter=None,
-                 import_everything_langs=None):
+                 import_everything_langs=None,
+                 system_base_dir=None):
         """
             "base_dir" (optional) specifies the base directory for
                 the codeintel database. If not given it will default to
                 '~/.codeintel'.
+            "system_base_dir" (optional) specifies the base directory of
+                a shared, read-only database tier from which the stdlibs
+                and catalogs zones are served when it is up to date. See
+                "System-wide (shared) tier" in the module docstring.
             "catalog_dirs" (optional) is a list of catalog dirs in
                 addition to the std one to use for the CatalogsZone. All
                 *.cix files in a catalog dir are made available.
@@ -388,6 +427,9 @@ class Database(object):
 
         self._catalogs_zone = None
         self._stdlibs_zone = None
+        self._system_catalogs_zone = None
+        self._system_stdlibs_zone = None
+        self._is_system_catalogs_zone_current_from_selections = {}
         self._lang_zone_from_lang = {}
         self._proj_zone_from_proj_path = weakref.WeakValueDictionary()
 
@@ -397,6 +439,23 @@ class Database(object):
             self.base_dir = abspath(base_dir)
         else:
             self.base_dir = base_dir
+
+        if system_base_dir is None:
+            self.system_base_dir = None
+        else:
+            self.system_base_dir = abspath(system_base_dir)
+        self._is_system_tier_usable = None # determined lazily
+
+        # CIX of scanned binary modules. This is kept out of the db dir
+        # to survive a reset of the database.
+        self.binary_scan_cache = BinaryScanCache(
+            normpath(self.base_dir) + "-bincache", self.VERSION)
+        # Output of the interpreter info probes of the LangIntels.
+        self.interpreter_probe_cache = InterpreterProbeCache(
+            join(self.base_dir, "probes.pickle"))
+        # Dir listings for the import dir and importables lookups.
+        self.dir_listing_cache = DirListingCache(
+            join(self.base_dir, "dirlistings.pickle"))
         
         self.catalog_dirs = catalog_dirs
         self.event_reporter = event_reporter
@@ -414,12 +473,8 @@ class Database(object):
     def release_lock(self):
         self._lock.release()
 
-    @property
-    def version(self):
-        """Return the version of the db on disk (or None if cannot
-        determine).
-        """
-        path = join(self.base_dir, "VERSION")
+    def _version_from_base_dir(self, base_dir):
+        path = join(base_dir, "VERSION")
         try:
             fin = open(path, 'r')
         except EnvironmentError, ex:
@@ -429,6 +484,48 @@ class Database(object):
         finally:
             fin.close()
 
+    @property
+    def version(self):
+        """Return the version of the db on disk (or None if cannot
+        determine).
+        """
+        return self._version_from_base_dir(self.base_dir)
+
+    @property
+    def system_version(self):
+        """Return the version of the system db tier on disk (or None if
+        there is no system tier or it cannot be determined).
+        """
+        if self.system_base_dir is None:
+            return None
+        return self._version_from_base_dir(self.system_base_dir)
+
+    def is_system_tier_usable(self):
+        """Return True iff the read-only system tier is configured and
+        its version matches this Database code.
+        """
+        if self._is_system_tier_usable is None:
+            self._check_system_tier()
+        return self._is_system_tier_usable
+
+    def _check_system_tier(self):
+        if self.system_base_dir is None:
+            self._is_system_tier_usable = False
+            return
+        system_ver = self.system_version
+        if system_ver is None:
+            log.info("system db tier `%s' does not exist (not using it)",
+                     self.system_base_dir)
+            self._is_system_tier_usable = False
+        elif system_ver != self.VERSION:
+            # The system tier is read-only: we cannot upgrade it. Fall
+            # back to the user tier for stdlibs and catalogs.
+            log.info("system db tier `%s' is v%s, need v%s (not using it)",
+                     self.system_base_dir, system_ver, self.VERSION)
+            self._is_system_tier_usable = False
+        else:
+            self._is_system_tier_usable = True
+
     def upgrade_info(self):
         """Returns information indicating if a db upgrade is necessary
         and possible.
@@ -437,7 +534,12 @@ class Database(object):
             (UPGRADE_NOT_NECESSARY, None)
             (UPGRADE_NOT_POSSIBLE, "<reason>")
             (UPGRADE_NECESSARY, None)
+
+        This is the status of the (writable) user tier. The system tier,
+        if any, is checked separately: if its version does not match it
+        is not used and its zones fall back to the user tier.
         """
+        self._check_system_tier()
         if self.version == self.VERSION:
             return (Database.UPGRADE_NOT_NECESSARY, None)
         # Presuming that we *have* an upgrade path from the current
@@ -514,10 +616,12 @@ class Database(object):
                                         % curr_ver)
                 log.info("upgrading from db v%s to db v%s ...",
                          curr_ver, result_ver)
-                if upgrader_arg is not None:
-                    upgrader(self, curr_ver, result_ver, upgrader_arg)
-                else:
-                    upgrader(self, curr_ver, result_ver)
+                with self.mgr.startup_tracer.phase("db upgrade v%s -> v%s (%s)"
+                        % (curr_ver, result_ver, upgrader.__name__)):
+                    if upgrader_arg is not None:
+                        upgrader(self, curr_ver, result_ver, upgrader_arg)
+                    else:
+                        upgrader(self, curr_ver, result_ver)
                 curr_ver = result_ver
         finally:
             self.release_lock()
@@ -629,6 +733,7 @@ class Database(object):
             self._catalogs_zone.save()
         for lang_zone in self._lang_zone_from_lang.values():
             lang_zone.save()
+        self.dir_listing_cache.save()
 
     def cull_mem(self):
         """Cull memory usage as necessary"""
@@ -874,6 +979,38 @@ class Database(object):
             self._catalogs_zone = CatalogsZone(self.mgr, self.catalog_dirs)
         return self._catalogs_zone
 
+    def get_system_catalogs_zone(self):
+        """Return the read-only catalogs zone of the system tier, or None
+        if there is no usable system tier.
+        """
+        if not self.is_system_tier_usable():
+            return None
+        if self._system_catalogs_zone is None:
+            self._system_catalogs_zone = CatalogsZone(self.mgr,
+                self.catalog_dirs,
+                base_dir=join(self.system_base_dir, "db", "catalogs"),
+                read_only=True)
+        return self._system_catalogs_zone
+
+    def _catalogs_zone_from_selections(self, selections):
+        """Return the system catalogs zone if it is current for the given
+        selections, else the user catalogs zone.
+        """
+        system_zone = self.get_system_catalogs_zone()
+        if system_zone is not None:
+            key = selections is not None and tuple(selections) or None
+            is_current = self._is_system_catalogs_zone_current_from_selections.get(key)
+            if is_current is None:
+                is_current = system_zone.is_current(selections)
+                if not is_current:
+                    log.info("system catalogs zone is not current for "
+                             "selections %r: using user tier", selections)
+                self._is_system_catalogs_zone_current_from_selections[key] \
+                    = is_current
+            if is_current:
+                return system_zone
+        return self.get_catalogs_zone()
+
     def get_catalog_lib(self, lang, selections=None):
         """Get a lang-specific handler for the catalog of loaded CIX files.
         
@@ -885,21 +1022,61 @@ class Database(object):
                 catalogs are used. A catalog "name" is the
                 (case-normalized) basename of the .cix file.
         """
-        return self.get_catalogs_zone().get_lib(lang, selections)
+        return self._catalogs_zone_from_selections(selections)\
+                   .get_lib(lang, selections)
 
     def get_stdlibs_zone(self):
         if self._stdlibs_zone is None:
             self._stdlibs_zone = StdLibsZone(self)
         return self._stdlibs_zone
 
+    def get_system_stdlibs_zone(self):
+        """Return the read-only stdlibs zone of the system tier, or None
+        if there is no usable system tier.
+        """
+        if not self.is_system_tier_usable():
+            return None
+        if self._system_stdlibs_zone is None:
+            self._system_stdlibs_zone = StdLibsZone(self,
+                base_dir=join(self.system_base_dir, "db", "stdlibs"),
+                read_only=True)
+        return self._system_stdlibs_zone
+
     def get_stdlib(self, lang, ver=None):
         """Get a stdlib zone for the given language and version.
 
         On first get of a stdlib for a particular language, all
         available stdlibs for that lang are updated, if necessary.
+        If the system tier has an up-to-date copy of the stdlib, that is
+        used instead (and nothing is written to the user tier).
         """
+        system_zone = self.get_system_stdlibs_zone()
+        if system_zone is not None:
+            stdlib = system_zone.get_lib(lang, ver)
+            if stdlib is not None:
+                return stdlib
         return self.get_stdlibs_zone().get_lib(lang, ver)
 
+    def populate_shared_zones(self, langs=None, progress_cb=None):
+        """Fully import the stdlibs and catalogs zones of this database.
+
+            "langs" (optional) is a list of languages for which to import
+                stdlibs. By default all registered Citadel languages are
+                done.
+            "progress_cb" (optional) is a progress callback as for
+                `CatalogsZone.update()`.
+
+        This is used to build a system tier: create a Database with the
+        intended system dir as its "base_dir", call this, and then point
+        other Databases' "system_base_dir" at it.
+        """
+        if langs is None:
+            langs = self.mgr.get_citadel_langs()
+        stdlibs_zone = self.get_stdlibs_zone()
+        for lang in sorted(langs):
+            stdlibs_zone.update_lang(lang, progress_cb=progress_cb)
+        self.get_catalogs_zone().update(progress_cb=progress_cb)
+
     def _get_lang_zone(self, lang):
         if lang not in self._lang_zone_from_lang:
             if self.mgr.is_multilang(lang):
@@ -956,15 +1133,25 @@ class Database(object):
             yield self._catalogs_zone
         if self._stdlibs_zone:
             yield self._stdlibs_zone
+        if self._system_catalogs_zone:
+            yield self._system_catalogs_zone
+        if self._system_stdlibs_zone:
+            yield self._system_stdlibs_zone
         for zone in self._lang_zone_from_lang.values()[:]:
             yield zone
         for zone in self._proj_zone_from_proj_path.values()[:]:
             yield zone
 
+    @traced("db: load blob", "dbsubpath")
     def load_blob(self, dbsubpath):
         """Load the blob and all persisted blob cache keys from disk."""
         log.debug("fs-read: load blob `%s'", dbsubpath[len(self.base_dir)+1:])
-        blob = ET.parse(dbsubpath+".blob").getroot()
+        fin = open(dbsubpath+".blob", 'rb')
+        try:
+            blob = ET.parse(fin).getroot()
+            metrics.fs_read(fin.tell())
+        finally:
+            fin.close()
         blob_files = glob(dbsubpath+".*")
         for blob_cache_file in blob_files:
             ext = splitext(blob_cache_file)[1]
@@ -992,7 +1179,9 @@ class Database(object):
             log.debug("fs-read: load pickle `%s'", path[len(self.base_dir)+1:])
             fin = open(path, 'rb')
             try:
-                return pickle.load(fin)
+                obj = pickle.load(fin)
+                metrics.fs_read(fin.tell())
+                return obj
             except:
                 if default is not None:
                     return default
@@ -1016,6 +1205,7 @@ class Database(object):
         fout = open(path, 'wb')
         try:
             pickle.dump(obj, fout, 2)
+            metrics.fs_write(fout.tell())
         finally:
             fout.close()
 
@@ -1052,6 +1242,12 @@ class Database(object):
         """
         return self._get_lang_zone(buf.lang).get_buf_scan_time(buf)
 
+    def get_path_scan_time(self, path, lang):
+        """Return the mtime for the given file of the given language in
+        the database or return None.
+        """
+        return self._get_lang_zone(lang).get_path_scan_time(path)
+
     def get_buf_data(self, buf):
         """Return the tree for the given buffer in the database or
         raise NotFoundInDatabase.
@@ -1072,3 +1268,19 @@ class Database(object):
             buf, scan_tree, scan_time, scan_error,
             skip_scan_time_check=skip_scan_time_check)
 
+    def update_bufs_data(self, buf_datas, skip_scan_time_check=False):
+        """Add or update data for a number of buffers into the database.
+
+        "buf_datas" is a list of
+            (<buf>, <scan_tree>, <scan_time>, <scan_error>)
+        as for `update_buf_data()`. The index updates are done in one
+        pass per dir (see `LangZone.update_bufs_data()`).
+        """
+        buf_datas_from_lang = {}
+        for buf_data in buf_datas:
+            buf_datas_from_lang.setdefault(buf_data[0].lang, [])\
+                .append(buf_data)
+        for lang, lang_buf_datas in buf_datas_from_lang.items():
+            self._get_lang_zone(lang).update_bufs_data(lang_buf_datas,
+                skip_scan_time_check=skip_scan_time_check)
+
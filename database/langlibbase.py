@@ -6,6 +6,7 @@
 See langlib.py / multilanglib.py
 """
 
+import os
 import logging
 from os.path import join
 from contextlib import contextmanager
@@ -17,6 +18,10 @@ log = logging.getLogger("codeintel.db")
 
 #---- Base lang lib implementation
 class LangDirsLibBase(object):
+    # The max number of files scanned in one batch (see
+    # Citadel.scan_bufs()) by ensure_dir_scanned().
+    SCAN_BATCH_SIZE = 100
+
     def __init__(self):
         self._have_ensured_scanned_from_dir_cache = set()
 
@@ -85,17 +90,23 @@ class LangDirsLibBase(object):
             importables = self._importables_from_dir(dir)
             importable_values = [i[0] for i in importables.values()
                                  if i[0] is not None]
+            bufs = []
             for base in importable_values:
                 if ctlr and ctlr.is_aborted():
                     log.debug("ctlr aborted")
                     return
                 if base not in res_index:
+                    path = join(dir, base)
+                    if os.sep in base \
+                       and self.lang_zone.get_path_scan_time(path) is not None:
+                        # E.g. the "__init__.py" of a Python package: it is
+                        # in the res_index of the package dir, not this one.
+                        continue
                     if reporter:
                         reporter("scanning %s files in '%s'" % (self.lang, dir))
                         reporter = None # don't report again
                     try:
-                        buf = self.mgr.buf_from_path(join(dir, base),
-                                                     lang=self.lang)
+                        buf = self.mgr.buf_from_path(path, lang=self.lang)
                     except (EnvironmentError, CodeIntelError), ex:
                         # This can occur if the path does not exist, such as a
                         # broken symlink, or we don't have permission to read
@@ -103,7 +114,12 @@ class LangDirsLibBase(object):
                         continue
                     if ctlr is not None:
                         ctlr.info("load %r", buf)
-                    buf.scan_if_necessary()
+                    bufs.append(buf)
+                    if len(bufs) >= self.SCAN_BATCH_SIZE:
+                        self.mgr.citadel.scan_bufs(bufs)
+                        bufs = []
+            if bufs:
+                self.mgr.citadel.scan_bufs(bufs)
 
             # Remove scanned paths that don't exist anymore.
             removed_values = set(res_index.keys()).difference(importable_values)
@@ -118,3 +134,68 @@ class LangDirsLibBase(object):
                 self.lang_zone.remove_path(basename)
 
             self._have_ensured_scanned_from_dir_cache.add(dir)
+
+    def _watch_dir(self, dir):
+        """Have the Manager's dir watcher, if any, tell this lib about
+        changes to the files in the given dir (see fswatch.py).
+        """
+        watcher = self.mgr.dir_watcher
+        if watcher is not None:
+            watcher.watch(dir, self)
+
+    def dir_changed(self, dir, names):
+        """Called by the dir watcher when files in the given dir were
+        created, changed or removed.
+
+            "names" is the set of the base names of those files, or None
+            if any file in the dir may have changed.
+
+        This drops what is cached about the dir and stages a
+        FileChangeRequest for each file: the staging delay coalesces the
+        events of, e.g., a VCS checkout.
+        """
+        from codeintel2.indexer import FileChangeRequest
+        self._importables_from_dir_cache.pop(dir, None)
+        if names is None:
+            names = [None]
+        for name in names:
+            self.mgr.idxr.stage_request(FileChangeRequest(self, dir, name))
+
+    def update_from_disk(self, dir, name=None):
+        """Bring the db up to date with the given file in the given dir
+        as it is on disk now -- or with all of the files in it if "name"
+        is None.
+
+        An importable file is scanned if it changed since it was last
+        scanned. A file that is gone is removed from the db.
+        """
+        res_index = self.lang_zone.load_index(dir, "res_index", {})
+        self._importables_from_dir_cache.pop(dir, None)
+        importables = self._importables_from_dir(dir)
+        blobfiles = set(i[0] for i in importables.values()
+                        if i[0] is not None and os.sep not in i[0])
+        if name is None:
+            names = blobfiles.union(res_index)
+        else:
+            names = [name]
+
+        for name in names:
+            path = join(dir, name)
+            try:
+                mtime = os.stat(path).st_mtime
+            except EnvironmentError:
+                if name in res_index:
+                    log.debug("update_from_disk: remove '%s'", path)
+                    self.lang_zone.remove_path(path)
+                continue
+            if name not in blobfiles:
+                continue
+            if name in res_index and res_index[name][0] >= mtime:
+                continue # the db is up-to-date
+            try:
+                buf = self.mgr.buf_from_path(path, lang=self.lang)
+            except (EnvironmentError, CodeIntelError), ex:
+                # The file was removed, or can't be read or isn't text.
+                continue
+            log.debug("update_from_disk: scan '%s'", path)
+            buf.scan(mtime=mtime)
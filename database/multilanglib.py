@@ -55,6 +55,8 @@ from codeintel2.common import *
 from codeintel2.database.langlibbase import LangDirsLibBase
 from codeintel2.database.langlib import LangZone
 from codeintel2 import util
+from codeintel2.metrics import metrics
+from codeintel2.tracing import traced
 
 
 #---- globals
@@ -121,6 +123,7 @@ class MultiLangDirsLib(LangDirsLibBase):
             blobname, ctlr=ctlr, only_look_in_db=True)
         return dbsubpath is not None
 
+    @traced("db: get_blob", "self", "blobname")
     def get_blob(self, blobname, ctlr=None, specific_dir=None):
         self._acquire_lock()
         try:
@@ -133,6 +136,7 @@ class MultiLangDirsLib(LangDirsLibBase):
         finally:
             self._release_lock()
 
+    @traced("db: hits_from_lpath", "self", "lpath")
     def hits_from_lpath(self, lpath, ctlr=None, curr_buf=None):
         """Return all hits of the given lookup path.
         
@@ -246,6 +250,7 @@ class MultiLangDirsLib(LangDirsLibBase):
 
     def _importables_from_dir(self, dir):
         if dir not in self._importables_from_dir_cache:
+            self._watch_dir(dir)
             self._importables_from_dir_cache[dir] \
                 = self.import_handler.find_importables_in_dir(dir)
         return self._importables_from_dir_cache[dir]
@@ -790,185 +795,213 @@ class MultiLangZone(LangZone):
             boolean indicating if the buffer data should be updated even
             if `scan_time` is <= that in the database.
         """
-        self._acquire_lock()
-        try:
-            #TODO: Canonicalize path (or assert that it is canonicalized)
-            dir, base = split(buf.path)
+        self.update_bufs_data([(buf, scan_tree, scan_time, scan_error)],
+                              skip_scan_time_check=skip_scan_time_check)
 
-            # Get the current data, if any.
-            res_index = self.load_index(dir, "res_index", {})
-            res_index_has_changed = False
-            blob_index = self.load_index(dir, "blob_index", {})
-            blob_index_has_changed = False
-            is_hits_from_lpath_lang = self.lang in self.db.import_everything_langs
-            if is_hits_from_lpath_lang:
-                #TODO: Not sure {} for a default is correct here.
-                toplevelname_index = self.load_index(dir, "toplevelname_index", {})
-                toplevelname_index_has_changed = False
-            try:
-                (old_scan_time, old_scan_error, old_res_data) = res_index[base]
-            except KeyError:    # adding a new entry
-                (old_scan_time, old_scan_error, old_res_data) = None, None, {}
-            else:               # updating an existing entry
-                if not skip_scan_time_check and scan_time is not None \
-                   and scan_time <= old_scan_time:
-                    log.debug("skipping db update for '%s': %s < %s and "
-                              "no 'skip_scan_time_check' option",
-                              base, scan_time, old_scan_time)
-                    return
-
-            log.debug("update from %s buf '%s'", buf.lang, buf.path)
-
-            # Parse the tree and get the list of blobnames.
-            # res_data: {lang -> blobname -> ilk -> toplevelnames}
-            new_res_data = {}
-            new_blob_from_lang_and_blobname = {}
-            if scan_tree:
-                for blob in scan_tree[0]:
-                    lang = blob.get("lang")
-                    blobname = blob.get("name")
-                    new_blob_from_lang_and_blobname[(lang, blobname)] = blob
-                    tfifb = new_res_data.setdefault(lang, {})
-                    toplevelnames_from_ilk = tfifb.setdefault(blobname, {})
-                    for toplevelname, elem in blob.names.iteritems():
-                        ilk = elem.get("ilk") or elem.tag
-                        if ilk not in toplevelnames_from_ilk:
-                            toplevelnames_from_ilk[ilk] = set([toplevelname])
-                        else:
-                            toplevelnames_from_ilk[ilk].add(toplevelname)
-                        # For PHP namespaces, we also want to add all namespace
-                        # child items, as this will make it easy for tree_php
-                        # to lookup a Fully Qualified Namespace (FQN).
-                        if ilk == "namespace" and lang == "PHP":
-                            for childname, childelem in elem.names.iteritems():
-                                child_ilk = childelem.get("ilk") or childelem.tag
-                                child_fqn = "%s\\%s" % (toplevelname, childname)
-                                if child_ilk not in toplevelnames_from_ilk:
-                                    toplevelnames_from_ilk[child_ilk] = set([child_fqn])
-                                else:
-                                    toplevelnames_from_ilk[child_ilk].add(child_fqn)
+    def update_bufs_data(self, buf_datas, skip_scan_time_check=False):
+        """Update this MultiLangZone with the data of a number of buffers.
 
-            # Determine necessary changes to res_index.
-            if scan_error:
-                if (scan_time != old_scan_time
-                    or scan_error != old_scan_error):
-                    res_index[base] = (scan_time, scan_error,
-                                       old_res_data)
-                    res_index_has_changed = True
-
-            else:
-                # Only consider new blobs if there wasn't a scan error.
-                # I.e., we want to preserve the last good scan info.
-
-                if (scan_time != old_scan_time
-                    or scan_error != old_scan_error
-                    or new_res_data != old_res_data):
-                    res_index[base] = (scan_time, scan_error,
-                                       new_res_data)
-                    res_index_has_changed = True
+        @param buf_datas {list} is a list of
+                (<buf>, <scan_tree>, <scan_time>, <scan_error>)
+            for the buffers, see `update_buf_data()`.
+        @param skip_scan_time_check {boolean} see `update_buf_data()`.
 
+        The buffers are grouped by dir: the indexes of a dir are loaded,
+        updated and marked as changed once for all of its buffers, with
+        the lock held.
+        """
+        #TODO: Canonicalize path (or assert that it is canonicalized)
+        buf_datas_from_dir = {}
+        for buf_data in buf_datas:
+            buf_datas_from_dir.setdefault(dirname(buf_data[0].path), [])\
+                .append(buf_data)
+
+        for dir, dir_buf_datas in buf_datas_from_dir.items():
+            self._acquire_lock()
+            try:
+                # Get the current data, if any.
+                res_index = self.load_index(dir, "res_index", {})
+                res_index_has_changed = False
+                blob_index = self.load_index(dir, "blob_index", {})
+                blob_index_has_changed = False
+                is_hits_from_lpath_lang = self.lang in self.db.import_everything_langs
                 if is_hits_from_lpath_lang:
-                    if new_res_data != old_res_data:
-                        toplevelname_index.update(base,
-                            old_res_data, new_res_data)
-                        toplevelname_index_has_changed = True
-
-                # Determine necessary changes to dbfile_from_blobname index
-                # and the dbfiles and then make them.
-                dbfile_changes = []
-                for (lang, blobname), blob \
-                        in new_blob_from_lang_and_blobname.items():
+                    #TODO: Not sure {} for a default is correct here.
+                    toplevelname_index = self.load_index(dir, "toplevelname_index", {})
+                    toplevelname_index_has_changed = False
+                for buf, scan_tree, scan_time, scan_error in dir_buf_datas:
+                    base = basename(buf.path)
                     try:
-                        old_res_data[lang][blobname]
-                    except KeyError:
-                        dbfile_changes.append(("add", lang, blobname, blob))
-                    else:
-                        dbfile_changes.append(("update", lang, blobname, blob))
+                        (old_scan_time, old_scan_error, old_res_data) = res_index[base]
+                    except KeyError:    # adding a new entry
+                        (old_scan_time, old_scan_error, old_res_data) = None, None, {}
+                    else:               # updating an existing entry
+                        if not skip_scan_time_check and scan_time is not None \
+                           and scan_time <= old_scan_time:
+                            log.debug("skipping db update for '%s': %s < %s and "
+                                      "no 'skip_scan_time_check' option",
+                                      base, scan_time, old_scan_time)
+                            continue
+
+                    log.debug("update from %s buf '%s'", buf.lang, buf.path)
+
+                    # Parse the tree and get the list of blobnames.
+                    # res_data: {lang -> blobname -> ilk -> toplevelnames}
+                    new_res_data = {}
+                    new_blob_from_lang_and_blobname = {}
+                    if scan_tree:
+                        for blob in scan_tree[0]:
+                            lang = blob.get("lang")
+                            blobname = blob.get("name")
+                            new_blob_from_lang_and_blobname[(lang, blobname)] = blob
+                            tfifb = new_res_data.setdefault(lang, {})
+                            toplevelnames_from_ilk = tfifb.setdefault(blobname, {})
+                            for toplevelname, elem in blob.names.iteritems():
+                                ilk = elem.get("ilk") or elem.tag
+                                if ilk not in toplevelnames_from_ilk:
+                                    toplevelnames_from_ilk[ilk] = set([toplevelname])
+                                else:
+                                    toplevelnames_from_ilk[ilk].add(toplevelname)
+                                # For PHP namespaces, we also want to add all namespace
+                                # child items, as this will make it easy for tree_php
+                                # to lookup a Fully Qualified Namespace (FQN).
+                                if ilk == "namespace" and lang == "PHP":
+                                    for childname, childelem in elem.names.iteritems():
+                                        child_ilk = childelem.get("ilk") or childelem.tag
+                                        child_fqn = "%s\\%s" % (toplevelname, childname)
+                                        if child_ilk not in toplevelnames_from_ilk:
+                                            toplevelnames_from_ilk[child_ilk] = set([child_fqn])
+                                        else:
+                                            toplevelnames_from_ilk[child_ilk].add(child_fqn)
+
+                    # Determine necessary changes to res_index.
+                    if scan_error:
+                        if (scan_time != old_scan_time
+                            or scan_error != old_scan_error):
+                            res_index[base] = (scan_time, scan_error,
+                                               old_res_data)
+                            res_index_has_changed = True
 
-                for lang, old_tfifb in old_res_data.items():
-                    for blobname in old_tfifb:
-                        try:
-                            new_res_data[lang][blobname]
-                        except KeyError:
-                            dbfile_changes.append(("remove", lang, blobname, None))
-
-                dhash = self.dhash_from_dir(dir)
-                for action, lang, blobname, blob in dbfile_changes:
-                    if action == "add":
-                        dbfile = self.db.bhash_from_blob_info(
-                                    buf.path, lang, blobname)
-                        blob_index.setdefault(lang, {})[blobname] = dbfile
-                        blob_index_has_changed = True
-                        dbdir = join(self.base_dir, dhash)
-                        if not exists(dbdir):
-                            self._mk_dbdir(dbdir, dir)
-                        #XXX What to do on write failure?
-                        log.debug("fs-write: %s|%s blob '%s/%s'",
-                                  self.lang, lang, dhash, dbfile)
-                        if blob.get("src") is None:
-                            blob.set("src", buf.path)   # for defns_from_pos() support
-                        ET.ElementTree(blob).write(join(dbdir, dbfile+".blob"))
-                    elif action == "remove":
-                        dbfile = blob_index[lang][blobname]
-                        del blob_index[lang][blobname]
-                        blob_index_has_changed = True
-                        #XXX What to do on removal failure?
-                        log.debug("fs-write: remove %s|%s blob '%s/%s'",
-                                  self.lang, lang, dhash, dbfile)
-                        try:
-                            os.remove(join(self.base_dir, dhash, dbfile+".blob"))
-                        except EnvironmentError, ex:
-                            self.db.corruption("MultiLangZone.update_buf_data",
-                                "could not remove dbfile for '%s' blob: %s"\
-                                    % (blobname, ex),
-                                "ignore")
-                    elif action == "update":
-                        # Try to only change the dbfile on disk if it is
-                        # different.
-                        s = StringIO()
-                        if blob.get("src") is None:
-                            blob.set("src", buf.path)   # for defns_from_pos() support
-                        ET.ElementTree(blob).write(s)
-                        new_dbfile_content = s.getvalue()
-                        dbfile = blob_index[lang][blobname]
-                        dbpath = join(self.base_dir, dhash, dbfile+".blob")
-                        # PERF: Might be nice to cache the new dbfile
-                        #       content for the next time this resource is
-                        #       updated. For files under edit this will be
-                        #       common. I.e. just for the "editset".
-                        try:
-                            fin = open(dbpath, 'r')
-                        except (OSError, IOError), ex:
-                            # Technically if the dbfile doesn't exist, this
-                            # is a sign of database corruption. No matter
-                            # though (for this blob anyway), we are about to
-                            # replace it.
-                            old_dbfile_content = None
-                        else:
-                            try:
-                                old_dbfile_content = fin.read()
-                            finally:
-                                fin.close()
-                        if new_dbfile_content != old_dbfile_content:
-                            if not exists(dirname(dbpath)):
-                                self._mk_dbdir(dirname(dbpath), dir)
-                            #XXX What to do if fail to write out file?
-                            log.debug("fs-write: %s|%s blob '%s/%s'",
-                                      self.lang, lang, dhash, dbfile)
-                            fout = open(dbpath, 'w')
+                    else:
+                        # Only consider new blobs if there wasn't a scan error.
+                        # I.e., we want to preserve the last good scan info.
+
+                        if (scan_time != old_scan_time
+                            or scan_error != old_scan_error
+                            or new_res_data != old_res_data):
+                            res_index[base] = (scan_time, scan_error,
+                                               new_res_data)
+                            res_index_has_changed = True
+
+                        if is_hits_from_lpath_lang:
+                            if new_res_data != old_res_data:
+                                toplevelname_index.update(base,
+                                    old_res_data, new_res_data)
+                                toplevelname_index_has_changed = True
+
+                        # Determine necessary changes to dbfile_from_blobname index
+                        # and the dbfiles and then make them.
+                        dbfile_changes = []
+                        for (lang, blobname), blob \
+                                in new_blob_from_lang_and_blobname.items():
                             try:
-                                fout.write(new_dbfile_content)
-                            finally:
-                                fout.close()
-
-            if res_index_has_changed:
-                self.changed_index(dir, "res_index")
-            if blob_index_has_changed:
-                self.changed_index(dir, "blob_index")
-            if is_hits_from_lpath_lang and toplevelname_index_has_changed:
-                self.changed_index(dir, "toplevelname_index")
-        finally:
-            self._release_lock()
+                                old_res_data[lang][blobname]
+                            except KeyError:
+                                dbfile_changes.append(("add", lang, blobname, blob))
+                            else:
+                                dbfile_changes.append(("update", lang, blobname, blob))
+
+                        for lang, old_tfifb in old_res_data.items():
+                            for blobname in old_tfifb:
+                                try:
+                                    new_res_data[lang][blobname]
+                                except KeyError:
+                                    dbfile_changes.append(("remove", lang, blobname, None))
+
+                        dhash = self.dhash_from_dir(dir)
+                        for action, lang, blobname, blob in dbfile_changes:
+                            if action == "add":
+                                dbfile = self.db.bhash_from_blob_info(
+                                            buf.path, lang, blobname)
+                                blob_index.setdefault(lang, {})[blobname] = dbfile
+                                blob_index_has_changed = True
+                                dbdir = join(self.base_dir, dhash)
+                                if not exists(dbdir):
+                                    self._mk_dbdir(dbdir, dir)
+                                #XXX What to do on write failure?
+                                log.debug("fs-write: %s|%s blob '%s/%s'",
+                                          self.lang, lang, dhash, dbfile)
+                                if blob.get("src") is None:
+                                    blob.set("src", buf.path)   # for defns_from_pos() support
+                                fout = open(join(dbdir, dbfile+".blob"), 'wb')
+                                try:
+                                    ET.ElementTree(blob).write(fout)
+                                    metrics.fs_write(fout.tell())
+                                finally:
+                                    fout.close()
+                            elif action == "remove":
+                                dbfile = blob_index[lang][blobname]
+                                del blob_index[lang][blobname]
+                                blob_index_has_changed = True
+                                #XXX What to do on removal failure?
+                                log.debug("fs-write: remove %s|%s blob '%s/%s'",
+                                          self.lang, lang, dhash, dbfile)
+                                try:
+                                    os.remove(join(self.base_dir, dhash, dbfile+".blob"))
+                                except EnvironmentError, ex:
+                                    self.db.corruption("MultiLangZone.update_buf_data",
+                                        "could not remove dbfile for '%s' blob: %s"\
+                                            % (blobname, ex),
+                                        "ignore")
+                            elif action == "update":
+                                # Try to only change the dbfile on disk if it is
+                                # different.
+                                s = StringIO()
+                                if blob.get("src") is None:
+                                    blob.set("src", buf.path)   # for defns_from_pos() support
+                                ET.ElementTree(blob).write(s)
+                                new_dbfile_content = s.getvalue()
+                                dbfile = blob_index[lang][blobname]
+                                dbpath = join(self.base_dir, dhash, dbfile+".blob")
+                                # PERF: Might be nice to cache the new dbfile
+                                #       content for the next time this resource is
+                                #       updated. For files under edit this will be
+                                #       common. I.e. just for the "editset".
+                                try:
+                                    fin = open(dbpath, 'r')
+                                except (OSError, IOError), ex:
+                                    # Technically if the dbfile doesn't exist, this
+                                    # is a sign of database corruption. No matter
+                                    # though (for this blob anyway), we are about to
+                                    # replace it.
+                                    old_dbfile_content = None
+                                else:
+                                    try:
+                                        old_dbfile_content = fin.read()
+                                    finally:
+                                        fin.close()
+                                    metrics.fs_read(len(old_dbfile_content))
+                                if new_dbfile_content != old_dbfile_content:
+                                    if not exists(dirname(dbpath)):
+                                        self._mk_dbdir(dirname(dbpath), dir)
+                                    #XXX What to do if fail to write out file?
+                                    log.debug("fs-write: %s|%s blob '%s/%s'",
+                                              self.lang, lang, dhash, dbfile)
+                                    fout = open(dbpath, 'w')
+                                    try:
+                                        fout.write(new_dbfile_content)
+                                    finally:
+                                        fout.close()
+                                    metrics.fs_write(len(new_dbfile_content))
+
+                if res_index_has_changed:
+                    self.changed_index(dir, "res_index")
+                if blob_index_has_changed:
+                    self.changed_index(dir, "blob_index")
+                if is_hits_from_lpath_lang and toplevelname_index_has_changed:
+                    self.changed_index(dir, "toplevelname_index")
+            finally:
+                self._release_lock()
         #TODO: Database.clean() should remove dirs that have no
         #      blob_index entries.    
 
@@ -65,6 +65,8 @@ from codeintel2.util import dedent, safe_lang_from_lang, banner
 from codeintel2.tree import tree_from_cix_path
 from codeintel2.database.resource import AreaResource
 from codeintel2.database.util import (rmdir, filter_blobnames_for_prefix)
+from codeintel2.metrics import metrics
+from codeintel2.tracing import traced
 
 
 
@@ -135,6 +137,7 @@ class StdLib(object):
     def has_blob(self, blobname):
         return blobname in self.blob_index
 
+    @traced("db: get_blob", "self", "blobname")
     def get_blob(self, blobname):
         # Cache the blob once. Don't need to worry about invalidating the stdlib
         # blobs as stdlibs should not change during a Komodo session, bug 65502.
@@ -144,8 +147,11 @@ class StdLib(object):
                 dbfile = self.blob_index[blobname]
             except KeyError:
                 return None
+            metrics.cache_lookup("stdlib blob", False)
             blob = self.db.load_blob(join(self.base_dir, dbfile))
             self._blob_from_blobname[blobname] = blob
+        else:
+            metrics.cache_lookup("stdlib blob", True)
         return blob
 
     def get_blob_imports(self, prefix):
@@ -163,6 +169,7 @@ class StdLib(object):
             self._blob_imports_from_prefix_cache[prefix] = matches
         return self._blob_imports_from_prefix_cache[prefix]
 
+    @traced("db: hits_from_lpath", "self", "lpath")
     def hits_from_lpath(self, lpath, ctlr=None, curr_buf=None):
         """Return all hits of the given lookup path.
         
@@ -271,13 +278,21 @@ class StdLibsZone(object):
 
     Because this is a singleton we shouldn't have to worry about locking
     to prevent corruption.
+
+    A "read_only" zone (the system tier, see database.py) never imports
+    anything: `get_lib()` returns None for a stdlib that isn't already
+    up to date in it, so the caller can fall back to the user tier.
     """
     _res_index = None                   # cix-path -> last-updated
 
-    def __init__(self, db):
+    def __init__(self, db, base_dir=None, read_only=False):
         self.db = db
         self.stdlibs_dir = join(dirname(dirname(__file__)), "stdlibs")
-        self.base_dir = join(self.db.base_dir, "db", "stdlibs")
+        if base_dir is None:
+            base_dir = join(self.db.base_dir, "db", "stdlibs")
+        self.base_dir = base_dir
+        self.read_only = read_only
+        self._stale_stdlib_matches = set() # read-only: (ver, name)'s not current here
         self._stdlib_from_stdlib_ver_and_name = {} # cache of StdLib singletons
         self._vers_and_names_from_lang = {} # lang -> ordered list of (ver, name)
 
@@ -328,6 +343,8 @@ class StdLibsZone(object):
         return self._res_index
     
     def save(self):
+        if self.read_only:
+            return
         if self._res_index is not None:
             self.db.save_pickle(join(self.base_dir, "res_index"),
                                 self._res_index)
@@ -361,7 +378,8 @@ class StdLibsZone(object):
         On first get of a stdlib for a particular language, all
         available stdlibs for that lang are updated, if necessary.
 
-        Returns None if there is not stdlib for this language.
+        Returns None if there is not stdlib for this language (or, for
+        a read-only zone, if that stdlib is not up to date in it).
         """
         vers_and_names = self.vers_and_names_from_lang(lang)
         if not vers_and_names:
@@ -399,9 +417,18 @@ class StdLibsZone(object):
         stdlib_ver, stdlib_name = stdlib_match
 
         if stdlib_match not in self._stdlib_from_stdlib_ver_and_name:
-            # TODO: This _update_lang_with_ver method should really moved into
-            #       the StdLib class.
-            self._update_lang_with_ver(lang, ver=stdlib_ver)
+            if self.read_only:
+                if stdlib_match in self._stale_stdlib_matches:
+                    return None
+                if self._res_todos_for_lang_with_ver(lang, stdlib_ver):
+                    log.info("%s stdlib is not current in `%s' (read-only)",
+                             stdlib_name, self.base_dir)
+                    self._stale_stdlib_matches.add(stdlib_match)
+                    return None
+            else:
+                # TODO: This _update_lang_with_ver method should really
+                #       moved into the StdLib class.
+                self._update_lang_with_ver(lang, ver=stdlib_ver)
             stdlib = StdLib(self.db,
                             join(self.base_dir, stdlib_name),
                             lang, stdlib_name)
@@ -467,6 +494,7 @@ class StdLibsZone(object):
     #      the relevant stdlib.
     def remove_lang(self, lang):
         """Remove the given language from the stdlib zone."""
+        assert not self.read_only, "cannot remove_lang() in read-only %r" % self
         log.debug("update '%s' stdlibs", lang)
 
         # Figure out what updates need to be done...
@@ -494,40 +522,48 @@ class StdLibsZone(object):
                 and <value> is an integer between 0 and 100 indicating the
                 level of completeness.
         """
+        assert not self.read_only, "cannot update read-only %r" % self
         log.debug("update '%s' stdlibs", lang)
         # Figure out what updates need to be done...
         if progress_cb:
             try:    progress_cb("Determining necessary updates...", 5)
             except: log.exception("error in progress_cb (ignoring)")
-        if ver is not None:
-            ver_str = ".".join(map(str, ver))
-            cix_path = join(self.stdlibs_dir,
-                            "%s-%s.cix" % (safe_lang_from_lang(lang), ver_str))
-        else:
-            cix_path = join(self.stdlibs_dir,
-                             "%s.cix" % (safe_lang_from_lang(lang), ))
 
         # Need to acquire db lock, as the indexer and main thread may both be
         # calling into _update_lang_with_ver at the same time.
         self.db.acquire_lock()
         try:
-            todo = []
-            res = AreaResource(cix_path, "ci-pkg-dir")
-            try:
-                last_updated = self.res_index[res.area_path]
-            except KeyError:
-                todo.append(("add", res))
-            else:
-                mtime = os.stat(cix_path).st_mtime
-                if last_updated != mtime: # epsilon? '>=' instead of '!='?
-                    todo.append(("update", res))
-    
+            todo = self._res_todos_for_lang_with_ver(lang, ver)
+
             # ... and then do them.
             self._handle_res_todos(lang, todo, progress_cb)
             self.save()
         finally:
             self.db.release_lock()
 
+    def _res_todos_for_lang_with_ver(self, lang, ver=None):
+        """Return the list of (<action>, <res>) needed to bring this
+        lang/ver stdlib up to date in this zone.
+        """
+        if ver is not None:
+            ver_str = ".".join(map(str, ver))
+            cix_path = join(self.stdlibs_dir,
+                            "%s-%s.cix" % (safe_lang_from_lang(lang), ver_str))
+        else:
+            cix_path = join(self.stdlibs_dir,
+                             "%s.cix" % (safe_lang_from_lang(lang), ))
+        todo = []
+        res = AreaResource(cix_path, "ci-pkg-dir")
+        try:
+            last_updated = self.res_index[res.area_path]
+        except KeyError:
+            todo.append(("add", res))
+        else:
+            mtime = os.stat(cix_path).st_mtime
+            if last_updated != mtime: # epsilon? '>=' instead of '!='?
+                todo.append(("update", res))
+        return todo
+
     def update_lang(self, lang, progress_cb=None, ver=None):
         vers_and_names = self.vers_and_names_from_lang(lang)
         if ver is not None:
@@ -565,15 +601,17 @@ class StdLibsZone(object):
             else:
                 self.db.report_event(desc)
 
-            if action == "add":
-                self._add_res(res, lang, name, ver)
-            elif action == "remove":
-                self._remove_res(res, lang, name, ver)
-            elif action == "update":
-                #XXX Bad for filesystem. Change this to do it
-                #    more intelligently if possible.
-                self._remove_res(res, lang, name, ver)
-                self._add_res(res, lang, name, ver)
+            with self.db.mgr.startup_tracer.phase("%s %s stdlib"
+                                                  % (action, name)):
+                if action == "add":
+                    self._add_res(res, lang, name, ver)
+                elif action == "remove":
+                    self._remove_res(res, lang, name, ver)
+                elif action == "update":
+                    #XXX Bad for filesystem. Change this to do it
+                    #    more intelligently if possible.
+                    self._remove_res(res, lang, name, ver)
+                    self._add_res(res, lang, name, ver)
 
     def _remove_res(self, res, lang, name, ver):
         log.debug("%s stdlibs: remove %s", lang, res)
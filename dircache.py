@@ -0,0 +1,185 @@
+#!/usr/bin/env python
+# Copyright (c) 2010 ActiveState Software Inc.
+# See LICENSE.txt for license details.
+
+"""A cache of directory listings for import path discovery.
+
+Finding the import dirs (util.gen_dirs_under_dirs()) and the importables
+in a dir (ImportHandler.find_importables_in_dir()) lists each dir and
+stats each entry in it to tell dirs from files. On large include dirs,
+and especially on network file systems, those stats take seconds.
+
+This cache keeps, for each dir, the names of its sub-dirs (and which of
+those are symlinks) and of its other entries, from a single listing. A
+listing is valid as long as the dir's mtime is unchanged (adding,
+removing or renaming an entry updates it), so re-using it costs one
+stat() of the dir. The cache is shared by all ImportHandlers (see
+Database.dir_listing_cache) and saved in the database dir between
+sessions.
+
+Usage:
+    cache = mgr.db.dir_listing_cache
+    listing = cache.listing(dir)
+    if listing is not None:
+        dirnames, nondirnames, linkdirnames = listing
+    for dirpath, dirnames, filenames in cache.walk(top):
+        ...
+"""
+
+import os
+from os.path import join, exists, dirname
+import stat
+import logging
+import threading
+import time
+import cPickle as pickle
+
+from codeintel2.util import write_file_atomically, load_pickle
+
+
+log = logging.getLogger("codeintel.dircache")
+
+
+class DirListingCache(object):
+    # The number of dir listings to save: the oldest ones are dropped
+    # beyond that.
+    MAX_DIRS = 50000
+    # A listing isn't cached if the dir was modified less than this
+    # number of seconds before it was made: a change in the same mtime
+    # tick would go unnoticed.
+    MTIME_SLOP = 2.0
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.RLock()
+        # {<dir>: (<mtime>, <dirnames>, <nondirnames>, <linkdirnames>,
+        #          <time listed>)}, loaded from the cache file on first use.
+        self._listing_from_dir = None
+        self._is_dirty = False
+
+    def __repr__(self):
+        return "<DirListingCache '%s'>" % self.path
+
+    def _load(self):
+        listing_from_dir = load_pickle(self.path, "dir listing cache")
+        if not isinstance(listing_from_dir, dict):
+            return {}
+        return listing_from_dir
+
+    def _get_listing_from_dir(self):
+        if self._listing_from_dir is None:
+            self._listing_from_dir = self._load()
+        return self._listing_from_dir
+
+    def _list_dir(self, dir):
+        """Return (<dirnames>, <nondirnames>, <linkdirnames>) for the given
+        dir, like util.walk2() would tell them apart.
+        """
+        names = os.listdir(dir)
+        dirnames, nondirnames, linkdirnames = [], [], []
+        for name in names:
+            try:
+                path = join(dir, name)
+                mode = os.lstat(path).st_mode
+                if stat.S_ISLNK(mode):
+                    mode = os.stat(path).st_mode
+                    if stat.S_ISDIR(mode):
+                        linkdirnames.append(name)
+            except UnicodeDecodeError:
+                # Hit a filename that cannot be encoded in the default
+                # encoding. Just skip it. (Bug 82268)
+                continue
+            except EnvironmentError:
+                nondirnames.append(name)  # e.g. a dangling symlink
+                continue
+            if stat.S_ISDIR(mode):
+                dirnames.append(name)
+            else:
+                nondirnames.append(name)
+        return tuple(dirnames), tuple(nondirnames), tuple(linkdirnames)
+
+    def listing(self, dir):
+        """Return (<dirnames>, <nondirnames>, <linkdirnames>) for the given
+        dir, or None if it cannot be listed. Symlinks to dirs are in
+        <dirnames> and also in <linkdirnames>.
+        """
+        try:
+            mtime = os.stat(dir).st_mtime
+        except EnvironmentError:
+            return None
+        self._lock.acquire()
+        try:
+            cached = self._get_listing_from_dir().get(dir)
+        finally:
+            self._lock.release()
+        if cached is not None and cached[0] == mtime:
+            return cached[1:4]
+
+        try:
+            listing = self._list_dir(dir)
+        except EnvironmentError:
+            return None
+        now = time.time()
+        if now - mtime >= self.MTIME_SLOP:
+            self._lock.acquire()
+            try:
+                self._get_listing_from_dir()[dir] = (mtime, ) + listing + (now, )
+                self._is_dirty = True
+            finally:
+                self._lock.release()
+        return listing
+
+    def walk(self, top):
+        """A version of util.walk2(top) using the cached listings."""
+        listing = self.listing(top)
+        if listing is None:
+            return
+        dirnames, nondirnames, linkdirnames = listing
+        dirnames = list(dirnames)
+        yield top, dirnames, list(nondirnames)
+        for name in dirnames:
+            if name not in linkdirnames:
+                for x in self.walk(join(top, name)):
+                    yield x
+
+    def save(self):
+        """Save the cache, if changed, to its file in the database dir
+        (if that exists). Failures to write it are logged and otherwise
+        ignored.
+        """
+        self._lock.acquire()
+        try:
+            if not self._is_dirty or not exists(dirname(self.path)):
+                return
+            listing_from_dir = self._listing_from_dir
+            if len(listing_from_dir) > self.MAX_DIRS:
+                by_age = sorted(listing_from_dir,
+                                key=lambda d: listing_from_dir[d][4])
+                for dir in by_age[:len(listing_from_dir) - self.MAX_DIRS]:
+                    del listing_from_dir[dir]
+            try:
+                log.debug("fs-write: dir listing cache '%s'", self.path)
+                write_file_atomically(self.path,
+                                      pickle.dumps(listing_from_dir, 2))
+            except EnvironmentError, ex:
+                log.warn("could not write dir listing cache '%s': %s",
+                         self.path, ex)
+            else:
+                self._is_dirty = False
+        finally:
+            self._lock.release()
+
+    def clear(self):
+        """Remove all listings from the cache."""
+        self._lock.acquire()
+        try:
+            self._listing_from_dir = {}
+            self._is_dirty = False
+            if exists(self.path):
+                try:
+                    os.remove(self.path)
+                except EnvironmentError, ex:
+                    log.warn("could not remove dir listing cache '%s': %s",
+                             self.path, ex)
+        finally:
+            self._lock.release()
@@ -0,0 +1,369 @@
+#!/usr/bin/env python
+# Copyright (c) 2010 ActiveState Software Inc.
+# See LICENSE.txt for license details.
+
+"""Watching the dirs of the import libs for changes on disk.
+
+The database only learns of changes to the files in the dirs of a
+LangDirsLib or MultiLangDirsLib (e.g. a project's PHP include dir, or
+a Python site-packages dir) when the editor submits a ScanRequest for
+them, or when the lib first checks a dir for new and removed files (see
+LangDirsLibBase.ensure_dir_scanned(), done once per dir per process).
+Files changed outside of the editor (a VCS checkout, a build, a package
+install) otherwise stay stale in the db.
+
+A DirWatcher watches the dirs the libs look into (inotify on Linux,
+polling the dirs elsewhere, or for dirs inotify cannot watch) and tells
+the libs which files in them were created, changed or removed. The libs
+stage a FileChangeRequest per file with the indexer: the staging delay
+coalesces the many events of a single write, save or checkout into one
+scan -- or one LangZone.remove_path() for a removed file.
+
+Usage:
+    watcher = DirWatcher()
+    watcher.start()
+    watcher.watch(dir, listener)    # calls listener.dir_changed(dir, names)
+    ...
+    watcher.finalize()
+
+where "names" is the set of base names of the entries that changed in
+"dir", or None if the watcher lost track (e.g. the inotify event queue
+overflowed, or the dir itself was removed). Listeners are only weakly
+referenced.
+"""
+
+import os
+from os.path import join
+import sys
+import errno
+import select
+import struct
+import logging
+import threading
+import time
+import weakref
+
+
+log = logging.getLogger("codeintel.fswatch")
+
+
+#---- inotify support (via ctypes, Linux only)
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+
+# IN_CLOSE_WRITE rather than IN_MODIFY: one event per write of a file
+# rather than one per write() call.
+_INOTIFY_MASK = (IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE
+                 | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
+# struct inotify_event {int wd; uint32_t mask, cookie, len; char name[];}
+_inotify_event_header = struct.Struct("iIII")
+
+_libc = None
+def _get_libc_with_inotify():
+    """Return the C library, if it has the inotify functions, else None."""
+    global _libc
+    if _libc is None:
+        _libc = False
+        if sys.platform.startswith("linux"):
+            try:
+                import ctypes
+                import ctypes.util
+                libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6",
+                                   use_errno=True)
+                libc.inotify_init.argtypes = []
+                libc.inotify_add_watch.argtypes = [ctypes.c_int,
+                    ctypes.c_char_p, ctypes.c_uint32]
+                libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+            except (ImportError, EnvironmentError, AttributeError), ex:
+                log.debug("inotify is not available: %s", ex)
+            else:
+                _libc = libc
+    return _libc or None
+
+
+#---- the watcher
+
+class DirWatcher(threading.Thread):
+    """A thread watching dirs for created, changed and removed files.
+
+    Changes to the entries of a dir (not of its sub-dirs) are reported
+    to the listeners on it by calling:
+        listener.dir_changed(dir, names)
+    on the watcher thread, at most once per dir per batch of events.
+    """
+    # The number of seconds between checks of the dirs that are polled.
+    POLL_INTERVAL = 5.0
+    # The max number of seconds the thread waits before checking if it
+    # should stop.
+    WAKEUP_INTERVAL = 1.0
+
+    def __init__(self, use_inotify=True):
+        threading.Thread.__init__(self, name="codeintel dir watcher")
+        self.setDaemon(True)
+        self._lock = threading.RLock()
+        self._stopping = False
+        # {<dir>: WeakSet(<listeners>)}
+        self._listeners_from_dir = {}
+        # inotify watches: {<wd>: <dir>} and {<dir>: <wd>}
+        self._dir_from_wd = {}
+        self._wd_from_dir = {}
+        self._inotify_fd = None
+        libc = use_inotify and _get_libc_with_inotify()
+        if libc:
+            fd = libc.inotify_init()
+            if fd < 0:
+                log.warn("could not initialize inotify, polling dirs "
+                         "instead: %s", os.strerror(self._errno()))
+            else:
+                self._libc = libc
+                self._inotify_fd = fd
+        # Polled dirs: {<dir>: <snapshot>}
+        self._snapshot_from_polled_dir = {}
+        self._next_poll_time = 0
+
+    def __repr__(self):
+        return "<DirWatcher: %d dirs (%s)>" % (
+            len(self._listeners_from_dir),
+            self._inotify_fd is None and "polling" or "inotify")
+
+    def _errno(self):
+        import ctypes
+        return ctypes.get_errno()
+
+    def watch(self, dir, listener):
+        """Tell the given listener about changes to the files in `dir'."""
+        self._lock.acquire()
+        try:
+            listeners = self._listeners_from_dir.get(dir)
+            if listeners is None:
+                listeners = self._listeners_from_dir[dir] = weakref.WeakSet()
+                self._add_watch(dir)
+            listeners.add(listener)
+        finally:
+            self._lock.release()
+
+    def unwatch(self, dir, listener=None):
+        """Stop telling the given listener (or any) about changes to the
+        files in `dir'.
+        """
+        self._lock.acquire()
+        try:
+            listeners = self._listeners_from_dir.get(dir)
+            if listeners is None:
+                return
+            if listener is not None:
+                listeners.discard(listener)
+            if listener is None or not listeners:
+                del self._listeners_from_dir[dir]
+                self._remove_watch(dir)
+        finally:
+            self._lock.release()
+
+    def _add_watch(self, dir):
+        if self._inotify_fd is not None:
+            if isinstance(dir, unicode):
+                path = dir.encode(sys.getfilesystemencoding() or "utf-8")
+            else:
+                path = dir
+            wd = self._libc.inotify_add_watch(self._inotify_fd, path,
+                                              _INOTIFY_MASK)
+            if wd >= 0:
+                self._dir_from_wd[wd] = dir
+                self._wd_from_dir[dir] = wd
+                return
+            err = self._errno()
+            if err in (errno.ENOENT, errno.ENOTDIR, errno.EACCES):
+                log.debug("not watching '%s': %s", dir, os.strerror(err))
+                return
+            # E.g. ENOSPC: fs.inotify.max_user_watches was reached.
+            log.debug("cannot watch '%s' with inotify (%s): polling it",
+                      dir, os.strerror(err))
+        # Take the first snapshot right away rather than on the watcher
+        # thread: a file created in between would never be reported.
+        snapshot = self._snapshot(dir)
+        if snapshot is None:
+            log.debug("not watching '%s': cannot list it", dir)
+            return
+        self._snapshot_from_polled_dir[dir] = snapshot
+
+    def _remove_watch(self, dir):
+        wd = self._wd_from_dir.pop(dir, None)
+        if wd is not None:
+            del self._dir_from_wd[wd]
+            if self._inotify_fd is not None:
+                self._libc.inotify_rm_watch(self._inotify_fd, wd)
+        self._snapshot_from_polled_dir.pop(dir, None)
+
+    def finalize(self):
+        """Stop watching. The thread stops within WAKEUP_INTERVAL.
+
+        This must be done even if the thread was never .start()'ed, to
+        close the inotify file descriptor.
+        """
+        self._stopping = True
+        if not self.isAlive() and self._inotify_fd is not None:
+            os.close(self._inotify_fd)
+            self._inotify_fd = None
+
+    def run(self):
+        log.debug("dir watcher: start (%r)", self)
+        try:
+            while not self._stopping:
+                try:
+                    if self._inotify_fd is not None:
+                        self._read_inotify_events()
+                    else:
+                        time.sleep(self.WAKEUP_INTERVAL)
+                    self._poll()
+                except:
+                    if not self._stopping:
+                        log.exception("unexpected error in dir watcher: "
+                                      "ignoring and continuing")
+                        time.sleep(self.WAKEUP_INTERVAL)
+        finally:
+            if self._inotify_fd is not None:
+                os.close(self._inotify_fd)
+                self._inotify_fd = None
+            log.debug("dir watcher: stopped")
+
+    def _read_inotify_events(self):
+        try:
+            readable = select.select([self._inotify_fd], [], [],
+                                     self.WAKEUP_INTERVAL)[0]
+        except select.error, ex:
+            if ex.args[0] == errno.EINTR:
+                return
+            raise
+        if not readable:
+            return
+        data = os.read(self._inotify_fd, 64 * 1024)
+
+        names_from_dir = {}
+        removed_dirs = set()
+        self._lock.acquire()
+        try:
+            pos = 0
+            while pos < len(data):
+                wd, mask, cookie, length \
+                    = _inotify_event_header.unpack_from(data, pos)
+                pos += _inotify_event_header.size
+                name = data[pos:pos+length].rstrip('\0')
+                pos += length
+
+                if mask & IN_Q_OVERFLOW:
+                    log.debug("inotify event queue overflowed: rescanning "
+                              "all %d watched dirs", len(self._wd_from_dir))
+                    for dir in self._wd_from_dir:
+                        names_from_dir[dir] = None
+                    continue
+                dir = self._dir_from_wd.get(wd)
+                if dir is None:
+                    continue
+                if mask & (IN_DELETE_SELF | IN_MOVE_SELF | IN_IGNORED):
+                    names_from_dir[dir] = None
+                    removed_dirs.add(dir)
+                    continue
+                if not name or dir in names_from_dir \
+                   and names_from_dir[dir] is None:
+                    continue
+                if isinstance(dir, unicode):
+                    try:
+                        name = name.decode(sys.getfilesystemencoding()
+                                           or "utf-8")
+                    except UnicodeDecodeError:
+                        continue
+                names_from_dir.setdefault(dir, set()).add(name)
+        finally:
+            self._lock.release()
+        self._report(names_from_dir)
+        # Forget about removed dirs: the listeners watch them again if
+        # they are re-created and looked into.
+        for dir in removed_dirs:
+            self.unwatch(dir)
+
+    def _snapshot(self, dir):
+        """Return {<name>: (<mtime>, <size>)} for the entries in `dir', or
+        None if it cannot be listed.
+        """
+        try:
+            names = os.listdir(dir)
+        except EnvironmentError:
+            return None
+        snapshot = {}
+        for name in names:
+            try:
+                st = os.stat(join(dir, name))
+            except EnvironmentError:
+                snapshot[name] = None
+            else:
+                snapshot[name] = (st.st_mtime, st.st_size)
+        return snapshot
+
+    def _poll(self):
+        now = time.time()
+        if now < self._next_poll_time:
+            return
+        self._next_poll_time = now + self.POLL_INTERVAL
+        self._lock.acquire()
+        try:
+            dirs = self._snapshot_from_polled_dir.keys()
+        finally:
+            self._lock.release()
+        if not dirs:
+            return
+
+        names_from_dir = {}
+        removed_dirs = []
+        for dir in dirs:
+            snapshot = self._snapshot(dir)
+            self._lock.acquire()
+            try:
+                if dir not in self._snapshot_from_polled_dir:
+                    continue  # unwatched meanwhile
+                last_snapshot = self._snapshot_from_polled_dir[dir]
+                self._snapshot_from_polled_dir[dir] = snapshot
+            finally:
+                self._lock.release()
+            if snapshot is None:
+                names_from_dir[dir] = None  # the dir is gone
+                removed_dirs.append(dir)
+                continue
+            names = set(name for name, stat in snapshot.iteritems()
+                        if last_snapshot.get(name, False) != stat)
+            names.update(name for name in last_snapshot
+                         if name not in snapshot)
+            if names:
+                names_from_dir[dir] = names
+        self._report(names_from_dir)
+        for dir in removed_dirs:
+            self.unwatch(dir)
+
+    def _report(self, names_from_dir):
+        for dir, names in names_from_dir.items():
+            self._lock.acquire()
+            try:
+                listeners = self._listeners_from_dir.get(dir)
+                listeners = listeners and list(listeners) or []
+                if not listeners:
+                    # All listeners are gone: stop watching the dir.
+                    self.unwatch(dir)
+            finally:
+                self._lock.release()
+            log.debug("dir watcher: changed in '%s': %s", dir,
+                      names is None and "everything" or ", ".join(names))
+            for listener in listeners:
+                try:
+                    listener.dir_changed(dir, names)
+                except:
+                    log.exception("ignoring error in %r.dir_changed()",
+                                  listener)
@@ -51,17 +51,20 @@ XXX A separate indexer instance may be used for batch updates of the db.
 # - batch updating (still wanted? probably)
 
 import os, sys
+from os.path import join, exists, dirname
 import threading
 import time
 import bisect
 import Queue
 from hashlib import md5
 import traceback
+import cPickle as pickle
 
 import logging
 
 from codeintel2.common import *
 from codeintel2.buffer import Buffer
+from codeintel2.util import write_file_atomically, load_pickle
 from codeintel2.database.langlib import LangDirsLib
 from codeintel2.database.multilanglib import MultiLangDirsLib
 
@@ -127,6 +130,12 @@ class _Request(object):
     def __init__(self, id=None):
         if id is not None:
             self.id = id
+    def journal_entry(self):
+        """Return a picklable tuple describing this request for the
+        indexer journal (see JournaledRequest), or None if it is not
+        worth resuming in a later process.
+        """
+        return None
 
 
 class _UniqueRequestPriorityQueue(_PriorityQueue):
@@ -144,12 +153,34 @@ class _UniqueRequestPriorityQueue(_PriorityQueue):
     higher priority (and earlier timestamp) to ensure the requestor does
     not starve.
 
+    Requests are not taken in strict (priority, timestamp) order, so
+    that a steady stream of requests of one priority or type (e.g. scans
+    of the buffer under edit) cannot starve the others:
+    - Aging: the effective priority of a request improves by one for
+      every AGING_INTERVAL seconds it has waited, but never beyond
+      PRIORITY_CURRENT. Of the requests with the best effective
+      priority the oldest is taken.
+    - Fairness: after FAIRNESS_QUOTA requests of one type in a row, the
+      next request is of another type, if any is waiting.
+    Control requests are always taken first. PRIORITY_IMMEDIATE requests
+    (the UI is waiting on those) are taken ahead of aged requests, but
+    fairness applies to them too: a steady stream of them lets another
+    request through after every FAIRNESS_QUOTA of them.
+
     Note: This presumes that an "item" is this 3-tuple:
         (<priority-number>, <timestamp>, <_Request instance>)
     """
+    AGING_INTERVAL = 10.0
+    FAIRNESS_QUOTA = 20
+
     def __init__(self, maxsize=0):
         _PriorityQueue.__init__(self, maxsize)
         self._item_from_id = {}
+        self._num_from_type = {}    # number of queued requests per type
+        self._last_type = None      # type of the last request taken...
+        self._num_last_type = 0     # ...and the number in a row of it
+        self._num_aged = 0          # requests taken early due to aging
+        self._num_fairness = 0      # requests taken early due to fairness
 
     def _put(self, item):
         # Remove a possible existing request for the same file (there can
@@ -161,15 +192,111 @@ class _UniqueRequestPriorityQueue(_PriorityQueue):
             self.queue.remove(i)
             p, t, r = i
             item = (min(priority, p), t, request)
+            self._num_from_type[type(r)] -= 1
         # Add the (possibly updated) item to the queue.
         self._item_from_id[id] = item
+        self._num_from_type[type(request)] \
+            = self._num_from_type.get(type(request), 0) + 1
         _PriorityQueue._put(self, item)
 
     def _get(self):
-        item = _PriorityQueue._get(self)
-        del self._item_from_id[item[-1].id]
+        item = self.queue.pop(self._index_to_get())
+        request = item[-1]
+        del self._item_from_id[request.id]
+        self._num_from_type[type(request)] -= 1
+        if type(request) is self._last_type:
+            self._num_last_type += 1
+        else:
+            self._last_type = type(request)
+            self._num_last_type = 1
         return item
 
+    def _index_to_get(self):
+        """Return the index in the (sorted) queue of the item to get."""
+        queue = self.queue
+        if queue[0][0] < PRIORITY_IMMEDIATE:
+            return 0 # control requests go first
+
+        if queue[0][0] == PRIORITY_IMMEDIATE:
+            best_index = 0 # ahead of aged requests
+        else:
+            # The first item for each priority is the oldest one, i.e. the
+            # one with the best effective priority.
+            now = time.time()
+            best_key = best_index = None
+            index = 0
+            while index < len(queue):
+                priority, timestamp, request = queue[index]
+                key = (max(min(priority, PRIORITY_CURRENT),
+                           priority - int((now - timestamp)
+                                          / self.AGING_INTERVAL)),
+                       timestamp)
+                if best_key is None or key < best_key:
+                    best_key, best_index = key, index
+                index = bisect.bisect_left(queue, (priority+1, ), index)
+            if best_index != 0:
+                self._num_aged += 1
+
+        if self._num_last_type >= self.FAIRNESS_QUOTA \
+           and type(queue[best_index][-1]) is self._last_type \
+           and self._num_from_type[self._last_type] < len(queue):
+            for index, (priority, timestamp, request) in enumerate(queue):
+                if type(request) is not self._last_type:
+                    self._num_fairness += 1
+                    return index
+        return best_index
+
+    def snapshot(self):
+        """Return a list of the items in the queue."""
+        self.mutex.acquire()
+        try:
+            return list(self.queue)
+        finally:
+            self.mutex.release()
+
+    def has_request(self, id):
+        """Return true if a request with the given id is queued."""
+        self.mutex.acquire()
+        try:
+            return id in self._item_from_id
+        finally:
+            self.mutex.release()
+
+    def get_stats(self):
+        """Return a dict of metrics about the queue:
+            "depth"             the number of queued requests
+            "depth_by_type"     {<request type name>: <number queued>}
+            "max_age_by_type"   {<request type name>: <seconds the oldest
+                                 request of that type has waited>}
+            "num_aged"          the number of requests taken ahead of a
+                                request of a better priority (aging)
+            "num_fairness"      the number of requests taken ahead of a
+                                request of the type of the previous ones
+                                (fairness)
+        """
+        self.mutex.acquire()
+        try:
+            return self._get_stats()
+        finally:
+            self.mutex.release()
+
+    def _get_stats(self):
+        now = time.time()
+        depth_by_type = {}
+        max_age_by_type = {}
+        for priority, timestamp, request in self.queue:
+            name = type(request).__name__
+            depth_by_type[name] = depth_by_type.get(name, 0) + 1
+            max_age_by_type[name] = max(max_age_by_type.get(name, 0),
+                                        now - timestamp)
+        return {
+            "depth": len(self.queue),
+            "depth_by_type": depth_by_type,
+            "max_age_by_type": max_age_by_type,
+            "num_aged": self._num_aged,
+            "num_fairness": self._num_fairness,
+        }
+
 
 class _StagingRequestQueue(_UniqueRequestPriorityQueue):
     """A thread-safe priority queue for '_Request' objects with delayed
@@ -248,6 +375,35 @@ class _StagingRequestQueue(_UniqueRequestPriorityQueue):
         finally:
             self.mutex.release()
 
+    def snapshot(self):
+        """Return a list of the items in the queue, and of those staged
+        for it.
+        """
+        self.mutex.acquire()
+        try:
+            return list(self.queue) + [item for timeDue, priority, item
+                                       in self._onDeck.values()]
+        finally:
+            self.mutex.release()
+
+    def has_request(self, id):
+        """Return true if a request with the given id is queued or staged
+        for the queue.
+        """
+        self.mutex.acquire()
+        try:
+            return id in self._item_from_id or id in self._onDeck
+        finally:
+            self.mutex.release()
+
+    def _get_stats(self):
+        """Return the metrics of _UniqueRequestPriorityQueue.get_stats(),
+        plus "num_staged": the number of requests on deck.
+        """
+        stats = _UniqueRequestPriorityQueue._get_stats(self)
+        stats["num_staged"] = len(self._onDeck)
+        return stats
+
     def _stagingThread(self):
         """Thread that handles moving requests on-deck to the queue."""
         log.debug("staging thread: start")
@@ -342,6 +498,10 @@ class ScanRequest(_Request):
         return "<ScanRequest %r>" % self.id
     def __str__(self):
         return "scan request '%s' (prio %s)" % (self.buf.path, self.priority)
+    def journal_entry(self):
+        if isUnsavedPath(self.buf.path):
+            return None
+        return ("scan", self.buf.path, self.buf.lang, self.force)
     def complete(self, status):
         """Called by scheduler when this scan is complete (whether or
         not it was successful/skipped/whatever).
@@ -369,6 +529,56 @@ class ScanRequest(_Request):
         self.complete_event.wait(timeout)
 
 
+class BatchScanRequest(_Request):
+    """A request to scan a number of files for codeintel in one batch.
+
+    Like a ScanRequest for each buffer, except that the db indexes of
+    each dir are only updated once for all of the buffers in it (see
+    Citadel.scan_bufs()). Useful for the bulk indexing of a dir.
+
+        "bufs" is the list of CitadelBuffer instances.
+        "priority", "force" and "mtime" are as for ScanRequest and
+            apply to all of the buffers.
+        "id" (optional) identifies the request for staging. By default
+            each batch is unique.
+
+        "status" is set on completion as for a ScanRequest: "changed"
+        if any of the buffers was scanned, else "skipped".
+    """
+    status = None
+    _id_counter = 0
+    def __init__(self, bufs, priority, force=False, mtime=None, id=None):
+        if _xpcom_:
+            bufs = [UnwrapObject(buf) for buf in bufs]
+        self.bufs = bufs
+        if id is None:
+            BatchScanRequest._id_counter += 1
+            id = "batch scan request %d" % BatchScanRequest._id_counter
+        self.id = id
+        self.priority = priority
+        self.force = force
+        if mtime is None:
+            self.mtime = time.time()
+        else:
+            self.mtime = mtime
+        self.complete_event = threading.Event()
+    def __repr__(self):
+        return "<BatchScanRequest %r (%d bufs)>" % (self.id, len(self.bufs))
+    def __str__(self):
+        return "batch scan request of %d files (prio %s)" \
+               % (len(self.bufs), self.priority)
+    def complete(self, status):
+        log.debug("complete %s", self)
+        self.status = status
+        self.complete_event.set()
+    def wait(self, timeout=None):
+        self.complete_event.wait(timeout)
+    def journal_entry(self):
+        return ("batch-scan", [(buf.path, buf.lang) for buf in self.bufs
+                               if not isUnsavedPath(buf.path)],
+                self.force)
+
+
 class PreloadBufLibsRequest(_Request):
     priority = PRIORITY_BACKGROUND    
     def __init__(self, buf):
@@ -392,6 +602,50 @@ class PreloadLibRequest(_Request):
     def __str__(self):
         return "pre-load %s %s (%d dirs)" \
                % (self.lib.lang, self.lib.name, len(self.lib.dirs))
+    def journal_entry(self):
+        return ("preload-lib", _lib_key(self.lib))
+
+class FileChangeRequest(_Request):
+    """A request to bring the db up to date with a file, in a dir of a
+    LangDirsLib or MultiLangDirsLib, that changed on disk (see
+    fswatch.py). "name" is None to check all files in the dir.
+    """
+    priority = PRIORITY_BACKGROUND
+    def __init__(self, lib, dir, name=None):
+        self.lib = lib
+        self.dir = dir
+        self.name = name
+        path = name is None and dir or os.path.join(dir, name)
+        # Per lib: libs of different sublangs may share a dir.
+        self.id = "%s#fs-change-%x" % (path, id(lib))
+    def __repr__(self):
+        return "<FileChangeRequest %r>" % self.id
+    def __str__(self):
+        return "update %s from '%s'" % (self.lib,
+            self.name is None and self.dir or os.path.join(self.dir, self.name))
+    def journal_entry(self):
+        return ("fs-change", _lib_key(self.lib), self.dir, self.name)
+
+class JournaledRequest(_Request):
+    """A request of an earlier process, resumed from the indexer journal
+    (see Indexer.resume_from_journal()).
+
+    It has the id and priority of the original request, so that a new
+    request for the same thing replaces it on the queue. The work is
+    only done for the files that changed since they were last scanned
+    into the db.
+    """
+    def __init__(self, id, priority, entry):
+        self.id = id
+        self.priority = priority
+        self.entry = entry
+    def __repr__(self):
+        return "<JournaledRequest %r>" % self.id
+    def __str__(self):
+        return "resumed %s request %r (prio %s)" \
+               % (self.entry[0], self.id, self.priority)
+    def journal_entry(self):
+        return self.entry
 
 class CullMemRequest(_Request):
     id = "cull memory request"
@@ -448,6 +702,10 @@ class Indexer(threading.Thread):
     MODE_DAEMON, MODE_ONE_SHOT = range(2)
     mode = MODE_DAEMON
 
+    # While there are pending requests, the db is saved and the pending
+    # requests written to the journal every this many seconds.
+    JOURNAL_INTERVAL = 30.0
+
     class StopIndexing(Exception):
         """Used to signal that indexer iteration should stop.
 
@@ -474,6 +732,15 @@ class Indexer(threading.Thread):
         self._stopping = False
         self._resumeEvent = None
 
+        # The journal of pending requests, for a later process to resume
+        # the work if this one exits (or crashes) before it is done.
+        self._journal_path = join(mgr.db.base_dir, "indexer-journal.pickle")
+        self._have_journal = False
+        self._journal_lock = threading.Lock()
+        self._next_journal_time = time.time() + self.JOURNAL_INTERVAL
+        self._curr_request = None
+        self._num_culls_skipped = 0
+
     def finalize(self):
         """Shutdown the indexer.
         
@@ -484,6 +751,8 @@ class Indexer(threading.Thread):
         self._stopping = True
         if isinstance(self._requests, _StagingRequestQueue):
             self._requests.finalize()
+        if self.mode == self.MODE_DAEMON:
+            self._write_journal()
         if self.isAlive():
             self.add_request(IndexerStopRequest())
             try:
@@ -517,6 +786,104 @@ class Indexer(threading.Thread):
         #self._abortMatchingRunner(request.buf.path, request.buf.lang)
         self._requests.put( (request.priority, time.time(), request) )
 
+    def get_stats(self):
+        """Return a dict of metrics about the pending requests: see
+        _UniqueRequestPriorityQueue.get_stats(), plus:
+            "num_culls_skipped" the number of CullMemRequest's not
+                                staged because one was already queued
+                                or staged
+        """
+        stats = self._requests.get_stats()
+        stats["num_culls_skipped"] = self._num_culls_skipped
+        return stats
+
+    def resume_from_journal(self):
+        """Queue the requests left pending by an earlier process, from
+        the journal in the database dir.
+
+        This is called by Manager.initialize(). The resumed requests
+        (JournaledRequest's) are cheap to queue: the files are only
+        read, and compared with the scan times in the db, when each
+        request is handled.
+        """
+        if self.mode != self.MODE_DAEMON or not exists(self._journal_path):
+            return
+        records = load_pickle(self._journal_path, "indexer journal")
+        if not isinstance(records, list):
+            return
+        log.info("resuming %d indexer requests from '%s'", len(records),
+                 self._journal_path)
+        self._have_journal = True
+        # Queue the requests as new: the journaled timestamps can be hours
+        # old and would make them outrank this session's requests (see
+        # _UniqueRequestPriorityQueue aging). They only keep the order of
+        # the resumed requests.
+        records.sort(key=lambda r: r[1])
+        now = time.time()
+        for i, (priority, timestamp, id, entry) in enumerate(records):
+            timestamp = now - (len(records) - i) * 1e-6
+            self._requests.put(
+                (priority, timestamp, JournaledRequest(id, priority, entry)))
+
+    def _write_journal(self):
+        """Write the pending requests that are worth resuming to the
+        journal -- or remove it if there are none.
+        """
+        self._journal_lock.acquire()
+        try:
+            self._write_journal_locked()
+        finally:
+            self._journal_lock.release()
+
+    def _write_journal_locked(self):
+        items = self._requests.snapshot()
+        curr_request = self._curr_request
+        if curr_request is not None:
+            items.append((curr_request.priority, time.time(), curr_request))
+        records = []
+        for priority, timestamp, request in items:
+            entry = request.journal_entry()
+            if entry is not None:
+                records.append((priority, timestamp, request.id, entry))
+        if not records and not self._have_journal:
+            return
+        try:
+            if not records:
+                log.debug("fs-write: remove indexer journal")
+                os.remove(self._journal_path)
+                self._have_journal = False
+                return
+            if not exists(dirname(self._journal_path)):
+                return
+            log.debug("fs-write: indexer journal (%d requests)", len(records))
+            write_file_atomically(self._journal_path,
+                                  pickle.dumps(records, 2))
+            self._have_journal = True
+        except EnvironmentError, ex:
+            log.warn("could not write indexer journal '%s': %s",
+                     self._journal_path, ex)
+
+    def _checkpoint(self):
+        """Every JOURNAL_INTERVAL seconds while there are pending
+        requests, and when the queue has run empty: save the db and
+        journal the pending requests.
+
+        The db is saved first, so that the journal is never behind the
+        db: resuming a request that has been done is cheap (the scan
+        times in the db are checked), but work that is in neither the
+        journal nor the saved db would be lost.
+        """
+        if self.mode != self.MODE_DAEMON:
+            return
+        if self._requests.qsize():
+            if time.time() < self._next_journal_time:
+                return
+        elif not self._have_journal:
+            return
+        self._next_journal_time = time.time() + self.JOURNAL_INTERVAL
+        self.mgr.db.save()
+        self._write_journal()
+
 #XXX re-instate for batch updating (was getNumRequests)
 ##    def num_requests(self):
 ##        return self._requests.qsize()
@@ -528,6 +895,7 @@ class Indexer(threading.Thread):
             while 1:
                 try:
                     self._iteration()
+                    self._checkpoint()
                 except Queue.Empty: # for mode=MODE_ONE_SHOT only
 ##                    reason = "completed"
                     break
@@ -568,6 +936,7 @@ class Indexer(threading.Thread):
             priority, timestamp, request = self._requests.get_nowait()
         #log.debug("indexer: GOT request")
 
+        self._curr_request = request
         try:
             if request.priority == PRIORITY_CONTROL: # sentinel
                 if isinstance(request, IndexerStopRequest):
@@ -596,6 +965,26 @@ class Indexer(threading.Thread):
 
                 buf.scan(mtime=request.mtime)
 
+            elif isinstance(request, BatchScanRequest):
+                # Drop the buffers for which the db is already up-to-date.
+                db = self.mgr.db
+                bufs = request.bufs
+                status = "skipped"
+                if not request.force:
+                    bufs = []
+                    for buf in request.bufs:
+                        scan_time_in_db = db.get_buf_scan_time(buf)
+                        if scan_time_in_db is not None \
+                           and scan_time_in_db > request.mtime:
+                            log.debug("indexer: drop %s from %s: have "
+                                      "up-to-date data in the db", buf,
+                                      request)
+                        else:
+                            bufs.append(buf)
+                if bufs:
+                    self.mgr.citadel.scan_bufs(bufs, mtime=request.mtime)
+                    status = "changed"
+
             elif isinstance(request, XMLParseRequest):
                 request.buf.xml_parse()
 
@@ -616,14 +1005,25 @@ class Indexer(threading.Thread):
                 lib = request.lib
                 assert isinstance(lib, (LangDirsLib, MultiLangDirsLib))
                 lib.ensure_all_dirs_scanned()
+            elif isinstance(request, FileChangeRequest):
+                request.lib.update_from_disk(request.dir, request.name)
+            elif isinstance(request, JournaledRequest):
+                self._handle_journaled_request(request)
 
             if not isinstance(request, CullMemRequest) and self.mode == self.MODE_DAEMON:
                 # we did something; ask for a memory cull after 5 minutes
-                log.debug("staging new cull mem request")
-                self.stage_request(CullMemRequest(), 300)
+                # (unless one is already queued: it will do)
+                if self._requests.has_request(CullMemRequest.id):
+                    self._num_culls_skipped += 1
+                else:
+                    log.debug("staging new cull mem request")
+                    self.stage_request(CullMemRequest(), 300)
             self.mgr.db.report_event(None)
 
         finally:
+            self._curr_request = None
+            if isinstance(request, BatchScanRequest):
+                request.complete(status)
             if isinstance(request, ScanRequest):
                 request.complete(status)
                 if self.on_scan_complete:
@@ -634,9 +1034,53 @@ class Indexer(threading.Thread):
                                       "on_scan_complete callback")
 
 
+    def _handle_journaled_request(self, request):
+        db = self.mgr.db
+        entry = request.entry
+        kind = entry[0]
+        if kind in ("scan", "batch-scan"):
+            if kind == "scan":
+                paths_and_langs, force = [entry[1:3]], entry[3]
+            else:
+                paths_and_langs, force = entry[1:3]
+            bufs = []
+            for path, lang in paths_and_langs:
+                try:
+                    mtime = os.stat(path).st_mtime
+                except EnvironmentError:
+                    continue
+                if not force:
+                    scan_time_in_db = db.get_path_scan_time(path, lang)
+                    if scan_time_in_db is not None \
+                       and scan_time_in_db >= mtime:
+                        continue
+                try:
+                    bufs.append(self.mgr.buf_from_path(path, lang=lang))
+                except (EnvironmentError, CodeIntelError), ex:
+                    continue
+            log.debug("indexer: %s: %d of %d files to scan", request,
+                      len(bufs), len(paths_and_langs))
+            if bufs:
+                self.mgr.citadel.scan_bufs(bufs)
+        elif kind in ("preload-lib", "fs-change"):
+            lang, name, dirs, sublang = entry[1]
+            lib = db.get_lang_lib(lang, name, dirs, sublang)
+            if kind == "preload-lib":
+                lib.ensure_all_dirs_scanned()
+            else:
+                lib.update_from_disk(entry[2], entry[3])
+        else:
+            log.warn("ignoring unknown journaled indexer request: %r",
+                     entry)
+
+
 
 #---- internal support stuff
 
+def _lib_key(lib):
+    """The arguments to Database.get_lang_lib() for the given lib."""
+    return (lib.lang, lib.name, tuple(lib.dirs), getattr(lib, "sublang", None))
+
 # Recipe: indent (0.2.1) in C:\trentm\tm\recipes\cookbook
 def _indent(s, width=4, skip_first_line=False):
     """_indent(s, [width=4]) -> 's' indented by 'width' spaces
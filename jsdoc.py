@@ -544,6 +544,27 @@ class JSDoc:
         return self.attributes & self.A___LOCAL__
 
 
+# Parsed JSDoc's by comment text, see parsed_jsdoc(). Library code (and
+# a buffer being edited, rescanned on every change) has the same comments
+# parsed over and over.
+_jsdoc_from_comment = {}
+_JSDOC_CACHE_MAX_SIZE = 2000
+
+def parsed_jsdoc(comment):
+    """Return a JSDoc for the given comment.
+
+    The returned JSDoc is shared by all users of the same comment text: it
+    must not be modified (copy it first, see copy.copy()).
+    """
+    jsdoc = _jsdoc_from_comment.get(comment)
+    if jsdoc is None:
+        jsdoc = JSDoc(comment)
+        if len(_jsdoc_from_comment) >= _JSDOC_CACHE_MAX_SIZE:
+            _jsdoc_from_comment.clear()
+        _jsdoc_from_comment[comment] = jsdoc
+    return jsdoc
+
+
 ############################################################
 #                       Test code                          #
 ############################################################
@@ -67,10 +67,6 @@ from codeintel2.util import (OrdPunctLast, make_short_name_dict,
 from codeintel2.langintel import LangIntel, ParenStyleCalltipIntelMixin
 from codeintel2.udl import UDLBuffer, is_udl_css_style
 from codeintel2.accessor import AccessorCache
-from codeintel2 import constants_css3 as constants_css
-from codeintel2 import constants_css_microsoft_extensions
-from codeintel2 import constants_css_moz_extensions
-from codeintel2 import constants_css_webkit_extensions
 
 if _xpcom_:
     from xpcom.server import UnwrapObject
@@ -419,30 +415,36 @@ class _UDLCSSStyleClassifier(_StraightCSSStyleClassifier):
 StraightCSSStyleClassifier = _StraightCSSStyleClassifier()
 UDLCSSStyleClassifier      = _UDLCSSStyleClassifier()
 
+class _CSSTable(object):
+    """A CSSLangIntel attribute for one of the tables of
+    constants_css_tables, which is imported on first use.
+    """
+    def __init__(self, name):
+        self.name = name
+    def __get__(self, obj, cls=None):
+        from codeintel2 import constants_css_tables
+        return getattr(constants_css_tables, self.name)
+
 class CSSLangIntel(LangIntel, ParenStyleCalltipIntelMixin):
     lang = "CSS"
 
+    # The property/value tables (see constants_css_tables.py) are only
+    # loaded on first use.
     # CSS attributes:
     #     key (string) is the css property (attribute) name
-    #     value (list) is the possible css property (attribute) values
-    CSS_ATTRIBUTES = constants_css.CSS_ATTR_DICT.copy()
-    CSS_ATTRIBUTES.update(constants_css_microsoft_extensions.CSS_MICROSOFT_SPECIFIC_ATTRS_DICT)
-    CSS_ATTRIBUTES.update(constants_css_moz_extensions.CSS_MOZ_SPECIFIC_ATTRS_DICT)
-    CSS_ATTRIBUTES.update(constants_css_webkit_extensions.CSS_WEBKIT_SPECIFIC_ATTRS_DICT)
+    #     value (tuple) is the possible css property (attribute) values
+    CSS_ATTRIBUTES = _CSSTable("CSS_ATTRIBUTES")
     # Setup the names triggered for "property-names"
-    CSS_PROPERTY_NAMES = sorted(CSS_ATTRIBUTES.keys(), key=OrdPunctLast)
+    CSS_PROPERTY_NAMES = _CSSTable("CSS_PROPERTY_NAMES")
 
     # Calltips for css property attributes
-    CSS_PROPERTY_ATTRIBUTE_CALLTIPS_DICT = constants_css.CSS_PROPERTY_ATTRIBUTE_CALLTIPS_DICT.copy()
-    CSS_PROPERTY_ATTRIBUTE_CALLTIPS_DICT.update(constants_css_microsoft_extensions.CSS_MICROSOFT_SPECIFIC_CALLTIP_DICT)
-    CSS_PROPERTY_ATTRIBUTE_CALLTIPS_DICT.update(constants_css_moz_extensions.CSS_MOZ_SPECIFIC_CALLTIP_DICT)
-    CSS_PROPERTY_ATTRIBUTE_CALLTIPS_DICT.update(constants_css_webkit_extensions.CSS_WEBKIT_SPECIFIC_CALLTIP_DICT)
+    CSS_PROPERTY_ATTRIBUTE_CALLTIPS_DICT = _CSSTable("CSS_PROPERTY_ATTRIBUTE_CALLTIPS_DICT")
 
     # Tag names
     CSS_HTML_TAG_NAMES = sorted(Keywords.hypertext_elements.split())
 
     # pseudo-class-names
-    CSS_PSEUDO_CLASS_NAMES = sorted(constants_css.CSS_PSEUDO_CLASS_NAMES, key=OrdPunctLast)
+    CSS_PSEUDO_CLASS_NAMES = _CSSTable("CSS_PSEUDO_CLASS_NAMES")
 
     # at rules
     CSS_AT_RULE_NAMES = sorted(["import", "media", "charset", "font-face", "page", "namespace"],
@@ -831,17 +833,12 @@ class CSSLangIntel(LangIntel, ParenStyleCalltipIntelMixin):
                                                               values)
                 try:
                     #print "\ndict:", self.CSS_ATTRIBUTES[property]
-                    property_values = sorted(self.CSS_ATTRIBUTES[property],
-                                             key=OrdPunctLast)
-                    # Check if it matches anything, if not, dismiss the list
-                    if current_value:
-                        clen = len(current_value)
-                        for v in property_values:
-                            if clen <= len(v) and current_value == v[:clen]:
-                                # Found a match
-                                break
-                        # Else, return the full list, even though no match made
-                        # XXX - May want to cancel the CC list, any way to do this?
+                    # Already in completion order.
+                    property_values = self.CSS_ATTRIBUTES[property]
+                    # XXX - May want to cancel the CC list when the current
+                    #       value doesn't match any of them, any way to do
+                    #       this? For now return the full list.
+                    values = set(values)
                     cplns = [("value", v)
                              for v in property_values
                              if v not in values or v == current_value]
@@ -55,6 +55,7 @@ Future ideas and changes for the JavaScript ciler:
 """
 
 import os
+import copy
 from os.path import splitext, basename, exists, dirname, normpath
 import sys
 import types
@@ -85,10 +86,10 @@ from codeintel2.tree_javascript import JavaScriptTreeEvaluator
 from codeintel2 import util
 from codeintel2.common import *
 from codeintel2.indexer import PreloadBufLibsRequest, PreloadLibRequest
-from codeintel2.jsdoc import JSDoc, JSDocParameter, jsdoc_tags
+from codeintel2.jsdoc import JSDoc, JSDocParameter, jsdoc_tags, parsed_jsdoc
 from codeintel2.gencix_utils import *
 from codeintel2.database.langlib import LangDirsLib
-from codeintel2.udl import UDLBuffer, is_udl_csl_style
+from codeintel2.udl import UDLBuffer
 from codeintel2.accessor import AccessorCache, KoDocumentAccessor
 from codeintel2.langintel import (ParenStyleCalltipIntelMixin,
                                   ProgLangTriggerIntelMixin,
@@ -132,6 +133,8 @@ TYPE_OBJECT = 6
 TYPE_CLASS = 7
 TYPE_PARENT = 8
 TYPE_ALIAS = 9
+_type_name_from_type = dict((v, k) for k, v in globals().items()
+                            if k.startswith("TYPE_"))
 
 
 
@@ -702,7 +705,8 @@ class JavaScriptLangIntel(CitadelLangIntel,
             extra_dirs = tuple(
                 util.gen_dirs_under_dirs(extra_dirs,
                     max_depth=max_depth,
-                    interesting_file_patterns=js_assocs)
+                    interesting_file_patterns=js_assocs,
+                    dir_cache=self.mgr.db.dir_listing_cache)
             )
         else:
             extra_dirs = () # ensure retval is a tuple
@@ -925,28 +929,17 @@ class JavaScriptImportHandler(ImportHandler):
 
         TODO: log the fs-stat'ing a la codeintel.db logging.
         """
-        from os.path import join, isdir, splitext
+        from os.path import splitext
 
         if dir == "<Unsaved>":
             #TODO: stop these getting in here.
             return {}
 
         #TODO: log the fs-stat'ing a la codeintel.db logging.
-        try:
-            names = os.listdir(dir)
-        except OSError, ex:
+        listing = self._listing_of_dir(dir)
+        if listing is None:
             return {}
-        dirs, nondirs = set(), set()
-        for name in names:
-            try:
-                if isdir(join(dir, name)):
-                    dirs.add(name)
-                else:
-                    nondirs.add(name)
-            except UnicodeDecodeError:
-                # Hit a filename that cannot be encoded in the default encoding.
-                # Just skip it. (Bug 82268)
-                pass
+        dirs, nondirs = listing
 
         importables = {}
         for name in nondirs:
@@ -979,9 +972,11 @@ class JavaScriptCILEDriver(CILEDriver):
         # Profiling code: BEGIN
         #import hotshot, hotshot.stats
         #profiler = hotshot.Profile("%s.prof" % (__file__))
-        #profiler.runcall(jscile.scan_puretext, buf.accessor.text)
+        #profiler.runcall(jscile.scan_tokens, buf.accessor.gen_tokens())
         # Profiling code: END
-        jscile.scan_puretext(buf.accessor.text)
+        # The buffer has already been lexed (or will be, for triggers
+        # anyway): use its tokens.
+        jscile.scan_tokens(buf.accessor.gen_tokens())
 
         tree = createCixRoot()
         jscile.convertToElementTreeFile(tree, file_lang=self.lang)
@@ -1008,15 +1003,9 @@ class JavaScriptCILEDriver(CILEDriver):
                               stringStyles=(SCE_UDL_CSL_STRING, ),
                               numberStyle=SCE_UDL_CSL_NUMBER,
                               commentStyles=jscile.UDL_COMMENT_STYLES)
-        for token in buf.accessor.gen_tokens():
-            # The tokens can be a generator of mixed UDL tokens (CSL, SSL, CSS
-            # etc.). Need to parse out the tokens that are not CSL.
-            if is_udl_csl_style(token['style']):
-                jscile.token_next(**token)
-        # Ensure we take notice of any text left in the ciler
-        jscile._endOfScanReached()
-        # We've parsed up the JavaScript, fix any variables types
-        jscile.cile.updateAllScopeNames()
+        # The tokens can be a generator of mixed UDL tokens (CSL, SSL, CSS
+        # etc.): scan_tokens() only looks at the (CSL) styles set above.
+        jscile.scan_tokens(buf.accessor.gen_tokens())
 
         tree = createCixRoot()
         jscile.convertToElementTreeFile(tree, file_lang=buf.lang, module_lang=self.lang)
@@ -1039,12 +1028,7 @@ class JavaScriptCILEDriver(CILEDriver):
                               stringStyles=(SCE_UDL_CSL_STRING, ),
                               numberStyle=SCE_UDL_CSL_NUMBER,
                               commentStyles=jscile.UDL_COMMENT_STYLES)
-        for csl_token in csl_tokens:
-            jscile.token_next(**csl_token)
-        # Ensure we take notice of any text left in the ciler
-        jscile._endOfScanReached()
-        # We've parsed up the JavaScript, fix any variables types
-        jscile.cile.updateAllScopeNames()
+        jscile.scan_tokens(csl_tokens)
         jscile.convertToElementTreeModule(blob_elem)
 
 
@@ -1093,10 +1077,24 @@ class JSObject:
             self.attributes.append("private")
 
         self.doc = doc
-        self.jsdoc = None
+        # The doc list is turned into a JSDoc object on first use of
+        # `self.jsdoc', most are only needed for the cix. The ciler keeps
+        # adding to the doc list: use what it is now. The JSDoc is shared
+        # with other objects having the same comment (see parsed_jsdoc()).
         if self.doc:
-            # Turn the doc list into a JSDoc object
-            self.jsdoc = JSDoc("".join(self.doc))
+            self._jsdoc_comment = "".join(self.doc)
+        else:
+            self._jsdoc_comment = None
+
+    def _get_jsdoc(self):
+        if self._jsdoc_comment:
+            jsdoc = parsed_jsdoc(self._jsdoc_comment)
+        else:
+            jsdoc = None
+        # Shadows this property from now on, as does assigning `.jsdoc'.
+        self.__dict__["jsdoc"] = jsdoc
+        return jsdoc
+    jsdoc = property(_get_jsdoc)
 
     def setParent(self, parent):
         # Validate the parent/child relationship. This is to avoid possible
@@ -2103,7 +2101,7 @@ class JavaScriptCiler:
         if not jsdoc_says_class and self.last_comment_and_jsdoc[0]:
             last_jsdoc = self.last_comment_and_jsdoc[1]
             if last_jsdoc is None:
-                last_jsdoc = JSDoc("".join(self.last_comment_and_jsdoc[0]))
+                last_jsdoc = parsed_jsdoc("".join(self.last_comment_and_jsdoc[0]))
                 self.last_comment_and_jsdoc[1] = last_jsdoc
                 if last_jsdoc.isClass() and \
                    fn.name == last_jsdoc.classname:
@@ -2510,6 +2508,8 @@ class JavaScriptCiler:
         if jsfunc.jsdoc and jsfunc.jsdoc.baseclasses:
             for baseclass in jsfunc.jsdoc.baseclasses:
                 jsclass.addClassRef(baseclass)
+            # The JSDoc is shared, see parsed_jsdoc().
+            jsfunc.jsdoc = copy.copy(jsfunc.jsdoc)
             jsfunc.jsdoc.baseclasses = []
         return jsclass
 
@@ -3215,8 +3215,7 @@ class JavaScriptCiler:
                     if len(typeNames) < 1 or len(typeNames) == 1 and typeNames[0] in known_javascript_types:
                         # "alias" to a primitive
                         varType = TYPE_VARIABLE
-                varType_mapping = dict([(v, k) for k,v in globals().items() if k.startswith("TYPE_")])
-                log.debug("_variableHandler:: varType:%r, typeNames:%r, args:%r, p: %d", varType_mapping.get(varType, varType), typeNames, args, p)
+                log.debug("_variableHandler:: varType:%r, typeNames:%r, args:%r, p: %d", _type_name_from_type.get(varType, varType), typeNames, args, p)
                 if varType == TYPE_FUNCTION:
                     if addToClass:
                         log.debug("_variableHandler:: Line %d, class function: %r(%r)",
@@ -3748,7 +3747,7 @@ class JavaScriptCiler:
         """Determine from the text (a namelist) what scope the text is referring
         to. Returns the scope found or None.
         """
-        log.debug("_findScopeFromContext: %r" % (text, ))
+        log.debug("_findScopeFromContext: %r", text)
         scope = None
         try:
             idx = text.index("prototype")
@@ -3988,11 +3987,29 @@ class JavaScriptCiler:
 
     def scan_puretext(self, content, updateAllScopeNames=True):
         """Scan the given pure javascript content"""
-
-        #XXX Should eventually use lang_javascript.JavaScriptLexer()
-        #    because (1) it's word lists might differ and (2) the
-        #    codeintel system manages one instance of it.
-        JavaScriptLexer(self.mgr).tokenize_by_style(content, self.token_next)
+        # Use the lexer the Manager keeps for this language.
+        lexer = self.mgr.silvercity_lexer_from_lang.get(self.lang)
+        if lexer is None:
+            lexer = JavaScriptLexer(self.mgr)
+        self.scan_tokens(lexer.tokenize_by_style(content),
+                         updateAllScopeNames)
+
+    def scan_tokens(self, tokens, updateAllScopeNames=True):
+        """Scan the given pure javascript tokens, e.g. the already lexed
+        tokens of a buffer (`buf.accessor.gen_tokens()`).
+        """
+        token_next = self.token_next
+        # Only these tokens are of interest to token_next(): most of the
+        # others are whitespace.
+        scanned_styles = set(self.JS_CILE_STYLES + self.JS_COMMENT_STYLES)
+        for token in tokens:
+            style = token["style"]
+            if style in scanned_styles:
+                token_next(style, token["text"], token["start_column"],
+                           token["start_line"])
+        self._endOfTokensReached(updateAllScopeNames)
+
+    def _endOfTokensReached(self, updateAllScopeNames=True):
         # Ensure we take notice of any text left in the ciler
         self._endOfScanReached()
         if updateAllScopeNames:
@@ -264,13 +264,19 @@ class NodeJSLangIntel(JavaScriptLangIntel):
         if not os.path.exists(executable):
             log.info("Node.js executable %s does not exist", executable)
             return None
-        p = process.ProcessOpen([executable, "--version"],
-                                env=env.get_all_envvars(), stdin=None)
-        stdout, stderr = p.communicate()
-        if p.returncode != 0:
-            log.info("Failed to find Node.js version: %r: %s",
-                     p.returncode, stderr)
-            return None # Failed to run
+        # The output is cached on disk (see probecache.py), so the Node.js
+        # is only run again when it has changed.
+        probe_cache = self.mgr.db.interpreter_probe_cache
+        stdout = probe_cache.get(executable, "--version", {})
+        if stdout is None:
+            p = process.ProcessOpen([executable, "--version"],
+                                    env=env.get_all_envvars(), stdin=None)
+            stdout, stderr = p.communicate()
+            if p.returncode != 0:
+                log.info("Failed to find Node.js version: %r: %s",
+                         p.returncode, stderr)
+                return None # Failed to run
+            probe_cache.put(executable, "--version", {}, stdout)
         version = stdout.lstrip("v")
         short_ver = ".".join(version.split(".", 2)[:2])
         return short_ver
@@ -1033,6 +1033,9 @@ class PerlLangIntel(CitadelLangIntel,
             (<version>, <config_dirs>, <import_path>)
         where <config_dirs> is a dict with (relevant) dirs from
         Config.pm.
+
+        The output is cached on disk (see probecache.py), so the Perl is
+        only run again when it has changed.
         """
         import process
 
@@ -1044,20 +1047,30 @@ class PerlLangIntel(CitadelLangIntel,
                     r'print "vendorarch:$Config{vendorarch}\n";'
                     r'print "vendorlib:$Config{vendorlib}\n";'
                     r'print join("\n", @INC);')
-        argv = [perl, "-e", info_cmd]
-        log.debug("run `%s -e ...'", perl)
-        p = process.ProcessOpen(argv, env=env.get_all_envvars(), stdin=None)
-        stdout, stderr = p.communicate()
-        stdout_lines = stdout.splitlines(0)
-        retval = p.returncode
-        if retval:
-            log.warn("failed to determine Perl info:\n"
-                     "  path: %s\n"
-                     "  retval: %s\n"
-                     "  stdout:\n%s\n"
-                     "  stderr:\n%s\n",
-                     perl, retval, indent('\n'.join(stdout_lines)),
-                     indent(stderr))
+        envvars = env.get_all_envvars()
+        info_envvars = dict((name, envvars.get(name))
+                            for name in ("PERL5LIB", "PERLLIB"))
+        probe_cache = self.mgr.db.interpreter_probe_cache
+        stdout = probe_cache.get(perl, info_cmd, info_envvars)
+        if stdout is not None:
+            stdout_lines = stdout.splitlines(0)
+        else:
+            argv = [perl, "-e", info_cmd]
+            log.debug("run `%s -e ...'", perl)
+            p = process.ProcessOpen(argv, env=envvars, stdin=None)
+            stdout, stderr = p.communicate()
+            stdout_lines = stdout.splitlines(0)
+            retval = p.returncode
+            if retval:
+                log.warn("failed to determine Perl info:\n"
+                         "  path: %s\n"
+                         "  retval: %s\n"
+                         "  stdout:\n%s\n"
+                         "  stderr:\n%s\n",
+                         perl, retval, indent('\n'.join(stdout_lines)),
+                         indent(stderr))
+            else:
+                probe_cache.put(perl, info_cmd, info_envvars, stdout)
 
         perl_ver = stdout_lines[0].split(':', 1)[1]
         config_dirs = dict(
@@ -1335,23 +1348,17 @@ class PerlImportHandler(ImportHandler):
         - Keep non-capitalized dirs and modules (e.g. want "strict" in
           cplns for "use <|>").
         """
-        from os.path import join, isdir, splitext
+        from os.path import splitext
 
         if dir == "<Unsaved>":
             #TODO: stop these getting in here.
             return {}
 
         #TODO: log the fs-stat'ing a la codeintel.db logging.
-        try:
-            names = os.listdir(dir)
-        except OSError, ex:
+        listing = self._listing_of_dir(dir)
+        if listing is None:
             return {}
-        dirs, nondirs = set(), set()
-        for name in names:
-            if isdir(join(dir, name)):
-                dirs.add(name)
-            else:
-                nondirs.add(name)
+        dirs, nondirs = listing
 
         importables = {}
         dirs.discard("auto")
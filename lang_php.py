@@ -51,6 +51,7 @@ import time
 import warnings
 from cStringIO import StringIO
 import weakref
+import operator
 from glob import glob
 
 from SilverCity.ScintillaConstants import (SCE_UDL_SSL_DEFAULT,
@@ -942,6 +943,9 @@ class PHPLangIntel(CitadelLangIntel, ParenStyleCalltipIntelMixin,
         """Call the given PHP and return:
             (<version>, <include_path>)
         Returns (None, []) if could not determine.
+
+        The output is cached on disk (see probecache.py), so the PHP is
+        only run again when it, or its php.ini files, have changed.
         """
         import process
         import tempfile
@@ -953,6 +957,10 @@ class PHPLangIntel(CitadelLangIntel, ParenStyleCalltipIntelMixin,
                     + r'echo("%s\n");' % marker
                     + r'echo(phpversion()."\n");'
                     + r'echo(ini_get("include_path")."\n");'
+                    + r'if (function_exists("php_ini_loaded_file")) {'
+                    + r'  echo(php_ini_loaded_file()."\n");'
+                    + r'  echo(str_replace("\n", "", php_ini_scanned_files())."\n");'
+                    + r'}'
                     + r' ?>')
         
         argv = [php]
@@ -960,28 +968,44 @@ class PHPLangIntel(CitadelLangIntel, ParenStyleCalltipIntelMixin,
         php_ini_path = env.get_pref("phpConfigFile")
         if php_ini_path:
             envvars["PHPRC"] = php_ini_path
+        info_envvars = dict((name, envvars.get(name))
+                            for name in ("PHPRC", "PHP_INI_SCAN_DIR"))
 
-        fd, filepath = tempfile.mkstemp(suffix=".php")
-        try:
-            os.write(fd, info_cmd)
-            os.close(fd)
-            argv.append(filepath)
-            p = process.ProcessOpen(argv, env=env.get_all_envvars())
-            stdout, stderr = p.communicate()
-        finally:
-            os.remove(filepath)
-
-        stdout_lines = stdout.splitlines(0)
-        retval = p.returncode
-        if retval:
-            log.warn("failed to determine PHP info:\n"
-                     "  path: %s\n"
-                     "  retval: %s\n"
-                     "  stdout:\n%s\n"
-                     "  stderr:\n%s\n",
-                     php, retval, util.indent('\n'.join(stdout_lines)),
-                     util.indent(stderr))
-            return None, []
+        probe_cache = self.mgr.db.interpreter_probe_cache
+        stdout = probe_cache.get(php, info_cmd, info_envvars)
+        if stdout is not None:
+            stdout_lines = stdout.splitlines(0)
+        else:
+            fd, filepath = tempfile.mkstemp(suffix=".php")
+            try:
+                os.write(fd, info_cmd)
+                os.close(fd)
+                argv.append(filepath)
+                p = process.ProcessOpen(argv, env=envvars)
+                stdout, stderr = p.communicate()
+            finally:
+                os.remove(filepath)
+
+            stdout_lines = stdout.splitlines(0)
+            retval = p.returncode
+            if retval:
+                log.warn("failed to determine PHP info:\n"
+                         "  path: %s\n"
+                         "  retval: %s\n"
+                         "  stdout:\n%s\n"
+                         "  stderr:\n%s\n",
+                         php, retval, util.indent('\n'.join(stdout_lines)),
+                         util.indent(stderr))
+                return None, []
+            # The include_path comes from the loaded php.ini files.
+            ini_lines = stdout_lines[stdout_lines.index(marker)+3:]
+            ini_paths = [path.strip()
+                         for path in ",".join(ini_lines).split(",")
+                         if path.strip()]
+            if php_ini_path:
+                ini_paths.append(php_ini_path)
+            probe_cache.put(php, info_cmd, info_envvars, stdout,
+                            dep_paths=ini_paths)
 
         stdout_lines = stdout_lines[stdout_lines.index(marker)+1:]
         php_ver = stdout_lines[0]
@@ -1008,7 +1032,8 @@ class PHPLangIntel(CitadelLangIntel, ParenStyleCalltipIntelMixin,
             extra_dirs = tuple(
                 util.gen_dirs_under_dirs(extra_dirs,
                     max_depth=max_depth,
-                    interesting_file_patterns=php_assocs)
+                    interesting_file_patterns=php_assocs,
+                    dir_cache=self.mgr.db.dir_listing_cache)
             )
         else:
             extra_dirs = () # ensure retval is a tuple
@@ -1072,7 +1097,8 @@ class PHPLangIntel(CitadelLangIntel, ParenStyleCalltipIntelMixin,
                 include_dirs = tuple(
                     util.gen_dirs_under_dirs(include_dirs,
                         max_depth=max_depth,
-                        interesting_file_patterns=php_assocs)
+                        interesting_file_patterns=php_assocs,
+                        dir_cache=db.dir_listing_cache)
                 )
                 if include_dirs:
                     libs.append( db.get_lang_lib("PHP", "inilib",
@@ -1247,36 +1273,20 @@ class PHPImportHandler(ImportHandler):
 
         TODO: log the fs-stat'ing a la codeintel.db logging.
         """
-        from os.path import join, isdir
-        from fnmatch import fnmatch
-
         if dir == "<Unsaved>":
             #TODO: stop these getting in here.
             return {}
 
-        try:
-            names = os.listdir(dir)
-        except OSError, ex:
+        listing = self._listing_of_dir(dir)
+        if listing is None:
             return {}
-        dirs, nondirs = set(), set()
-        for name in names:
-            try:
-                if isdir(join(dir, name)):
-                    dirs.add(name)
-                else:
-                    nondirs.add(name)
-            except UnicodeDecodeError:
-                # Hit a filename that cannot be encoded in the default encoding.
-                # Just skip it. (Bug 82268)
-                pass
+        dirs, nondirs = listing
 
         importables = {}
         patterns = self.mgr.env.assoc_patterns_from_lang("PHP")
+        is_php_file = util.patterns_re(patterns).match
         for name in nondirs:
-            for pattern in patterns:
-                if fnmatch(name, pattern):
-                    break
-            else:
+            if not is_php_file(name):
                 continue
             if name in dirs:
                 importables[name] = (name, None, True)
@@ -1366,15 +1376,8 @@ TYPE_CLASS = 7
 TYPE_PARENT = 8
 
 
-def _sortByLineCmp(val1, val2):
-    try:
-    #if hasattr(val1, "line") and hasattr(val2, "line"):
-        return cmp(val1.linestart, val2.linestart)
-    except AttributeError:
-        return cmp(val1, val2)
-
 def sortByLine(seq):
-    seq.sort(_sortByLineCmp)
+    seq.sort(key=operator.attrgetter("linestart"))
     return seq
 
 
@@ -1610,7 +1613,21 @@ class PHPFunction:
         for v in self.variables.values():
             v.toElementTree(cixelement)
 
-class PHPInterface:
+class _LazyDocMixin:
+    """The doc comment (`self._doc_comment') is only uncommented on first
+    use of `self.doc', most are only needed for the cix.
+    """
+    def _get_doc(self):
+        if self._doc_comment:
+            doc = uncommentDocString(self._doc_comment)
+        else:
+            doc = None
+        # Shadows this property from now on, as does assigning `.doc'.
+        self.__dict__["doc"] = doc
+        return doc
+    doc = property(_get_doc)
+
+class PHPInterface(_LazyDocMixin):
     def __init__(self, name, extends, lineno, depth, doc=None):
         self.name = name
         self.extends = extends
@@ -1621,9 +1638,7 @@ class PHPInterface:
         self.members = {} # declared class variables
         self.variables = {} # all variables used in class
         self.functions = {}
-        self.doc = None
-        if doc:
-            self.doc = uncommentDocString(doc)
+        self._doc_comment = doc
 
     def __repr__(self):
         # dump our contents to human readable form
@@ -1675,7 +1690,7 @@ class PHPInterface:
         for v in sortByLine(allValues):
             v.toElementTree(cixelement)
 
-class PHPClass:
+class PHPClass(_LazyDocMixin):
 
     cixtype = "CLASS"
     # PHPDoc magic property sniffer.
@@ -1703,11 +1718,12 @@ class PHPClass:
             self.attributes = ' '.join(attributes)
         else:
             self.attributes = None
-        self.doc = None
-        if doc:
-            if isinstance(doc, list):
-                doc = "".join(doc)
-            self.doc = uncommentDocString(doc)
+        if isinstance(doc, list):
+            doc = "".join(doc)
+        self._doc_comment = doc
+        # The magic members are needed now, the doc is otherwise uncommented
+        # lazily.
+        if doc and ("@property" in doc or "@method" in doc):
             if self.doc.find("@property") >= 0:
                 all_matches = re.findall(self._re_magic_property, self.doc)
                 for match in all_matches:
@@ -1840,7 +1856,7 @@ def qualifyNamespacePath(namespace_path):
     # Ensure the namespace does not begin or end with a backslash.
     return namespace_path.strip("\\")
 
-class PHPNamespace:
+class PHPNamespace(_LazyDocMixin):
     def __init__(self, name, lineno, depth, doc=None):
         assert not name.startswith("\\")
         assert not name.endswith("\\")
@@ -1848,9 +1864,7 @@ class PHPNamespace:
         self.linestart = lineno
         self.lineend = None
         self.depth = depth
-        self.doc = None
-        if doc:
-            self.doc = uncommentDocString(doc)
+        self._doc_comment = doc
         
         self.functions = {} # functions declared in file
         self.classes = {} # classes declared in file
@@ -2029,9 +2043,13 @@ class PHPParser:
         self.csl_tokens = []
         self.lineno = 0
         self.depth = 0
+        # The tokens of the current statement: these lists are reused
+        # for all statements, see _resetState().
         self.styles = []
         self.linenos = []
         self.text = []
+        # Whether self.text has a "case" or "default" keyword.
+        self._text_has_case = False
         self.comment = None
         self.comments = []
         self.heredocMarker = None
@@ -2049,6 +2067,10 @@ class PHPParser:
         self.PHP_OPERATOR    = SCE_UDL_SSL_OPERATOR
         self.PHP_STRINGS     = (SCE_UDL_SSL_STRING,)
         self.PHP_NUMBER      = SCE_UDL_SSL_NUMBER
+        # The styles of the tokens gathered for _addCodePiece().
+        self._code_styles = frozenset((self.PHP_WORD, self.PHP_IDENTIFIER,
+                                       self.PHP_OPERATOR, self.PHP_NUMBER,
+                                       self.PHP_VARIABLE) + self.PHP_STRINGS)
 
         # XXX bug 44775
         # having the next line after scanData below causes a crash on osx
@@ -2143,7 +2165,7 @@ class PHPParser:
                      self.currentClass.name, self.currentClass.extends, 
                      self.currentClass.interfaces, self.currentClass.attributes,
                      self.currentClass.linestart, self.filename, self.depth,
-                     self.currentClass.doc)
+                     self.currentClass._doc_comment)
         else:
             # shouldn't ever get here
             pass
@@ -3113,11 +3135,13 @@ class PHPParser:
 
     def _resetState(self, newstate=S_DEFAULT):
         self.state = newstate
-        self.styles = []
-        self.linenos = []
-        self.text = []
+        # Clear the scratch lists in place: token_next() holds on to them.
+        del self.styles[:]
+        del self.linenos[:]
+        del self.text[:]
+        self._text_has_case = False
         self.comment = None
-        self.comments = []
+        del self.comments[:]
 
     def token_next(self, style, text, start_column, start_line, **other_args):
         """Loops over the styles in the document and stores important info.
@@ -3145,9 +3169,7 @@ class PHPParser:
             else:
                 log.debug("ignoring heredoc material")
 
-        elif (style in (self.PHP_WORD, self.PHP_IDENTIFIER,
-                      self.PHP_OPERATOR, self.PHP_NUMBER, self.PHP_VARIABLE) or
-            style in (self.PHP_STRINGS)):
+        elif style in self._code_styles:
             # We keep track of these styles and the text associated with it.
             # When we gather enough info, these will be sent to the
             # _addCodePiece() function which will analyze the info.
@@ -3162,6 +3184,8 @@ class PHPParser:
                     self.text.append(text)
                     self.styles.append(style)
                     self.linenos.append(self.lineno)
+                    if text == "case" or text == "default":
+                        self._text_has_case = True
                     #print "Text:", text
             else:
                 # Do heredoc parsing, since UDL cannot as yet
@@ -3187,15 +3211,14 @@ class PHPParser:
                 elif text.endswith("<%"):
                     text = text[:-len("%>")]
 
-                col = start_column + 1
-                #for op in text:
-                #    self.styles.append(style)
-                #    self.text.append(op)
                 #log.debug("token_next: line %d, %r" % (self.lineno, text))
+                styles = self.styles
+                linenos = self.linenos
+                text_list = self.text
                 for op in text:
-                    self.styles.append(style)
-                    self.text.append(op)
-                    self.linenos.append(self.lineno)
+                    styles.append(style)
+                    text_list.append(op)
+                    linenos.append(self.lineno)
                     if op == "(":
                         # We can start defining arguments now
                         #log.debug("Entering S_IN_ARGS state")
@@ -3214,30 +3237,29 @@ class PHPParser:
                         self.incBlock()
                     elif op == "}":
                         # Decreasing depth/scope
-                        if len(self.text) == 1:
+                        if len(text_list) == 1:
                             self._resetState()
                         else:
                             self._addCodePiece()
                         self.decBlock()
                     elif op == ":":
                         # May be an alternative syntax
-                        if len(self.text) > 0 and \
-                           self.styles[0] == self.PHP_WORD and \
-                           self.text[0].lower() in ("if", "elseif", "else", "while", "for", "foreach", "switch"):
-                            #print "Alt syntax? text: %r" % (self.text, )
+                        if len(text_list) > 0 and \
+                           styles[0] == self.PHP_WORD and \
+                           text_list[0].lower() in ("if", "elseif", "else", "while", "for", "foreach", "switch"):
+                            #print "Alt syntax? text: %r" % (text_list, )
                             self._addCodePiece()
-                        elif "case" in self.text or "default" in self.text:
+                        elif self._text_has_case:
                             # Part of a switch statement - bug 86927.
                             self._addCodePiece()
                     elif op == ";":
                         # Statement is done
-                        if len(self.text) > 0 and \
-                           self.styles[0] == self.PHP_WORD and \
-                           self.text[-1].lower() in ("endif", "endwhile", "endfor", "endforeach", "endswitch"):
+                        if len(text_list) > 0 and \
+                           styles[0] == self.PHP_WORD and \
+                           text_list[-1].lower() in ("endif", "endwhile", "endfor", "endforeach", "endswitch"):
                             # Alternative syntax, remove this from the text.
-                            self.text = self.text[:-1]
+                            del text_list[-1]
                         self._addCodePiece()
-                    col += 1
         elif style in self.PHP_COMMENT_STYLES:
             # Use rstrip to remove any trailing spaces or newline characters.
             comment = text.rstrip()
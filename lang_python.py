@@ -46,6 +46,7 @@ import random
 import parser
 from glob import glob
 import weakref
+import threading
 import re
 import imp
 from pprint import pprint, pformat
@@ -60,7 +61,7 @@ from codeintel2.common import *
 from codeintel2.citadel import (CitadelBuffer, CitadelEvaluator, ImportHandler,
                                 CitadelLangIntel)
 from codeintel2.indexer import PreloadLibRequest
-from codeintel2 import pythoncile
+from codeintel2 import pythoncile, pythoncile_ast
 from codeintel2.util import (banner, indent, markup_text, isident, isdigit,
                              makePerformantLogger)
 from codeintel2 import tree
@@ -394,27 +395,46 @@ class PythonLangIntel(CitadelLangIntel, ParenStyleCalltipIntelMixin,
         r"sys.stdout.write(sys.prefix+'\n');"
         r"sys.stdout.write('\n'.join(sys.path));")
 
+    # The envvars affecting the output of `info_cmd'.
+    info_envvar_names = ("PYTHONPATH", "PYTHONHOME", "PYTHONUSERBASE",
+                         "PYTHONNOUSERSITE")
+
     def _python_info_from_python(self, python, env):
         """Call the given Python and return:
             (<version>, <sys.prefix>, <lib-dir>, <site-lib-dir>, <sys.path>)
 
+        The output is cached on disk (see probecache.py), so the Python is
+        only run again when it, or its sys.path dirs, have changed.
+
         TODO: Unicode path issues?
         """
         import process
-        argv = [python, "-c", self.info_cmd]
-        log.debug("run `%s -c ...'", python)
-        p = process.ProcessOpen(argv, env=env.get_all_envvars(), stdin=None)
-        stdout, stderr = p.communicate()
-        stdout_lines = stdout.splitlines(0)
-        retval = p.returncode
-        if retval:
-            log.warn("failed to determine Python info:\n"
-                     "  path: %s\n"
-                     "  retval: %s\n"
-                     "  stdout:\n%s\n"
-                     "  stderr:\n%s\n",
-                     python, retval, indent('\n'.join(stdout_lines)),
-                     indent(stderr))
+        envvars = env.get_all_envvars()
+        info_envvars = dict((name, envvars.get(name))
+                            for name in self.info_envvar_names)
+        probe_cache = self.mgr.db.interpreter_probe_cache
+        stdout = probe_cache.get(python, self.info_cmd, info_envvars)
+        if stdout is not None:
+            stdout_lines = stdout.splitlines(0)
+        else:
+            argv = [python, "-c", self.info_cmd]
+            log.debug("run `%s -c ...'", python)
+            p = process.ProcessOpen(argv, env=envvars, stdin=None)
+            stdout, stderr = p.communicate()
+            stdout_lines = stdout.splitlines(0)
+            retval = p.returncode
+            if retval:
+                log.warn("failed to determine Python info:\n"
+                         "  path: %s\n"
+                         "  retval: %s\n"
+                         "  stdout:\n%s\n"
+                         "  stderr:\n%s\n",
+                         python, retval, indent('\n'.join(stdout_lines)),
+                         indent(stderr))
+            else:
+                # sys.path changes with the .pth files in its dirs.
+                probe_cache.put(python, self.info_cmd, info_envvars, stdout,
+                                dep_paths=[d for d in stdout_lines[2:] if d])
 
         # We are only to rely on the first 2 digits being in the form x.y.
         ver_match = re.search("([0-9]+.[0-9]+)", stdout_lines[0])
@@ -1101,15 +1121,19 @@ class PythonImportHandler(ImportHandler):
         
         importables = {}
         
-        if os.path.isdir(imp_dir):
+        listing = self._listing_of_dir(imp_dir)
+        if listing is not None:
+            dirs, nondirs = listing
             suffixes = dict((s, i) for i, s
                                    in enumerate(self._gen_suffixes(), 1))
             modules = []
-            for name in os.listdir(imp_dir):
+            for name in dirs | nondirs:
                 mod, suffix = os.path.splitext(name)
                 if mod != '__init__':
                     init = os.path.join(name, '__init__.py')
-                    if os.path.exists(os.path.join(imp_dir, init)):
+                    # Checking a sub-dir's listing would cost a stat() too.
+                    if name in dirs and os.path.exists(
+                            os.path.join(imp_dir, init)):
                             modules.append((0, name, (init, '__init__', False)))
                     else:
                         if suffix in suffixes:
@@ -1127,6 +1151,24 @@ class PythonImportHandler(ImportHandler):
 
 class PythonCILEDriver(CILEDriver):
     lang = lang
+    # The Python scanner to use: "ast" (pythoncile_ast) or "compiler" (the
+    # older pythoncile). This can be overridden with the
+    # "codeintel_python_scanner" pref.
+    scanner = "ast"
+
+    def __init__(self, mgr):
+        CILEDriver.__init__(self, mgr)
+        # The pythoncile_ast.IncrementalScanState of the last scan of each
+        # buffer, to only rescan what changed. A state is taken out while
+        # it is used: it must not be shared between scans.
+        self._scan_state_from_buf = weakref.WeakKeyDictionary()
+        self._scan_state_lock = threading.Lock()
+
+    def scanner_module(self, buf):
+        scanner = buf.env.get_pref("codeintel_python_scanner", self.scanner)
+        if scanner == "compiler":
+            return pythoncile
+        return pythoncile_ast
 
     def scan_purelang(self, buf):
         #log.warn("TODO: python cile that uses elementtree")
@@ -1138,7 +1180,23 @@ class PythonCILEDriver(CILEDriver):
             except UnicodeError, ex:
                 raise CodeIntelError("cannot encode Python content as %r (%s)"
                                      % (encoding, ex))
-        el = pythoncile.scan_et(content, buf.path, lang=self.lang)
+        scanner = self.scanner_module(buf)
+        if scanner is not pythoncile_ast:
+            return scanner.scan_et(content, buf.path, lang=self.lang)
+
+        self._scan_state_lock.acquire()
+        try:
+            state = self._scan_state_from_buf.pop(buf, None)
+        finally:
+            self._scan_state_lock.release()
+        el, state = pythoncile_ast.scan_et_incremental(content, buf.path,
+                                                       state, lang=self.lang)
+        if state is not None:
+            self._scan_state_lock.acquire()
+            try:
+                self._scan_state_from_buf[buf] = state
+            finally:
+                self._scan_state_lock.release()
         return el
 
     def scan_binary(self, buf):
@@ -1146,7 +1204,17 @@ class PythonCILEDriver(CILEDriver):
         python = buf.langintel.interpreter_from_env(buf.env)
         if not python:
             raise CodeIntelError("cannot find a usable Python interpreter")
-        cix = pybinary.safe_scan(buf.path, python)
+        # The CIX of an unchanged binary module is reused across
+        # environments and database resets. It cannot be reused if the
+        # version of the interpreter is unknown.
+        python_ver = buf.langintel.python_info_from_env(buf.env)[0]
+        if not python_ver:
+            return tree_from_cix(pybinary.safe_scan(buf.path, python))
+        cache = self.mgr.db.binary_scan_cache
+        cix = cache.get(buf.path, python_ver, pybinary.SCANNER_VERSION)
+        if cix is None:
+            cix = pybinary.safe_scan(buf.path, python)
+            cache.put(buf.path, python_ver, pybinary.SCANNER_VERSION, cix)
         return tree_from_cix(cix)
 
 
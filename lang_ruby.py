@@ -344,26 +344,40 @@ class RubyLangIntel(CitadelLangIntel,
         """Call the given Ruby and return:
             (<version>, <lib-dir>, <site-lib-dir>, <import-dirs>, <gem-dirs>)
 
+        The output of the Ruby is cached on disk (see probecache.py), so it
+        is only run again when it has changed. The gem dirs are looked up
+        each time.
+
         TODO: Unicode path issues?
         """
         import process
 
         # Ruby 1.5.2 does not support sys.version_info.
         info_cmd = "puts RUBY_VERSION; puts $:"
-        argv = [ruby, "-e", info_cmd]
-        log.debug("run `%s -e ...'", ruby)
-        p = process.ProcessOpen(argv, env=env.get_all_envvars(), stdin=None)
-        stdout, stderr = p.communicate()
-        stdout_lines = stdout.splitlines(0)
-        retval = p.returncode
-        if retval:
-            log.warn("failed to determine Ruby info:\n"
-                     "  path: %s\n"
-                     "  retval: %s\n"
-                     "  stdout:\n%s\n"
-                     "  stderr:\n%s\n",
-                     ruby, retval, indent('\n'.join(stdout_lines)),
-                     indent(stderr))
+        envvars = env.get_all_envvars()
+        info_envvars = dict((name, envvars.get(name))
+                            for name in ("RUBYLIB", "RUBYOPT"))
+        probe_cache = self.mgr.db.interpreter_probe_cache
+        stdout = probe_cache.get(ruby, info_cmd, info_envvars)
+        if stdout is not None:
+            stdout_lines = stdout.splitlines(0)
+        else:
+            argv = [ruby, "-e", info_cmd]
+            log.debug("run `%s -e ...'", ruby)
+            p = process.ProcessOpen(argv, env=envvars, stdin=None)
+            stdout, stderr = p.communicate()
+            stdout_lines = stdout.splitlines(0)
+            retval = p.returncode
+            if retval:
+                log.warn("failed to determine Ruby info:\n"
+                         "  path: %s\n"
+                         "  retval: %s\n"
+                         "  stdout:\n%s\n"
+                         "  stderr:\n%s\n",
+                         ruby, retval, indent('\n'.join(stdout_lines)),
+                         indent(stderr))
+            else:
+                probe_cache.put(ruby, info_cmd, info_envvars, stdout)
 
         ruby_ver = stdout_lines[0]
         _ver_parts = ruby_ver.split('.', 2)
@@ -1528,25 +1542,20 @@ class RubyImportHandler(ImportHandler):
         TODO: consider *.so files when have a story for binary modules
               on the fly
         """
-        from os.path import join, isdir, splitext, exists
+        from os.path import join, splitext, exists
 
         if dir == "<Unsaved>":
             #TODO: stop these getting in here.
             return {}
 
-        try:
-            names = os.listdir(dir)
-        except OSError, ex:
+        listing = self._listing_of_dir(dir)
+        if listing is None:
             return {}
-        dirs, nondirs = set(), set()
-        for name in names:
-            if isdir(join(dir, name)):
-                if '-' in name and exists(join(dir, name, "rbconfig.rb")):
-                    # Looks like a plat dir: skip it.
-                    continue
-                dirs.add(name)
-            else:
-                nondirs.add(name)
+        dirs, nondirs = listing
+        for name in list(dirs):
+            if '-' in name and exists(join(dir, name, "rbconfig.rb")):
+                # Looks like a plat dir: skip it.
+                dirs.remove(name)
 
         importables = {}
         for name in nondirs:
@@ -1579,7 +1588,8 @@ class RubyCILEDriver(CILEDriver):
                              request.md5sum, request.mtime)
 
     def scan_purelang(self, buf):
-        tree = rubycile.scan_purelang(buf.accessor.text, buf.path)
+        tree = rubycile.scan_purelang(buf.accessor.text, buf.path,
+                                      tokens=buf.accessor.gen_tokens())
         blob_scope = _blob_scope_from_codeintel_tree(tree)
         rubycile.check_insert_rails_env(buf.path, blob_scope)
         return tree
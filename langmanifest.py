@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# Copyright (c) 2010 ActiveState Software Inc.
+# See LICENSE.txt for license details.
+
+"""Manifest of the language support modules shipped with codeintel2.
+
+The Manager uses this to register the languages of the standard
+"lang_*.py" modules up front *without* importing them. A module is only
+imported (and its `register()` called) on first real use of one of its
+languages -- see `Manager.ensure_lang_registered()`.
+
+Each entry maps a module name to the languages it registers, and each
+language to its capabilities. The capabilities are what the Manager
+must be able to answer before the module is imported:
+
+    citadel             a `cile_driver_class` is registered (i.e.
+                        `mgr.is_citadel_lang(lang)`)
+    cpln                `is_cpln_lang=True`
+    import_everything   `import_everything=True`
+    multilang           the buffer class is a UDLBuffer
+    xml                 the buffer class is an XMLParsingBufferMixin
+
+This must be kept in sync with the `register()` functions of those
+modules. A mismatch is logged (and corrected) when the module is loaded.
+"""
+
+_XML_UDL = ("citadel", "cpln", "multilang", "xml")
+
+# module name -> ((lang, capabilities), ...)
+capabilities_from_lang_from_module = {
+    "lang_css": (("CSS", ("cpln",)),),
+    "lang_django": (("Django", _XML_UDL),),
+    "lang_html": (("HTML", _XML_UDL),),
+    "lang_html5": (("HTML5", _XML_UDL),),
+    "lang_javascript": (("JavaScript", ("citadel", "cpln",
+                                        "import_everything")),),
+    "lang_less": (("Less", ("cpln",)),
+                  ("SCSS", ("cpln",)),
+                  ("Sass", ("cpln",))),
+    "lang_mason": (("Mason", _XML_UDL),),
+    "lang_nodejs": (("Node.js", ("citadel", "cpln")),),
+    "lang_perl": (("Perl", ("citadel", "cpln")),),
+    "lang_php": (("PHP", _XML_UDL + ("import_everything",)),),
+    "lang_python": (("Python", ("citadel", "cpln")),),
+    "lang_python3": (("Python3", ("citadel", "cpln")),),
+    "lang_rhtml": (("RHTML", _XML_UDL),),
+    "lang_ruby": (("Ruby", ("citadel", "cpln")),),
+    "lang_smarty": (("Smarty", _XML_UDL),),
+    "lang_tcl": (("Tcl", ("citadel",)),),
+    "lang_templatetoolkit": (("TemplateToolkit", _XML_UDL),),
+    "lang_twig": (("Twig", _XML_UDL),),
+    "lang_xbl": (("XBL", _XML_UDL),),
+    "lang_xml": (("XML", ("cpln", "multilang", "xml")),),
+    "lang_xslt": (("XSLT", ("cpln", "multilang", "xml")),),
+    "lang_xul": (("XUL", _XML_UDL),),
+}
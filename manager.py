@@ -49,6 +49,7 @@ from Queue import Queue
 import warnings
 import traceback
 import codecs
+import time
 
 from SilverCity import ScintillaConstants
 
@@ -62,6 +63,9 @@ from codeintel2.environment import DefaultEnvironment
 from codeintel2 import indexer
 from codeintel2.util import guess_lang_from_path
 from codeintel2 import hooks
+from codeintel2.tracing import PhaseTracer, active_tracer, span
+from codeintel2.fswatch import DirWatcher
+from codeintel2.metrics import metrics, StatsDumper
 from codeintel2.udl import XMLParsingBufferMixin, UDLBuffer
 
 import langinfo
@@ -88,7 +92,11 @@ class Manager(threading.Thread, Queue):
     def __init__(self, db_base_dir=None, on_scan_complete=None,
                  extra_module_dirs=None, env=None,
                  db_event_reporter=None, db_catalog_dirs=None,
-                 db_import_everything_langs=None):
+                 db_import_everything_langs=None,
+                 db_system_base_dir=None,
+                 lazy_lang_modules=True, startup_trace_path=None,
+                 watch_lib_dirs=False, stats_dump_path=None,
+                 stats_dump_interval=60.0):
         """Create a CodeIntel manager.
         
             "db_base_dir" (optional) specifies the base directory for
@@ -113,11 +121,36 @@ class Manager(threading.Thread, Queue):
                 the extra effort to support Database
                 `lib.hits_from_lpath()' should be made. See class
                 Database for more details.
+            "db_system_base_dir" (optional) specifies the base directory
+                of a shared, read-only database tier (e.g.
+                '/usr/share/codeintel/db') from which stdlibs and catalogs
+                are used when up to date. See class Database for details.
+            "lazy_lang_modules" (optional, default True) indicates if the
+                import of the standard "lang_*.py" support modules should
+                be deferred until first use of one of their languages.
+                See langmanifest.py.
+            "startup_trace_path" (optional) is a path to which the startup
+                trace (see `.startup_tracer`) is written as JSON on
+                `.finalize()`. The trace is always logged (at INFO level
+                on the "codeintel.tracing" logger) on finalize.
+            "watch_lib_dirs" (optional, default False) indicates if the
+                dirs of the import libs should be watched (with inotify
+                on Linux, else by polling) to keep the db up to date with
+                changes to their files on disk. See fswatch.py.
+            "stats_dump_path" (optional) is a path to which the result
+                of `.get_stats()` is written as JSON every
+                "stats_dump_interval" (default 60) seconds, and on
+                `.finalize()`. See metrics.py.
         """
         threading.Thread.__init__(self, name="CodeIntel Manager")
         self.setDaemon(True)
         Queue.__init__(self)
 
+        # Timed phase tree of startup work: module import/registration,
+        # db upgrade, stdlib imports and catalog updates.
+        self.startup_tracer = PhaseTracer("codeintel startup")
+        self.startup_trace_path = startup_trace_path
+
         self.citadel = Citadel(self)
 
         # Module registry bits.
@@ -130,16 +163,35 @@ class Manager(threading.Thread, Queue):
         self._is_citadel_from_lang = {} # registered langs that are Citadel-based
         self._is_cpln_from_lang = {} # registered langs for which completion is supported
         self._hook_handlers_from_lang = defaultdict(list)
+        # Langs whose support module import has been deferred.
+        self._lazy_lang_modules = lazy_lang_modules
+        self._deferred_module_path_from_lang = {}
+        self._deferred_caps_from_lang = {}
+        self._deferred_registration_lock = threading.RLock()
+        self._loading_deferred_module_paths = set()
 
         self.env = env or DefaultEnvironment() 
+        # Watches the dirs of the import libs, see fswatch.py.
+        if watch_lib_dirs:
+            self.dir_watcher = DirWatcher()
+        else:
+            self.dir_watcher = None
+        if stats_dump_path:
+            self.stats_dumper = StatsDumper(self.get_stats, stats_dump_path,
+                                            stats_dump_interval)
+        else:
+            self.stats_dumper = None
         # The database must be enabled before registering modules.
         self.db = Database(self, base_dir=db_base_dir,
                            catalog_dirs=db_catalog_dirs,
                            event_reporter=db_event_reporter,
-                           import_everything_langs=db_import_everything_langs)
+                           import_everything_langs=db_import_everything_langs,
+                           system_base_dir=db_system_base_dir)
 
-        self.lidb = langinfo.get_default_database()
-        self._register_modules(extra_module_dirs)
+        with self.startup_tracer.phase("langinfo database"):
+            self.lidb = langinfo.get_default_database()
+        with self.startup_tracer.phase("register modules"):
+            self._register_modules(extra_module_dirs)
 
         self.idxr = indexer.Indexer(self, on_scan_complete)
 
@@ -153,24 +205,34 @@ class Manager(threading.Thread, Queue):
             Database.reset()
         """
         log.debug("upgrade db if necessary")
-        status, reason = self.db.upgrade_info()
-        if status == Database.UPGRADE_NECESSARY:
-            log.info("db upgrade is necessary")
-            self.db.upgrade()
-        elif status == Database.UPGRADE_NOT_POSSIBLE:
-            log.warn("%s (resetting db)", reason)
-            log.info("reset db at `%s' (creating backup)", self.db.base_dir)
-            self.db.reset()
-        elif status == Database.UPGRADE_NOT_NECESSARY:
-            log.debug("no upgrade necessary")
-        else:
-            raise CodeIntelError("unknown db upgrade status: %r" % status)
+        with self.startup_tracer.phase("Manager.upgrade()"):
+            with self.startup_tracer.phase("db upgrade_info"):
+                status, reason = self.db.upgrade_info()
+            if status == Database.UPGRADE_NECESSARY:
+                log.info("db upgrade is necessary")
+                self.db.upgrade()
+            elif status == Database.UPGRADE_NOT_POSSIBLE:
+                log.warn("%s (resetting db)", reason)
+                log.info("reset db at `%s' (creating backup)", self.db.base_dir)
+                with self.startup_tracer.phase("db reset"):
+                    self.db.reset()
+            elif status == Database.UPGRADE_NOT_NECESSARY:
+                log.debug("no upgrade necessary")
+            else:
+                raise CodeIntelError("unknown db upgrade status: %r" % status)
 
     def initialize(self):
         """Initialize the codeintel system."""
         # TODO: Implement DB cleaning.
         #self.db.clean()
-        self.idxr.start()
+        with self.startup_tracer.phase("Manager.initialize()"):
+            # Resume the indexing work left by an earlier process.
+            self.idxr.resume_from_journal()
+            self.idxr.start()
+            if self.dir_watcher is not None:
+                self.dir_watcher.start()
+            if self.stats_dumper is not None:
+                self.stats_dumper.start()
 
     def _register_modules(self, extra_module_dirs=None):
         """Register codeintel/lang modules.
@@ -191,7 +253,86 @@ class Manager(threading.Thread, Queue):
                               "use `codeintel_*.py'. Support for `lang_*.py' "
                               "will be dropped in Komodo 5.1." % module_path,
                               CodeIntelDeprecationWarning)
-                self._register_module(module_path)
+                if dir == dirs[0] and self._lazy_lang_modules:
+                    self._defer_module_registration(module_path)
+                else:
+                    self._register_module(module_path)
+
+    def _defer_module_registration(self, module_path):
+        """Register the langs of the given standard support module from
+        the manifest, deferring the module import until first use.
+
+        Modules not in the manifest are registered immediately.
+        """
+        from codeintel2.langmanifest import capabilities_from_lang_from_module
+        module_name = splitext(basename(module_path))[0]
+        try:
+            langs_and_caps = capabilities_from_lang_from_module[module_name]
+        except KeyError:
+            self._register_module(module_path)
+            return
+        for lang, caps in langs_and_caps:
+            log.debug("defer `%s' support module registration for %s",
+                      module_path, lang)
+            self._deferred_module_path_from_lang[lang] = module_path
+            self._deferred_caps_from_lang[lang] = caps
+            if "citadel" in caps:
+                self._is_citadel_from_lang[lang] = True
+                self.citadel.set_deferred_lang_info(lang,
+                    is_cpln_lang=("cpln" in caps))
+            if "cpln" in caps:
+                self._is_cpln_from_lang[lang] = True
+            if "import_everything" in caps:
+                self.db.import_everything_langs.add(lang)
+
+    def ensure_lang_registered(self, lang):
+        """Import and register the support module for the given lang if
+        that was deferred (see `lazy_lang_modules` in the constructor).
+
+        This is cheap if the lang is already registered (or unknown).
+        """
+        if lang not in self._deferred_module_path_from_lang:
+            return
+        self._deferred_registration_lock.acquire()
+        try:
+            module_path = self._deferred_module_path_from_lang.get(lang)
+            if module_path is None:
+                return # registered by another thread meanwhile
+            log.debug("load deferred `%s' support module for %s",
+                      module_path, lang)
+            self._loading_deferred_module_paths.add(module_path)
+            try:
+                with self.startup_tracer.phase("deferred registration for %s"
+                                               % lang):
+                    self._register_module(module_path)
+            finally:
+                self._loading_deferred_module_paths.discard(module_path)
+            # Only drop the deferred entries *after* registration so other
+            # threads don't see a half-registered lang.
+            for l, p in self._deferred_module_path_from_lang.items():
+                if p == module_path:
+                    self._check_deferred_caps(l, self._deferred_caps_from_lang[l])
+                    del self._deferred_module_path_from_lang[l]
+                    del self._deferred_caps_from_lang[l]
+        finally:
+            self._deferred_registration_lock.release()
+
+    def _check_deferred_caps(self, lang, caps):
+        """Warn if the manifest capabilities for this lang don't match
+        what its support module actually registered.
+        """
+        buf_class = self.buf_class_from_lang.get(lang)
+        actual = {
+            "citadel": lang in self.citadel._cile_driver_from_lang,
+            "multilang": buf_class is not None
+                         and issubclass(buf_class, UDLBuffer),
+            "xml": buf_class is not None
+                   and issubclass(buf_class, XMLParsingBufferMixin),
+        }
+        for cap, has_cap in actual.items():
+            if has_cap != (cap in caps):
+                log.warn("langmanifest.py is out of date: %s '%s' "
+                         "capability is %s", lang, cap, has_cap)
 
     def _register_module(self, module_path):
         """Register the given codeintel support module.
@@ -211,12 +352,14 @@ class Manager(threading.Thread, Queue):
 
         module_dir, module_name = os.path.split(module_path)
         module_name = splitext(module_name)[0]
-        iinfo = imp.find_module(module_name, [module_dir])
-        module = imp.load_module(module_name, *iinfo)
+        with self.startup_tracer.phase("import %s" % module_name):
+            iinfo = imp.find_module(module_name, [module_dir])
+            module = imp.load_module(module_name, *iinfo)
         if hasattr(module, "register"):
             log.debug("register `%s' support module", module_path)
             try:
-                module.register(self)
+                with self.startup_tracer.phase("register %s" % module_name):
+                    module.register(self)
             except CodeIntelError, ex:
                 log.warn("error registering `%s' support module: %s",
                          module_path, ex)
@@ -231,6 +374,14 @@ class Manager(threading.Thread, Queue):
                       is_cpln_lang=False, langintel_class=None,
                       import_everything=False):
         """Called by register() functions in language support modules."""
+        module_path = self._deferred_module_path_from_lang.get(lang)
+        if module_path is not None \
+           and module_path not in self._loading_deferred_module_paths:
+            # A module from `extra_module_dirs' overrides a lang whose
+            # standard module is deferred: load the latter first, as
+            # without lazy_lang_modules, so that it doesn't later clobber
+            # the override.
+            self.ensure_lang_registered(lang)
         if silvercity_lexer:
             self.silvercity_lexer_from_lang[lang] = silvercity_lexer
         if buf_class:
@@ -260,11 +411,22 @@ class Manager(threading.Thread, Queue):
             self._hook_handlers_from_lang[lang].append(hook_handler)
 
     def finalize(self, timeout=None):
+        self.startup_tracer.log_report()
+        if self.startup_trace_path:
+            try:
+                self.startup_tracer.write_json(self.startup_trace_path)
+            except (EnvironmentError, ImportError), ex:
+                log.warn("could not write startup trace to `%s': %s",
+                         self.startup_trace_path, ex)
         if self.citadel is not None:
             self.citadel.finalize()
         if self.isAlive():
             self.stop()
             self.join(timeout)
+        if self.dir_watcher is not None:
+            self.dir_watcher.finalize()
+        if self.stats_dumper is not None:
+            self.stats_dumper.finalize()
         self.idxr.finalize()
         if self.db is not None:
             try:
@@ -273,6 +435,26 @@ class Manager(threading.Thread, Queue):
                 log.exception("error saving database")
             self.db = None # break the reference
 
+    def get_stats(self):
+        """Return a dict of metrics about the work of this codeintel
+        system, e.g. for monitoring a codeintel service:
+            "indexer"   the indexer's queue stats, see Indexer.get_stats()
+            "eval"      {"queued": <number of eval sessions queued>,
+                         "current": <name of the trigger being eval'd>}
+        plus the process-wide metrics (see Metrics.to_dict()), notably:
+            counters "db.fs_read[_bytes]", "db.fs_write[_bytes]",
+                "eval.aborted" and "eval.dropped"
+            latencies "scan.<lang>" and "eval.<trigger name>"
+            caches "index", "stdlib blob" and "catalog blob"
+        """
+        stats = metrics.to_dict()
+        stats["indexer"] = self.idxr.get_stats()
+        eval_sess = self._curr_eval_sess
+        trg = getattr(eval_sess, "trg", None)
+        stats["eval"] = {"queued": len(self.queue),
+                         "current": trg is not None and trg.name or None}
+        return stats
+
     # Proxy the batch update API onto our Citadel instance.
     def batch_update(self, join=True, updater=None):
         return self.citadel.batch_update(join=join, updater=updater)
@@ -288,9 +470,15 @@ class Manager(threading.Thread, Queue):
         programming languages. For example RHTML can have Ruby and
         JavaScript content, HTML can have JavaScript content.
         """
+        caps = self._deferred_caps_from_lang.get(lang)
+        if caps is not None:
+            return "multilang" in caps
         return issubclass(self.buf_class_from_lang[lang], UDLBuffer)
 
     def is_xml_lang(self, lang):
+        caps = self._deferred_caps_from_lang.get(lang)
+        if caps is not None:
+            return "xml" in caps
         try:
             buf_class = self.buf_class_from_lang[lang]
         except KeyError:
@@ -318,6 +506,7 @@ class Manager(threading.Thread, Queue):
 
     def langintel_from_lang(self, lang):
         if lang not in self._langintel_from_lang_cache:
+            self.ensure_lang_registered(lang)
             try:
                 langintel_class = self.langintel_class_from_lang[lang]
             except KeyError:
@@ -336,6 +525,7 @@ class Manager(threading.Thread, Queue):
     #XXX 
     def buf_from_koIDocument(self, doc, env=None):
         lang = doc.language
+        self.ensure_lang_registered(lang)
         path = doc.displayPath
         if doc.isUntitled:
             path = join("<Unsaved>", path)
@@ -358,6 +548,7 @@ class Manager(threading.Thread, Queue):
 
     def buf_from_content(self, content, lang, env=None, path=None,
                          encoding=None):
+        self.ensure_lang_registered(lang)
         lexer = self.silvercity_lexer_from_lang.get(lang)
         accessor = SilverCityAccessor(lexer, content)
         try:
@@ -450,8 +641,17 @@ class Manager(threading.Thread, Queue):
             eval_sess, is_reeval = self.get()
             if eval_sess is None: # Sentinel to stop.
                 break
+            trg = getattr(eval_sess, "trg", None)
+            trg_name = trg is not None and trg.name or "unknown"
+            # The tracer enabled on the ctlr, if any, also records the
+            # db lookups made for the eval, see EvalController.
+            tracer = getattr(getattr(eval_sess, "ctlr", None), "tracer", None)
+            start = time.time()
             try:
-                eval_sess.eval(self)
+                with active_tracer(tracer):
+                    with span(is_reeval and "re-eval" or "eval",
+                              trigger=trg_name):
+                        eval_sess.eval(self)
             except:
                 try:
                     self._handle_eval_sess_error(eval_sess)
@@ -459,6 +659,7 @@ class Manager(threading.Thread, Queue):
                     pass
             finally:
                 self._curr_eval_sess = None
+                metrics.observe("eval.%s" % trg_name, time.time() - start)
         self.db.report_event(None)
     
     def _handle_eval_sess_error(self, eval_sess):
@@ -493,9 +694,11 @@ class Manager(threading.Thread, Queue):
             # We only allow *one* eval session at a time.
             # - Drop a possible accumulated eval session.
             if len(self.queue):
+                metrics.incr("eval.dropped", len(self.queue))
                 self.queue.clear()
             ## - Abort the current eval session.
             if not is_reeval and self._curr_eval_sess is not None:
+                metrics.incr("eval.aborted")
                 self._curr_eval_sess.ctlr.abort()
 
         # Lazily start the eval thread.
@@ -0,0 +1,196 @@
+#!/usr/bin/env python
+# Copyright (c) 2010 ActiveState Software Inc.
+# See LICENSE.txt for license details.
+
+"""Process-wide metrics of the codeintel system.
+
+The work codeintel does in the background (the indexer thread, the
+Manager's eval thread) was only observable through debug logging. The
+`metrics' registry here collects counters, latency histograms and cache
+hit rates from the places doing that work:
+
+    from codeintel2.metrics import metrics
+    metrics.incr("eval.aborted")
+    metrics.observe("scan.Python", seconds)
+    metrics.cache_lookup("index", hit)
+    metrics.fs_read(nbytes)
+    metrics.fs_write(nbytes)
+
+`Manager.get_stats()' reports them (see `Metrics.to_dict()'), together
+with the indexer's queue stats. A Manager can also dump its stats as JSON
+to a file every so often (see StatsDumper and the "stats_dump_path"
+Manager argument).
+
+The registry is shared by all Managers in the process: the counters are
+never reset, consumers compare successive dumps.
+"""
+
+import time
+import bisect
+import threading
+import logging
+
+try:
+    import json
+except ImportError:
+    json = None
+
+from codeintel2.util import write_file_atomically
+
+
+log = logging.getLogger("codeintel.metrics")
+
+
+
+class Histogram(object):
+    """A histogram of latencies, in seconds, with fixed buckets."""
+    # Upper bounds (in ms) of the buckets. The last bucket is unbounded.
+    BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BOUNDS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds):
+        self.counts[bisect.bisect_left(self.BOUNDS_MS, seconds * 1000)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def to_dict(self):
+        buckets = {}
+        for bound, count in zip(self.BOUNDS_MS, self.counts):
+            if count:
+                buckets["<=%dms" % bound] = count
+        if self.counts[-1]:
+            buckets[">%dms" % self.BOUNDS_MS[-1]] = self.counts[-1]
+        return {"count": self.count,
+                "mean": self.count and round(self.total / self.count, 6) or 0,
+                "max": round(self.max, 6),
+                "buckets": buckets}
+
+
+class Metrics(object):
+    """A thread-safe registry of counters, histograms and cache lookups.
+    See the module docstring.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.start_time = time.time()
+        self._count_from_name = {}
+        self._histogram_from_name = {}
+        # {<cache name>: [<hits>, <misses>]}
+        self._lookups_from_cache = {}
+
+    def __repr__(self):
+        return "<Metrics: %d counters, %d histograms, %d caches>" % (
+            len(self._count_from_name), len(self._histogram_from_name),
+            len(self._lookups_from_cache))
+
+    def incr(self, name, n=1):
+        """Add `n' to the named counter."""
+        self._lock.acquire()
+        try:
+            self._count_from_name[name] = self._count_from_name.get(name, 0) + n
+        finally:
+            self._lock.release()
+
+    def observe(self, name, seconds):
+        """Add a latency (in seconds) to the named histogram."""
+        self._lock.acquire()
+        try:
+            histogram = self._histogram_from_name.get(name)
+            if histogram is None:
+                histogram = self._histogram_from_name[name] = Histogram()
+            histogram.observe(seconds)
+        finally:
+            self._lock.release()
+
+    def cache_lookup(self, cache, hit):
+        """Count a hit (or miss, if `hit' is false) in the named cache."""
+        self._lock.acquire()
+        try:
+            lookups = self._lookups_from_cache.get(cache)
+            if lookups is None:
+                lookups = self._lookups_from_cache[cache] = [0, 0]
+            lookups[not hit and 1 or 0] += 1
+        finally:
+            self._lock.release()
+
+    def fs_read(self, nbytes):
+        """Count a read of a database file of `nbytes' bytes."""
+        self.incr("db.fs_read")
+        self.incr("db.fs_read_bytes", nbytes)
+
+    def fs_write(self, nbytes):
+        """Count a write of a database file of `nbytes' bytes."""
+        self.incr("db.fs_write")
+        self.incr("db.fs_write_bytes", nbytes)
+
+    def to_dict(self):
+        """Return the metrics as a dict:
+            "uptime"        seconds since the registry was created
+            "counters"      {<name>: <count>}
+            "latencies"     {<name>: {"count", "mean", "max" (seconds),
+                                      "buckets": {"<=<n>ms": <count>}}}
+            "caches"        {<name>: {"hits", "misses", "hit_rate"}}
+        """
+        self._lock.acquire()
+        try:
+            caches = {}
+            for cache, (hits, misses) in self._lookups_from_cache.items():
+                caches[cache] = {"hits": hits, "misses": misses,
+                                 "hit_rate": round(float(hits)
+                                                   / (hits + misses), 4)}
+            return {
+                "uptime": round(time.time() - self.start_time, 3),
+                "counters": dict(self._count_from_name),
+                "latencies": dict((name, h.to_dict()) for name, h
+                                  in self._histogram_from_name.items()),
+                "caches": caches,
+            }
+        finally:
+            self._lock.release()
+
+metrics = Metrics()
+
+
+class StatsDumper(threading.Thread):
+    """A thread writing the result of `get_stats()' as JSON to `path'
+    every `interval' seconds, and once more on .finalize().
+    """
+    def __init__(self, get_stats, path, interval=60.0):
+        threading.Thread.__init__(self, name="codeintel stats dumper")
+        self.setDaemon(True)
+        self.get_stats = get_stats
+        self.path = path
+        self.interval = interval
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.isSet():
+            self._stop_event.wait(self.interval)
+            if not self._stop_event.isSet():
+                self.dump()
+
+    def finalize(self):
+        self._stop_event.set()
+        self.dump()
+
+    def dump(self):
+        """Write the stats. Failures are logged and otherwise ignored."""
+        if json is None:
+            log.warn("cannot dump stats to '%s': no 'json' module", self.path)
+            return
+        try:
+            stats = self.get_stats()
+            stats["time"] = time.time()
+            write_file_atomically(self.path,
+                json.dumps(stats, indent=2, sort_keys=True))
+        except EnvironmentError, ex:
+            log.warn("could not dump stats to '%s': %s", self.path, ex)
+        except Exception:
+            log.exception("error dumping stats to '%s'", self.path)
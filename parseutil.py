@@ -115,7 +115,23 @@ _indent = re.compile(r'^([ \t]*)', re.M)
 _param = re.compile(r'^\s*@param\s+(?P<type>[\w\\]+)\s+\$(?P<name>\w+)(?:\s+?(?P<doc>.*?))?', re.M|re.U)
 _return = re.compile(r'^\s*@return\s+(?P<type>[\w\\]+)(?:\s+(?P<doc>.*))?', re.M|re.U)
 
+# Results of uncommentDocString() and parseDocString() by doc comment. The
+# same doc comments are processed over and over: a buffer being edited is
+# rescanned on every change, library files are rescanned when changed.
+_uncommented_from_doc = {}
+_parsed_from_doc = {}
+_DOC_CACHE_MAX_SIZE = 2000
+
 def uncommentDocString(doc):
+    d = _uncommented_from_doc.get(doc)
+    if d is None:
+        d = _uncommentDocString(doc)
+        if len(_uncommented_from_doc) >= _DOC_CACHE_MAX_SIZE:
+            _uncommented_from_doc.clear()
+        _uncommented_from_doc[doc] = d
+    return d
+
+def _uncommentDocString(doc):
     # remove block style leading and end comments
     d = '\n'.join(re.findall(_javadoc1, doc))
     if d:
@@ -151,12 +167,24 @@ def uncommentDocString(doc):
     return d
 
 def parseDocString(doc):
-    d = uncommentDocString(doc)
-    params = re.findall(_param, d)
-    result = re.findall(_return, d)
-    if result:
-        result = result[0]
-    return (d, params, result)
+    """Return (<uncommented doc>, <params>, <return>) for the given doc
+    comment, where <params> is a tuple of (<type>, <name>, <doc>) for the
+    "@param" tags and <return> the (<type>, <doc>) of the "@return" tag.
+
+    The result is shared by all callers for the same doc comment.
+    """
+    info = _parsed_from_doc.get(doc)
+    if info is None:
+        d = uncommentDocString(doc)
+        params = tuple(re.findall(_param, d))
+        result = re.findall(_return, d)
+        if result:
+            result = result[0]
+        info = (d, params, result)
+        if len(_parsed_from_doc) >= _DOC_CACHE_MAX_SIZE:
+            _parsed_from_doc.clear()
+        _parsed_from_doc[doc] = info
+    return info
 
 
 
@@ -95,13 +95,32 @@ class _CommonLexer(shared_lexer.Lexer):
         self.q = []
         self.multi_char_ops = self.build_dict('-> ++ -- ** =~ !~ << >> <= >= == != <=> && || ... .. => <<= >>= &&= ||= ~*= /= %= += -= .= &= |= ^= ::')
 
+_silvercity_lexer = None
+def _get_silvercity_lexer():
+    global _silvercity_lexer
+    if _silvercity_lexer is None:
+        _silvercity_lexer = Perl.PerlLexer()
+    return _silvercity_lexer
+
 class PerlLexer(_CommonLexer):
-    def __init__(self, code, provide_full_docs=True):
+    def __init__(self, code, provide_full_docs=True, tokens=None):
+        """Lex the given Perl code.
+
+        If "tokens" is given, it is used instead of lexing "code" again:
+        an iterable of the SilverCity tokens for the code, e.g. from
+        `shared_lexer.expand_tabs_in_tokens(buf.accessor.gen_tokens())`.
+        """
         _CommonLexer.__init__(self)
         self.q = []
         self.classifier = PerlLexerClassifier()
         self._provide_full_docs = provide_full_docs
-        Perl.PerlLexer().tokenize_by_style(code, self._fix_token_list)
+        if tokens is None:
+            _get_silvercity_lexer().tokenize_by_style(code,
+                                                      self._fix_token_list)
+        else:
+            add_token = self._add_token
+            for tok in tokens:
+                add_token(tok)
         # self._fix_token_list(q_tmp) # Updates self.q in place
         self.string_types = [ScintillaConstants.SCE_PL_STRING,
                          ScintillaConstants.SCE_PL_CHARACTER,
@@ -114,6 +133,9 @@ class PerlLexer(_CommonLexer):
                          ]
         
     def _fix_token_list(self, **tok):
+        self._add_token(tok)
+
+    def _add_token(self, tok):
         """ SilverCity doesn't know much about Perl, and breaks in two ways:
         1. It doesn't know how to separate sequences of characters into
         separate tokens.
@@ -125,6 +147,9 @@ class PerlLexer(_CommonLexer):
         whole silvercity abstraction into this module, and it doesn't
         belong here.  This routine works with SilverCity tokens, not
         shared_lexer Tokens.
+
+        The given token dict is not modified: it may be shared, e.g. with
+        the buffer's cached tokens.
         """
         if tok['start_column'] > shared_lexer.MAX_REASONABLE_LIMIT:
             return
@@ -138,8 +163,7 @@ class PerlLexer(_CommonLexer):
             # Push all but the last token on the pending block.
             self.append_split_tokens(tok, self.multi_char_ops, self.q)
         elif ttype == ScintillaConstants.SCE_PL_IDENTIFIER:
-            tok['text'] = tok['text'].strip()
-            self.q.append(tok)
+            self.q.append(dict(tok, text=tval.strip()))
         elif (not self._provide_full_docs) and \
                 ttype in (ScintillaConstants.SCE_PL_DATASECTION,
                           ScintillaConstants.SCE_PL_POD):
@@ -147,6 +171,7 @@ class PerlLexer(_CommonLexer):
         elif ttype == ScintillaConstants.SCE_PL_DATASECTION:
             if pod_markings.search(tval):
                 # putback (KWD package), (ID main), (OP ;), (POD this)
+                tok = dict(tok)
                 col = tok['start_column']
                 for new_vals in ((ScintillaConstants.SCE_PL_WORD, "package"),
                                  (ScintillaConstants.SCE_PL_IDENTIFIER, "main"),
@@ -89,7 +89,7 @@ import stat
 from ciElementTree import Element, SubElement, tostring
 from SilverCity import ScintillaConstants
 
-from codeintel2 import perl_lexer, perl_parser, util
+from codeintel2 import perl_lexer, perl_parser, shared_lexer, util
 from codeintel2.tree import pretty_tree_from_tree
 from codeintel2.common import CILEError
 from codeintel2 import parser_cix
@@ -112,8 +112,12 @@ gProvideFullDocs = False
 # perl_parser.py
 
 def scan_purelang(buf):
-    content = buf.accessor.text.expandtabs(8)
-    tokenizer = perl_lexer.PerlLexer(content, gProvideFullDocs)
+    # Use the buffer's tokens rather than lexing the content again. The
+    # parser expects tab-expanded content (it doesn't use the token
+    # indices).
+    tokens = shared_lexer.expand_tabs_in_tokens(buf.accessor.gen_tokens(), 8,
+                                                adjust_indices=False)
+    tokenizer = perl_lexer.PerlLexer(None, gProvideFullDocs, tokens=tokens)
     parser = perl_parser.Parser(tokenizer, provide_full_docs=gProvideFullDocs)
     parser.moduleName = buf.path
     parse_tree = parser.parse()
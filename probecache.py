@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# Copyright (c) 2010 ActiveState Software Inc.
+# See LICENSE.txt for license details.
+
+"""A persistent cache of the output of interpreter probes.
+
+To determine the version and import path of the Python, PHP, Perl, Ruby
+or Node.js to use, the LangIntels run the interpreter with a small info
+script (e.g. PythonLangIntel._python_info_from_python()). The results are
+only kept in the environment's cache, so every new process -- and every
+pref change invalidating that cache -- launches the interpreters again.
+
+This cache keeps the output of successful probes in a file in the
+database dir, keyed by the interpreter path, the probe script and the
+values of the environment variables that affect the output. An entry is
+valid as long as the interpreter (and any other files the output depends
+on, e.g. the loaded php.ini) have the same size and mtime: checking that
+is a stat() per file.
+
+Usage:
+    cache = mgr.db.interpreter_probe_cache
+    output = cache.get(python, info_cmd, envvars)
+    if output is None:
+        output = <run the python with info_cmd>
+        cache.put(python, info_cmd, envvars, output)
+
+where "envvars" is a dict of the values (or None) of just the environment
+variables affecting the output.
+"""
+
+import os
+from os.path import exists, dirname
+import logging
+import threading
+import time
+from hashlib import sha1
+import cPickle as pickle
+
+from codeintel2.util import write_file_atomically, load_pickle
+
+
+log = logging.getLogger("codeintel.probecache")
+
+
+class InterpreterProbeCache(object):
+    # The number of entries to keep: the least recently probed
+    # interpreters are dropped beyond that.
+    MAX_ENTRIES = 100
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.RLock()
+        # {<key>: (<file stats>, <output>, <time of probe>)}, loaded from
+        # the cache file on first use.
+        self._entries = None
+
+    def __repr__(self):
+        return "<InterpreterProbeCache '%s'>" % self.path
+
+    def _key(self, interpreter, probe, envvars):
+        return (interpreter, sha1(probe).hexdigest(),
+                tuple(sorted(envvars.items())))
+
+    def _stats(self, paths):
+        """Return ((<path>, <size-and-mtime-or-None>), ...) for the given
+        paths.
+        """
+        stats = []
+        for path in paths:
+            try:
+                st = os.stat(path)
+            except EnvironmentError:
+                stats.append((path, None))
+            else:
+                stats.append((path, (st.st_size, st.st_mtime)))
+        return tuple(stats)
+
+    def _load(self):
+        entries = load_pickle(self.path, "probe cache")
+        if not isinstance(entries, dict):
+            return {}
+        return entries
+
+    def _get_entries(self):
+        if self._entries is None:
+            self._entries = self._load()
+        return self._entries
+
+    def get(self, interpreter, probe, envvars):
+        """Return the cached output of running the given probe script with
+        the given interpreter, or None if not cached (or out of date).
+        """
+        key = self._key(interpreter, probe, envvars)
+        self._lock.acquire()
+        try:
+            entry = self._get_entries().get(key)
+        finally:
+            self._lock.release()
+        if entry is None:
+            return None
+        stats, output, probe_time = entry
+        if self._stats([path for path, stat in stats]) != stats:
+            log.debug("probe cache entry for '%s' is out of date",
+                      interpreter)
+            return None
+        log.debug("probe cache hit for '%s'", interpreter)
+        return output
+
+    def put(self, interpreter, probe, envvars, output, dep_paths=()):
+        """Cache the output of running the given probe script with the
+        given interpreter.
+
+        "dep_paths" (optional) are other files or dirs the output depends
+        on: the entry is out of date when any of them changes.
+
+        The cache file is only written if the database dir exists.
+        Failures to write it are logged and otherwise ignored.
+        """
+        key = self._key(interpreter, probe, envvars)
+        stats = self._stats([interpreter] + list(dep_paths))
+        self._lock.acquire()
+        try:
+            # Re-read the cache file to keep the entries written by other
+            # processes sharing it.
+            entries = self._load()
+            entries[key] = (stats, output, time.time())
+            if len(entries) > self.MAX_ENTRIES:
+                by_age = sorted(entries, key=lambda k: entries[k][2])
+                for k in by_age[:len(entries) - self.MAX_ENTRIES]:
+                    del entries[k]
+            self._entries = entries
+            if not exists(dirname(self.path)):
+                return
+            try:
+                log.debug("fs-write: interpreter probe cache '%s'",
+                          self.path)
+                write_file_atomically(self.path, pickle.dumps(entries, 2))
+            except EnvironmentError, ex:
+                log.warn("could not write probe cache '%s': %s",
+                         self.path, ex)
+        finally:
+            self._lock.release()
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        self._lock.acquire()
+        try:
+            self._entries = {}
+            if exists(self.path):
+                try:
+                    os.remove(self.path)
+                except EnvironmentError, ex:
+                    log.warn("could not remove probe cache '%s': %s",
+                             self.path, ex)
+        finally:
+            self._lock.release()
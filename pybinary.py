@@ -6,19 +6,233 @@
 
 import os
 import sys
+import atexit
+import threading
+import traceback
 import cStringIO as io
 import optparse
 
 from process import ProcessOpen
 
 
+# The version of the CIX this scanner generates: bump it on changes to the
+# output, to not reuse the CIX cached by earlier versions (see bincache.py).
+SCANNER_VERSION = "1"
+
 SCAN_PROCESS_TIMEOUT = 2.0
 
+# The number of modules a scanner process scans before it is replaced.
+# Every scan leaves the scanned module (and whatever it imported) loaded
+# in the process.
+MAX_SCANS_PER_PROCESS = 50
+
+# The max number of scanner processes per Python interpreter.
+MAX_PROCESSES_PER_POOL = 2
+
+# The line ending a response from a scanner process. (CIX cannot contain
+# a NUL character.)
+_END_OF_RESPONSE = "\0\n"
+
 class BinaryScanError(Exception): pass
 
-class TimedPopen(ProcessOpen):
-    def wait(self):
-        return super(TimedPopen, self).wait(SCAN_PROCESS_TIMEOUT)
+class _StaleScannerError(Exception):
+    """The scanner process already has the module to scan imported."""
+
+
+class _ScannerProcess(object):
+    """A scanner process ("pybinary.py --serve") scanning one module at a
+    time.
+
+    The protocol: a request is the path of the module to scan on one
+    line. The response is a status line ("ok", "error" or "stale"), the
+    CIX or the error message, and a line with just a NUL character.
+    "stale" means that a module of that name was already imported by an
+    earlier scan (a fresh process is needed to scan it).
+    """
+    def __init__(self, python):
+        # this is needed to avoid picking up a stale .pyc file.
+        myself = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                              "pybinary.py")
+        self.proc = ProcessOpen(cmd=[python, myself, "--serve"],
+                                env=dict(PYTHONPATH=os.pathsep.join(sys.path)))
+        self.num_scans = 0
+        self.is_dead = False
+
+    def scan(self, path, timeout):
+        """Scan the given module and return its CIX.
+
+        Raises BinaryScanError on failure. If the scan did not finish
+        within `timeout` seconds the process is killed.
+        """
+        if isinstance(path, unicode):
+            path = path.encode(sys.getfilesystemencoding() or "utf-8")
+        self.num_scans += 1
+        try:
+            self.proc.stdin.write(path + "\n")
+            self.proc.stdin.flush()
+        except EnvironmentError, ex:
+            self.kill()
+            raise BinaryScanError("could not send scan request: %s" % ex)
+
+        # Read the response on another thread, to be able to time out.
+        response = []
+        reader = threading.Thread(target=self._read_response,
+                                  args=(response,),
+                                  name="pybinary scan response reader")
+        reader.setDaemon(True)
+        reader.start()
+        reader.join(timeout)
+        if reader.isAlive():
+            self.kill()
+            raise BinaryScanError("timed out scanning '%s'" % path)
+        if not response:
+            self.kill()
+            raise BinaryScanError("scanner process died scanning '%s'"
+                                  % path)
+        status, output = response[0]
+        if status == "stale":
+            raise _StaleScannerError(path)
+        elif status != "ok":
+            raise BinaryScanError(output)
+        return output
+
+    def _read_response(self, response):
+        stdout = self.proc.stdout
+        status = stdout.readline()
+        lines = []
+        while True:
+            line = stdout.readline()
+            if not line:
+                return # the process died
+            if line == _END_OF_RESPONSE:
+                break
+            lines.append(line)
+        response.append((status.strip(), "".join(lines)))
+
+    def kill(self):
+        self.is_dead = True
+        try:
+            self.proc.kill()
+        except Exception:
+            pass
+
+    def close(self):
+        """Close the process: it exits at the end of its input."""
+        self.is_dead = True
+        try:
+            self.proc.stdin.close()
+        except EnvironmentError:
+            pass
+
+
+class ScannerPool(object):
+    """A pool of persistent scanner processes for one Python interpreter.
+
+    This saves starting a new interpreter for each binary module scanned.
+    A process is replaced after it timed out (see `SCAN_PROCESS_TIMEOUT`)
+    and after `MAX_SCANS_PER_PROCESS` scans.
+    """
+    def __init__(self, python, max_processes=MAX_PROCESSES_PER_POOL,
+                 max_scans_per_process=MAX_SCANS_PER_PROCESS,
+                 timeout=SCAN_PROCESS_TIMEOUT):
+        self.python = python
+        self.max_processes = max_processes
+        self.max_scans_per_process = max_scans_per_process
+        self.timeout = timeout
+        self._idle = []
+        self._num_processes = 0
+        self._cond = threading.Condition()
+
+    def __repr__(self):
+        return "<ScannerPool %s: %d processes>" % (self.python,
+                                                   self._num_processes)
+
+    def scan(self, path):
+        """Scan the given binary module in one of the pool's processes and
+        return a CIX 2.0 string.
+
+        In case of errors raises a BinaryScanError.
+        """
+        for attempt in range(self.max_processes + 1):
+            proc = self._acquire()
+            try:
+                return proc.scan(path, self.timeout)
+            except _StaleScannerError:
+                proc.close()
+            finally:
+                self._release(proc)
+        raise BinaryScanError("could not get a fresh scanner process for "
+                              "'%s'" % path)
+
+    def _acquire(self):
+        self._cond.acquire()
+        try:
+            while not self._idle \
+                  and self._num_processes >= self.max_processes:
+                self._cond.wait()
+            if self._idle:
+                return self._idle.pop()
+            self._num_processes += 1
+        finally:
+            self._cond.release()
+        try:
+            return _ScannerProcess(self.python)
+        except:
+            self._cond.acquire()
+            try:
+                self._num_processes -= 1
+                self._cond.notify()
+            finally:
+                self._cond.release()
+            raise
+
+    def _release(self, proc):
+        self._cond.acquire()
+        try:
+            if proc.is_dead or proc.num_scans >= self.max_scans_per_process:
+                proc.close()
+                self._num_processes -= 1
+            else:
+                self._idle.append(proc)
+            self._cond.notify()
+        finally:
+            self._cond.release()
+
+    def close(self):
+        """Close the idle processes of the pool."""
+        self._cond.acquire()
+        try:
+            for proc in self._idle:
+                proc.close()
+            self._num_processes -= len(self._idle)
+            self._idle = []
+        finally:
+            self._cond.release()
+
+
+_pool_from_python = {}
+_pools_lock = threading.Lock()
+
+def scanner_pool(python):
+    """Return the ScannerPool for the given Python interpreter."""
+    _pools_lock.acquire()
+    try:
+        pool = _pool_from_python.get(python)
+        if pool is None:
+            pool = _pool_from_python[python] = ScannerPool(python)
+        return pool
+    finally:
+        _pools_lock.release()
+
+def _close_scanner_pools():
+    _pools_lock.acquire()
+    try:
+        for pool in _pool_from_python.values():
+            pool.close()
+    finally:
+        _pools_lock.release()
+
+atexit.register(_close_scanner_pools)
 
 
 def safe_scan(path, python):
@@ -34,20 +248,9 @@ def safe_scan(path, python):
     
     In case of errors raises a BinaryScanError.
     """
-    # indirectly calls "_main" defined below
-    
-    # this is needed to avoid picking up a stale .pyc file.
-    myself = os.path.join(os.path.dirname(os.path.abspath(__file__)),
-                          "pybinary.py")
-    
-    proc = TimedPopen(cmd="%s %s %s" % (python, myself, path),
-                      env=dict(PYTHONPATH=os.pathsep.join(sys.path)))
-    
-    out, err = proc.communicate()
-    if err:
-        raise BinaryScanError(err)
-    
-    return out
+    # The scan is done by a process of the interpreter's scanner pool,
+    # running "_serve" defined below.
+    return scanner_pool(python).scan(path)
     
 
 def scan(path):
@@ -82,9 +285,58 @@ def scan(path):
         stream.close()
     
 
+def _serve():
+    """Scan the modules whose paths are given on stdin, one per line,
+    until the end of input. See _ScannerProcess for the protocol.
+    """
+    # Keep whatever the scanned modules write out of the responses.
+    responses = os.fdopen(os.dup(sys.stdout.fileno()), "w")
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, sys.stdout.fileno())
+    os.dup2(devnull, sys.stderr.fileno())
+
+    startup_modules = set(sys.modules)
+    while True:
+        line = sys.stdin.readline()
+        if not line:
+            break
+        mod_path = os.path.abspath(line.rstrip("\r\n"))
+        name = os.path.splitext(os.path.basename(mod_path))[0]
+        if name in sys.modules and name not in startup_modules:
+            responses.write("stale\n" + _END_OF_RESPONSE)
+            responses.flush()
+            continue
+        # As for a scan in a new process: anything written to stderr
+        # is an error.
+        sys.stdout = io.StringIO()
+        sys.stderr = err = io.StringIO()
+        try:
+            try:
+                if not os.path.isfile(mod_path):
+                    raise BinaryScanError("'%s' is not a file" % mod_path)
+                cix = scan(mod_path)
+            except:
+                traceback.print_exc(file=err)
+        finally:
+            sys.stdout = sys.__stdout__
+            sys.stderr = sys.__stderr__
+        error = err.getvalue()
+        if error:
+            responses.write("error\n%s\n" % error.replace("\0", "").rstrip())
+        else:
+            responses.write("ok\n%s\n" % cix)
+        responses.write(_END_OF_RESPONSE)
+        responses.flush()
+
 def _main(argv):
-    parser = optparse.OptionParser(usage="%prog mdoulepath")
+    parser = optparse.OptionParser(usage="%prog [--serve] [modulepath]")
+    parser.add_option("--serve", action="store_true",
+                      help="scan the modules whose paths are given on "
+                           "stdin (see _ScannerProcess)")
     (options, args) = parser.parse_args(args=argv)
+    if options.serve:
+        _serve()
+        return
     if len(args) != 1:
         parser.error("Incorrect number of args")
     
@@ -98,4 +350,3 @@ def _main(argv):
 
 if __name__ == '__main__':
     _main(sys.argv[1:])
-
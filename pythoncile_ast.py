@@ -0,0 +1,1672 @@
+#!/usr/bin/env python
+# Copyright (c) 2010 ActiveState Software Inc.
+# See LICENSE.txt for license details.
+
+"""
+    pythoncile_ast - a Python CILE using the standard `ast` module
+
+    This is a drop-in alternative to pythoncile1, which walks the trees
+    of the deprecated `compiler` package. It builds the same namespace
+    data as pythoncile1 (and re-uses its CIX emitters), so that the CIX
+    for a given file is identical. See `benchmarks/pythoncile.py` for a
+    tool to diff the two over a corpus and to compare their speed.
+
+    Differences from pythoncile1:
+    - Parsing is done with a single `compile(..., PyCF_ONLY_AST)` call,
+      which is much faster than `compiler.parse()`.
+    - Syntax error recovery: rather than re-parsing the whole file for
+      each (at most one) syntax error, the content is split into its
+      top-level blocks and only the blocks with errors are re-parsed,
+      with the offending lines nulled out. Blocks that cannot be
+      recovered are dropped. As a result, files with several syntax
+      errors yield (partial) CIX rather than an error.
+    - Non-ASCII unicode literals in files with an encoding declaration
+      are decoded correctly (`compiler` double-decodes them).
+
+    Module Usage:
+        from codeintel2.pythoncile_ast import scan_et
+        content = open("foo.py", "r").read()
+        scan_et(content, "foo.py")
+
+    To rescan a file being edited, `scan_et_incremental()` re-uses the
+    results of the previous scan for the unchanged top-level blocks.
+
+    Command-line Usage:
+        pythoncile_ast.py [<options>...] [<Python files>...]
+
+    Options:
+        -h, --help          dump this help and exit
+        -v, --verbose       verbose output, use twice for more verbose output
+        -L, --language <name>
+                            the language of the file being scanned
+"""
+
+import os
+import sys
+import re
+import types
+import getopt
+import logging
+import __future__
+import ast
+from cStringIO import StringIO
+
+import ciElementTree as et
+
+from codeintel2 import pythoncile1
+from codeintel2.pythoncile1 import (PythonCILEError, _isclass, _isfunction,
+                                    _et_attrs, _convert3to2)
+from codeintel2 import util
+
+
+
+#---- globals
+
+log = logging.getLogger("pythoncile.ast")
+#log.setLevel(logging.DEBUG)
+
+# The max number of lines nulled out in one top-level block when trying
+# to recover from syntax errors in it.
+_MAX_FIXES_PER_BLOCK = 3
+
+# Child nodes of an `ast` node that have no equivalent node in a
+# `compiler.ast` tree.
+_NON_NODES = (ast.expr_context, ast.operator, ast.boolop, ast.cmpop,
+              ast.unaryop, ast.alias)
+
+_ARITH_OPS = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Mod, ast.Pow)
+_INT_OPS = (ast.FloorDiv, ast.BitAnd, ast.BitOr, ast.BitXor, ast.RShift,
+            ast.LShift)
+_BINOP_STRS = {ast.Add: "+", ast.Sub: "-", ast.Mult: "*", ast.Div: "/",
+               ast.FloorDiv: "//", ast.Mod: "%", ast.Pow: "**",
+               ast.LShift: "<<", ast.RShift: ">>",
+               ast.BitOr: "|", ast.BitAnd: "&", ast.BitXor: "^"}
+
+# Compound statements whose bodies are walked for nested statements.
+_COMPOUND_STMTS = (ast.If, ast.For, ast.While, ast.TryExcept,
+                   ast.TryFinally, ast.With, ast.ExceptHandler)
+
+
+
+#---- internal support
+
+def _docstring(body):
+    if body and isinstance(body[0], ast.Expr) \
+       and isinstance(body[0].value, ast.Str):
+        return body[0].value.s
+    return None
+
+def _body_sans_docstring(body):
+    if _docstring(body) is not None:
+        return body[1:]
+    return body
+
+def _is_simple_slice(node):
+    """Return true iff `node` is a subscript that `compiler` represents as
+    a `Slice` node, i.e. `foo[lower:upper]`.
+    """
+    return (isinstance(node, ast.Subscript)
+            and isinstance(node.slice, ast.Slice)
+            and node.slice.step is None)
+
+_trailing_semicolon_re = re.compile(r''';\s*(#[^'"]*)?$''')
+
+def _last_lineno(node, lines=None):
+    """Return the "lineend" pythoncile1 would determine for this node.
+
+    pythoncile1 uses the line number of the leaf reached by repeatedly
+    descending into the last child of the equivalent `compiler.ast` node.
+    Where the two trees differ in shape, this follows the `compiler` one.
+    """
+    in_simple_stmt = False
+    while True:
+        if isinstance(node, ast.stmt) \
+           and not isinstance(node, _COMPOUND_STMTS):
+            in_simple_stmt = True
+        if isinstance(node, ast.FunctionDef):
+            body = _body_sans_docstring(node.body)
+            if not body:
+                return None
+            node = body[-1]
+            continue
+        elif isinstance(node, ast.ClassDef):
+            if node.decorator_list:
+                node = node.decorator_list[-1]
+                continue
+            body = _body_sans_docstring(node.body)
+            if not body:
+                return None
+            node = body[-1]
+            continue
+        elif isinstance(node, (ast.Return, ast.Yield)):
+            # `compiler` uses a `Const(None)` without a line number.
+            if node.value is None:
+                return None
+            node = node.value
+            continue
+        elif isinstance(node, ast.Print) and node.dest is not None:
+            node = node.dest
+            continue
+        elif (_is_simple_slice(node) and node.slice.lower is None
+              and node.slice.upper is None):
+            node = node.value
+            continue
+        children = [c for c in ast.iter_child_nodes(node)
+                    if not isinstance(c, _NON_NODES)]
+        if not children:
+            break
+        node = children[-1]
+    lineno = getattr(node, "lineno", None)
+    if lineno and in_simple_stmt and lines \
+       and _trailing_semicolon_re.search(lines[lineno-1]):
+        # `compiler` adds a `Discard(Const(None))` without a line number
+        # for a trailing semicolon.
+        return None
+    return lineno
+
+def _max_lineno(node):
+    lineno = getattr(node, "lineno", 0)
+    for child in ast.walk(node):
+        lineno = max(lineno, getattr(child, "lineno", 0))
+    return lineno
+
+def _argnames(arguments):
+    """Return the `compiler`-style argnames list for an `ast.arguments`."""
+    def argname(arg):
+        if isinstance(arg, ast.Tuple):
+            return tuple(argname(a) for a in arg.elts)
+        return arg.id
+    argnames = [argname(a) for a in arguments.args]
+    if arguments.vararg:
+        argnames.append(arguments.vararg)
+    if arguments.kwarg:
+        argnames.append(arguments.kwarg)
+    return argnames
+
+
+
+class _KeyRecordingDict(dict):
+    """A dict that records the keys set on it in `keys_set`.
+
+    Keys looked up with `get()` are recorded as well: that is how the
+    visitor finds an existing symbol to update.
+    """
+    def __init__(self):
+        dict.__init__(self)
+        self.keys_set = []
+
+    def __setitem__(self, key, value):
+        self.keys_set.append(key)
+        dict.__setitem__(self, key, value)
+
+    def get(self, key, default=None):
+        self.keys_set.append(key)
+        return dict.get(self, key, default)
+
+
+
+#---- the CIX visitor
+
+class AST2CIXVisitor(pythoncile1.AST2CIXVisitor):
+    """Generate Code Intelligence XML (CIX) from walking a Python `ast` tree.
+
+    This builds the same symbol tables as pythoncile1.AST2CIXVisitor (and
+    uses its cix_*() methods to emit them) from an `ast` module tree.
+    """
+    _def_line_re = re.compile(r"^\s*(def|class)\b")
+
+    def visit(self, node):
+        method = getattr(self, "visit" + node.__class__.__name__, None)
+        if method is not None:
+            method(node)
+        elif isinstance(node, _COMPOUND_STMTS):
+            for field in ("body", "handlers", "orelse", "finalbody"):
+                for child in getattr(node, field, ()):
+                    self.visit(child)
+
+    def _visitBody(self, body):
+        for child in body:
+            self.visit(child)
+
+    def _defLineno(self, node):
+        """The line number of a def or class statement.
+
+        For decorated definitions `ast` gives the line of the first
+        decorator; `compiler` gives the line of the 'def' or 'class'.
+        """
+        lineno = node.lineno
+        if node.decorator_list and self.lines:
+            i = _max_lineno(node.decorator_list[-1]) - 1
+            while i < len(self.lines):
+                if self._def_line_re.match(self.lines[i]):
+                    return i + 1
+                i += 1
+        return lineno
+
+    def _startModule(self, body, symbols):
+        nspath = ()
+        namespace = {"name": self.moduleName,
+                     "nspath": nspath,
+                     "types": {"module": 1},
+                     "symbols": symbols}
+        doc = _docstring(body)
+        if doc:
+            summarylines = util.parseDocSummary(doc.splitlines(0))
+            namespace["doc"] = "\n".join(summarylines)
+
+        self.st[nspath] = namespace
+        self.nsstack.append(namespace)
+
+    def visitModule(self, node):
+        log.info("visitModule")
+        self._startModule(node.body, {})
+        self._visitBody(_body_sans_docstring(node.body))
+        self.nsstack.pop()
+
+    def visitModuleBlocks(self, blocks):
+        """Visit a module given as a list of top-level blocks (each a list
+        of statements).
+
+        Returns a list with, for each block, the names of the module-level
+        symbols (re)defined by that block.
+        """
+        log.info("visitModuleBlocks")
+        symbols = _KeyRecordingDict()
+        self._startModule(blocks and blocks[0] or [], symbols)
+        names_from_block = []
+        for i, stmts in enumerate(blocks):
+            if i == 0:
+                stmts = _body_sans_docstring(stmts)
+            symbols.keys_set = []
+            self._visitBody(stmts)
+            names = []
+            for name in symbols.keys_set:
+                if name not in names:
+                    names.append(name)
+            names_from_block.append(names)
+        self.nsstack.pop()
+        return names_from_block
+
+    def symbolElements(self, names):
+        """Return the CIX elements for the given module-level symbols,
+        in the order in which getCIX() would emit them.
+        """
+        symbols = self.st[()]["symbols"]
+        elems = []
+        for var in sorted((symbols[n] for n in names),
+                          key=lambda v: v.get("line")):
+            self.cix = et.TreeBuilder()
+            self.cix_symbol(var)
+            elems.append(self.cix.close())
+        return elems
+
+    def visitReturn(self, node):
+        log.info("visitReturn: %r", node.value)
+        if node.value is None:
+            return
+        citdl_types = self._guessTypes(node.value)
+        for citdl in citdl_types:
+            if citdl:
+                citdl = citdl.split(None, 1)[0]
+                if citdl and citdl not in ("None", "NoneType"):
+                    if citdl in ("False", "True"):
+                        citdl = "bool"
+                    func_node = self.nsstack[-1]
+                    t = func_node["returns"]
+                    t[citdl] = t.get(citdl, 0) + 1
+
+    def visitClassDef(self, node):
+        lineno = self._defLineno(node)
+        log.info("visitClassDef:%d: %r", lineno,
+                 self.lines and self.lines[lineno-1])
+        locals = self.nsstack[-1]
+        name = node.name
+        nspath = locals["nspath"] + (name,)
+        namespace = {
+            "nspath": nspath,
+            "name": name,
+            "types": {"class": 1},
+            "classrefs": [],
+            "symbols": {},
+        }
+        namespace["declaration"] = namespace
+
+        namespace["line"] = lineno
+        lineend = _last_lineno(node, self.lines)
+        if lineend: namespace["lineend"] = lineend
+
+        attributes = []
+        if name.startswith("__") and name.endswith("__"):
+            pass
+        elif name.startswith("__"):
+            attributes.append("private")
+        elif name.startswith("_"):
+            attributes.append("protected")
+        namespace["attributes"] = ' '.join(attributes)
+
+        for baseNode in node.bases:
+            baseName = self._getExprRepr(baseNode)
+            classref = {"name": baseName, "types": {}}
+            for t in self._guessTypes(baseNode):
+                if t not in classref["types"]:
+                    classref["types"][t] = 0
+                classref["types"][t] += 1
+            namespace["classrefs"].append(classref)
+        doc = _docstring(node.body)
+        if doc:
+            siglines, desclines = util.parsePyFuncDoc(doc)
+            if siglines:
+                namespace["signature"] = "\n".join(siglines)
+            if desclines:
+                namespace["doc"] = "\n".join(desclines)
+        self.st[nspath] = locals["symbols"][name] = namespace
+
+        self.nsstack.append(namespace)
+        self._visitBody(_body_sans_docstring(node.body))
+        self.nsstack.pop()
+
+    def visitFunctionDef(self, node):
+        lineno = self._defLineno(node)
+        log.info("visitFunctionDef:%d: %r", lineno,
+                 self.lines and self.lines[lineno-1])
+        parent = self.nsstack[-1]
+        parentIsClass = _isclass(parent)
+
+        namespace = {
+            "types": {"function": 1},
+            "returns": {},
+            "arguments": [],
+            "symbols": {},
+        }
+
+        namespace["declaration"] = namespace
+        namespace["line"] = lineno
+        lineend = _last_lineno(node, self.lines)
+        if lineend: namespace["lineend"] = lineend
+
+        name = node.name
+
+        # Determine attributes
+        attributes = []
+        if name.startswith("__") and name.endswith("__"):
+            pass
+        elif name.startswith("__"):
+            attributes.append("private")
+        elif name.startswith("_"):
+            attributes.append("protected")
+        if name == "__init__" and parentIsClass:
+            attributes.append("__ctor__")
+
+        # process decorators
+        prop_var = None
+        for deco in node.decorator_list:
+            prop_mode = None
+            if isinstance(deco, ast.Name) and deco.id == 'property':
+                prop_mode = 'getter'
+            elif isinstance(deco, ast.Attribute) and deco.attr in ('getter',
+                                                                   'setter',
+                                                                   'deleter'):
+                prop_mode = deco.attr
+
+            if prop_mode:
+                if prop_mode == 'getter':
+                    # it's a getter, create a pseudo-var
+                    prop_var = parent["symbols"].get(name, None)
+                    if prop_var is None:
+                        prop_var = dict(name=name,
+                                        nspath=parent["nspath"] + (name,),
+                                        doc=None,
+                                        types={},
+                                        symbols={})
+                        var_attrs = ['property']
+                        if name.startswith("__") and name.endswith("__"):
+                            pass
+                        elif name.startswith("__"):
+                            var_attrs.append("private")
+                        elif name.startswith("_"):
+                            var_attrs.append("protected")
+                        prop_var["attributes"] = ' '.join(var_attrs)
+                        prop_var["declaration"] = prop_var
+                        parent["symbols"][name] = prop_var
+
+                    if not "is-class-var" in prop_var:
+                        prop_var["is-class-var"] = 1
+
+                # hide the function
+                attributes += ['__hidden__']
+                name += " (property %s)" % prop_mode
+
+                # only one property decorator makes sense
+                break
+
+        namespace["attributes"] = ' '.join(attributes)
+
+        if parentIsClass and name == "__init__":
+            fallbackSig = parent["name"]
+        else:
+            fallbackSig = name
+        namespace["name"] = name
+
+        nspath = parent["nspath"] + (name,)
+        namespace["nspath"] = nspath
+
+        # Handle arguments.
+        args = node.args
+        argnames = _argnames(args)
+        defaults = args.defaults
+        defaultArgsBaseIndex = len(args.args) - len(defaults)
+        varargsIndex = kwargsIndex = None
+        if args.vararg:
+            varargsIndex = len(args.args)
+        if args.kwarg:
+            kwargsIndex = len(argnames) - 1
+        sigArgs = []
+        for i in range(len(argnames)):
+            argOrArgTuple = argnames[i]
+
+            if isinstance(argOrArgTuple, tuple):
+                # If it is a tuple arg with a default assignment, then we
+                # drop that info (except for the sig): too hard and too rare
+                # to bother with.
+                sigArg = str(argOrArgTuple)
+                if i >= defaultArgsBaseIndex:
+                    defaultNode = defaults[i-defaultArgsBaseIndex]
+                    try:
+                        default = self._getExprRepr(defaultNode)
+                    except PythonCILEError, ex:
+                        raise PythonCILEError("unexpected default argument node "
+                                              "type for Function '%s': %s"
+                                              % (node.name, ex))
+                    sigArg += "="+default
+                sigArgs.append(sigArg)
+                arguments = []
+                for argName in argOrArgTuple:
+                    argument = {"name": argName,
+                                "nspath": nspath+(argName,),
+                                "doc": None,
+                                "types": {},
+                                "symbols": {}}
+                    arguments.append(argument)
+            else:
+                argName = argOrArgTuple
+                argument = {"name": argName,
+                            "nspath": nspath+(argName,),
+                            "doc": None,
+                            "types": {},
+                            "symbols": {}}
+                if i == kwargsIndex:
+                    argument["attributes"] = "kwargs"
+                    sigArgs.append("**"+argName)
+                elif i == varargsIndex:
+                    argument["attributes"] = "varargs"
+                    sigArgs.append("*"+argName)
+                elif i >= defaultArgsBaseIndex:
+                    defaultNode = defaults[i-defaultArgsBaseIndex]
+                    try:
+                        argument["default"] = self._getExprRepr(defaultNode)
+                    except PythonCILEError, ex:
+                        raise PythonCILEError("unexpected default argument node "
+                                              "type for Function '%s': %s"
+                                              % (node.name, ex))
+                    sigArgs.append(argName+'='+argument["default"])
+                    for t in self._guessTypes(defaultNode):
+                        log.info("guessed type: %s ::= %s", argName, t)
+                        if t not in argument["types"]:
+                            argument["types"][t] = 0
+                        argument["types"][t] += 1
+                else:
+                    sigArgs.append(argName)
+
+                if i == 0 and parentIsClass:
+                    # If this is a class method, then the first arg is the class
+                    # instance.
+                    className = self.nsstack[-1]["nspath"][-1]
+                    argument["types"][className] = 1
+                    argument["declaration"] = self.nsstack[-1]
+                arguments = [argument]
+
+            for argument in arguments:
+                if "declaration" not in argument:
+                    argument["declaration"] = argument # namespace dict of the declaration
+                namespace["arguments"].append(argument)
+                namespace["symbols"][argument["name"]] = argument
+        # Drop first "self" argument from class method signatures.
+        if _isclass(parent) and sigArgs:
+            del sigArgs[0]
+        fallbackSig += "(%s)" % (", ".join(sigArgs))
+        doc = _docstring(node.body)
+        if doc:
+            siglines, desclines = util.parsePyFuncDoc(doc, [fallbackSig])
+            namespace["signature"] = "\n".join(siglines)
+            if desclines:
+                namespace["doc"] = "\n".join(desclines)
+        else:
+            namespace["signature"] = fallbackSig
+        self.st[nspath] = parent["symbols"][name] = namespace
+
+        self.nsstack.append(namespace)
+        self._visitBody(_body_sans_docstring(node.body))
+        self.nsstack.pop()
+
+        if prop_var:
+            # this is a property getter function,
+            # copy its return types to the corresponding property variable...
+            var_types = prop_var["types"]
+            for t in namespace["returns"]:
+                if t not in var_types:
+                    var_types[t] = 0
+                else:
+                    var_types[t] += 1
+            # ... as well as its line number
+            prop_var["line"] = namespace["line"]
+
+    def visitImport(self, node):
+        log.info("visitImport:%d: %r", node.lineno,
+                 self.lines and self.lines[node.lineno-1])
+        imports = self.nsstack[-1].setdefault("imports", [])
+        for alias in node.names:
+            import_ = {"module": alias.name}
+            import_["line"] = node.lineno
+            if alias.asname: import_["alias"] = alias.asname
+            imports.append(import_)
+
+    def visitImportFrom(self, node):
+        log.info("visitImportFrom:%d: %r", node.lineno,
+                 self.lines and self.lines[node.lineno-1])
+        imports = self.nsstack[-1].setdefault("imports", [])
+        module = node.module or ""
+        if node.level > 0:
+            module = ("." * node.level) + module
+        for alias in node.names:
+            import_ = {"module": module, "symbol": alias.name}
+            import_["line"] = node.lineno
+            if alias.asname:
+                import_["alias"] = alias.asname
+            imports.append(import_)
+
+    def _assignVariable(self, varName, namespace, rhsNode, line,
+                        isClassVar=0):
+        """Handle a simple variable name assignment.
+
+            "varName" is the variable name being assign to.
+            "namespace" is the namespace dict to which to assign the variable.
+            "rhsNode" is the ast node of the right-hand side of the
+                assignment.
+            "line" is the line number on which the variable is being assigned.
+            "isClassVar" (optional) is a boolean indicating if this var is
+                a class variable, as opposed to an instance variable
+        """
+        log.debug("_assignVariable(varName=%r, namespace %s, rhsNode=%r, "
+                  "line, isClassVar=%r)", varName,
+                  '.'.join(namespace["nspath"]), rhsNode, isClassVar)
+        variable = namespace["symbols"].get(varName, None)
+
+        new_var = False
+        if variable is None:
+            new_var = True
+            variable = {"name": varName,
+                        "nspath": namespace["nspath"]+(varName,),
+                        "doc": None,
+                        "types": {},
+                        "symbols": {}}
+            # Determine attributes
+            attributes = []
+            if varName.startswith("__") and varName.endswith("__"):
+                pass
+            elif varName.startswith("__"):
+                attributes.append("private")
+            elif varName.startswith("_"):
+                attributes.append("protected")
+            variable["attributes"] = ' '.join(attributes)
+
+            variable["declaration"] = variable
+            if line: variable["line"] = line
+            namespace["symbols"][varName] = variable
+
+        if isClassVar and not "is-class-var" in variable:
+            variable["is-class-var"] = 1
+            # line number of first class-level assignment wins
+            if line:
+                variable["line"] = line
+
+        if (not new_var and
+            _isfunction(variable) and
+            isinstance(rhsNode, ast.Call) and
+            rhsNode.args and
+            isinstance(rhsNode.args[0], ast.Name) and
+            variable["name"] == rhsNode.args[0].id
+            ):
+            # a speial case for 2.4-styled decorators
+            return
+
+        varTypes = variable["types"]
+        for t in self._guessTypes(rhsNode, namespace):
+            log.info("guessed type: %s ::= %s", varName, t)
+            if t not in varTypes:
+                varTypes[t] = 0
+            varTypes[t] += 1
+
+    def _visitSimpleAssign(self, lhsNode, rhsNode, line):
+        log.debug("_visitSimpleAssign(lhsNode=%r, rhsNode=%r)", lhsNode,
+                  rhsNode)
+        if isinstance(lhsNode, ast.Name):
+            # E.g.:  foo = ...
+            ns = self.nsstack[-1]
+            self._assignVariable(lhsNode.id, ns, rhsNode, line,
+                                 isClassVar=_isclass(ns))
+        elif isinstance(lhsNode, ast.Attribute):
+            # E.g.:  foo.bar = ...
+            # If we can resolve "foo", then we update that namespace.
+            variable, citdl = self._resolveObjectRef(lhsNode.value)
+            if variable:
+                self._assignVariable(lhsNode.attr,
+                                     variable["declaration"], rhsNode, line)
+        else:
+            log.debug("could not handle simple assign (module '%s'): "
+                      "lhsNode=%r, rhsNode=%r", self.moduleName, lhsNode,
+                      rhsNode)
+
+    def _assignLineno(self, node):
+        """The line number of the first '=' of an assignment, which is what
+        `compiler` uses for the line of an assignment.
+        """
+        if isinstance(node.targets[0], ast.Name):
+            lineno = node.lineno
+        else:
+            lineno = _max_lineno(node.targets[0])
+        # The "=" may follow a backslash line continuation.
+        lines = self.lines
+        while lineno < len(lines) and lines[lineno-1].endswith("\\") \
+              and "=" not in lines[lineno-1] \
+              and lines[lineno].lstrip().startswith("="):
+            lineno += 1
+        return lineno
+
+    def visitAssign(self, node):
+        lhsNode = node.targets[0]
+        rhsNode = node.value
+        lineno = self._assignLineno(node)
+        log.info("visitAssign:%d: %r", lineno,
+                 self.lines and self.lines[lineno-1])
+        if isinstance(lhsNode, (ast.Name, ast.Attribute)):
+            self._visitSimpleAssign(lhsNode, rhsNode, lineno)
+        elif isinstance(lhsNode, (ast.Tuple, ast.List)):
+            if isinstance(rhsNode, (ast.Tuple, ast.List)):
+                if len(lhsNode.elts) == len(rhsNode.elts):
+                    for i in range(len(lhsNode.elts)):
+                        self._visitSimpleAssign(lhsNode.elts[i],
+                                                rhsNode.elts[i], lineno)
+            elif isinstance(rhsNode, ast.Dict):
+                if len(lhsNode.elts) == len(rhsNode.keys):
+                    for i in range(len(lhsNode.elts)):
+                        self._visitSimpleAssign(lhsNode.elts[i],
+                                                rhsNode.keys[i], lineno)
+            elif isinstance(rhsNode, ast.Call):
+                for i in range(len(lhsNode.elts)):
+                    self._visitSimpleAssign(lhsNode.elts[i],
+                                            None, # we don't have a good type.
+                                            lineno)
+            else:
+                log.info("visitAssign:: skipping unknown rhsNode type: %r - %r",
+                         type(rhsNode), rhsNode)
+        elif isinstance(lhsNode, ast.Subscript):
+            # E.g.:  bar[1] = "foo"
+            # We don't bother with these: too hard.
+            log.info("visitAssign:: skipping subscript - too hard")
+        else:
+            raise PythonCILEError("unexpected type of LHS of assignment: %r"
+                                  % lhsNode)
+
+    def _resolveObjectRef(self, expr):
+        """Try to resolve the given expression to a variable namespace.
+
+        See pythoncile1.AST2CIXVisitor._resolveObjectRef().
+        """
+        log.debug("_resolveObjectRef(expr=%r)", expr)
+        if isinstance(expr, ast.Name):
+            name = expr.id
+            nspath = self.nsstack[-1]["nspath"]
+            for i in range(len(nspath), -1, -1):
+                ns = self.st[nspath[:i]]
+                if name in ns["symbols"]:
+                    return (ns["symbols"][name], None)
+                else:
+                    log.debug("_resolveObjectRef: %r not in namespace %r", name,
+                              '.'.join(ns["nspath"]))
+        elif isinstance(expr, ast.Attribute):
+            obj, citdl = self._resolveObjectRef(expr.value)
+            decl = obj and obj["declaration"] or None # want the declaration
+            if decl and expr.attr in decl["symbols"]:
+                return (decl["symbols"][expr.attr], None)
+            elif isinstance(expr.value, ast.Num):
+                # Special case: specifically refer to type object for
+                # attribute access on constants, e.g.:
+                #   ' '.join
+                return (None, "__builtins__.%s.%s"
+                              % (type(expr.value.n).__name__, expr.attr))
+            elif isinstance(expr.value, ast.Str):
+                return (None, "__builtins__.%s.%s"
+                              % (type(expr.value.s).__name__, expr.attr))
+        elif isinstance(expr, ast.Num):
+            # Special case: specifically refer to type object for constants.
+            return (None, "__builtins__.%s" % type(expr.n).__name__)
+        elif isinstance(expr, ast.Str):
+            return (None, "__builtins__.%s" % type(expr.s).__name__)
+
+        # Fallback: return CITDL code for delayed resolution.
+        log.debug("_resolveObjectRef: could not resolve %r", expr)
+        scope = '.'.join(self.nsstack[-1]["nspath"])
+        exprrepr = self._getCITDLExprRepr(expr)
+        if exprrepr:
+            if scope:
+                citdl = "%s %s" % (exprrepr, scope)
+            else:
+                citdl = exprrepr
+        else:
+            citdl = None
+        return (None, citdl)
+
+    def _guessTypes(self, expr, curr_ns=None):
+        log.debug("_guessTypes(expr=%r)", expr)
+        ts = []
+        if isinstance(expr, ast.Num):
+            ts = [type(expr.n).__name__]
+        elif isinstance(expr, ast.Str):
+            ts = [type(expr.s).__name__]
+        elif isinstance(expr, ast.Tuple):
+            ts = [tuple.__name__]
+        elif isinstance(expr, (ast.List, ast.ListComp)):
+            ts = [list.__name__]
+        elif isinstance(expr, ast.Set):
+            ts = [set.__name__]
+        elif isinstance(expr, ast.Dict):
+            ts = [dict.__name__]
+        elif isinstance(expr, ast.BinOp) and isinstance(expr.op, _ARITH_OPS):
+            order = ["int", "bool", "long", "float", "complex", "string",
+                     "unicode"]
+            possibles = self._guessTypes(expr.left)+self._guessTypes(expr.right)
+            ts = []
+            highest = -1
+            for possible in possibles:
+                if possible not in order:
+                    ts.append(possible)
+                else:
+                    highest = max(highest, order.index(possible))
+            if not ts and highest > -1:
+                ts = [order[highest]]
+        elif isinstance(expr, ast.BinOp) and isinstance(expr.op, _INT_OPS):
+            ts = [int.__name__]
+        elif isinstance(expr, ast.BoolOp):
+            ts = []
+            for node in expr.values:
+                for t in self._guessTypes(node):
+                    if t not in ts:
+                        ts.append(t)
+        elif isinstance(expr, ast.Compare) or (isinstance(expr, ast.UnaryOp)
+                                               and isinstance(expr.op, ast.Not)):
+            ts = [type(1==2).__name__]
+        elif isinstance(expr, ast.UnaryOp):
+            ts = self._guessTypes(expr.operand)
+        elif _is_simple_slice(expr):
+            ts = [list.__name__]
+        elif isinstance(expr, ast.Repr):
+            ts = [str.__name__]
+
+        elif isinstance(expr, (ast.Name, ast.Attribute)):
+            variable, citdl = self._resolveObjectRef(expr)
+            if variable:
+                if _isclass(variable) or _isfunction(variable):
+                    ts = [ '.'.join(variable["nspath"]) ]
+                else:
+                    ts = variable["types"].keys()
+            elif citdl:
+                ts = [citdl]
+        elif isinstance(expr, ast.Call):
+            variable, citdl = self._resolveObjectRef(expr.func)
+            if variable:
+                # Remove the common leading namespace elements.
+                scope_parts = list(variable["nspath"])
+                if curr_ns is not None:
+                    for part in curr_ns["nspath"]:
+                        if scope_parts and part == scope_parts[0]:
+                            scope_parts.pop(0)
+                        else:
+                            break
+                scope = '.'.join(scope_parts)
+                if _isclass(variable):
+                    ts = [ scope ]
+                else:
+                    ts = [scope+"()"]
+            elif citdl:
+                # Add the "()" to the type part only, not to the scope
+                # part (if any), e.g. "string.split myfunction".
+                ts = citdl.split(None, 1)
+                ts[0] += "()"
+                ts = [" ".join(ts)]
+        elif isinstance(expr, (ast.Subscript, ast.Lambda)):
+            pass
+        else:
+            log.info("don't know how to guess types from this expr: %r" % expr)
+        return ts
+
+    def _getStarArgReprs(self, node):
+        # pythoncile1 iterates over the *children* of the `compiler` node
+        # for a `*args` or `**kwargs` call argument, which only works for
+        # sequence displays.
+        if isinstance(node, (ast.Tuple, ast.List, ast.Set)):
+            return [self._getExprRepr(c) for c in node.elts]
+        raise PythonCILEError("don't know how to get string repr "
+                              "of expression: %r" % node)
+
+    def _getExprRepr(self, node):
+        """Return a string representation for this Python expression.
+
+        Raises PythonCILEError if can't do it.
+        """
+        s = None
+        if isinstance(node, ast.Name):
+            s = node.id
+        elif isinstance(node, ast.Num):
+            s = repr(node.n)
+        elif isinstance(node, ast.Str):
+            s = repr(node.s)
+        elif isinstance(node, ast.Attribute):
+            s = '.'.join([self._getExprRepr(node.value), node.attr])
+        elif isinstance(node, ast.List):
+            items = [self._getExprRepr(c) for c in node.elts]
+            s = "[%s]" % ", ".join(items)
+        elif isinstance(node, ast.Tuple):
+            items = [self._getExprRepr(c) for c in node.elts]
+            s = "(%s)" % ", ".join(items)
+        elif isinstance(node, ast.Set):
+            items = [self._getExprRepr(c) for c in node.elts]
+            s = "{%s}" % ", ".join(items)
+        elif isinstance(node, ast.Dict):
+            items = ["%s: %s" % (self._getExprRepr(k), self._getExprRepr(v))
+                     for (k, v) in zip(node.keys, node.values)]
+            s = "{%s}" % ", ".join(items)
+        elif isinstance(node, ast.Call):
+            s = self._getExprRepr(node.func)
+            s += "("
+            allargs = []
+            for arg in node.args:
+                allargs.append( self._getExprRepr(arg) )
+            for keyword in node.keywords:
+                allargs.append( self._getExprRepr(keyword) )
+            if node.starargs:
+                for arg in self._getStarArgReprs(node.starargs):
+                    allargs.append( "*" + arg )
+            if node.kwargs:
+                for arg in self._getStarArgReprs(node.kwargs):
+                    allargs.append( "**" + arg )
+            s += ",".join( allargs )
+            s += ")"
+        elif _is_simple_slice(node):
+            s = self._getExprRepr(node.value)
+            s += "["
+            if node.slice.lower:
+                s += self._getExprRepr(node.slice.lower)
+            s += ":"
+            if node.slice.upper:
+                s += self._getExprRepr(node.slice.upper)
+            s += "]"
+        elif isinstance(node, ast.Subscript):
+            s = "[%s]" % self._getExprRepr(node.value)
+        elif isinstance(node, ast.Repr):
+            s = "`%s`" % self._getExprRepr(node.value)
+        elif isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+            s = "-" + self._getExprRepr(node.operand)
+        elif isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.UAdd):
+            s = "+" + self._getExprRepr(node.operand)
+        elif isinstance(node, ast.BinOp) and isinstance(node.op,
+                (ast.BitOr, ast.BitAnd, ast.BitXor)):
+            # `compiler` flattens chains of these into one n-ary node.
+            opclass = node.op.__class__
+            cnodes = []
+            while isinstance(node, ast.BinOp) \
+                  and node.op.__class__ is opclass:
+                cnodes.append(node.right)
+                node = node.left
+            cnodes.append(node)
+            cnodes.reverse()
+            creprs = []
+            for cnode in cnodes:
+                if isinstance(cnode, (ast.Name, ast.Str)) \
+                   or (isinstance(cnode, ast.Num)
+                       and not repr(cnode.n).startswith("-")):
+                    crepr = self._getExprRepr(cnode)
+                else:
+                    crepr = "(%s)" % self._getExprRepr(cnode)
+                creprs.append(crepr)
+            s = _BINOP_STRS[opclass].join(creprs)
+        elif isinstance(node, ast.BinOp):
+            s = self._getExprRepr(node.left) + _BINOP_STRS[node.op.__class__] \
+                + self._getExprRepr(node.right)
+        elif isinstance(node, ast.keyword):
+            s = node.arg + "=" + self._getExprRepr(node.value)
+        elif isinstance(node, ast.Lambda):
+            s = "lambda"
+            argnames = _argnames(node.args)
+            defaults = node.args.defaults
+            defaultArgsBaseIndex = len(node.args.args) - len(defaults)
+            varargsIndex = kwargsIndex = None
+            if node.args.vararg:
+                varargsIndex = len(node.args.args)
+            if node.args.kwarg:
+                kwargsIndex = len(argnames) - 1
+            args = []
+            for i in range(len(argnames)):
+                argOrArgTuple = argnames[i]
+                if isinstance(argOrArgTuple, tuple):
+                    arg = "(%s)" % ','.join(argOrArgTuple)
+                    if i >= defaultArgsBaseIndex:
+                        defaultNode = defaults[i-defaultArgsBaseIndex]
+                        try:
+                            arg += "="+self._getExprRepr(defaultNode)
+                        except PythonCILEError:
+                            #XXX Work around some trouble cases.
+                            arg += arg+"=..."
+                else:
+                    argname = argOrArgTuple
+                    if i == kwargsIndex:
+                        arg = "**"+argname
+                    elif i == varargsIndex:
+                        arg = "*"+argname
+                    elif i >= defaultArgsBaseIndex:
+                        defaultNode = defaults[i-defaultArgsBaseIndex]
+                        try:
+                            arg = argname+"="+self._getExprRepr(defaultNode)
+                        except PythonCILEError:
+                            #XXX Work around some trouble cases.
+                            arg = argname+"=..."
+                    else:
+                        arg = argname
+                args.append(arg)
+            if args:
+                s += " " + ",".join(args)
+            try:
+                s += ": " + self._getExprRepr(node.body)
+            except PythonCILEError:
+                #XXX Work around some trouble cases.
+                s += ":..."
+        else:
+            raise PythonCILEError("don't know how to get string repr "
+                                  "of expression: %r" % node)
+        return s
+
+    def _getCITDLExprRepr(self, node, _level=0):
+        """Return a string repr for this expression that CITDL processing
+        can handle, or None if it is out of CITDL's scope.
+        """
+        s = None
+        if isinstance(node, ast.Name):
+            s = node.id
+        elif isinstance(node, ast.Num):
+            s = repr(node.n)
+        elif isinstance(node, ast.Str):
+            s = repr(node.s)
+        elif isinstance(node, ast.Attribute):
+            exprRepr = self._getCITDLExprRepr(node.value, _level+1)
+            if exprRepr is not None:
+                s = '.'.join([exprRepr, node.attr])
+        elif isinstance(node, ast.List):
+            s = "[]"
+        elif isinstance(node, ast.Tuple):
+            s = "()"
+        elif isinstance(node, ast.Set):
+            s = "set()"
+        elif isinstance(node, ast.Dict):
+            s = "{}"
+        elif isinstance(node, ast.Call):
+            # Only allow a call at the top-level. I.e. this:
+            #   spam.ham.eggs()
+            # is in scope, but this:
+            #   spam.ham().eggs
+            # is not.
+            if _level == 0:
+                s = self._getCITDLExprRepr(node.func, _level+1)
+                if s is not None:
+                    s += "()"
+        return s
+
+
+
+#---- parsing and syntax error recovery
+
+# Tokens relevant to finding where top-level statements start.
+_block_token_re = re.compile(r'''("""|\'\'\'|"(?:\\.|[^"\\])*"?|'(?:\\.|[^'\\])*'?|\#|[][(){}])''')
+_block_continuation_re = re.compile(r"(else|elif|except|finally)\b")
+_block_reset_re = re.compile(r"(@|(def|class|import|from)\b)")
+
+def _top_level_block_starts(lines):
+    """Return the indeces of the lines starting top-level statements.
+
+    This is a heuristic line scan (tracking brackets, strings and line
+    continuations) used only for error recovery. The first index is
+    always 0.
+    """
+    starts = [0]
+    depth = 0
+    triple = None       # the open triple-quote delimiter, if any
+    continued = False   # if the previous line ended with a backslash
+    in_decorator = False
+    for i, line in enumerate(lines):
+        pos = 0
+        if triple is not None:
+            end = line.find(triple)
+            if end == -1:
+                continue
+            pos = end + 3
+            triple = None
+        elif not continued and line[:1] not in ("", " ", "\t", "\r", "\n",
+                                                "#", ")", "]", "}"):
+            if depth and _block_reset_re.match(line):
+                # Can't be inside brackets: there must be an unclosed
+                # bracket (i.e. a syntax error) before here.
+                depth = 0
+            if not depth:
+                if not in_decorator and i != 0 \
+                   and not _block_continuation_re.match(line):
+                    starts.append(i)
+                in_decorator = line.startswith("@")
+        while True:
+            match = _block_token_re.search(line, pos)
+            if match is None:
+                break
+            token = match.group(1)
+            pos = match.end()
+            if token in ('"""', "'''"):
+                end = line.find(token, pos)
+                if end == -1:
+                    triple = token
+                    break
+                pos = end + 3
+            elif token == "#":
+                break
+            elif token in "([{":
+                depth += 1
+            elif token in ")]}":
+                depth = max(depth - 1, 0)
+        continued = (triple is None and line.rstrip("\r\n").endswith("\\"))
+    return starts
+
+def _compile_ast(content, filename, flags=0):
+    return compile(content, filename, "exec", ast.PyCF_ONLY_AST | flags)
+
+# `compiler` ignores "from __future__ import unicode_literals" (string
+# literals are still `str`), `compile()` does not. To get the same type
+# guesses, that import is parsed as another (no-op) feature and then
+# restored in the tree.
+_unicode_literals_re = re.compile(
+    r"^([ \t]*from[ \t]+__future__[ \t]+import\b[^\n]*?)\bunicode_literals\b",
+    re.M)
+_unicode_literals_standin = "generators"
+
+def _hide_unicode_literals(content):
+    """Return (<content>, <linenos>) where <linenos> are the lines on which
+    a "unicode_literals" future import was replaced.
+    """
+    if "unicode_literals" not in content:
+        return content, None
+    linenos = set()
+    def standin(match):
+        linenos.add(content.count("\n", 0, match.start()) + 1)
+        return match.group(1) + _unicode_literals_standin
+    return _unicode_literals_re.sub(standin, content), linenos
+
+def _restore_unicode_literals(module, linenos):
+    for stmt in module.body:
+        if isinstance(stmt, ast.ImportFrom) and stmt.module == "__future__" \
+           and stmt.lineno in linenos:
+            for alias in stmt.names:
+                if alias.name == _unicode_literals_standin:
+                    alias.name = "unicode_literals"
+                    break
+
+def _future_flags(tree):
+    flags = 0
+    for stmt in tree.body:
+        if isinstance(stmt, ast.ImportFrom) and stmt.module == "__future__":
+            for alias in stmt.names:
+                feature = getattr(__future__, alias.name, None)
+                if feature is not None:
+                    flags |= feature.compiler_flag
+    return flags
+
+def _null_out_line(lines, i):
+    offender = lines[i]
+    indent = offender[:len(offender) - len(offender.lstrip(" \t"))]
+    lines[i] = indent + "pass\n"
+
+def _prepare_content(content):
+    """Return (<content>, <unicode-literals-linenos>) for the content as
+    it should be passed to `_compile_ast()`.
+    """
+    # Normalize EOLs, as pythoncile1 does: line numbers must match.
+    content = '\n'.join(content.splitlines(0))
+    return _hide_unicode_literals(content)
+
+def _getAST(content, filename="<string>"):
+    """Return an `ast.Module` for the given Python content.
+
+    On a syntax error this falls back to parsing the content one
+    top-level block at a time (see the module docstring).
+    """
+    content, unicode_literals_linenos = _prepare_content(content)
+    try:
+        module = _compile_ast(content, filename)
+    except SyntaxError, ex:
+        log.debug("ast parse: syntax error on line %s", ex.lineno)
+        module = _getASTByBlocks(content, filename)
+    if unicode_literals_linenos:
+        _restore_unicode_literals(module, unicode_literals_linenos)
+    return module
+
+def _getASTByBlocks(content, filename):
+    """Parse the content one top-level block at a time, nulling out the
+    lines with syntax errors in each block. Unrecoverable blocks are
+    dropped.
+    """
+    lines = (content + '\n').splitlines(1)
+    starts = _top_level_block_starts(lines)
+    module = ast.Module(body=[])
+    flags = 0
+    num_dropped = 0
+    for start, end in zip(starts, starts[1:] + [len(lines)]):
+        block_lines = lines[start:end]
+        for attempt in range(_MAX_FIXES_PER_BLOCK + 1):
+            try:
+                tree = _compile_ast(''.join(block_lines), filename, flags)
+            except SyntaxError, ex:
+                errlineno = ex.lineno
+                if attempt == _MAX_FIXES_PER_BLOCK or not errlineno \
+                   or errlineno > len(block_lines):
+                    log.info("cannot recover from syntax error on line %s: "
+                             "dropping lines %d-%d", ex.lineno and
+                             ex.lineno + start, start+1, end)
+                    num_dropped += 1
+                    break
+                log.info("syntax error on line %d: %r: trying to recover",
+                         errlineno + start, block_lines[errlineno-1])
+                _null_out_line(block_lines, errlineno-1)
+            else:
+                ast.increment_lineno(tree, start)
+                flags |= _future_flags(tree)
+                module.body += tree.body
+                break
+    if num_dropped == len(starts):
+        raise ValueError("cannot recover from syntax errors")
+    return module
+
+
+
+#---- incremental rescanning
+
+class _Block(object):
+    """A top-level block of a scanned module: one (or more, if on the same
+    line) top-level statements and the lines up to the next block.
+    """
+    __slots__ = ("text", "nlines", "stmts", "line_delta", "names")
+
+    def __init__(self, text, stmts, names):
+        self.text = text
+        self.nlines = text.count('\n')
+        self.stmts = stmts
+        # Pending line number adjustment for `stmts` (applied lazily, see
+        # `current_stmts()`).
+        self.line_delta = 0
+        # The module-level symbols defined by this block.
+        self.names = names
+
+    def shifted(self, delta):
+        """Return a copy of this block moved by `delta` lines."""
+        block = _Block.__new__(_Block)
+        block.text = self.text
+        block.nlines = self.nlines
+        block.stmts = self.stmts
+        block.line_delta = self.line_delta + delta
+        block.names = self.names
+        return block
+
+    def current_stmts(self):
+        if self.line_delta:
+            ast.increment_lineno(ast.Module(body=self.stmts), self.line_delta)
+            self.line_delta = 0
+        return self.stmts
+
+
+def _assigned_attr_base_names(stmts):
+    """Return the set of names at the base of the attributes assigned to
+    (as in `AST2CIXVisitor.visitAssign()`) in the given statements, e.g.
+    "foo" for "foo.bar.baz = 42".
+    """
+    names = set()
+    for node in ast.walk(ast.Module(body=stmts)):
+        if not isinstance(node, ast.Assign):
+            continue
+        targets = node.targets[:1]
+        if isinstance(targets[0], (ast.Tuple, ast.List)):
+            targets = targets[0].elts
+        for target in targets:
+            if isinstance(target, ast.Attribute):
+                while isinstance(target, ast.Attribute):
+                    target = target.value
+                if isinstance(target, ast.Name):
+                    names.add(target.id)
+    return names
+
+def _attr_ref_re(name):
+    """A (conservative) pattern for attribute references on the given
+    name, e.g. "foo.bar" or "(foo).bar" for "foo".
+    """
+    return re.compile(r"\b%s\b[\s\\)]*\." % re.escape(name))
+
+def _blocks_from_module(module, content):
+    """Split the (prepared) content and its parsed module into a list of
+    (<text>, <stmts>) top-level blocks.
+    """
+    lines = content.splitlines(1)
+    blocks = []
+    prev_start = 0
+    for stmt in module.body:
+        start = min([stmt.lineno] + [d.lineno for d in
+                     getattr(stmt, "decorator_list", ())]) - 1
+        # Bare string statements are not split off: `ast` gives the *last*
+        # line of multi-line strings.
+        if blocks and (start <= prev_start or (isinstance(stmt, ast.Expr)
+                       and isinstance(stmt.value, ast.Str))):
+            blocks[-1][1].append(stmt)
+            continue
+        if blocks:
+            blocks[-1][0] = ''.join(lines[prev_start:start])
+        else:
+            start = 0
+        blocks.append([None, [stmt]])
+        prev_start = start
+    if blocks:
+        blocks[-1][0] = ''.join(lines[prev_start:])
+    return blocks
+
+
+_coding_re = re.compile(r"^[ \t\f]*#.*?coding[:=][ \t]*([-\w.]+)")
+
+def _coding_line(content):
+    """Return a source encoding declaration line for the encoding
+    declared by the given content, or None.
+    """
+    if content.startswith("\xef\xbb\xbf"):
+        return "# coding: utf-8\n"
+    for line in content.split("\n", 2)[:2]:
+        match = _coding_re.match(line)
+        if match:
+            return "# coding: %s\n" % match.group(1)
+    return None
+
+
+class IncrementalScanState(object):
+    """What `scan_et_incremental()` keeps from one scan of a file to
+    re-use in the next.
+    """
+    def __init__(self, lang, filename, blocks, flags, coding_line, file):
+        self.lang = lang
+        self.filename = filename
+        self.blocks = blocks
+        self.flags = flags     # the __future__ flags of the module
+        # The encoding declaration to parse a block after the first with.
+        self.coding_line = coding_line
+        self.file = file       # the CIX <file> element
+
+    def __repr__(self):
+        return "<IncrementalScanState %r: %d blocks>" \
+               % (self.filename, len(self.blocks))
+
+
+def _changed_block(state, content):
+    """Find the one top-level block of `state` changed by the new
+    (prepared) content.
+
+    Returns (<block index>, <new block text>, <start line>, <start pos>,
+    <end pos>) or None if the content is unchanged. Raises
+    _FullScanNeeded if more than one block changed.
+    """
+    blocks = state.blocks
+    num_blocks = len(blocks)
+    pos = 0
+    start_line = 0
+    p = 0
+    while p < num_blocks and content.startswith(blocks[p].text, pos):
+        pos += len(blocks[p].text)
+        start_line += blocks[p].nlines
+        p += 1
+    end = len(content)
+    s = 0
+    while p + s < num_blocks:
+        text = blocks[num_blocks-s-1].text
+        if end - len(text) < pos or not content.startswith(text,
+                                                            end - len(text)):
+            break
+        end -= len(text)
+        s += 1
+    if p + s == num_blocks and pos == end:
+        return None
+    if p + s != num_blocks - 1:
+        raise _FullScanNeeded("more than one top-level block changed")
+    return p, content[pos:end], start_line, pos, end
+
+
+class _FullScanNeeded(Exception):
+    pass
+
+
+def _max_line(elem):
+    """The highest "line" or "lineend" in the given CIX element tree. (An
+    element can contain symbols from later blocks, e.g. class attributes
+    assigned to at the module-level.)
+    """
+    return max(int(e.get("lineend") or e.get("line") or 0)
+               for e in elem.getiterator())
+
+def _copy_elem(elem, first_line, delta):
+    """Return a copy of the given CIX element with "line" and "lineend"
+    attributes from `first_line` on moved by `delta` lines.
+    """
+    attrs = dict(elem.items())
+    for attr in ("line", "lineend"):
+        if attr in attrs and int(attrs[attr]) >= first_line:
+            attrs[attr] = str(int(attrs[attr]) + delta)
+    copy = et.Element(elem.tag, attrs)
+    copy.text = elem.text
+    copy.tail = elem.tail
+    for child in elem:
+        copy.append(_copy_elem(child, first_line, delta))
+    return copy
+
+
+def _rescan_block(state, content, prepared_content, moduleName, path):
+    """Rescan the one changed top-level block of `state`.
+
+    Returns (<file element>, <new state>); if the content is unchanged
+    these are the old ones. Raises _FullScanNeeded if the changed block
+    cannot be rescanned on its own.
+    """
+    changed = _changed_block(state, prepared_content)
+    if changed is None:
+        return state.file, state
+    k, text, start_line, pos, end = changed
+    old_block = state.blocks[k]
+    if len(old_block.stmts) != 1 or len(old_block.names) != 1 \
+       or not isinstance(old_block.stmts[0], (ast.FunctionDef, ast.ClassDef)):
+        raise _FullScanNeeded("changed block is not a def or class")
+    name = old_block.names[0]
+
+    # The new block must parse on its own to the same kind of definition.
+    # The encoding declaration is needed to decode string literals.
+    if k and state.coding_line:
+        source, line_offset = state.coding_line + text, start_line - 1
+    else:
+        source, line_offset = text, start_line
+    try:
+        tree = _compile_ast(source, state.filename, state.flags)
+    except SyntaxError, ex:
+        raise _FullScanNeeded("syntax error in changed block: %s" % ex)
+    if len(tree.body) != 1 or tree.body[0].__class__ is not \
+       old_block.stmts[0].__class__ or tree.body[0].name != name:
+        raise _FullScanNeeded("top-level structure changed")
+    ast.increment_lineno(tree, line_offset)
+
+    # The symbols of the other blocks must not depend on this one, nor
+    # this one assign into them.
+    other_blocks = state.blocks[:k] + state.blocks[k+1:]
+    for block in other_blocks:
+        if name in block.names:
+            raise _FullScanNeeded("%r is also defined in another block"
+                                  % name)
+    attr_ref_re = _attr_ref_re(name)
+    if attr_ref_re.search(prepared_content, 0, pos) \
+       or attr_ref_re.search(prepared_content, end):
+        raise _FullScanNeeded("attributes of %r are referred to in another "
+                              "block" % name)
+    assigned = _assigned_attr_base_names(old_block.stmts + tree.body)
+    if assigned:
+        for block in other_blocks:
+            if assigned.intersection(block.names):
+                raise _FullScanNeeded("%r assigns to another block's symbols"
+                                      % name)
+
+    # Replay the visitor over the blocks up to and including this one to
+    # get the same symbol table state as a full scan would.
+    visitor = AST2CIXVisitor(moduleName, content=content, lang=state.lang)
+    names_from_block = visitor.visitModuleBlocks(
+        [b.current_stmts() for b in state.blocks[:k]] + [tree.body])
+    if names_from_block[-1] != [name]:
+        raise _FullScanNeeded("%r defines other module symbols" % name)
+    new_elem = visitor.symbolElements([name])[0]
+
+    # Splice the new element into a copy of the old blob. The elements
+    # not affected by the change are shared with the old blob.
+    delta = text.count('\n') - old_block.nlines
+    first_line = start_line + old_block.nlines + 1
+    old_blob = state.file[0]
+    blob_attrs = dict(old_blob.items())
+    blob_attrs.pop("src", None)   # set by the database
+    blob = et.Element(old_blob.tag, blob_attrs)
+    blob.text = old_blob.text
+    num_replaced = 0
+    for child in old_blob:
+        if child.tag != "import" and child.get("name") == name:
+            blob.append(new_elem)
+            num_replaced += 1
+        elif delta and _max_line(child) >= first_line:
+            blob.append(_copy_elem(child, first_line, delta))
+        else:
+            blob.append(child)
+    if num_replaced != 1:
+        raise _FullScanNeeded("cannot find <%s> element to replace" % name)
+    file = et.Element(state.file.tag, dict(state.file.items()))
+    file.append(blob)
+
+    new_block = _Block(text, tree.body, old_block.names)
+    blocks = state.blocks[:k] + [new_block]
+    if delta:
+        blocks += [b.shifted(delta) for b in state.blocks[k+1:]]
+    else:
+        blocks += state.blocks[k+1:]
+    log.debug("rescanned '%s' block %r (lines %d-%d)", state.filename, name,
+              start_line+1, start_line+new_block.nlines)
+    return file, IncrementalScanState(state.lang, state.filename, blocks,
+                                      state.flags, state.coding_line, file)
+
+
+def _scan_file_incremental(content, filename, path, moduleName, lang):
+    """Do a full scan for scan_et_incremental().
+
+    Returns (<file element>, <state>); <state> is None if the content
+    had syntax errors.
+    """
+    prepared_content, unicode_literals_linenos = _prepare_content(content)
+    try:
+        try:
+            tree = _compile_ast(prepared_content, filename)
+        except SyntaxError, ex:
+            log.debug("ast parse: syntax error on line %s", ex.lineno)
+            tree = _getASTByBlocks(prepared_content, filename)
+            prepared_content = None
+        # Before restoring "unicode_literals": the blocks are re-parsed
+        # with it hidden.
+        flags = _future_flags(tree)
+        if unicode_literals_linenos:
+            _restore_unicode_literals(tree, unicode_literals_linenos)
+    except Exception, ex:
+        file = et.Element('file', _et_attrs(dict(lang=lang,
+                                                 path=path,
+                                                 error=str(ex))))
+        return file, None
+
+    visitor = AST2CIXVisitor(moduleName, content=content, lang=lang)
+    if prepared_content is None:
+        visitor.visit(tree)
+        return visitor.getCIX(path), None
+    text_and_stmts = _blocks_from_module(tree, prepared_content)
+    names_from_block = visitor.visitModuleBlocks(
+        [stmts for text, stmts in text_and_stmts])
+    file = visitor.getCIX(path)
+    blocks = [_Block(text, stmts, names) for (text, stmts), names
+              in zip(text_and_stmts, names_from_block)]
+    state = IncrementalScanState(lang, filename, blocks, flags,
+                                 _coding_line(prepared_content), file)
+    return file, state
+
+
+
+#---- public module interface
+
+def scan_cix(content, filename, md5sum=None, mtime=None, lang="Python"):
+    """Scan the given Python content and return Code Intelligence data
+    conforming the the Code Intelligence XML format.
+
+    See scan_et() for details.
+    """
+    codeintel = scan_et(content, filename, md5sum, mtime, lang)
+    tree = et.ElementTree(codeintel)
+    stream = StringIO()
+    # this is against the W3C spec, but ElementTree wants it lowercase
+    tree.write(stream, "utf-8")
+    # This matches pythoncile1.scan_cix().
+    return stream.getvalue().replace('\x0a', '&#xA;')
+
+def scan_et(content, filename, md5sum=None, mtime=None, lang="Python"):
+    """Scan the given Python content and return Code Intelligence data
+    conforming the the Code Intelligence XML format.
+
+    This has the same interface as pythoncile1.scan_et(), which see.
+    """
+    log.info("scan '%s'", filename)
+
+    # Strip funky *whitespace* at the end of the file, as pythoncile1 does.
+    content = content.rstrip() + '\n'
+
+    if lang == "Python3":
+        # Make Python3 code as compatible with the Python2 parser as
+        # neessary for codeintel purposes.
+        content = _convert3to2(content)
+
+    if type(filename) == types.UnicodeType:
+        filename = filename.encode('utf-8')
+    # The 'path' attribute must use normalized dir separators.
+    if sys.platform.startswith("win"):
+        path = filename.replace('\\', '/')
+    else:
+        path = filename
+
+    try:
+        tree = _getAST(content, filename)
+    except Exception, ex:
+        file = et.Element('file', _et_attrs(dict(lang=lang,
+                                                 path=path,
+                                                 error=str(ex))))
+    else:
+        moduleName = os.path.splitext(os.path.basename(filename))[0]
+        visitor = AST2CIXVisitor(moduleName, content=content, lang=lang)
+        visitor.visit(tree)
+        file = visitor.getCIX(path)
+
+    codeintel = et.Element('codeintel', _et_attrs(dict(version="2.0")))
+    codeintel.append(file)
+    return codeintel
+
+
+
+def scan_et_incremental(content, filename, state=None, lang="Python"):
+    """Scan the given Python content, re-using the results of a previous
+    scan of the same file if possible.
+
+        "state" is the IncrementalScanState returned by the previous
+            call for this file, if any. A state may only be passed in
+            once: the new state shares (and updates) parts of it.
+
+    Returns (<codeintel element>, <new state>). The element is the same
+    as scan_et() would return.
+
+    Rather than re-parsing the whole file, only a changed top-level
+    `def` or `class` block is re-parsed and re-visited, and its CIX is
+    spliced into the CIX of the previous scan. A full scan is done
+    whenever that might give a different result: if more than one
+    top-level block changed, if the module-level structure changed
+    (e.g. a block was split or merged by an indentation change), if
+    other blocks refer to the changed definition's attributes, or if
+    the file has syntax errors.
+    """
+    log.info("scan '%s' (incremental)", filename)
+    content = content.rstrip() + '\n'
+    if lang == "Python3":
+        content = _convert3to2(content)
+    if type(filename) == types.UnicodeType:
+        filename = filename.encode('utf-8')
+    if sys.platform.startswith("win"):
+        path = filename.replace('\\', '/')
+    else:
+        path = filename
+    moduleName = os.path.splitext(os.path.basename(filename))[0]
+
+    file = None
+    if state is not None and state.lang == lang \
+       and state.filename == filename:
+        prepared_content = _prepare_content(content)[0]
+        try:
+            file, state = _rescan_block(state, content, prepared_content,
+                                        moduleName, path)
+        except _FullScanNeeded, ex:
+            log.debug("full rescan of '%s': %s", filename, ex)
+            file = None
+    if file is None:
+        file, state = _scan_file_incremental(content, filename, path,
+                                             moduleName, lang)
+
+    codeintel = et.Element('codeintel', _et_attrs(dict(version="2.0")))
+    codeintel.append(file)
+    return codeintel, state
+
+
+
+#---- mainline
+
+def main(argv):
+    logging.basicConfig()
+    try:
+        opts, args = getopt.getopt(argv[1:], "hvL:",
+            ["help", "verbose", "language="])
+    except getopt.GetoptError, ex:
+        log.error(str(ex))
+        log.error("Try `pythoncile_ast --help'.")
+        return 1
+    lang = "Python"
+    numVerboses = 0
+    for opt, optarg in opts:
+        if opt in ("-h", "--help"):
+            sys.stdout.write(__doc__)
+            return 0
+        elif opt in ("-v", "--verbose"):
+            numVerboses += 1
+            if numVerboses == 1:
+                log.setLevel(logging.INFO)
+            else:
+                log.setLevel(logging.DEBUG)
+        elif opt in ("-L", "--language"):
+            lang = optarg
+
+    for path in args:
+        fin = open(path, 'r')
+        try:
+            content = fin.read()
+        finally:
+            fin.close()
+        try:
+            sys.stdout.write(scan_cix(content, path, lang=lang))
+        except PythonCILEError, ex:
+            log.error("%s: %s", path, ex)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
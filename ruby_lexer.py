@@ -91,11 +91,29 @@ class _CommonLexer(shared_lexer.Lexer):
         self.q = []
         self.multi_char_ops = self.build_dict('!= !~ && ** :: <= << == => =~ >> ||')    
 
+_silvercity_lexer = None
+def _get_silvercity_lexer():
+    global _silvercity_lexer
+    if _silvercity_lexer is None:
+        _silvercity_lexer = Ruby.RubyLexer()
+    return _silvercity_lexer
+
 class RubyLexer(_CommonLexer):
-    def __init__(self, code):
+    def __init__(self, code, tokens=None):
+        """Lex the given Ruby code.
+
+        If "tokens" is given, it is used instead of lexing "code" again
+        (see perl_lexer.PerlLexer).
+        """
         _CommonLexer.__init__(self)
         self.classifier = RubyLexerClassifier()
-        Ruby.RubyLexer().tokenize_by_style(code, self._fix_token_list)
+        if tokens is None:
+            _get_silvercity_lexer().tokenize_by_style(code,
+                                                      self._fix_token_list)
+        else:
+            add_token = self._add_token
+            for tok in tokens:
+                add_token(tok)
         self.string_types = [ScintillaConstants.SCE_RB_STRING,
                 ScintillaConstants.SCE_RB_CHARACTER,
                 ScintillaConstants.SCE_RB_STRING_Q,
@@ -106,7 +124,14 @@ class RubyLexer(_CommonLexer):
                 ]
         
     def _fix_token_list(self, **tok):
-        """See perl_lexer.py for details on what this routine does."""
+        self._add_token(tok)
+
+    def _add_token(self, tok):
+        """See perl_lexer.py for details on what this routine does.
+
+        The given token dict is not modified: it may be one of the
+        buffer's cached tokens.
+        """
         if tok['style'] == ScintillaConstants.SCE_RB_OPERATOR and len(tok['text']) > 1:
             self.append_split_tokens(tok, self.multi_char_ops, self.q)
         else:
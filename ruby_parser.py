@@ -811,13 +811,18 @@ class Parser:
 
     def parse_aux(self, curr_node):
         at_start = True
+        # Looked up once: this loop sees most of the tokens of a file.
+        get_next_token = self.tokenizer.get_next_token
+        style_word = self.classifier.style_word
+        style_identifier = self.classifier.style_identifier
+        is_any_operator = self.classifier.is_any_operator
         while 1:
-            tok = self.tokenizer.get_next_token()
+            tok = get_next_token()
             if tok.style == shared_lexer.EOF_STYLE:
                 break
             # style, text, start_column, start_line, end_column, end_line = tok
             style, text = tok.style, tok.text
-            if style == self.classifier.style_word:
+            if style == style_word:
                 if text in ["module", "class", "def"]:
                     # Check to see if we missed some nodes,
                     # using heuristic that the end statements line up
@@ -920,7 +925,7 @@ class Parser:
                             # the caller will pop the stack
                             return
                         
-            elif style == self.classifier.style_identifier:
+            elif style == style_identifier:
                 if text == "require" or text == "load":
                     tok = self.tokenizer.get_next_token()
                     if (self.tokenizer.is_string_token(tok)):
@@ -953,7 +958,7 @@ class Parser:
                         # Make sure it isn't an assignment function
                         self.parse_assignment(self.containers[VAR_KIND_LOCAL], text, tok.start_line)
 
-            elif self.classifier.is_any_operator(tok):
+            elif is_any_operator(tok):
                 if text == "{":
                     new_node = BlockNode("{", tok.start_line);
                     new_node.indentation = self.tokenizer.get_curr_indentation()
@@ -87,7 +87,7 @@ import stat
 from ciElementTree import Element, SubElement, tostring
 from SilverCity import ScintillaConstants
 
-from codeintel2 import ruby_lexer, ruby_parser, util
+from codeintel2 import ruby_lexer, ruby_parser, shared_lexer, util
 from codeintel2.common import CILEError
 from codeintel2 import parser_cix
 
@@ -164,6 +164,48 @@ class _DirInfo:
 
 _modelDirInfo = _DirInfo("*.rb")
 
+class _RailsAppContext:
+    """The parts of a Rails app that check_insert_rails_env() adds to the
+    CIX of the app's files: the names of its models and migrations.
+
+    There is one of these per app root dir (see _get_rails_app_context()),
+    shared by the scans of all the files of the app. The names are only
+    derived again when the models or migrations dir changes.
+    """
+    def __init__(self, app_root):
+        self.app_root = app_root
+        self.models_dir = join(app_root, "app", "models")
+        self.migrate_dir = join(app_root, "db", "migrate")
+        # {<dir>: (<file list from _modelDirInfo>, <module names>)}
+        self._names_from_dir = {}
+
+    def __repr__(self):
+        return "<Rails app '%s'>" % self.app_root
+
+    def _names(self, dirname):
+        # _modelDirInfo returns the same list until the dir changes.
+        files = _modelDirInfo.get_files(dirname)
+        cached = self._names_from_dir.get(dirname)
+        if cached is None or cached[0] is not files:
+            cached = (files, [splitext(basename(f))[0] for f in files])
+            self._names_from_dir[dirname] = cached
+        return cached[1]
+
+    def model_names(self):
+        return self._names(self.models_dir)
+
+    def migration_names(self):
+        return self._names(self.migrate_dir)
+
+_rails_app_context_from_root = {}
+
+def _get_rails_app_context(app_root):
+    context = _rails_app_context_from_root.get(app_root)
+    if context is None:
+        context = _RailsAppContext(app_root)
+        _rails_app_context_from_root[app_root] = context
+    return context
+
 def rails_role_from_path(path):
     apath = abspath(path)
     aplist = apath.split(os.path.sep)
@@ -193,9 +235,14 @@ def rails_role_from_path(path):
     return role_parts
 
 def check_insert_rails_env(path, blob_scope):
-    role_parts = rails_role_from_path(path)
+    apath = abspath(path)
+    role_parts = rails_role_from_path(apath)
     if role_parts is None:
         return
+    app_root = apath
+    for part in role_parts:
+        app_root = dirname(app_root)
+    app_context = _get_rails_app_context(app_root)
     add_models = False
     if len(role_parts) > 1 and role_parts[0] == "app":
         if role_parts[1] == "views":
@@ -208,9 +255,7 @@ def check_insert_rails_env(path, blob_scope):
                     if role_parts[2] != "application.rb":
                         blob_scope.insert(0, Element("import", module="./application", symbol='*'))
                     # For loading models
-                    apath = abspath(path)
                     add_models = True
-                    models_dir = join(dirname(dirname(apath)), "models")
                     rel_part = "../"
                     # For loading migrations
                     modelName = "*"
@@ -222,23 +267,20 @@ def check_insert_rails_env(path, blob_scope):
                     # Try to load module=foo, symbol=inflector.camelcase(drop_ext(basename(filename)))
                     modelName = ruby_parser.get_inflector().camelize(splitext(basename(path))[0])
                 # Load the migration modules
-                apath = abspath(path)
-                migration_dir = join(dirname(dirname(dirname(apath))), "db", "migrate")
-                migration_files = _modelDirInfo.get_files(migration_dir)
-                idx = 0
-                for migration_file in migration_files:
-                    idx += 1
-                    base_part = "../../db/migrate/" + splitext(basename(migration_file))[0]
+                migration_names = app_context.migration_names()
+                if migration_names:
                     blob_class = blob_scope.find("scope")
                     assert blob_class.get('ilk') == 'class'
-                    blob_class.insert(idx, Element("import", module=base_part, symbol=modelName))
+                    idx = 0
+                    for migration_name in migration_names:
+                        idx += 1
+                        base_part = "../../db/migrate/" + migration_name
+                        blob_class.insert(idx, Element("import", module=base_part, symbol=modelName))
     elif (len(role_parts) > 2
           and ((role_parts[0] == "db" and role_parts[1] == "migrate"
                 and role_parts[2][0].isdigit())
                 or role_parts[0] == "test")):
-        apath = abspath(path)
         add_models = True
-        models_dir = join(dirname(dirname(dirname(apath))), "app", "models")
         rel_part = "../../app/"
         if role_parts[0] == "test" and role_parts[1] == 'functional':
             # Each file functional/foo_controller_test.rb will contain a line reading
@@ -251,21 +293,30 @@ def check_insert_rails_env(path, blob_scope):
             blob_scope.insert(0, Element("import", module=controller_file, symbol='*'))
             modelName = '*'
         #XXX - tests can't see migration dirs yet.
-        #migration_dir = join(dirname(dirname(dirname(apath))), "db", "migrate")
 
     if add_models:
-        model_files = _modelDirInfo.get_files(models_dir)
         idx = 0
-        for model_file in model_files:
+        for model_name in app_context.model_names():
             idx += 1
-            base_part = rel_part + "models/" + splitext(basename(model_file))[0]
+            base_part = rel_part + "models/" + model_name
             blob_scope.insert(idx, Element("import", module=base_part, symbol='*'))
 
 
 # @hotshotit
-def scan_purelang(content, filename):
-    content = content.expandtabs(8)
-    tokenizer = ruby_lexer.RubyLexer(content)
+def scan_purelang(content, filename, tokens=None):
+    """Scan the given Ruby content and return a CIX element tree.
+
+        "tokens" (optional) are the SilverCity tokens for the content,
+            e.g. from the buffer's accessor. If given, these are used
+            instead of lexing the content again.
+    """
+    if tokens is None:
+        tokenizer = ruby_lexer.RubyLexer(content.expandtabs(8))
+    else:
+        # The parser doesn't use the token indices.
+        tokenizer = ruby_lexer.RubyLexer(None,
+            tokens=shared_lexer.expand_tabs_in_tokens(tokens, 8,
+                                                      adjust_indices=False))
     parser = ruby_parser.Parser(tokenizer, "Ruby")
     parse_tree = parser.parse()
     tree = parser_cix.produce_elementTree_cix(parse_tree, filename,
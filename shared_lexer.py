@@ -57,7 +57,73 @@ trailing_spaces_re = re.compile("\n([ \t]*)$")
 trim_ws_re2 = re.compile(r'[\r\n\t]')
 trim_ws_re3 = re.compile(r' {2,}')
 
-class Token:
+def expand_tabs_in_tokens(tokens, tabsize=8, adjust_indices=True):
+    """Generate the given SilverCity tokens (dicts, as from
+    `tokenize_by_style()`) as they would be for lexing
+    `content.expandtabs(tabsize)`, i.e. with tabs expanded in the token
+    text and the columns and indices after them adjusted to match.
+
+    This allows a scanner that wants tab-expanded content to use a
+    buffer's existing tokens (e.g. `buf.accessor.gen_tokens()`) rather
+    than lexing the content again. Tokens not affected by a tab are
+    passed through as is.
+
+    If "adjust_indices" is false the "start_index" and "end_index" of
+    the tokens are left alone, for scanners that don't use them: then
+    only the tokens on a line after a tab are affected.
+    """
+    index_shift = 0 # chars added by expanding tabs so far
+    col_shift = 0   # columns added on the current line so far
+    for token in tokens:
+        text = token["text"]
+        if "\t" in text:
+            lines = text.split("\n")
+            shifts = []
+            col = token["start_column"] + col_shift
+            for i, line in enumerate(lines):
+                if "\t" in line:
+                    # Leading padding to get the tab stops right.
+                    expanded = (" " * col + line).expandtabs(tabsize)[col:]
+                    shifts.append(len(expanded) - len(line))
+                    lines[i] = expanded
+                else:
+                    shifts.append(0)
+                col = 0
+            text = "\n".join(lines)
+        elif not (col_shift or index_shift):
+            yield token
+            continue
+        else:
+            shifts = None
+        # The line (of the token) with the last char of the token.
+        last_line = token["text"].count("\n", 0, len(token["text"]) - 1)
+        end_shift = shifts and shifts[last_line] or 0
+        if last_line == 0:
+            end_shift += col_shift
+        added = shifts and sum(shifts) or 0
+        if adjust_indices:
+            yield dict(token, text=text,
+                       start_column=token["start_column"] + col_shift,
+                       end_column=token["end_column"] + end_shift,
+                       start_index=token["start_index"] + index_shift,
+                       end_index=token["end_index"] + index_shift + added)
+            index_shift += added
+        else:
+            yield dict(token, text=text,
+                       start_column=token["start_column"] + col_shift,
+                       end_column=token["end_column"] + end_shift)
+        if text.endswith("\n"):
+            col_shift = 0
+        else:
+            col_shift = end_shift
+
+class Token(object):
+    # There is one of these per token of a scanned file. The "__dict__"
+    # slot is for the odd attribute set by a parser (e.g. css_linter's
+    # loop checks): it is only allocated when used.
+    __slots__ = ("style", "text", "start_column", "start_line", "end_column",
+                 "end_line", "generated", "__dict__")
+
     def __init__(self, style, text="", start_column=None, start_line=None, end_column=None, end_line=None):
         self.style = style
         self.text = text
@@ -118,7 +184,10 @@ class Lexer:
         self.finished_comment = True
         self.use_leading_spaces = True
         self.signature = Signature()
+        # The raw tokens. They are consumed from `self.q_pos` on rather
+        # than deleted from the front of the list, which is quadratic.
         self.q = []
+        self.q_pos = 0
         self.curr_line = 1
 
     def build_dict(self, ws_sep_str):
@@ -141,21 +210,29 @@ class Lexer:
         return line_num + 1
 
     def _get_next_token(self):
-        if len(self.pending_tokens) > 0:
+        if self.pending_tokens:
             tok = self.pending_tokens[0]
             del self.pending_tokens[0]
-        elif len(self.q) > 0:
-            raw_tok = self.q[0]
-            del self.q[0]
+        elif self.q_pos < len(self.q):
+            raw_tok = self.q[self.q_pos]
+            self.q_pos += 1
+            start_line = raw_tok.get('start_line')
+            end_line = raw_tok.get('end_line')
             tok = Token(raw_tok['style'],
                         raw_tok['text'],
                         raw_tok['start_column'],
-                        self._adapt_line(raw_tok.get('start_line', None)),
-                        raw_tok.get('end_column',None),
-                        self._adapt_line(raw_tok.get('end_line',None)))
+                        start_line is not None and start_line + 1 or None,
+                        raw_tok.get('end_column'),
+                        end_line is not None and end_line + 1 or None)
         else:
             tok = EOF_TOKEN
         return tok
+
+    def peek_raw_token(self):
+        """Return the next raw (SilverCity) token, or None at the end."""
+        if self.q_pos < len(self.q):
+            return self.q[self.q_pos]
+        return None
     
     def _get_eof_token(self):
         return EOF_TOKEN
@@ -262,10 +339,12 @@ class Lexer:
 
     
     def get_next_token(self, skip_ws=1):
+        style_comment = self.classifier.style_comment
+        style_default = self.classifier.style_default
+        signature = self.signature
         while True:
-            is_pending = len(self.pending_tokens) > 0
             tok = self.gen()
-            gather = self.signature.is_gathering() and not getattr(tok, "generated", False)
+            gather = signature._gathering and not getattr(tok, "generated", False)
             if not (tok.start_line is None):
                 self.curr_line = tok.start_line
             ttype = tok.style
@@ -273,7 +352,7 @@ class Lexer:
                 # Stop leaning on the queue, just return an eof_token
                 self.gen = self._get_eof_token
                 self.curr_indentation = 0
-            elif ttype == self.classifier.style_comment:
+            elif ttype == style_comment:
                 if self.finished_comment:
                     self.curr_comments = []
                     self.finished_comment = False
@@ -281,10 +360,10 @@ class Lexer:
                 self.use_leading_spaces = False
                 if skip_ws:
                     continue
-            elif ttype == self.classifier.style_default and self.matches_whitespace(tok.text):
+            elif ttype == style_default and ws_re.match(tok.text):
                 if gather:
-                    self.signature.append(self.trim_ws(tok.text))
-                has_nl = self.contains_nl(tok.text)
+                    signature.append(self.trim_ws(tok.text))
+                has_nl = "\n" in tok.text
                 if has_nl or self.use_leading_spaces:
                     # Update this line's indentation only if we're at the start
                     if has_nl:
@@ -301,7 +380,7 @@ class Lexer:
             else:
                 # At this point we're done with comments and leading white-space
                 if gather:
-                    self.signature.append(tok.text)
+                    signature.append(tok.text)
                 self.finished_comment = True
                 self.use_leading_spaces = False
             # If the loop doesn't continue, break here
@@ -0,0 +1,106 @@
+<?php
+namespace Foo\Bar;
+
+use Some\Other\Thing as Alias;
+use Another\Klass;
+
+/**
+ * A constant.
+ */
+define('MY_CONST', 42);
+const OTHER = "x";
+
+/** @var Klass $global_k */
+$global_k = new Klass();
+$arr = array(1, 2, 3);
+$str = <<<EOT
+class NotAClass { function nope() {} }
+EOT;
+
+interface Iface extends \Countable, \ArrayAccess {
+    const IC = 1;
+    public function ifunc($a, array $b = array());
+}
+
+trait Helper {
+    protected $helped = false;
+    public function help($x) { return $x; }
+}
+
+/**
+ * Class doc.
+ * @property int $magic some magic
+ * @method string magicMethod() does magic
+ */
+abstract class Base implements Iface {
+    use Helper, Other\Trait2 {
+        Helper::help insteadof Trait2;
+        Trait2::help as protected help2;
+    }
+    const BC = 'b';
+    public static $count = 0;
+    private $items = array(), $more;
+    /** @var Klass */
+    protected $k;
+
+    /**
+     * Construct it.
+     * @param Klass $k the k
+     * @param int $n the n
+     * @return Base
+     */
+    function __construct(Klass $k, &$n = 5) {
+        $this->k = $k;
+        $this->items[] = $n;
+        self::$count++;
+        $local = new \DateTime();
+        $closure = function($a) use ($local) { return $a + 1; };
+        if ($n > 1):
+            $n = 2;
+        elseif ($n < 0):
+            $n = 0;
+        else:
+            $n = 1;
+        endif;
+        switch ($n) {
+            case 1: $y = "one"; break;
+            case 2:
+                $y = 'two';
+                break;
+            default: $y = null;
+        }
+        foreach ($this->items as $key => $value) {
+            echo "$key => $value";
+        }
+        while (false): endwhile;
+        return $this;
+    }
+
+    abstract protected function absFunc();
+
+    public static function &refFunc($a = null) {
+        global $arr;
+        static $cache = array();
+        return $cache;
+    }
+}
+
+final class Child extends Base {
+    function absFunc() { return parent::refFunc(); }
+    function ifunc($a, array $b = array()) { return count($b); }
+}
+
+function top_level($x, $y = "default") {
+    $obj = new Child(new Klass, $x);
+    /* @var $obj Child */
+    $obj->absFunc();
+    return $obj;
+}
+
+namespace Second;
+
+class InSecond {
+    var $old_style;
+    function InSecond() {}
+}
+?>
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# Copyright (c) 2010 ActiveState Software Inc.
+# See LICENSE.txt for license details.
+
+"""Check that CSSLinter.lint_incrementally() gives the same results as
+lint() after edits, with the cached results of the rulesets after the
+edit moved to their new lines.
+"""
+
+import unittest
+
+from codeintel2 import css_linter
+
+
+_stylesheet = """\
+@charset "UTF-8";
+body {
+    margin: 0;
+}
+
+h1 { color: red; }
+
+.middle {
+    padding: 1px;
+    border: 1px solid black;
+}
+
+p {
+    color: ;
+}
+
+a:hover {
+    text-decoration: underline;
+    font-weight: bold
+}
+
+div { width: 10px; height: @; }
+"""
+
+def _strs(results):
+    return [str(result) for result in results]
+
+
+class LintIncrementallyTestCase(unittest.TestCase):
+    def setUp(self):
+        # Count the parts of the stylesheet that are (re-)parsed.
+        self.num_parses = 0
+        self._parse = css_linter._CSSParser.parse
+        def parse(parser, *args, **kwargs):
+            self.num_parses += 1
+            return self._parse(parser, *args, **kwargs)
+        css_linter._CSSParser.parse = parse
+        self.linter = css_linter.CSSLinter()
+
+    def tearDown(self):
+        css_linter._CSSParser.parse = self._parse
+
+    def _check_lint(self, text, num_parses=None):
+        """Lint `text' incrementally and check that it gives the same
+        results as a full lint, and that `num_parses' parts were parsed
+        (if given).
+        """
+        self.num_parses = 0
+        results = _strs(self.linter.lint_incrementally(text))
+        if num_parses is not None:
+            self.failUnlessEqual(self.num_parses, num_parses)
+        expected = _strs(css_linter.CSSLinter().lint(text))
+        self.failUnlessEqual(results, expected)
+        return results
+
+    def test_first_lint(self):
+        results = self._check_lint(_stylesheet)
+        # The errors are in the rulesets after the middle one.
+        self.failUnless(len(results) >= 2, results)
+
+    def test_unchanged(self):
+        self._check_lint(_stylesheet)
+        self._check_lint(_stylesheet, 0)
+
+    def test_edit_in_middle_ruleset(self):
+        self._check_lint(_stylesheet)
+        self._check_lint(_stylesheet.replace("padding: 1px;",
+                                             "padding: 2px;"), 1)
+
+    def test_lines_added_in_middle_ruleset(self):
+        self._check_lint(_stylesheet)
+        results = self._check_lint(_stylesheet.replace("padding: 1px;\n",
+            "padding: 1px;\n    margin: 2px;\n\n    color: blue;\n"), 1)
+        self.failIfEqual(results, _strs(css_linter.CSSLinter()
+                                        .lint(_stylesheet)))
+
+    def test_lines_removed_in_middle_ruleset(self):
+        self._check_lint(_stylesheet)
+        self._check_lint(_stylesheet.replace(
+            "    border: 1px solid black;\n", ""), 1)
+
+    def test_error_added_in_middle_ruleset(self):
+        self._check_lint(_stylesheet)
+        self._check_lint(_stylesheet.replace("padding: 1px;",
+                                             "padding: 1px 2px !;"))
+
+    def test_brace_removed_in_middle_ruleset(self):
+        self._check_lint(_stylesheet)
+        self._check_lint(_stylesheet.replace("solid black;\n}",
+                                             "solid black;\n"))
+
+    def test_successive_edits(self):
+        text = _stylesheet
+        self._check_lint(text)
+        for old, new in (("padding: 1px;\n", "padding: 1px;\n\n\n"),
+                         ("color: ;", "color: green;"),
+                         ("h1 {", "h1, h2 {"),
+                         ("\n\n\n", "\n")):
+            text = text.replace(old, new)
+            self._check_lint(text)
+
+
+if __name__ == "__main__":
+    unittest.main()
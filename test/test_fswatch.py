@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# Copyright (c) 2010 ActiveState Software Inc.
+# See LICENSE.txt for license details.
+
+"""Test that the DirWatcher reports the files created, changed and
+removed in a watched dir, with inotify and by polling.
+"""
+
+import os
+from os.path import join
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from codeintel2 import fswatch
+
+
+class _Listener(object):
+    def __init__(self):
+        self.names = set()
+        self._cond = threading.Condition()
+
+    def dir_changed(self, dir, names):
+        self._cond.acquire()
+        try:
+            if names is not None:
+                names = frozenset(names)
+            self.names.add(names)
+            self._cond.notifyAll()
+        finally:
+            self._cond.release()
+
+    def wait_for(self, name, timeout=10.0):
+        """Wait until `name' was reported changed and return True, or
+        False on timeout.
+        """
+        end_time = time.time() + timeout
+        self._cond.acquire()
+        try:
+            while True:
+                if [names for names in self.names
+                    if names is None or name in names]:
+                    self.names = set()
+                    return True
+                remaining = end_time - time.time()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        finally:
+            self._cond.release()
+
+
+class _DirWatcherTests(object):
+    use_inotify = None
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp(prefix="codeintel-test-")
+        self.watcher = fswatch.DirWatcher(use_inotify=self.use_inotify)
+        self.watcher.POLL_INTERVAL = 0.1
+        self.watcher.WAKEUP_INTERVAL = 0.1
+        self.listener = _Listener()
+
+    def tearDown(self):
+        self.watcher.finalize()
+        if self.watcher.isAlive():
+            self.watcher.join()
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def _is_testable(self):
+        # No inotify on this platform: the polling test covers it.
+        return not self.use_inotify or self.watcher._inotify_fd is not None
+
+    def _write(self, name, content):
+        fout = open(join(self.dir, name), 'w')
+        try:
+            fout.write(content)
+        finally:
+            fout.close()
+
+    def test_created_changed_removed(self):
+        if not self._is_testable():
+            return
+        self.watcher.start()
+        self.watcher.watch(self.dir, self.listener)
+        self._write("a.py", "a = 1\n")
+        self.failUnless(self.listener.wait_for("a.py"))
+        self._write("a.py", "a = 'changed'\n")
+        self.failUnless(self.listener.wait_for("a.py"))
+        os.remove(join(self.dir, "a.py"))
+        self.failUnless(self.listener.wait_for("a.py"))
+
+    def test_created_before_start(self):
+        # A file created right after watch() is reported, even if the
+        # watcher thread hasn't looked at the dir yet.
+        if not self._is_testable():
+            return
+        self.watcher.watch(self.dir, self.listener)
+        self._write("b.py", "b = 1\n")
+        self.watcher.start()
+        self.failUnless(self.listener.wait_for("b.py"))
+
+    def test_dir_removed(self):
+        if not self._is_testable():
+            return
+        self.watcher.start()
+        self.watcher.watch(self.dir, self.listener)
+        shutil.rmtree(self.dir)
+        self.failUnless(self.listener.wait_for(None))
+
+class InotifyDirWatcherTestCase(_DirWatcherTests, unittest.TestCase):
+    use_inotify = True
+
+class PollingDirWatcherTestCase(_DirWatcherTests, unittest.TestCase):
+    use_inotify = False
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,246 @@
+#!/usr/bin/env python
+# Copyright (c) 2010 ActiveState Software Inc.
+# See LICENSE.txt for license details.
+
+"""Test the order in which the indexer's request queue hands out
+requests (aging and fairness, see _UniqueRequestPriorityQueue), the
+resuming of pending requests from the indexer journal, and the staging
+of memory culls.
+"""
+
+import os
+from os.path import join, exists
+import shutil
+import tempfile
+import time
+import unittest
+
+from codeintel2 import indexer
+from codeintel2.common import (PRIORITY_IMMEDIATE, PRIORITY_CURRENT,
+                               PRIORITY_OPEN, PRIORITY_BACKGROUND)
+
+
+class _ARequest(indexer._Request):
+    def __init__(self, id, priority):
+        self.id = id
+        self.priority = priority
+
+class _BRequest(_ARequest):
+    pass
+
+
+class RequestOrderTestCase(unittest.TestCase):
+    def setUp(self):
+        self.queue = indexer._UniqueRequestPriorityQueue()
+        self.now = time.time()
+
+    def _put(self, request_class, id, priority, age=0):
+        self.queue.put((priority, self.now - age, request_class(id, priority)))
+
+    def _get_ids(self):
+        ids = []
+        while not self.queue.empty():
+            ids.append(self.queue.get()[-1].id)
+        return ids
+
+    def _put_old_background(self, request_class, num=100):
+        # Old enough to have aged to better than PRIORITY_IMMEDIATE if
+        # aging wasn't capped.
+        age = (PRIORITY_BACKGROUND + 1) * self.queue.AGING_INTERVAL
+        for i in range(num):
+            self._put(request_class, "bg%d" % i, PRIORITY_BACKGROUND, age)
+
+    def test_immediate_before_aged_same_type(self):
+        self._put_old_background(_ARequest)
+        self._put(_ARequest, "ui", PRIORITY_IMMEDIATE)
+        self.failUnlessEqual(self._get_ids()[0], "ui")
+
+    def test_immediate_before_aged_other_type(self):
+        self._put_old_background(_ARequest)
+        self._put(_BRequest, "ui", PRIORITY_IMMEDIATE)
+        self.failUnlessEqual(self._get_ids()[0], "ui")
+
+    def test_fairness_for_immediate(self):
+        # A steady stream of immediate requests does not starve the others.
+        quota = self.queue.FAIRNESS_QUOTA
+        for i in range(quota + 10):
+            self._put(_ARequest, "ui%d" % i, PRIORITY_IMMEDIATE)
+        self._put(_BRequest, "bg", PRIORITY_BACKGROUND)
+        self.failUnlessEqual(self._get_ids()[quota], "bg")
+
+    def test_aging(self):
+        for i in range(10):
+            self._put(_ARequest, "cur%d" % i, PRIORITY_CURRENT)
+        self._put_old_background(_BRequest, 1)
+        self.failUnlessEqual(self._get_ids()[0], "bg0")
+
+    def test_fairness(self):
+        quota = self.queue.FAIRNESS_QUOTA
+        for i in range(quota + 10):
+            self._put(_ARequest, "cur%d" % i, PRIORITY_CURRENT)
+        self._put(_BRequest, "bg", PRIORITY_BACKGROUND)
+        self.failUnlessEqual(self._get_ids()[quota], "bg")
+
+
+class StagingTestCase(unittest.TestCase):
+    def setUp(self):
+        self.queue = indexer._StagingRequestQueue()
+
+    def tearDown(self):
+        self.queue.finalize()
+
+    def test_has_staged_request(self):
+        self.queue.stage((PRIORITY_BACKGROUND, time.time(),
+                          _ARequest("staged", PRIORITY_BACKGROUND)), 300)
+        self.failUnless(self.queue.has_request("staged"))
+        self.failIf(self.queue.has_request("other"))
+
+
+class _Buf(object):
+    def __init__(self, mgr, path, lang="Python"):
+        self.mgr = mgr
+        self.path = path
+        self.lang = lang
+
+    def scan(self, mtime=None):
+        self.mgr.scanned_paths.append(self.path)
+        self.mgr.db.scan_time_from_path[self.path] = time.time()
+
+class _Database(object):
+    """The parts of a Database used by the indexer."""
+    def __init__(self, base_dir):
+        self.base_dir = base_dir
+        self.scan_time_from_path = {}
+
+    def get_path_scan_time(self, path, lang):
+        return self.scan_time_from_path.get(path)
+
+    def get_buf_scan_time(self, buf):
+        return self.scan_time_from_path.get(buf.path)
+
+    def save(self):
+        pass
+
+    def report_event(self, desc):
+        pass
+
+class _Citadel(object):
+    def scan_bufs(self, bufs, mtime=None):
+        for buf in bufs:
+            buf.scan(mtime)
+
+class _Manager(object):
+    def __init__(self, db):
+        self.db = db
+        self.citadel = _Citadel()
+        self.scanned_paths = []
+
+    def buf_from_path(self, path, lang=None):
+        return _Buf(self, path, lang)
+
+
+class IndexerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp(prefix="codeintel-test-")
+        self.db = _Database(self.dir)
+        self.journal_path = join(self.dir, "indexer-journal.pickle")
+        self.paths = []
+        mtime = time.time() - 100
+        for i in range(6):
+            path = join(self.dir, "f%d.py" % i)
+            fout = open(path, 'w')
+            try:
+                fout.write("f%d = 1\n" % i)
+            finally:
+                fout.close()
+            os.utime(path, (mtime, mtime))
+            self.paths.append(path)
+        self.indexers = []
+
+    def tearDown(self):
+        for idxr in self.indexers:
+            idxr.finalize()
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def _new_indexer(self):
+        """Return a new indexer (not started) and its manager, as in a new
+        process.
+        """
+        mgr = _Manager(self.db)
+        idxr = indexer.Indexer(mgr)
+        self.indexers.append(idxr)
+        return idxr, mgr
+
+    def _journal_pending_requests(self):
+        """Queue requests for the files, and an unsaved buffer, and
+        finalize the indexer before it handles them.
+        """
+        idxr, mgr = self._new_indexer()
+        for path in self.paths[:4]:
+            idxr.add_request(indexer.ScanRequest(_Buf(mgr, path),
+                                                 PRIORITY_BACKGROUND))
+        idxr.add_request(indexer.ScanRequest(_Buf(mgr, "<Unsaved>/x.py"),
+                                             PRIORITY_CURRENT))
+        idxr.add_request(indexer.BatchScanRequest(
+            [_Buf(mgr, path) for path in self.paths[4:]], PRIORITY_OPEN))
+        idxr.finalize()
+
+    def _handle_requests(self, idxr):
+        """Handle the queued requests, as the indexer thread would."""
+        while idxr._requests.qsize():
+            idxr._iteration()
+            idxr._checkpoint()
+
+    def test_journal_written(self):
+        self._journal_pending_requests()
+        self.failUnless(exists(self.journal_path))
+        idxr, mgr = self._new_indexer()
+        idxr.resume_from_journal()
+        # All but the unsaved buffer.
+        self.failUnlessEqual(idxr._requests.qsize(), 5)
+        self._handle_requests(idxr)
+        self.failUnlessEqual(sorted(mgr.scanned_paths), self.paths)
+
+    def test_up_to_date_and_removed_skipped(self):
+        self._journal_pending_requests()
+        self.db.scan_time_from_path[self.paths[0]] = time.time()
+        os.remove(self.paths[1])
+        idxr, mgr = self._new_indexer()
+        idxr.resume_from_journal()
+        self._handle_requests(idxr)
+        self.failUnlessEqual(sorted(mgr.scanned_paths), self.paths[2:])
+
+    def test_new_request_replaces_journaled(self):
+        self._journal_pending_requests()
+        idxr, mgr = self._new_indexer()
+        idxr.resume_from_journal()
+        idxr.add_request(indexer.ScanRequest(_Buf(mgr, self.paths[2]),
+                                             PRIORITY_IMMEDIATE))
+        self.failUnlessEqual(idxr._requests.qsize(), 5)
+        self._handle_requests(idxr)
+        self.failUnlessEqual(mgr.scanned_paths[0], self.paths[2])
+        self.failUnlessEqual(sorted(mgr.scanned_paths), self.paths)
+
+    def test_one_cull_mem_request_staged(self):
+        idxr, mgr = self._new_indexer()
+        for path in self.paths:
+            idxr.add_request(indexer.ScanRequest(_Buf(mgr, path),
+                                                 PRIORITY_BACKGROUND))
+        self._handle_requests(idxr)
+        self.failUnlessEqual(idxr.get_stats()["num_staged"], 1)
+        self.failUnlessEqual(idxr.get_stats()["num_culls_skipped"],
+                             len(self.paths) - 1)
+
+    def test_journal_removed_when_queue_empty(self):
+        self._journal_pending_requests()
+        idxr, mgr = self._new_indexer()
+        idxr.resume_from_journal()
+        self.failUnless(exists(self.journal_path))
+        self._handle_requests(idxr)
+        self.failIf(exists(self.journal_path))
+        idxr.finalize()
+        self.failIf(exists(self.journal_path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# Copyright (c) 2010 ActiveState Software Inc.
+# See LICENSE.txt for license details.
+
+"""Test that LangDirsLibBase.ensure_dir_scanned() only scans the files
+of a dir that aren't in the db yet.
+"""
+
+from os.path import join, split
+import unittest
+
+from codeintel2.database.langlibbase import LangDirsLibBase
+
+
+class _LangZone(object):
+    """The parts of a LangZone used by ensure_dir_scanned()."""
+    def __init__(self):
+        self.res_index_from_dir = {}
+
+    def load_index(self, dir, index_name, default=None):
+        return self.res_index_from_dir.get(dir, default)
+
+    def get_path_scan_time(self, path):
+        dir, base = split(path)
+        res_index = self.res_index_from_dir.get(dir, {})
+        if base not in res_index:
+            return None
+        return res_index[base][0]
+
+    def remove_path(self, path):
+        dir, base = split(path)
+        del self.res_index_from_dir[dir][base]
+
+class _Buf(object):
+    def __init__(self, path):
+        self.path = path
+
+class _Citadel(object):
+    def __init__(self, lang_zone):
+        self.lang_zone = lang_zone
+        self.scanned_paths = []
+
+    def scan_bufs(self, bufs):
+        for buf in bufs:
+            self.scanned_paths.append(buf.path)
+            dir, base = split(buf.path)
+            self.lang_zone.res_index_from_dir.setdefault(dir, {})[base] \
+                = (1000.0, None, {})
+
+class _Mgr(object):
+    def __init__(self, lang_zone):
+        self.citadel = _Citadel(lang_zone)
+
+    def buf_from_path(self, path, lang=None):
+        return _Buf(path)
+
+class _Lib(LangDirsLibBase):
+    lang = "Python"
+
+    def __init__(self, mgr, lang_zone, importables):
+        LangDirsLibBase.__init__(self)
+        self.mgr = mgr
+        self.lang_zone = lang_zone
+        self._importables = importables
+
+    def _importables_from_dir(self, dir):
+        return self._importables
+
+
+class EnsureDirScannedTestCase(unittest.TestCase):
+    dir = join("src", "lib")
+
+    def setUp(self):
+        self.lang_zone = _LangZone()
+        self.mgr = _Mgr(self.lang_zone)
+        self.importables = {
+            "mod": ("mod.py", None, False),
+            "pkg": (join("pkg", "__init__.py"), "__init__", False),
+            "nopkg": (None, None, True),
+        }
+
+    def _ensure_dir_scanned(self):
+        """Run ensure_dir_scanned() on a new lib, as a new process would,
+        and return the paths that it scanned.
+        """
+        self.mgr.citadel.scanned_paths = []
+        lib = _Lib(self.mgr, self.lang_zone, self.importables)
+        lib.ensure_dir_scanned(self.dir, reporter=lambda msg: None)
+        return sorted(self.mgr.citadel.scanned_paths)
+
+    def test_first_scan(self):
+        self.failUnlessEqual(self._ensure_dir_scanned(),
+            [join(self.dir, "mod.py"), join(self.dir, "pkg", "__init__.py")])
+
+    def test_unchanged_dir(self):
+        self._ensure_dir_scanned()
+        self.failUnlessEqual(self._ensure_dir_scanned(), [])
+
+    def test_new_file(self):
+        self._ensure_dir_scanned()
+        self.importables["other"] = ("other.py", None, False)
+        self.failUnlessEqual(self._ensure_dir_scanned(),
+                             [join(self.dir, "other.py")])
+
+
+if __name__ == "__main__":
+    unittest.main()
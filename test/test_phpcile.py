@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# Copyright (c) 2010 ActiveState Software Inc.
+# See LICENSE.txt for license details.
+
+"""Check that the PHP CILE (PHPParser) still produces the CIX it produced
+before it was optimized, on the PHP files generated from the PHP stdlib
+CIX files (see benchmarks/phpcile.py) and on the hand-written files in
+"data/phpcile" (namespaces, traits, heredocs, alternative syntax, ...).
+
+The expected CIX is in "data/phpcile/<name>.cix.gz". The files are
+tokenized with the simple tokenizer below rather than with the UDL lexer,
+so that only the parser is checked. After an intended change of the CIX,
+regenerate the expected files with:
+    python test_phpcile.py --update
+"""
+
+import re
+import sys
+import gzip
+import difflib
+import unittest
+from glob import glob
+from os.path import join, dirname, abspath, basename
+
+from ciElementTree import tostring
+from SilverCity import ScintillaConstants
+
+from codeintel2.benchmarks import phpcile
+
+
+data_dir = join(dirname(abspath(__file__)), "data", "phpcile")
+
+_keywords = set("""abstract and array as break case catch class clone const
+    continue declare default do echo else elseif empty enddeclare endfor
+    endforeach endif endswitch endwhile extends final for foreach function
+    global goto if implements include include_once instanceof insteadof
+    interface isset list namespace new or print private protected public
+    require require_once return static switch throw trait try unset use var
+    while xor""".split())
+
+_re_token = re.compile(r"""
+     (?P<whitespace>\s+)
+    |(?P<commentblock>/\*.*?\*/)
+    |(?P<comment>(?://|\#)[^\n]*)
+    |(?P<variable>\$\w+)
+    |(?P<number>\d+(?:\.\d+)?)
+    |(?P<identifier>[A-Za-z_]\w*)
+    |(?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"
+                |<<<(?P<heredoc>\w+)\n.*?\n(?P=heredoc))
+    |(?P<operator>[-(){}\[\];,=.+*/<>!&|?:@^%~\\]+|.)
+""", re.S | re.X)
+
+_style_from_kind = {
+    "whitespace": ScintillaConstants.SCE_UDL_SSL_DEFAULT,
+    "commentblock": ScintillaConstants.SCE_UDL_SSL_COMMENTBLOCK,
+    "comment": ScintillaConstants.SCE_UDL_SSL_COMMENT,
+    "variable": ScintillaConstants.SCE_UDL_SSL_VARIABLE,
+    "number": ScintillaConstants.SCE_UDL_SSL_NUMBER,
+    "identifier": ScintillaConstants.SCE_UDL_SSL_IDENTIFIER,
+    "string": ScintillaConstants.SCE_UDL_SSL_STRING,
+    "operator": ScintillaConstants.SCE_UDL_SSL_OPERATOR,
+}
+
+def _tokenize(content):
+    """Return the tokens of the given PHP code (starting with "<?php"), as
+    given to PHPParser.token_next().
+    """
+    assert content.startswith("<?php")
+    tokens = [{"style": ScintillaConstants.SCE_UDL_SSL_OPERATOR,
+               "text": "<?php", "start_line": 0, "start_column": 0}]
+    line = 0
+    column = len("<?php")
+    for match in _re_token.finditer(content, len("<?php")):
+        kind = match.lastgroup
+        text = match.group()
+        style = _style_from_kind[kind]
+        if kind == "identifier" and text.lower() in _keywords:
+            style = ScintillaConstants.SCE_UDL_SSL_WORD
+        tokens.append({"style": style, "text": text, "start_line": line,
+                       "start_column": column})
+        num_newlines = text.count("\n")
+        if num_newlines:
+            line += num_newlines
+            column = len(text) - text.rfind("\n") - 1
+        else:
+            column += len(text)
+    return tokens
+
+def _corpus():
+    """Return a list of (name, content) for the PHP files to scan."""
+    corpus = phpcile._corpus([])
+    for path in sorted(glob(join(data_dir, "*.php"))):
+        fin = open(path, 'rb')
+        try:
+            corpus.append((basename(path), fin.read()))
+        finally:
+            fin.close()
+    return corpus
+
+def _scan_cix(name, content):
+    return tostring(phpcile.scan_tokens(name, _tokenize(content)), "utf-8")
+
+def _expected_path(name):
+    return join(data_dir, name + ".cix.gz")
+
+
+class PHPCILETestCase(unittest.TestCase):
+    def test_same_cix(self):
+        corpus = _corpus()
+        self.failUnless(corpus, "no PHP corpus")
+        for name, content in corpus:
+            fin = gzip.open(_expected_path(name), 'rb')
+            try:
+                expected = fin.read()
+            finally:
+                fin.close()
+            cix = _scan_cix(name, content)
+            if cix != expected:
+                diff = difflib.unified_diff(expected.splitlines(),
+                    cix.splitlines(), "expected", "actual", lineterm="")
+                self.fail("CIX differs for '%s':\n%s"
+                          % (name, "\n".join(list(diff)[:200])))
+
+
+def _update():
+    for name, content in _corpus():
+        fout = gzip.GzipFile(_expected_path(name), 'wb', mtime=0)
+        try:
+            fout.write(_scan_cix(name, content))
+        finally:
+            fout.close()
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["--update"]:
+        _update()
+    else:
+        unittest.main()
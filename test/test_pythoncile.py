@@ -0,0 +1,230 @@
+#!/usr/bin/env python
+# Copyright (c) 2010 ActiveState Software Inc.
+# See LICENSE.txt for license details.
+
+"""Check that the `ast'-based Python CILE (pythoncile_ast) produces the
+same CIX as the `compiler'-based one (pythoncile1) on a small corpus.
+
+The files the two scanners differ on (all error or encoding cases) are
+listed in `_known_differences' and their actual behaviour is checked. For
+a larger corpus, see `python -m codeintel2.benchmarks.pythoncile --diff'.
+
+Also check that incremental rescans (pythoncile_ast.scan_et_incremental())
+give the same CIX as full scans.
+"""
+
+import os
+from os.path import join, dirname, abspath
+import difflib
+import unittest
+from cStringIO import StringIO
+
+import ciElementTree as et
+
+from codeintel2 import pythoncile1, pythoncile_ast
+from codeintel2.pythoncile1 import PythonCILEError
+
+
+# The corpus files are named "<name>.py.txt", as some are not valid Python
+# (compileall would fail on them).
+corpus_dir = join(dirname(abspath(__file__)), "data", "pythoncile")
+
+# {<corpus file name>: <why the CIX differs>}
+_known_differences = {
+    "known_unknown_coding.py":
+        "ast rejects an unknown coding declaration; compiler ignores it",
+    "known_bom_coding.py":
+        "compiler fails on a UTF-8 BOM followed by a coding declaration",
+    "known_string_escape_coding.py":
+        "compiler fails on a (valid) 'string-escape' coding declaration",
+    "known_bad_assign_target.py":
+        "compiler cannot build an AST for an invalid assignment target; "
+        "ast recovers from the syntax error",
+    "known_multiple_syntax_errors.py":
+        "ast recovers from syntax errors in more than one top-level block",
+    "known_utf8_docstring.py":
+        "compiler decodes unicode docstrings of utf-8 files as latin-1",
+    "known_ifexp_base.py":
+        "both fail on a conditional expression as a base class, the "
+        "error message shows the compiler or ast node",
+}
+
+
+def _read(name):
+    fin = open(join(corpus_dir, name + ".txt"), 'rb')
+    try:
+        return fin.read()
+    finally:
+        fin.close()
+
+def _scan_cix(scanner, name):
+    return scanner.scan_cix(_read(name), join(corpus_dir, name), mtime=0)
+
+def _file_elem(scanner, name):
+    tree = scanner.scan_et(_read(name), join(corpus_dir, name), mtime=0)
+    return tree[0]
+
+
+class ScannerCompatTestCase(unittest.TestCase):
+    def test_same_cix(self):
+        names = sorted(n[:-len(".txt")] for n in os.listdir(corpus_dir)
+                       if n.endswith(".py.txt")
+                       and n[:-len(".txt")] not in _known_differences)
+        self.failUnless(names, "no corpus files in '%s'" % corpus_dir)
+        for name in names:
+            cix_a = _scan_cix(pythoncile1, name)
+            cix_b = _scan_cix(pythoncile_ast, name)
+            if cix_a != cix_b:
+                diff = difflib.unified_diff(cix_a.splitlines(),
+                    cix_b.splitlines(), "pythoncile1", "pythoncile_ast",
+                    lineterm="")
+                self.fail("CIX differs for '%s':\n%s" % (name, "\n".join(diff)))
+
+    def test_known_differences_still_differ(self):
+        # Drop an entry from `_known_differences' once the scanners agree.
+        for name in sorted(_known_differences):
+            try:
+                cix_a = _scan_cix(pythoncile1, name)
+            except PythonCILEError, ex:
+                cix_a = str(ex)
+            try:
+                cix_b = _scan_cix(pythoncile_ast, name)
+            except PythonCILEError, ex:
+                cix_b = str(ex)
+            self.failIfEqual(cix_a, cix_b, "'%s' is no longer a known "
+                             "difference: %s" % (name, _known_differences[name]))
+
+    def test_unknown_coding(self):
+        self.failIf(_file_elem(pythoncile1, "known_unknown_coding.py")
+                    .get("error"))
+        self.failUnless(_file_elem(pythoncile_ast, "known_unknown_coding.py")
+                        .get("error"))
+
+    def test_recovered_by_ast_only(self):
+        for name in ("known_bom_coding.py", "known_string_escape_coding.py",
+                     "known_bad_assign_target.py",
+                     "known_multiple_syntax_errors.py"):
+            self.failUnless(_file_elem(pythoncile1, name).get("error"), name)
+            self.failIf(_file_elem(pythoncile_ast, name).get("error"), name)
+
+    def test_multiple_syntax_errors(self):
+        blob = _file_elem(pythoncile_ast, "known_multiple_syntax_errors.py")[0]
+        self.failUnlessEqual([elem.get("name") for elem in blob
+                              if elem.tag == "scope"],
+                             ["first", "Middle", "last"])
+
+    def test_utf8_docstring(self):
+        name = "known_utf8_docstring.py"
+        expected = u"\u0409\u040a\u0408"
+        self.failIf(expected in _file_elem(pythoncile1, name)[0][0].get("doc"))
+        self.failUnless(expected
+                        in _file_elem(pythoncile_ast, name)[0][0].get("doc"))
+
+    def test_ifexp_base(self):
+        for scanner in (pythoncile1, pythoncile_ast):
+            self.assertRaises(PythonCILEError, scanner.scan_et,
+                              _read("known_ifexp_base.py"),
+                              "known_ifexp_base.py")
+
+
+_incremental_base = """\
+import os
+
+X = 1
+
+def f(a):
+    b = a
+    return b
+
+class C(object):
+    def m(self):
+        self.x = 1
+
+def g(c=X):
+    return c
+"""
+
+def _cix_from_elem(elem):
+    stream = StringIO()
+    et.ElementTree(elem).write(stream, "utf-8")
+    return stream.getvalue()
+
+class IncrementalScanTestCase(unittest.TestCase):
+    path = "incremental.py"
+
+    def setUp(self):
+        # Count the full scans done by scan_et_incremental().
+        self.num_full_scans = 0
+        self._scan_file_incremental = pythoncile_ast._scan_file_incremental
+        def scan_file_incremental(*args):
+            self.num_full_scans += 1
+            return self._scan_file_incremental(*args)
+        pythoncile_ast._scan_file_incremental = scan_file_incremental
+
+    def tearDown(self):
+        pythoncile_ast._scan_file_incremental = self._scan_file_incremental
+
+    def _check_rescan(self, old, new, full_scan, state=None):
+        """Rescan `new' after a scan of `old' and check that it gives the
+        same CIX as a full scan of `new'. Returns the new state.
+        """
+        if state is None:
+            state = pythoncile_ast.scan_et_incremental(old, self.path)[1]
+        self.num_full_scans = 0
+        elem, state = pythoncile_ast.scan_et_incremental(new, self.path,
+                                                         state)
+        self.failUnlessEqual(self.num_full_scans, full_scan and 1 or 0)
+        expected = _cix_from_elem(pythoncile_ast.scan_et(new, self.path))
+        self.failUnlessEqual(_cix_from_elem(elem), expected)
+        return state
+
+    def test_unchanged(self):
+        self._check_rescan(_incremental_base, _incremental_base, False)
+
+    def test_edit_in_def(self):
+        self._check_rescan(_incremental_base,
+            _incremental_base.replace("b = a\n", "b = [a]\n"), False)
+
+    def test_later_blocks_shifted_down(self):
+        self._check_rescan(_incremental_base,
+            _incremental_base.replace("b = a\n", "b = a\n    d = 'x'\n"),
+            False)
+
+    def test_later_blocks_shifted_up(self):
+        self._check_rescan(_incremental_base,
+            _incremental_base.replace("    b = a\n", ""), False)
+
+    def test_successive_edits(self):
+        first = _incremental_base.replace("b = a\n", "b = a\n\n\n")
+        state = self._check_rescan(_incremental_base, first, False)
+        second = first.replace("self.x = 1\n", "self.x = 1\n        y = 2\n")
+        state = self._check_rescan(first, second, False, state)
+        third = second.replace("return c\n", "return [c]\n")
+        self._check_rescan(second, third, False, state)
+
+    def test_rebound_name(self):
+        # Another block rebinds `f': its symbol depends on the edited def.
+        old = _incremental_base + "f = staticmethod(f)\n"
+        self._check_rescan(old, old.replace("b = a\n", "b = [a]\n"), True)
+
+    def test_renamed_def(self):
+        self._check_rescan(_incremental_base,
+            _incremental_base.replace("def f(a)", "def h(a)"), True)
+
+    def test_attribute_referred_to(self):
+        old = _incremental_base + "Y = C.m\n"
+        self._check_rescan(old, old.replace("self.x = 1", "self.x = 'x'"),
+                           True)
+
+    def test_syntax_error(self):
+        self._check_rescan(_incremental_base,
+            _incremental_base.replace("b = a\n", "b = = a\n"), True)
+
+    def test_edit_of_two_blocks(self):
+        self._check_rescan(_incremental_base,
+            _incremental_base.replace("b = a\n", "b = [a]\n")
+                             .replace("return c\n", "return [c]\n"), True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# Copyright (c) 2010 ActiveState Software Inc.
+# See LICENSE.txt for license details.
+
+"""Test the file helpers of codeintel2.util used by the on-disk caches."""
+
+import os
+from os.path import join, exists
+import shutil
+import tempfile
+import unittest
+import cPickle as pickle
+
+from codeintel2.util import write_file_atomically, load_pickle
+
+
+class FileHelpersTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp(prefix="codeintel-test-")
+        self.path = join(self.dir, "cache.pickle")
+
+    def tearDown(self):
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def test_write_and_load(self):
+        write_file_atomically(self.path, pickle.dumps({"a": 1}, 2))
+        write_file_atomically(self.path, pickle.dumps({"b": 2}, 2))
+        self.failUnlessEqual(load_pickle(self.path), {"b": 2})
+        self.failUnlessEqual(os.listdir(self.dir), ["cache.pickle"])
+
+    def test_failed_write(self):
+        path = join(self.dir, "no such dir", "cache.pickle")
+        self.assertRaises(EnvironmentError, write_file_atomically, path,
+                          "data")
+        self.failIf(exists(path))
+
+    def test_load_missing(self):
+        self.failUnlessEqual(load_pickle(self.path), None)
+
+    def test_load_corrupt(self):
+        data = pickle.dumps({"a": 1}, 2)
+        for corrupt in ("", "garbage", data[:len(data)/2]):
+            write_file_atomically(self.path, corrupt)
+            self.failUnlessEqual(load_pickle(self.path), None)
+
+
+if __name__ == "__main__":
+    unittest.main()
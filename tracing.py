@@ -0,0 +1,303 @@
+#!/usr/bin/env python
+# Copyright (c) 2010 ActiveState Software Inc.
+# See LICENSE.txt for license details.
+
+"""Lightweight timed-phase tracing for codeintel.
+
+A PhaseTracer records a tree of named, timed phases:
+
+    tracer = PhaseTracer("startup")
+    with tracer.phase("register modules"):
+        with tracer.phase("import lang_python"):
+            ...
+
+The recorded tree can be dumped as JSON (`to_json()`), in the Chrome
+trace-event format (`to_chrome_trace_json()`, for chrome://tracing or
+Perfetto) or logged as an indented report (`log_report()`). Phases are
+nested per thread; phases started on another thread become new top-level
+phases.
+
+Code that is run on behalf of a traced operation, but has no handle on
+its tracer (e.g. the database libs during a completion evaluation), can
+record spans in the tracer made active on the current thread:
+
+    with active_tracer(tracer):     # e.g. by the Manager's eval thread
+        ...
+        with span("hits_from_lpath", lpath=lpath):  # no-op if no tracer
+            ...
+
+    @traced("import resolution")
+    def _hit_from_elem_imports(self, tokens, elem):
+        ...
+"""
+
+import os
+import sys
+import time
+import threading
+import logging
+from contextlib import contextmanager
+
+try:
+    import json
+except ImportError:
+    json = None
+
+
+log = logging.getLogger("codeintel.tracing")
+
+_clock = (sys.platform == "win32" and time.clock or time.time)
+
+
+
+class Phase(object):
+    """A single timed phase in a PhaseTracer tree."""
+    __slots__ = ("name", "start", "end", "children", "thread", "args")
+
+    def __init__(self, name, start, thread=None, args=None):
+        self.name = name
+        self.start = start
+        self.end = None
+        self.children = []
+        self.thread = thread
+        self.args = args
+
+    def __repr__(self):
+        return "<Phase %r %s>" % (self.name, self.duration)
+
+    @property
+    def duration(self):
+        """Duration of this phase in seconds (None if not finished)."""
+        if self.end is None:
+            return None
+        return self.end - self.start
+
+    def to_dict(self, origin):
+        d = {"name": self.name,
+             "start": round(self.start - origin, 6),
+             "duration": None}
+        if self.end is not None:
+            d["duration"] = round(self.end - self.start, 6)
+        if self.thread is not None:
+            d["thread"] = self.thread
+        if self.args:
+            d["args"] = self.args
+        if self.children:
+            d["children"] = [c.to_dict(origin) for c in self.children]
+        return d
+
+    def gen_trace_events(self, origin, pid, tid):
+        """Generate Chrome trace events for this phase and its children:
+        "complete" events, or "begin" events for unfinished phases.
+        """
+        event = {"name": self.name, "ph": "X", "pid": pid, "tid": tid,
+                 "ts": round((self.start - origin) * 1e6, 3)}
+        if self.end is None:
+            event["ph"] = "B"
+        else:
+            event["dur"] = round((self.end - self.start) * 1e6, 3)
+        if self.args:
+            event["args"] = self.args
+        yield event
+        for c in self.children:
+            for e in c.gen_trace_events(origin, pid, tid):
+                yield e
+
+
+class PhaseTracer(object):
+    """Records a tree of timed phases. See the module docstring."""
+    def __init__(self, name, enabled=True):
+        self.name = name
+        self.enabled = enabled
+        self.origin = _clock()
+        self.phases = [] # top-level phases
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def __repr__(self):
+        return "<PhaseTracer %r: %d phases>" % (self.name, len(self.phases))
+
+    def _stack(self):
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            return self._local.stack
+
+    def phase(self, name, **args):
+        """Context manager recording the enclosed block as a phase.
+
+        Keyword arguments, if any, are recorded with the phase (they
+        must be JSON-serializable).
+        """
+        return self._phase(name, args)
+
+    @contextmanager
+    def _phase(self, name, args):
+        if not self.enabled:
+            yield None
+            return
+        stack = self._stack()
+        if stack:
+            p = Phase(name, _clock(), args=args)
+            stack[-1].children.append(p)
+        else:
+            p = Phase(name, _clock(), threading.currentThread().getName(),
+                      args)
+            self._lock.acquire()
+            try:
+                self.phases.append(p)
+            finally:
+                self._lock.release()
+        stack.append(p)
+        try:
+            yield p
+        finally:
+            p.end = _clock()
+            stack.pop()
+
+    def to_dict(self):
+        self._lock.acquire()
+        try:
+            phases = self.phases[:]
+        finally:
+            self._lock.release()
+        return {"name": self.name,
+                "phases": [p.to_dict(self.origin) for p in phases]}
+
+    def to_json(self, indent=None):
+        if json is None:
+            raise ImportError("cannot dump %r as JSON: no 'json' module"
+                              % self)
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def write_json(self, path):
+        fout = open(path, 'w')
+        try:
+            fout.write(self.to_json(indent=2))
+        finally:
+            fout.close()
+
+    def to_trace_events(self):
+        """Return the phases as a list of Chrome trace events (one "tid"
+        per thread the top-level phases ran on).
+        """
+        self._lock.acquire()
+        try:
+            phases = self.phases[:]
+        finally:
+            self._lock.release()
+        pid = os.getpid()
+        tid_from_thread = {}
+        events = []
+        for p in phases:
+            tid = tid_from_thread.setdefault(p.thread, len(tid_from_thread)+1)
+            events += p.gen_trace_events(self.origin, pid, tid)
+        for thread, tid in tid_from_thread.items():
+            events.append({"name": "thread_name", "ph": "M", "pid": pid,
+                           "tid": tid, "args": {"name": thread or "?"}})
+        return events
+
+    def to_chrome_trace_json(self):
+        """Return the phases in the Chrome trace-event JSON format."""
+        if json is None:
+            raise ImportError("cannot dump %r as JSON: no 'json' module"
+                              % self)
+        return json.dumps({"traceEvents": self.to_trace_events(),
+                           "displayTimeUnit": "ms",
+                           "otherData": {"name": self.name}})
+
+    def write_chrome_trace(self, path):
+        fout = open(path, 'w')
+        try:
+            fout.write(self.to_chrome_trace_json())
+        finally:
+            fout.close()
+
+    def log_report(self, logger=None, level=logging.INFO):
+        """Log the phase tree as an indented report with durations."""
+        if logger is None:
+            logger = log
+        if not logger.isEnabledFor(level):
+            return
+        lines = ["%s trace:" % self.name]
+        def add_lines(phases, depth):
+            for p in phases:
+                if p.duration is None:
+                    dur_str = "   (unfinished)"
+                else:
+                    dur_str = "%9.1fms" % (p.duration * 1000)
+                lines.append("%s %s%s" % (dur_str, "  " * depth, p.name))
+                add_lines(p.children, depth+1)
+        add_lines(self.phases[:], 1)
+        logger.log(level, "\n".join(lines))
+
+
+
+#---- the tracer active on the current thread
+
+_active = threading.local()
+
+def get_active_tracer():
+    """Return the PhaseTracer active on this thread, if any."""
+    return getattr(_active, "tracer", None)
+
+@contextmanager
+def active_tracer(tracer):
+    """Context manager making `tracer' (may be None) the active one on
+    this thread for the enclosed block.
+    """
+    last_tracer = getattr(_active, "tracer", None)
+    _active.tracer = tracer
+    try:
+        yield tracer
+    finally:
+        _active.tracer = last_tracer
+
+@contextmanager
+def span(name, **args):
+    """Context manager recording the enclosed block as a phase of the
+    active tracer. A no-op if there is none.
+    """
+    tracer = getattr(_active, "tracer", None)
+    if tracer is None:
+        yield None
+    else:
+        with tracer._phase(name, args) as p:
+            yield p
+
+def traced(name, *arg_names):
+    """Decorator recording calls of the function as phases (of the given
+    name) of the active tracer, if any.
+
+    The values of the arguments named in "arg_names" are recorded (as
+    strings) with the phases.
+    """
+    def decorator(func):
+        varnames = func.func_code.co_varnames[:func.func_code.co_argcount]
+        index_from_arg_name = dict((n, varnames.index(n)) for n in arg_names)
+        def wrapper(*args, **kwargs):
+            tracer = getattr(_active, "tracer", None)
+            if tracer is None:
+                return func(*args, **kwargs)
+            phase_args = {}
+            for arg_name, index in index_from_arg_name.items():
+                if index < len(args):
+                    phase_args[arg_name] = _str_from_value(args[index])
+                elif arg_name in kwargs:
+                    phase_args[arg_name] = _str_from_value(kwargs[arg_name])
+            with tracer._phase(name, phase_args):
+                return func(*args, **kwargs)
+        wrapper.__name__ = func.__name__
+        wrapper.__doc__ = func.__doc__
+        wrapper.__dict__.update(func.__dict__)
+        return wrapper
+    return decorator
+
+def _str_from_value(value):
+    try:
+        if isinstance(value, (tuple, list)):  # e.g. an lpath
+            return u".".join(map(unicode, value))
+        return unicode(value)
+    except UnicodeError:
+        return repr(value)
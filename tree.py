@@ -57,6 +57,7 @@ if not getattr(ET, "_patched_for_komodo_", False):
 
 from codeintel2.common import *
 from codeintel2.citadel import CitadelEvaluator
+from codeintel2.tracing import span, traced
 
 
 log = logging.getLogger("codeintel.tree")
@@ -290,6 +291,7 @@ def check_tree(tree):
 
 
 class TreeEvaluator(CitadelEvaluator):
+    @traced("get_start_scoperef")
     def get_start_scoperef(self):
         linenum = self.line + 1 # convert to 1-based
         try:
@@ -307,27 +309,34 @@ class TreeEvaluator(CitadelEvaluator):
             return
         self.ctlr.info("eval %s  %s", self, self.trg)
 
-        self.pre_eval()
+        with span("pre_eval"):
+            self.pre_eval()
 
         try:
             if self.trg.form == TRG_FORM_CPLN:
-                cplns = self.eval_cplns()
+                with span("eval_cplns", expr=self.expr):
+                    cplns = self.eval_cplns()
                 if cplns:
-                    cplns = self.post_process_cplns(cplns)
+                    with span("post_process_cplns", num_cplns=len(cplns)):
+                        cplns = self.post_process_cplns(cplns)
                 self.info("    cplns: %r", cplns)
                 if cplns:
                     self.ctlr.set_cplns(cplns)
             elif self.trg.form == TRG_FORM_CALLTIP:
-                calltips = self.eval_calltips()
+                with span("eval_calltips", expr=self.expr):
+                    calltips = self.eval_calltips()
                 if calltips:
-                    calltips = self.post_process_calltips(calltips)
+                    with span("post_process_calltips"):
+                        calltips = self.post_process_calltips(calltips)
                 self.info("    calltips: %r", calltips)
                 if calltips:
                     self.ctlr.set_calltips(calltips)
             else:  # self.trg.form == TRG_FORM_DEFN
-                defns = self.eval_defns()
+                with span("eval_defns", expr=self.expr):
+                    defns = self.eval_defns()
                 if defns:
-                    defns = self.post_process_defns(defns)
+                    with span("post_process_defns"):
+                        defns = self.post_process_defns(defns)
                 self.info("    defns: %r", defns)
                 if defns:
                     self.ctlr.set_defns(defns)
@@ -463,6 +472,7 @@ class TreeEvaluator(CitadelEvaluator):
                                  % self.str_import(obj))
         return obj
 
+    @traced("import resolution", "module_name", "symbol_name")
     def _resolve_import(self, module_name, symbol_name=None):
         """Return a loaded citree node for the given import info.
 
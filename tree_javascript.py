@@ -44,6 +44,7 @@ from pprint import pformat
 from codeintel2.common import *
 from codeintel2.util import indent
 from codeintel2.tree import TreeEvaluator
+from codeintel2.tracing import traced
 
 if _xpcom_:
     from xpcom import components
@@ -716,6 +717,7 @@ class JavaScriptTreeEvaluator(CandidatesForTreeEvaluator):
 
         return hits
 
+    @traced("type inference", "citdl")
     def _hits_from_type_inference(self, citdl, scoperef):
         """Resolve the 'citdl' type inference at 'scoperef'."""
         self.log("resolve '%s' type inference:", citdl)
@@ -75,6 +75,7 @@ from pprint import pprint
 
 from codeintel2.common import *
 from codeintel2.tree import TreeEvaluator
+from codeintel2.tracing import traced
 from codeintel2.database.stdlib import StdLib
 from codeintel2.util import banner, isident
 
@@ -800,6 +801,7 @@ class PerlTreeEvaluator(PerlTreeEvaluatorBase):
                                 classref_pkg, _handled_pkg_names):
                     yield item
 
+    @traced("import resolution")
     def _hit_from_elem_imports(self, token, elem):
         """See if token is from one of the imports on this <scope> elem.
 
@@ -859,6 +861,7 @@ class PerlTreeEvaluator(PerlTreeEvaluatorBase):
             self.debug("is '%s' from %r? no", token, imp_elem)
         return None
 
+    @traced("type inference")
     def _hit_from_variable_type_inference(self, elem, scoperef):
         """Resolve the type inference for the given element."""
         #TODO:PERF: Consider cheating here with the knowledge that the
@@ -871,6 +874,7 @@ class PerlTreeEvaluator(PerlTreeEvaluatorBase):
         self.info("resolve '%s' type inference for %r:", citdl, elem)
         return self._hit_from_citdl(citdl, scoperef)
 
+    @traced("type inference", "citdl")
     def _hit_from_type_inference(self, citdl, scoperef):
         """Resolve the 'citdl' type inference at 'scoperef'."""
         #TODO:PERF: Consider cheating here with the knowledge that the
@@ -39,6 +39,7 @@
 
 from codeintel2.common import *
 from codeintel2.tree import TreeEvaluator
+from codeintel2.tracing import traced
 from codeintel2.util import make_short_name_dict, banner
 
 
@@ -1152,6 +1153,7 @@ class PHPTreeEvaluator(TreeEvaluator):
         return None, None
 
 
+    @traced("import resolution")
     def _hit_from_elem_imports(self, tokens, elem):
         """See if token is from one of the imports on this <scope> elem.
 
@@ -1344,6 +1346,7 @@ class PHPTreeEvaluator(TreeEvaluator):
         func_scoperef = (scoperef[0], scoperef[1]+[elem.get("name")])
         return self._hit_from_citdl(citdl, func_scoperef)
 
+    @traced("type inference")
     def _hit_from_variable_type_inference(self, elem, scoperef):
         """Resolve the type inference for 'elem' at 'scoperef'."""
         citdl = elem.get("citdl")
@@ -41,6 +41,7 @@ from os.path import basename, dirname, join, exists, isdir
 
 from codeintel2.common import *
 from codeintel2.tree import TreeEvaluator
+from codeintel2.tracing import traced
 
 base_exception_class_completions = [
     ("class", "BaseException"),
@@ -619,6 +620,7 @@ class PythonTreeEvaluator(TreeEvaluator):
 
         return None, None
 
+    @traced("import resolution")
     def _hit_from_elem_imports(self, tokens, elem):
         """See if token is from one of the imports on this <scope> elem.
 
@@ -728,6 +730,7 @@ class PythonTreeEvaluator(TreeEvaluator):
         raise CodeIntelError("could not resolve '%s' getattr on %r in %r"
                              % (first_token, elem, scoperef))
 
+    @traced("type inference")
     def _hit_from_variable_type_inference(self, elem, scoperef):
         """Resolve the type inference for 'elem' at 'scoperef'."""
         citdl = elem.get("citdl")
@@ -736,6 +739,7 @@ class PythonTreeEvaluator(TreeEvaluator):
         self.log("resolve '%s' type inference for %r:", citdl, elem)
         return self._hit_from_citdl(citdl, scoperef)
 
+    @traced("type inference", "citdl")
     def _hit_from_type_inference(self, citdl, scoperef):
         """Resolve the 'citdl' type inference at 'scoperef'."""
         self.log("resolve '%s' type inference:", citdl)
@@ -41,6 +41,7 @@ import re
 
 from codeintel2.common import *
 from codeintel2.tree import TreeEvaluator
+from codeintel2.tracing import traced
 from codeintel2.tree_javascript import JavaScriptTreeEvaluator
 from codeintel2.database.stdlib import StdLib
 
@@ -801,6 +802,7 @@ class RubyTreeEvaluator(TreeEvaluatorHelper):
                 self._append_hits_from_name(hits, first_token, hit[1], elem)
                 return hits
         
+    @traced("import resolution")
     def _hit_from_elem_imports(self, elem, first_token, filter_type):
         """See if token is from one of the imports on this <scope> elem.
 
@@ -823,6 +825,7 @@ class RubyTreeEvaluator(TreeEvaluatorHelper):
                 if new_hits:
                     return new_hits[0]
                 
+    @traced("type inference", "classname")
     def _hit_from_type_inference(self, classname, first_token, filter_type):
         hits = self._hits_from_citdl(classname)
         for hit in hits:
@@ -48,6 +48,9 @@ import types
 from pprint import pprint, pformat
 import time
 import codecs
+import cPickle as pickle
+
+log = logging.getLogger("codeintel.util")
 
 # Global dict for holding specific hotshot profilers
 hotshotProfilers = {}
@@ -114,8 +117,26 @@ def guess_lang_from_path(path):
     raise CodeIntelError("couldn't guess lang for `%s'" % path)
 
 
+_patterns_re_cache = {}
+def patterns_re(patterns):
+    """Return a compiled regex matching the filenames that match any of
+    the given glob patterns, as fnmatch.fnmatch() would (i.e. ignoring
+    case on case-insensitive platforms).
+    """
+    patterns = tuple(patterns)
+    regex = _patterns_re_cache.get(patterns)
+    if regex is None:
+        from fnmatch import translate
+        flags = 0
+        if os.path.normcase("A") == "a":
+            flags = re.IGNORECASE
+        regex = re.compile("|".join("(?:%s)" % translate(p)
+                                    for p in patterns) or "(?!)", flags)
+        _patterns_re_cache[patterns] = regex
+    return regex
+
 def gen_dirs_under_dirs(dirs, max_depth, interesting_file_patterns=None,
-                        skip_scc_control_dirs=True):
+                        skip_scc_control_dirs=True, dir_cache=None):
     """Generate all dirs under the given dirs (including the given dirs
     themselves).
     
@@ -126,19 +147,26 @@ def gen_dirs_under_dirs(dirs, max_depth, interesting_file_patterns=None,
             not included (though sub-directories of these may be).
         "skip_scc_control_dirs" is a boolean (default True) indicating if
             svn and cvs control dirs should be skipped.
+        "dir_cache" (optional) is a dircache.DirListingCache to get the
+            dir listings from (typically mgr.db.dir_listing_cache).
     """
     from os.path import normpath, abspath, expanduser
-    from fnmatch import fnmatch
 
     dirs_to_skip = (skip_scc_control_dirs
         and ["CVS", ".svn", ".hg", ".git", ".bzr"] or [])
+    if interesting_file_patterns:
+        interesting_match = patterns_re(interesting_file_patterns).match
     # We must keep track of the directories we have walked, as the list of dirs
     # can overlap - bug 90289.
     walked_these_dirs = {}
     for dir in dirs:
         norm_dir = normpath(abspath(expanduser(dir)))
         LEN_DIR = len(norm_dir)
-        for dirpath, dirnames, filenames in walk2(norm_dir):
+        if dir_cache is not None:
+            walker = dir_cache.walk(norm_dir)
+        else:
+            walker = walk2(norm_dir)
+        for dirpath, dirnames, filenames in walker:
             if dirpath in walked_these_dirs:
                 dirnames[:] = []  # Already walked - no need to do it again.
                 continue
@@ -150,10 +178,8 @@ def gen_dirs_under_dirs(dirs, max_depth, interesting_file_patterns=None,
                     if dir_to_skip in dirnames:
                         dirnames.remove(dir_to_skip)
             if interesting_file_patterns:
-                for pat, filename in (
-                    (p,f) for p in interesting_file_patterns
-                          for f in filenames):
-                    if fnmatch(filename, pat):
+                for filename in filenames:
+                    if interesting_match(filename):
                         break
                 else:
                     # No interesting files in this dir.
@@ -595,6 +621,50 @@ def walk2(top, topdown=True, onerror=None, followlinks=False,
     if not topdown:
         yield top, dirs, nondirs
 
+def write_file_atomically(path, data):
+    """Write the given data (a str) to the file at `path'.
+
+    The data is written to a temporary file that is then renamed to
+    `path', so that other processes (or the next session) never see a
+    half-written file. Raises EnvironmentError on failure.
+    """
+    tmp_path = "%s.%d.tmp" % (path, os.getpid())
+    try:
+        fout = open(tmp_path, 'wb')
+        try:
+            fout.write(data)
+        finally:
+            fout.close()
+        if os.path.exists(path):
+            os.remove(path)  # rename() doesn't replace on Windows
+        os.rename(tmp_path, path)
+    except EnvironmentError:
+        if os.path.exists(tmp_path):
+            try:
+                os.remove(tmp_path)
+            except EnvironmentError:
+                pass
+        raise
+
+def load_pickle(path, what="pickle"):
+    """Return the object pickled in the file at `path' (e.g. written
+    with write_file_atomically()), or None if there is no such file or
+    it cannot be unpickled. A corrupt file is logged as such, using
+    `what' to describe it, and otherwise ignored.
+    """
+    try:
+        fin = open(path, 'rb')
+    except EnvironmentError:
+        return None
+    try:
+        try:
+            return pickle.load(fin)
+        except Exception, ex:
+            log.warn("ignoring corrupt %s '%s': %s", what, path, ex)
+            return None
+    finally:
+        fin.close()
+
 
 # Decorators useful for timing and profiling specific functions.
 #